@@ -1,6 +1,11 @@
 # backend\agent\base_agent.py
+import logging
 from abc import ABC, abstractmethod
-from backend.core.llm_core import call_llm
+from typing import AsyncIterator
+from backend.core.config import settings
+from backend.core.llm_core import LLMTool, acall_llm, acall_llm_stream, acall_llm_tools
+
+logger = logging.getLogger(__name__)
 
 class BaseAgent(ABC):
     """모든 에이전트의 공통 기반 클래스"""
@@ -12,41 +17,59 @@ class BaseAgent(ABC):
     @abstractmethod
     def handle(self, db, session_id, user_id, model, message) -> tuple[str,str]:
         """각 에이전트별 요청 처리 로직"""
-        print( 
-            f'[_agent.py] >>>>>> handle( self, db: Session, session_id:str , user_id: str, model:str , message: str)  \n' 
-            f'  - db: {db} \n'
-            f'  - sesseion_id: {session_id} \n'
-            f'  - user_id: {user_id} \n'
-            f'  - model: {model} \n'
-            f'  - message: {message} \n'
-        )
-        pass
 
-        
-    def _llm_reply(self, model:str , message: str, chat_history: list[dict] = None , prompt: str = None) -> str:
+    @property
+    def use_response_cache(self) -> bool:
+        """에이전트별 LLM 응답 캐시 사용 여부 (settings.LLM_CACHE_AGENTS 에 이름이 있으면 사용)"""
+        return self.name in settings.LLM_CACHE_AGENTS
+
+    async def _llm_reply(self, model:str , message: str, chat_history: list[dict] = None , prompt: str = None, cache: bool = None) -> str:
         """
         LLM 호출 공통 공통 래퍼(wrapper) 함수.
+        - async 라우트에서 호출되므로 acall_llm(비동기 클라이언트)을 사용하여 이벤트 루프를 막지 않습니다.
         Arguments:
             - model(str): 모델
             - message(str): 사용자의 신규 메세지
             - chat_history(turple): Optional
+            - cache(bool): 응답 캐시 사용 여부 (None 이면 에이전트 설정 use_response_cache 를 따름)
         Returns:
             - str: 신규 메세지에 대한 llm 답변
         """
         # full_prompt = f"{self.role_prompt}\n\n사용자 요청:\n{content}"
         final_prompt = prompt or self.role_prompt
-        return call_llm(
+        return await acall_llm(
             model=model,
             prompt=final_prompt,
             message=message,
-            chat_history=chat_history
+            chat_history=chat_history,
+            cache=self.use_response_cache if cache is None else cache,
             # temperature는 llm_core의 기본값을 사용하므로 명시하지 않아도 됩니다.
         )
-    
-
-
-
-
-
 
+    async def _llm_reply_tools(self, model: str, message: str, tools: list[LLMTool], chat_history: list[dict] = None,
+                               prompt: str = None, cache: bool = None) -> str:
+        """
+        function calling LLM 호출 공통 래퍼(wrapper) 함수.
+        - _llm_reply 와 같고, LLM 이 tools 를 호출할 수 있습니다. (응답 캐시는 도구를 호출하지 않은 답변만 저장)
+        """
+        return await acall_llm_tools(
+            model=model,
+            prompt=prompt or self.role_prompt,
+            message=message,
+            tools=tools,
+            chat_history=chat_history,
+            cache=self.use_response_cache if cache is None else cache,
+        )
 
+    def _llm_reply_stream(self, model:str , message: str, chat_history: list[dict] = None , prompt: str = None) -> AsyncIterator[str]:
+        """
+        LLM 스트리밍 호출 공통 래퍼(wrapper) 함수.
+        - _llm_reply와 인자는 같고, 응답 텍스트 조각을 yield 하는 async generator를 반환합니다.
+        """
+        final_prompt = prompt or self.role_prompt
+        return acall_llm_stream(
+            model=model,
+            prompt=final_prompt,
+            message=message,
+            chat_history=chat_history
+        )
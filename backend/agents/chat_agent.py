@@ -1,10 +1,38 @@
 # backend/agnet/chat_agent.py
-from sqlalchemy import func
+from typing import AsyncIterator
 from backend.agents.base_agent import BaseAgent
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 import uuid
+import asyncio
+import logging
+import anyio
 
+from backend.core.config import settings
+from backend.core.session_cache import session_cache
+from backend.core.token_counter import estimate_tokens
 from backend.database.crud import chat_crud
+from backend.database.db_manager import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+# 대화 요약 시 한 번에 요약 대상으로 읽는 최대 메세지 수 (더 오래된 메세지는 기존 요약에 이미 반영되어 있다고 봄)
+SUMMARY_SOURCE_MAX_MESSAGES = 200
+SUMMARY_PROMPT = (
+    "다음은 사용자와 AI 어시스턴트의 이전 대화 요약과 그 이후의 대화입니다. "
+    "이후 대화를 이어가는 데 필요한 사실, 사용자 정보, 결정 사항을 빠짐없이 포함하여 "
+    "하나의 간결한 요약으로 다시 작성하세요."
+)
+
+
+def _sse(data: str, event: str = None) -> str:
+    """
+    SSE(Server-Sent Events) 이벤트 문자열 생성
+    - 토큰에 줄바꿈이 포함되면 SSE 규격대로 여러 줄의 data: 로 나눠서 전송 (클라이언트에서 다시 \n 으로 합쳐짐)
+    """
+    lines = [f"event: {event}"] if event else []
+    lines += [f"data: {line}" for line in data.split("\n")]
+    return "\n".join(lines) + "\n\n"
+
 
 class ChatAgent(BaseAgent):
     def __init__(self):
@@ -15,52 +43,287 @@ class ChatAgent(BaseAgent):
                 "짧고 명확하게 대답하세요."
             ),
         )
+        # Redis 세션 캐시 (최근 대화 이력 + sequence 카운터, 장애/miss 시 DB 사용)
+        self.session_cache = session_cache
+        # AsyncSession 생성 함수 (요청 처리 중 필요한 구간에서만 짧게 열고 닫음, 테스트에서 다른 엔진으로 교체 가능)
+        # 쿼리를 기다리는 동안 이벤트 루프는 다른 요청을 처리합니다. (asyncpg / aiosqlite)
+        self.session_factory = AsyncSessionLocal
+
+    async def _cache(self, method, *args):
+        """
+        Redis 세션 캐시(sync 클라이언트) 호출은 스레드에서 실행하여 이벤트 루프를 막지 않도록 함
+        - 캐시를 사용하지 않는 동안(꺼짐 / Redis 장애 후 retry_after)에는 Redis 를 호출하지 않으므로 바로 실행
+        """
+        if not self.session_cache.available:
+            return method(*args)
+        return await anyio.to_thread.run_sync(method, *args)
+
+    async def handle(self, session_id:str , user_id: str, model:str , message: str, session_factory=None) -> tuple[str, str] :
+        """
+        일반 대화 처리
+        - DB 세션(커넥션)은 요청 전체 동안 잡고 있지 않고, LLM 호출 앞뒤의 짧은 트랜잭션에서만 사용합니다.
+          1) 시작: 세션 생성 또는 이력 조회 + 이번 턴의 sequence 예약(user 메세지, 빈 assistant 메세지 저장) -> commit -> close
+          2) LLM 질의 (DB 연결 없음, 커넥션 풀 크기와 무관하게 동시에 대기 가능)
+          3) 종료: 예약해 둔 assistant 메세지에 답변 저장 -> commit -> close
+        - LLM 호출이 실패하면 예약한 메세지를 삭제합니다. (기존처럼 실패한 턴은 이력에 남지 않음)
+        Argument:
+            - session_factory: AsyncSession 생성 함수 (기본: self.session_factory = AsyncSessionLocal)
+        """
+        session_factory = session_factory or self.session_factory
+
+        # 1. 대화 시작 (짧은 트랜잭션, AsyncSession 이므로 쿼리를 기다리는 동안 이벤트 루프를 막지 않음)
+        session_id, chat_history, prompt, summarize_before, saved = await self._begin_turn(
+            session_factory, session_id, user_id, model, message, True
+        )
+
+        # 2. llm 질의 (DB 연결을 잡고 있지 않음)
+        try:
+            llm_reply = await self._llm_reply( model, message, chat_history, prompt)
+        except BaseException:
+            # 클라이언트 연결이 끊겨 취소된 경우에도 정리가 끝나도록 cancel scope를 shield 합니다.
+            with anyio.CancelScope(shield=True):
+                await self._discard_turn(session_factory, session_id, saved)
+            raise
+
+        # 3. 예약한 assistant 메세지에 답변 저장 (짧은 트랜잭션)
+        with anyio.CancelScope(shield=True):
+            await self._complete_turn(session_factory, session_id, saved, llm_reply)
 
-    def handle(self, db: Session, session_id:str , user_id: str, model:str , message: str) -> tuple[str, str] :
-        """일반 대화 처리"""
+        # 4. (선택) window 밖의 오래된 대화가 충분히 쌓였으면 응답과 별개로 백그라운드에서 요약 갱신
+        if summarize_before is not None:
+            self._schedule_summary(session_id, model, summarize_before)
         
-        chat_history = [] 
-
-        # 1. if seesion_id 가 없으면: = 첫 대화 이므로 세션 아이디 생성
-        #   databse에서 "chat_seesion" 테이블에 세션 데이터를 insert 하여 pk로 session_id(=uuid) 반환 받아 사용 한다. 
-        if session_id is None or session_id.strip() == "":
-            # print(f'[chat_agent.py] create new seesion_id!!! -> {session_id}')
-            # session_id = str(uuid.uuid4()) # (임시조치)
-            new_seesion = chat_crud.create_chat_session(
-                db=db,
-                user_id=user_id,
-                agent_id=self.name,
-                model_id=model
+        return llm_reply, session_id
+
+
+    async def _complete_turn(self, session_factory, session_id: str, saved: list[dict], llm_reply: str) -> None:
+        """
+        예약해 둔 assistant 메세지(saved 의 마지막)에 답변을 저장하고, commit 후 턴 전체를 캐시에 추가
+        - 예약한 메세지가 이미 삭제되었거나 답변이 저장되어 있으면 (0건) DB 에 없는 답변이 캐시에 남지 않도록
+          캐시에 추가하지 않고 무효화합니다. (다음 조회 시 DB 에서 다시 채움)
+        """
+        if not saved:
+            return
+        reply = dict(saved[-1], content=llm_reply)
+        async with session_factory() as db:
+            completed = await chat_crud.acomplete_message(db, session_id, reply["sequence"], llm_reply)
+            await db.commit()
+        if not completed:
+            logger.warning("reserved reply not found (session_id=%s, sequence=%s)", session_id, reply["sequence"])
+            await self._cache(self.session_cache.invalidate, session_id)
+            return
+        await self._cache(self.session_cache.append, session_id, saved[:-1] + [reply])
+
+
+    async def _discard_turn(self, session_factory, session_id: str, saved: list[dict]) -> None:
+        """LLM 호출 실패 시 예약한 메세지 삭제 (캐시의 sequence 카운터도 DB 기준으로 다시 채우도록 무효화)"""
+        async with session_factory() as db:
+            try:
+                await chat_crud.adiscard_messages(db, session_id, [m["sequence"] for m in saved])
+                await db.commit()
+            except Exception as e:
+                await db.rollback()
+                logger.warning("discard reserved messages failed (session_id=%s): %s", session_id, e)
+        await self._cache(self.session_cache.invalidate, session_id)
+
+
+    async def _load_history(self, db: AsyncSession, session_id: str, model: str, message: str) -> tuple[list[dict], str, int | None]:
+        """
+        LLM에 전달할 최근 대화 이력과 프롬프트 조회
+        - 최근 CHAT_HISTORY_MAX_TURNS 턴까지, 그리고 모델 max_tokens x CHAT_HISTORY_TOKEN_RATIO 토큰 예산 안에서만 읽습니다.
+        - CHAT_HISTORY_SUMMARY=True 이면 window 밖의 오래된 대화 요약을 프롬프트에 덧붙입니다.
+        Returns:
+            - chat_history: [{"role", "content"}, ...]
+            - prompt: 시스템 프롬프트 (요약 포함)
+            - summarize_before: 요약 갱신이 필요하면 이 sequence 이전까지 요약 (필요 없으면 None)
+        """
+        max_messages = settings.CHAT_HISTORY_MAX_TURNS * 2 or None
+
+        # 1. Redis 세션 캐시 조회 (hit 이면 DB를 읽지 않음)
+        cached = await self._cache(self.session_cache.get, session_id, max_messages)
+        if cached is not None:
+            messages, summary, summary_until = cached
+        # 2. miss: DB에서 최근 window 를 읽어 캐시를 채움 (턴 수 제한이 없으면 캐시를 쓰지 않고 토큰 예산으로만 읽음)
+        else:
+            summary, summary_until = (None, 0)
+            if settings.CHAT_HISTORY_SUMMARY:
+                summary, summary_until = await chat_crud.aget_session_summary(db, session_id)
+            if max_messages is not None:
+                messages = await chat_crud.aget_recent_messages(db, session_id, max_messages=max_messages, whole_turns=False)
+                await self._cache(
+                    self.session_cache.fill,
+                    session_id, messages, messages[-1]["sequence"] if messages else 0, summary, summary_until,
+                )
+            else:
+                messages = None
+
+        prompt = self.role_prompt
+        if settings.CHAT_HISTORY_SUMMARY and summary:
+            prompt = f"{self.role_prompt}\n\n[이전 대화 요약]\n{summary}"
+
+        # 3. 최근 N턴 + 토큰 예산 안에서 window 선택
+        max_tokens = await self._get_model_max_tokens(db, model) or settings.CHAT_HISTORY_DEFAULT_MAX_TOKENS
+        token_budget = max(int(max_tokens * settings.CHAT_HISTORY_TOKEN_RATIO) - estimate_tokens(prompt) - estimate_tokens(message), 0)
+        if messages is None:
+            recent = await chat_crud.aget_recent_messages(db, session_id, max_tokens=token_budget)
+        else:
+            recent = chat_crud.window_messages(messages, max_messages=max_messages, max_tokens=token_budget)
+        chat_history = [{"role": m["role"], "content": m["content"]} for m in recent]
+
+        summarize_before = None
+        if settings.CHAT_HISTORY_SUMMARY and recent:
+            first_sequence = recent[0]["sequence"]
+            if first_sequence - 1 - summary_until >= settings.CHAT_HISTORY_SUMMARY_MIN_MESSAGES:
+                summarize_before = first_sequence
+        return chat_history, prompt, summarize_before
+
+
+    # 모델별 max_tokens (llm_model 테이블, 거의 바뀌지 않으므로 프로세스 단위로 한 번만 조회)
+    _model_max_tokens: dict[str, int | None] = {}
+
+    async def _get_model_max_tokens(self, db: AsyncSession, model: str) -> int | None:
+        if model not in self._model_max_tokens:
+            self._model_max_tokens[model] = await chat_crud.aget_model_max_tokens(db, model)
+        return self._model_max_tokens[model]
+
+
+    async def _save_turn(self, db: AsyncSession, session_id: str, messages: list[tuple[str, str]]) -> list[dict]:
+        """
+        한 턴의 메세지를 저장하고, 저장된 메세지 목록(commit 후 캐시에 추가) 반환
+        - Redis 캐시에서 sequence를 할당받으면 바로 INSERT, 없으면 DB에서 sequence 계산 (chat_crud.asave_turn)
+        - 캐시의 카운터가 DB와 어긋나 있었다면 캐시를 지움 (다음 조회 시 DB에서 다시 채움)
+          지워진 캐시에는 append 가 반영되지 않으며, 그 사이 다시 채워져 메세지가 중복되면 조회 시 miss 로 처리됩니다.
+        """
+        first_sequence = await self._cache(self.session_cache.allocate, session_id, len(messages))
+        sequences = await chat_crud.asave_turn(db, session_id, messages, first_sequence=first_sequence)
+        if first_sequence is not None and sequences and sequences[0] != first_sequence:
+            await self._cache(self.session_cache.invalidate, session_id)
+        return [
+            {"sequence": sequence, "role": role, "content": content}
+            for sequence, (role, content) in zip(sequences, messages)
+        ]
+
+
+    # 요약 중인 세션 (같은 세션의 요약 작업이 동시에 여러 개 실행되지 않도록)
+    _summarizing: set[str] = set()
+    _summary_tasks: set[asyncio.Task] = set()
+
+    def _schedule_summary(self, session_id: str, model: str, before_sequence: int) -> None:
+        """요약 갱신을 백그라운드 task 로 실행 (요청 응답을 기다리게 하지 않음)"""
+        if session_id in self._summarizing:
+            return
+        self._summarizing.add(session_id)
+        task = asyncio.create_task(self.refresh_summary(session_id, model, before_sequence))
+        self._summary_tasks.add(task)   # task 가 GC 되지 않도록 참조 유지
+        task.add_done_callback(self._summary_tasks.discard)
+        task.add_done_callback(lambda _: self._summarizing.discard(session_id))
+
+
+    async def refresh_summary(self, session_id: str, model: str, before_sequence: int, session_factory=None) -> str | None:
+        """
+        before_sequence 이전의 아직 요약되지 않은 대화를 기존 요약과 합쳐 새 요약으로 저장
+        - DB 작업은 짧은 AsyncSession 으로 실행하고, LLM 호출 중에는 DB 연결을 잡고 있지 않습니다.
+        Returns:
+            - str: 새 요약 (요약할 대화가 없거나 실패하면 None)
+        """
+        session_factory = session_factory or self.session_factory
+        try:
+            async with session_factory() as db:
+                summary, summary_until = await chat_crud.aget_session_summary(db, session_id)
+                messages = await chat_crud.aget_messages_between(
+                    db, session_id, summary_until, before_sequence, limit=SUMMARY_SOURCE_MAX_MESSAGES
+                )
+            if not messages:
+                return None
+            transcript = "\n".join(f"{m['role']}: {m['content']}" for m in messages)
+            new_summary = await self._llm_reply(
+                model, f"[이전 대화 요약]\n{summary or '(없음)'}\n\n[이후 대화]\n{transcript}", [], SUMMARY_PROMPT,
+                cache=False,  # 세션마다 내용이 다르므로 응답 캐시를 사용하지 않음
             )
-            session_id = str(new_seesion.session_id)
-        # 2. else 전달받은 seesion_id 로 chat_history 이력을 가져온다. 
-        else: 
-            chat_history_orm = chat_crud.get_chat_history(db=db, session_id=session_id)
-            for msg in chat_history_orm:
-                chat_history.append( {"role": msg.role ,"content": msg.content} )
+            async with session_factory() as db:
+                await chat_crud.aupdate_session_summary(db, session_id, new_summary, before_sequence - 1)
+                await db.commit()
+            await self._cache(self.session_cache.set_summary, session_id, new_summary, before_sequence - 1)
+            return new_summary
+        except Exception as e:
+            logger.warning("refresh_summary failed (session_id=%s): %s", session_id, e)
+            return None
 
 
-        # 3. model + agent 조합으로 정해진 prompt 조합
-        # get_prompt(model, self.name) from databse
-        
-        
-        # 4. 사용자 메세지 히스토리 저장 
-        # 이 대화 세션에 마지막 sequence를 가져와서 저장한다 
-        last_sequence = chat_crud.get_last_sequence(db, session_id) or 0
-        last_sequence += 1
-        chat_crud.save_message(db,session_id,"user",message,last_sequence)
+    async def handle_stream(self, session_id:str , user_id: str, model:str , message: str, session_factory=None) -> AsyncIterator[str]:
+        """
+        일반 대화 처리 (SSE 스트리밍 버전, async generator)
+        - 첫 이벤트로 session_id를 전송하고(event: session), 이후 LLM 토큰을 도착하는 즉시 전송합니다.
+        - DB 세션은 스트림 전체 동안 잡고 있지 않고, 시작/종료 시점에 짧게 열고 닫습니다.
+          1) 시작: 세션 생성 또는 이력 조회 + 사용자 메세지 저장 -> commit -> close
+          2) 종료: 누적된 assistant 답변을 한 번에 저장 -> commit -> close
+        - 클라이언트가 중간에 연결을 끊어도 그때까지 생성된 답변은 저장합니다.
+        """
+        # 1. 대화 시작 (짧은 트랜잭션, AsyncSession 이므로 쿼리를 기다리는 동안 이벤트 루프를 막지 않음)
+        session_factory = session_factory or self.session_factory
+        session_id, chat_history, prompt, summarize_before, _ = await self._begin_turn(
+            session_factory, session_id, user_id, model, message
+        )
+        yield _sse(session_id, event="session")
 
-        # 5. llm 질의
-        llm_reply = self._llm_reply( model, message, chat_history)
+        # 2. llm 스트리밍 질의
+        reply_chunks = []
+        completed = False
+        try:
+            async for chunk in self._llm_reply_stream(model, message, chat_history, prompt):
+                reply_chunks.append(chunk)
+                yield _sse(chunk)
+            completed = True
+        finally:
+            # 3. LLM 답변 메세지 히스토리 저장 (스트림 종료 시 1회)
+            # 클라이언트 연결이 끊겨 취소된 경우에도 저장이 끝나도록 cancel scope를 shield 합니다.
+            llm_reply = "".join(reply_chunks)
+            if llm_reply:
+                with anyio.CancelScope(shield=True):
+                    await self._save_stream_reply(session_factory, session_id, llm_reply)
 
-        # 6. LLM 답변 메세지 히스토리 저장 
-        last_sequence += 1
-        chat_crud.save_message(db,session_id,"assistant",llm_reply,last_sequence)
+        if completed:
+            if summarize_before is not None:
+                self._schedule_summary(session_id, model, summarize_before)
+            yield "data: [DONE]\n\n"
 
 
-         # --- 6. 최종 커밋 ---
-        # 이 요청에 대한 모든 DB 작업(세션 생성, 메시지 저장 2건)이 성공했으므로,
-        # 트랜잭션을 최종적으로 DB에 확정(commit)합니다.
-        db.commit()
-        
-        return llm_reply, session_id
+    async def _begin_turn(self, session_factory, session_id:str , user_id: str, model:str , message: str, reserve_reply: bool = False) -> tuple[str, list[dict], str, int | None, list[dict]]:
+        """
+        대화 시작: 세션 확보, 최근 이력 조회, 사용자 메세지 저장 후 (session_id, chat_history, prompt, summarize_before, saved) 반환
+        - reserve_reply=True 이면 assistant 메세지도 빈 내용(NULL)으로 함께 저장하여 이번 턴의 sequence 를 미리 예약합니다.
+          (LLM 을 기다리는 동안 같은 세션에 다른 턴이 저장되어도 user/assistant 메세지가 연속된 sequence 를 가짐)
+          예약된 메세지는 이력 조회에서 제외되며, 답변 저장 전까지는 캐시에도 추가하지 않습니다.
+        """
+        chat_history = []
+        prompt = self.role_prompt
+        summarize_before = None
+        async with session_factory() as db:
+            if session_id is None or session_id.strip() == "":
+                new_seesion = await chat_crud.acreate_chat_session(
+                    db=db,
+                    user_id=user_id,
+                    agent_id=self.name,
+                    model_id=model
+                )
+                session_id = str(new_seesion.session_id)
+                # 새 세션은 메세지가 없으므로 바로 캐시에 등록 (sequence 카운터 = 0)
+                await self._cache(self.session_cache.fill, session_id, [], 0)
+            else:
+                chat_history, prompt, summarize_before = await self._load_history(db, session_id, model, message)
+
+            messages = [("user", message), ("assistant", None)] if reserve_reply else [("user", message)]
+            saved = await self._save_turn(db, session_id, messages)
+            await db.commit()
+        if not reserve_reply:
+            await self._cache(self.session_cache.append, session_id, saved)
+
+        return session_id, chat_history, prompt, summarize_before, saved
+
+
+    async def _save_stream_reply(self, session_factory, session_id: str, llm_reply: str) -> None:
+        """스트리밍이 끝난 뒤 누적된 assistant 답변을 저장 (sequence는 저장 시점에 할당)"""
+        async with session_factory() as db:
+            saved = await self._save_turn(db, session_id, [("assistant", llm_reply)])
+            await db.commit()
+        await self._cache(self.session_cache.append, session_id, saved)
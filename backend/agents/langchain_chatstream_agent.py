@@ -1,72 +1,86 @@
 # backend\agents\langchain_chatstream_agent.py
 import asyncio
-from queue import Queue
-from threading import Thread
 from backend.agents.base_agent import BaseAgent
-from langchain_openai import ChatOpenAI
-from langchain_classic.callbacks.base import BaseCallbackHandler
+from langchain_core.callbacks import AsyncCallbackHandler
 from langchain_classic.chains import ConversationChain
-from langchain_classic.memory import ConversationBufferMemory
-from langchain_community.chat_message_histories import RedisChatMessageHistory
-from backend.core.env_loader import REDIS_HOST, REDIS_PORT, REDIS_DB
+from backend.core.chat_memory import get_conversation_chain
 
-class QueueCallbackHandler(BaseCallbackHandler):
-    """LLM 응답을 Queue에 저장하는 콜백 핸들러"""
-    def __init__(self, queue: Queue):
+# 토큰 큐 최대 크기: 클라이언트가 느리면 큐가 가득 차고, LLM 스트림 소비도 함께 멈춤(backpressure)
+TOKEN_QUEUE_MAXSIZE = 64
+
+# 체인 실행이 끝났음을 알리는 종료 신호
+_STREAM_END = object()
+
+
+class AsyncQueueCallbackHandler(AsyncCallbackHandler):
+    """LLM 응답 토큰을 asyncio.Queue에 저장하는 비동기 콜백 핸들러"""
+    def __init__(self, queue: asyncio.Queue):
         self.queue = queue
 
-    def on_llm_new_token(self, token: str, **kwargs) -> None:
-        """새로운 토큰을 큐에 넣습니다."""
-        self.queue.put(token)
+    async def on_llm_new_token(self, token: str, **kwargs) -> None:
+        """새로운 토큰을 큐에 넣습니다. (큐가 가득 차 있으면 빈 자리가 날 때까지 대기)"""
+        # 스트림 마지막의 빈 chunk는 전송하지 않음
+        if token:
+            await self.queue.put(token)
 
-    def on_llm_end(self, *args, **kwargs) -> None:
-        """LLM 작업이 끝나면 큐에 종료 신호를 넣습니다."""
-        self.queue.put(None)
 
 class LangchainChatStreamAgent(BaseAgent):
     """
-    Redis 기반 LangChain Streaming Agent (Queue 사용)
+    Redis 기반 LangChain Streaming Agent (asyncio.Queue 사용)
+    - 요청마다 스레드를 만들지 않고, 체인을 이벤트 루프 위의 task로 실행(ainvoke)합니다.
     """
-    def __init__(self, user_id: str = "guest"):
+    def __init__(self, user_id: str = "guest", queue_maxsize: int = TOKEN_QUEUE_MAXSIZE):
         super().__init__(
             name="LangchainChatStreamAgent",
             role_prompt="Streaming 기반 대화형 AI 비서"
         )
         self.user_id = user_id
+        self.queue_maxsize = queue_maxsize
 
-    async def handle_stream(self, user_input: str):
-        """스트리밍 방식으로 응답 전송 (async generator)"""
-        q = Queue()
+    def _build_chain(self) -> ConversationChain:
+        """Redis 메모리 + 공유 Streaming LLM 으로 ConversationChain 구성 (요청별로 새로 만드는 것은 memory 뿐)"""
+        return get_conversation_chain(self.user_id, streaming=True)
 
-        redis_url = f"redis://{REDIS_HOST}:{REDIS_PORT}/{REDIS_DB}"
-        history = RedisChatMessageHistory(session_id=f"user:{self.user_id}", url=redis_url, ttl=3600)
-        memory = ConversationBufferMemory(chat_memory=history, return_messages=True)
+    async def handle_stream(self, user_input: str):
+        """
+        스트리밍 방식으로 응답 전송 (async generator)
+        - 체인 task가 토큰을 큐에 넣고, 이 generator가 꺼내서 yield 합니다.
+        - 큐가 가득 차면 콜백이 대기하므로 느린 클라이언트가 LLM 스트림 소비 속도를 조절합니다.
+        - 클라이언트 연결이 끊겨 generator가 닫히면 체인 task(=upstream LLM 호출)를 취소합니다.
+        """
+        q = asyncio.Queue(maxsize=self.queue_maxsize)
+        callback = AsyncQueueCallbackHandler(q)
+        chain = self._build_chain()
 
-        # 백그라운드 스레드에서 실행될 작업
-        def run_chain_in_thread():
-            callback = QueueCallbackHandler(q)
-            llm = ChatOpenAI(
-                model="gpt-4o-mini",
-                temperature=0.3,
-                streaming=True,
-                callbacks=[callback],
-            )
-            chain = ConversationChain(llm=llm, memory=memory, verbose=False)
-            chain.run(input=user_input)
+        async def run_chain():
+            cancelled = False
+            try:
+                # 콜백은 요청 단위로 config 에 전달 (LLM 호출과 메모리 저장까지 모두 끝나야 종료)
+                await chain.ainvoke({"input": user_input}, config={"callbacks": [callback]})
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+            finally:
+                # 클라이언트 연결이 끊겨 취소된 경우에는 큐를 읽는 쪽이 없으므로 종료 신호를 넣지 않음
+                # (큐가 가득 차 있으면 빈 자리를 영원히 기다리며 task 가 끝나지 않음)
+                if not cancelled:
+                    await q.put(_STREAM_END)
 
-        # 스레드 시작
-        thread = Thread(target=run_chain_in_thread)
-        thread.start()
+        task = asyncio.create_task(run_chain())
+        try:
+            # 큐에서 데이터를 기다리고 yield
+            while True:
+                token = await q.get()
+                if token is _STREAM_END:
+                    break
+                yield f"data: {token}\n\n"
+            # 체인 실행 중 발생한 예외가 있다면 여기서 전파
+            await task
+        finally:
+            if not task.done():
+                task.cancel()
 
-        # 큐에서 데이터를 기다리고 yield
-        while True:
-            token = await asyncio.to_thread(q.get)
-            if token is None:
-                # 종료 신호 수신
-                break
-            yield f"data: {token}\n\n"
-        
         yield "data: [DONE]\n\n"
 
     def handle(self, user_input: str) -> str:
-        return "This Agent only supports streaming"
\ No newline at end of file
+        return "This Agent only supports streaming"
@@ -1,11 +1,6 @@
 from backend.agents.base_agent import BaseAgent
 from backend.core.chat_memory import get_conversation_chain
-from backend.core.env_loader import REDIS_HOST, REDIS_PORT, REDIS_DB
-from langchain_openai import ChatOpenAI
 from langchain_classic.callbacks.base import BaseCallbackHandler
-from langchain_classic.chains import ConversationChain
-from langchain_classic.memory import ConversationBufferMemory
-from langchain_community.chat_message_histories import RedisChatMessageHistory
 
 class StreamCallbackHandler(BaseCallbackHandler):
     """LLM 응답을 스트리밍으로 전송하는 콜백 핸들러"""
@@ -30,9 +25,8 @@ class LangchainChatStreamAgent(BaseAgent):
     def handle_stream(self, user_input: str):
         """스트리밍 방식으로 응답 전송 (generator)"""
 
-        redis_url = f"redis://{REDIS_HOST}:{REDIS_PORT}/{REDIS_DB}"
-        history = RedisChatMessageHistory(session_id=f"user:{self.user_id}", url=redis_url, ttl=3600)
-        memory = ConversationBufferMemory(chat_memory=history, return_messages=True)
+        # 공유 Streaming LLM + 사용자별 Redis memory (공유 커넥션 풀 사용)
+        chain = get_conversation_chain(self.user_id, streaming=True)
 
         def event_stream():
             # 클라이언트로 실시간 전송할 yield generator
@@ -40,16 +34,9 @@ class LangchainChatStreamAgent(BaseAgent):
                 yield f"data: {token}\n\n"
 
             # LangChain의 Streaming Callback 설정
+            # (공유 LLM 이므로 콜백은 생성자가 아니라 호출 단위로 전달)
             callback = StreamCallbackHandler(lambda token: (yield f"data: {token}\n\n"))
-            llm = ChatOpenAI(
-                model="gpt-4o-mini",
-                temperature=0.3,
-                streaming=True,
-                callbacks=[callback],
-            )
-
-            chain = ConversationChain(llm=llm, memory=memory, verbose=False)
-            chain.run(input=user_input)
+            chain.run(input=user_input, callbacks=[callback])
             yield "data: [DONE]\n\n"
 
         return event_stream()
@@ -1,6 +1,19 @@
+import logging
 import uuid
 from backend.agents.base_agent import BaseAgent
-from backend.core.onspace_api import get_meeting_rooms, reserve_meeting_room, cancel_meeting_room
+from backend.core.llm_core import LLMTool
+from backend.core.onspace_api import list_meeting_rooms, reserve_meeting_room, cancel_meeting_room, parse_time_range
+
+logger = logging.getLogger(__name__)
+
+# 도구 인자의 시간 형식 (오늘, 24시간제)
+_TIME_RANGE_SCHEMA = {"type": "string", "description": "오늘의 시간대 'HH:MM~HH:MM' (24시간제, 예: 15:00~17:00)"}
+
+
+def _period(time_range: str = None):
+    """도구 인자 time_range -> (시작, 종료), 생략하면 (None, None) = 지금부터 1시간"""
+    return parse_time_range(time_range) if time_range else (None, None)
+
 
 class MeetingAgent(BaseAgent):
     def __init__(self):
@@ -8,65 +21,93 @@ class MeetingAgent(BaseAgent):
             name="MeetingAgent",
             role_prompt=(
                 "당신은 회사 내부 회의실 예약을 도와주는 AI 비서입니다. "
-                "사용자 요청에 따라 회의실 목록을 보여주거나 예약을 진행하세요."
+                "사용자 요청에 따라 회의실 목록을 보여주거나 예약을 진행하세요.\n"
+                "- 회의실 현황은 list_rooms 도구로 필요한 조건(인원, 시간대)에 맞는 회의실만 조회하세요.\n"
+                "- 사용자가 예약을 원하면 조건에 맞는 빈 회의실과 시간을 판단하여 reserve_room 도구로 예약하세요.\n"
+                "- 사용자가 예약 취소를 원하면 cancel_room 도구로 취소하세요. (본인 예약만 취소할 수 있습니다)\n"
+                "- 시간은 'HH:MM~HH:MM' (오늘, 24시간제) 형식으로 전달하고, 도구 결과의 message 를 바탕으로 답변하세요.\n"
+                "- 회의실과 관계 없는 요청에는 도구를 사용하지 않아도 됩니다."
             ),
         )
 
-    def handle(self, session_id:str , user_id: str, model: str, message: str) -> tuple[str, str]:
+    def tools(self, user_id: str) -> list[LLMTool]:
+        """
+        회의실 도구 (list_rooms / reserve_room / cancel_room)
+        - 예약/취소는 요청한 사용자(user_id) 이름으로 수행합니다.
+        - 도구 정의(이름/설명/schema)는 사용자와 관계없이 같으므로 LLM 에 전달하는 내용은 요청마다 같습니다.
+        """
+        def list_rooms(min_capacity: int = 1, time_range: str = None, only_free: bool = False) -> list[dict]:
+            start, end = _period(time_range)
+            return list_meeting_rooms(int(min_capacity), start, end, only_free=bool(only_free))
+
+        def reserve_room(room_name: str, time_range: str = None) -> dict:
+            return reserve_meeting_room(room_name, user_id, *_period(time_range))
+
+        def cancel_room(room_name: str, time_range: str = None) -> dict:
+            return cancel_meeting_room(room_name, user_id, *_period(time_range))
+
+        return [
+            LLMTool(
+                "list_rooms",
+                "수용 인원이 min_capacity 명 이상인 회의실을 작은 순으로 조회합니다. "
+                "free 는 time_range(생략 시 지금부터 1시간)에 비어 있는지, bookings 는 그날의 이후 예약입니다.",
+                {
+                    "type": "object",
+                    "properties": {
+                        "min_capacity": {"type": "integer", "description": "최소 수용 인원"},
+                        "time_range": _TIME_RANGE_SCHEMA,
+                        "only_free": {"type": "boolean", "description": "true 이면 비어 있는 회의실만"},
+                    },
+                },
+                list_rooms,
+            ),
+            LLMTool(
+                "reserve_room",
+                "회의실을 예약합니다. (time_range 생략 시 지금부터 1시간)",
+                {
+                    "type": "object",
+                    "properties": {"room_name": {"type": "string", "description": "회의실 이름"}, "time_range": _TIME_RANGE_SCHEMA},
+                    "required": ["room_name"],
+                },
+                reserve_room,
+            ),
+            LLMTool(
+                "cancel_room",
+                "사용자의 회의실 예약을 취소합니다. (time_range 생략 시 해당 회의실의 가장 빠른 본인 예약)",
+                {
+                    "type": "object",
+                    "properties": {"room_name": {"type": "string", "description": "회의실 이름"}, "time_range": _TIME_RANGE_SCHEMA},
+                    "required": ["room_name"],
+                },
+                cancel_room,
+            ),
+        ]
+
+    async def handle(self, session_id:str , user_id: str, model: str, message: str) -> tuple[str, str]:
         """회의실 업무 처리 """
 
         # 1. seesion_id가 없는 경우 대화 세션 생성
         if session_id is None or session_id.strip() == "":
             # session_id = insert_chat_seession(user_id, self.name, model, title)
-            session_id = str(uuid.uuid4()) 
-            print(f'[meeting_agent.py] create new seesion_id!!!! -> {session_id}')
+            session_id = str(uuid.uuid4())
+            logger.debug("create new session_id -> %s", session_id)
 
         # 2. 이 세션에서 이뤄진 대화 시트로리르저장 한다.
-        chat_history = []  
+        chat_history = []
         # fetch_chat_history(seesion_id) from databse
 
 
         # 3. model + agent 조합으로 prompt 조합
         # get_prompt(model, self.name) from databse
 
-        rooms = get_meeting_rooms()
-        room_info = ", ".join([f"{r['name']}({r['capacity']}명, {'예약가능' if r['available'] else f'예약불가. {r['user']}가 예약중입니다.'})" for r in rooms])
-        
-        self.role_prompt = f"""{self.role_prompt}\n\n 
-        다음은 현재 회의실 목록입니다:
-        {room_info}
-        
-        - 사용자가 단순히 회의실 상태를 물어보면 예약 없이 목록만 정리해 주세요. 
-        - 만약 사용자가 회의실과 관계 없는 요청을 했다면 현재 회의시 목록은 굳이 답변하지 않아도 좋습니다. 
-        - 사용자가 '예약' 또는 '예약해줘' 등의 의도를 표현하면 적절한 회의실 조건과 시간을 판단하여 추천하고,
-          추천한 회의실 이름과 시간을 '###예약:<회의실이름> | <시작시간>~<종료시간>' 형태로 출력해주세요.
-          <시작시간>과 <종료시간>의 양식은 <HH24:00> 으로 표현해주세요
-          예: "A 회의실이 적합합니다. ###예약:A | 15:00~17:00"
-          단, 예약 가능한 회의실만 선택하세요. 
-        - 사용자가 '예약취소' 또는 '에약취소해줘' 등의 의도를 표현하면 적절한 회의실 이름을 판단하고,
-          회의실 이름을 '###취소:<회의실이름>| <시작시간>~<종료시간>' 형태로 출력해주세요.
-          <시작시간>과 <종료시간>의 양식은 <HH24:00> 으로 표현해주세요
-          예: "A 회의실이 적합합니다. ###취소:A | 12:00~15:00"
-          단, 이미 예약 되어 있는 회의실만 취소 합니다.. 
-        """
+        # 회의실 현황은 prompt 에 넣지 않고, LLM 이 도구(list_rooms)로 필요한 회의실만 조회합니다.
+        # (prompt 는 요청마다 같으므로 길이가 늘지 않고, 회의실이 많아도 토큰 수가 일정함)
 
-        # 4. llm 질의하기 
+        # 4. llm 질의하기 (예약/취소는 LLM 이 reserve_room / cancel_room 도구를 호출하여 수행)
         # save_history(seesion_id,'USER',message)
-        llm_reply = self._llm_reply(model, message, chat_history)
+        llm_reply = await self._llm_reply_tools(model, message, self.tools(user_id), chat_history)
 
-        # 5. LLM 답변 히스토리 저장 
+        # 5. LLM 답변 히스토리 저장
         # save_history(seesion_id,'AGENT',llm_reply)
 
-        # 회의실 예약 여부 감지
-        if "###예약:" in llm_reply:
-            room_name = llm_reply.split("###예약:")[-1].strip().split()[0]
-            result = reserve_meeting_room(room_name)
-            llm_reply = llm_reply + "\n\n" + result["message"]
-        
-        # 회의실 취소 여부 감지
-        if "###취소:" in llm_reply:
-            room_name = llm_reply.split("###취소:")[-1].strip().split()[0]
-            result = cancel_meeting_room(room_name)
-            llm_reply = llm_reply + "\n\n" + result["message"]
-        
         return llm_reply, session_id
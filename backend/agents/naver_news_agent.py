@@ -1,6 +1,10 @@
+import logging
 import uuid
 from backend.agents.base_agent import BaseAgent
-from backend.core.naver_news_api import search_naver_news
+from backend.core.logging_config import truncate
+from backend.core.naver_news_api import naver_client
+
+logger = logging.getLogger(__name__)
 
 class NaverNewsAgent(BaseAgent):
     def __init__(self):
@@ -15,7 +19,7 @@ class NaverNewsAgent(BaseAgent):
             ),
         )
 
-    def handle(self, payload) -> tuple[list[dict], str, str] :
+    async def handle(self, payload) -> tuple[list[dict], str, str] :
         """
         네이버 API를 통해 검색 결과 회신
 
@@ -28,13 +32,9 @@ class NaverNewsAgent(BaseAgent):
             str: 네이버 뉴스 검색 결과 또는 에러 메시지
         """
 
-        print(
-            f'[naver_news_agent.py]\n'
-            f'  - session_id:   {payload.session_id}\n'
-            f'  - user_id   :   {payload.user_id}\n'
-            f'  - model     :   {payload.model}\n'
-            f'  - keywords  :   {payload.keywords}\n'
-            f'  - message   :   {payload.message}\n'
+        logger.debug(
+            "handle session_id=%s user_id=%s model=%s keywords=%s message=%s",
+            payload.session_id, payload.user_id, payload.model, payload.keywords, truncate(payload.message),
         )
 
         session_id = payload.session_id
@@ -56,10 +56,11 @@ class NaverNewsAgent(BaseAgent):
         final_prompt = self.role_prompt
 
         if keywords:
-            for idx, keyword in enumerate(keywords, start=1):
+            # 키워드별 검색을 순서대로 기다리지 않고 공유 커넥션 풀로 동시에 요청 (결과 수 상한 적용)
+            results = await naver_client.search_many(keywords, display=3)
+            for idx, (keyword, fetch_articles) in enumerate(zip(keywords, results), start=1):
                 # print(f'키워드{idx}: {keyword}')
                 final_prompt += f"\n\n\n# 검색 키워드 {idx}: {keyword}"
-                fetch_articles = search_naver_news(keyword,3)
                 if fetch_articles:
                     # total_articles에 단일 리스트로 합치기
                     total_articles.extend(fetch_articles)
@@ -73,7 +74,7 @@ class NaverNewsAgent(BaseAgent):
              
 
         # 3.2 키워드 검색 결과가 포함된 프롬프트로 llm query 질의 
-        llm_reply = self._llm_reply(model, message, chat_history, final_prompt)
+        llm_reply = await self._llm_reply(model, message, chat_history, final_prompt)
         
         
         return total_articles, llm_reply, session_id
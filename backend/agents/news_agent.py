@@ -1,6 +1,11 @@
+import asyncio
+import logging
 from backend.agents.base_agent import BaseAgent
-from backend.core.naver_news_api import search_naver_news
-from backend.core.news_db_manager import embed, record_news, find_similar_news
+from backend.core.config import settings
+from backend.core.news_db_manager import fetch_pending_news, subscribe_news
+from backend.core.news_ingest import news_ingest_scheduler
+
+logger = logging.getLogger(__name__)
 
 class NewsAgent(BaseAgent):
     def __init__(self):
@@ -12,48 +17,52 @@ class NewsAgent(BaseAgent):
             ),
         )
 
-    def handle(self, data) -> str:
+    async def handle(self, data) -> str:
         user_input = data.get("message", "")
         user_keywords = data.get("keywords", "")
         user_name = data.get("user_name", "")
     
-        """네이버 API를 통해 검색 결과 회신"""
-        fetch_news = search_naver_news(user_keywords,20) if user_keywords else "입력한 키워드가 없습니다."
-        
-        record_count = 0
-        new_aticles = []
+        """백그라운드 수집(backend/core/news_ingest.py)으로 이미 임베딩/중복 검사를 마친 기사 중 아직 전달하지 않은 기사 회신"""
+        if not user_keywords:
+            return "입력한 키워드가 없습니다."
+        # 처음 요청한 키워드는 구독으로 등록하고, 아직 수집된 기사가 없으므로 이번 요청에서 한 번 수집
+        # - 이후 요청은 백그라운드 수집 결과만 조회합니다.
+        # - 주기 수집이 진행 중이면 그 수집이 끝날 때까지 기다려야 하므로 NEWS_FIRST_INGEST_TIMEOUT 까지만 기다리고,
+        #   시간을 넘기거나 수집에 실패하면 스케줄러에 다시 요청하고 수집 중이라고 안내합니다.
+        if await asyncio.to_thread(subscribe_news, user_name, user_keywords):
+            logger.debug("뉴스 구독 등록 user_name=%s keyword=%s", user_name, user_keywords)
+            try:
+                await asyncio.wait_for(news_ingest_scheduler.run_once([user_keywords]), settings.NEWS_FIRST_INGEST_TIMEOUT)
+            except Exception as e:
+                if isinstance(e, asyncio.TimeoutError):
+                    logger.warning("새 구독 키워드 수집 시간 초과 keyword=%s (%.1fs)", user_keywords, settings.NEWS_FIRST_INGEST_TIMEOUT)
+                else:
+                    logger.exception("새 구독 키워드 수집 실패 keyword=%s", user_keywords)
+                news_ingest_scheduler.request(user_keywords)
+                return f"'{user_keywords}' 뉴스 구독을 등록하고 기사 수집을 시작했습니다. 잠시 후 다시 요청해 주세요."
 
-        for article in fetch_news:
-            
-            text = f"{article['title']} {article['description']}" # 기사를 벡터화
-            similar = find_similar_news(user_name, text)    # DB에서 유사한 기사가 있는지 검색
-            if similar is None:
-                # 유사한 기사가 없을경우 DB 저장
-                record_news(article,user_name,user_keywords)
-                new_aticles.append(article)
-                record_count+=1
-                # print(f"[+] 기사 저장 [{record_count}] {user_name} , {article['title']}")
-                info = (
-                    f" 제목: {article['title']}\n"
-                    f" 설명: {article.get('description', '설명 없음')}\n"
-                    f" 날짜: {article.get('pubDate', '날짜 정보 없음')}\n"
-                    f" 링크: {article.get('link', '링크 없음')}\n"
-                    f"{'-'*60}\n"
-                )
-                print(f"기사저장 ({record_count}) Title: {article['title']}")
-                print(f"-"*60)
-                new_aticles.append(info)
-            else:
-                pass    
-                
-            if record_count >= 3:
-                break
+        # DB 조회는 동기(블로킹) 작업이므로 스레드에서 실행하여 이벤트 루프를 막지 않도록 함
+        new_articles = await asyncio.to_thread(fetch_pending_news, user_name, user_keywords, settings.NEWS_DELIVER_LIMIT)
+        record_count = len(new_articles)
+
+        new_aticles = []
+        for idx, article in enumerate(new_articles, start=1):
+            info = (
+                f" 제목: {article['title']}\n"
+                f" 설명: {article.get('description', '설명 없음')}\n"
+                f" 날짜: {article.get('pubDate', '날짜 정보 없음')}\n"
+                f" 링크: {article.get('link', '링크 없음')}\n"
+                f"{'-'*60}\n"
+            )
+            logger.debug("기사전달 (%d) Title: %s", idx, article['title'])
+            new_aticles.append(article)
+            new_aticles.append(info)
         
         if record_count == 0:
             return "신규 기사가 없습니다."
         
         response = (
-        f"총 {record_count}개의 새 기사를 저장했습니다.\n\n"
+        f"총 {record_count}개의 새 기사가 있습니다.\n\n"
         + "".join(str(item) for item in new_aticles)
         )
         return response 
@@ -0,0 +1,328 @@
+# backend/core/booking_engine.py
+import datetime
+import logging
+import threading
+from bisect import bisect_left, bisect_right
+from typing import Callable, Iterable, Iterator
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from backend.database.crud import meeting_crud
+
+logger = logging.getLogger(__name__)
+
+# ------------------------------------------------------------------
+# 회의실 예약 엔진 (프로세스 단위, onspace_api 에서 사용)
+# - 회의실마다 예약 구간 [start, end) 을 시작 시각 순으로 정렬된 배열(starts / ends)로 보관합니다.
+#   같은 회의실의 예약은 서로 겹치지 않으므로 ends 도 정렬되어 있고,
+#   "start 이후에 끝나는 첫 예약" 을 bisect 로 찾으면 그 예약 하나만 보고 겹침 여부를 판단할 수 있습니다. (O(log n))
+# - 수용 인원 순으로 정렬된 (capacity, 이름) 색인으로 "N명 이상, [t1, t2) 에 비어 있는 가장 작은 회의실" 을 찾습니다.
+# - 예약/취소는 회의실 단위 lock 안에서 "DB 와 맞추기 -> 겹침 확인 -> DB 저장 -> 메모리 반영" 순으로 수행하므로
+#   같은 프로세스에서 동시에 같은 구간을 예약하면 한 건만 성공합니다.
+#   (여러 워커 사이의 겹침은 PostgreSQL exclusion 제약이 막고, 실패한 쪽은 IntegrityError -> "이미 예약됨")
+# - 메모리의 예약 목록은 워커(프로세스)마다 따로 있으므로, DB 를 사용하면 예약/취소 직전에 그 회의실의 예약을
+#   DB 에서 다시 읽어 다른 워커의 예약/취소를 반영합니다. (조회/빈 회의실 찾기는 메모리 기준)
+# - 시각은 정수(epoch 초)로 바꿔 보관합니다. (datetime 객체보다 작고 비교가 빠름, 1M 건 기준 benchmarks/bench_booking.py)
+# ------------------------------------------------------------------
+
+
+def _to_key(value: datetime.datetime) -> int:
+    return int(value.timestamp())
+
+
+def _from_key(key: int) -> datetime.datetime:
+    return datetime.datetime.fromtimestamp(key)
+
+
+class RoomSchedule:
+    """회의실 하나의 예약 목록 (시작 시각 순 정렬 배열, 변경은 lock 을 잡고 수행)"""
+    __slots__ = ("name", "capacity", "starts", "ends", "users", "lock")
+
+    def __init__(self, name: str, capacity: int):
+        self.name = name
+        self.capacity = capacity
+        self.starts = []  # 예약 시작 (epoch 초, 오름차순)
+        self.ends = []    # 예약 종료 (epoch 초, 오름차순)
+        self.users = []   # 예약자
+        self.lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def conflict(self, start: int, end: int) -> int:
+        """[start, end) 와 겹치는 예약의 위치 (없으면 -1)"""
+        index = bisect_right(self.ends, start)  # start 이후에 끝나는 첫 예약
+        if index < len(self.starts) and self.starts[index] < end:
+            return index
+        return -1
+
+    def find(self, start: int, end: int) -> int:
+        """정확히 [start, end) 인 예약의 위치 (없으면 -1)"""
+        index = bisect_left(self.starts, start)
+        if index < len(self.starts) and self.starts[index] == start and self.ends[index] == end:
+            return index
+        return -1
+
+    def insert(self, start: int, end: int, user: str) -> None:
+        """겹치지 않는 것을 확인한 예약 추가"""
+        index = bisect_left(self.starts, start)
+        self.starts.insert(index, start)
+        self.ends.insert(index, end)
+        self.users.insert(index, user)
+
+    def remove(self, index: int) -> None:
+        del self.starts[index], self.ends[index], self.users[index]
+
+    def reset(self, bookings: Iterable[tuple[int, int, str]]) -> None:
+        """예약 목록을 bookings 로 교체 (DB 에서 다시 읽은 예약)"""
+        self.starts, self.ends, self.users = [], [], []
+        self.load(bookings)
+
+    def load(self, bookings: Iterable[tuple[int, int, str]]) -> None:
+        """예약 일괄 적재 (정렬은 한 번만, 서로 겹치는 예약은 먼저 온 것만 남김)"""
+        merged = list(zip(self.starts, self.ends, self.users))
+        merged.extend(bookings)
+        merged.sort(key=lambda booking: booking[0])
+        starts, ends, users = [], [], []
+        for start, end, user in merged:
+            if ends and start < ends[-1]:
+                logger.warning("겹치는 예약을 건너뜁니다: %s %s~%s (%s)", self.name, _from_key(start), _from_key(end), user)
+                continue
+            starts.append(start)
+            ends.append(end)
+            users.append(user)
+        self.starts, self.ends, self.users = starts, ends, users
+
+    def between(self, start: int, end: int) -> list[tuple[int, int, str]]:
+        """[start, end) 와 겹치는 예약 목록"""
+        first = bisect_right(self.ends, start)
+        last = bisect_left(self.starts, end)
+        return list(zip(self.starts[first:last], self.ends[first:last], self.users[first:last]))
+
+
+class BookingEngine:
+    """
+    회의실 예약 엔진
+    - session_factory 를 지정하면 예약/취소를 DB(llm_agent.meeting_booking)에 저장합니다. (None: 메모리에만 보관)
+    - 서버 시작 시 load() 로 DB 의 회의실 / 끝나지 않은 예약을 읽어 옵니다.
+    - 예약/취소 결과는 기존 onspace_api 와 같은 {"status": "success" | "fail", "message": str} 형태입니다.
+    """
+    def __init__(self, session_factory: Callable[[], Session] = None):
+        self.session_factory = session_factory
+        self._rooms = {}         # 회의실 이름(소문자) -> RoomSchedule
+        self._by_capacity = []   # [(capacity, 회의실 이름(소문자))] 오름차순
+        self._lock = threading.Lock()  # 회의실 추가/색인 변경용
+
+    # ------------------------------------------------------------------
+    # 회의실
+    # ------------------------------------------------------------------
+    def add_room(self, name: str, capacity: int) -> RoomSchedule:
+        """회의실 추가 (메모리, 이미 있으면 기존 회의실 반환)"""
+        key = name.lower()
+        with self._lock:
+            room = self._rooms.get(key)
+            if room is None:
+                room = self._rooms[key] = RoomSchedule(name, capacity)
+                self._by_capacity.insert(bisect_left(self._by_capacity, (capacity, key)), (capacity, key))
+            return room
+
+    def add_rooms(self, rooms: Iterable[tuple[str, int]]) -> None:
+        """회의실 일괄 추가 (색인 정렬은 한 번만)"""
+        with self._lock:
+            for name, capacity in rooms:
+                key = name.lower()
+                if key not in self._rooms:
+                    self._rooms[key] = RoomSchedule(name, capacity)
+                    self._by_capacity.append((capacity, key))
+            self._by_capacity.sort()
+
+    def room(self, name: str) -> RoomSchedule | None:
+        return self._rooms.get(name.lower())
+
+    def rooms(self) -> list[RoomSchedule]:
+        """회의실 목록 (추가한 순서)"""
+        return list(self._rooms.values())
+
+    def __len__(self) -> int:
+        """전체 예약 수"""
+        return sum(len(room) for room in self._rooms.values())
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def is_free(self, room_name: str, start: datetime.datetime, end: datetime.datetime) -> bool:
+        room = self.room(room_name)
+        return room is not None and room.conflict(_to_key(start), _to_key(end)) < 0
+
+    def bookings(self, room_name: str, start: datetime.datetime, end: datetime.datetime) -> list[dict]:
+        """[start, end) 와 겹치는 예약 목록 (시작 시각 순)"""
+        room = self.room(room_name)
+        if room is None:
+            return []
+        return [
+            {"room": room.name, "start": _from_key(s), "end": _from_key(e), "user": user}
+            for s, e, user in room.between(_to_key(start), _to_key(end))
+        ]
+
+    def rooms_by_capacity(self, min_capacity: int) -> Iterator[RoomSchedule]:
+        """
+        min_capacity 명 이상 수용 가능한 회의실 (수용 인원 오름차순, 색인에서 bisect 로 시작 위치를 찾음)
+        - 색인과 회의실 목록은 lock 안에서 함께 읽습니다. (load() 가 둘을 교체하는 도중에 섞어 읽지 않도록)
+        """
+        with self._lock:
+            index, rooms = self._by_capacity, self._rooms
+            selected = [rooms[key] for _, key in index[bisect_left(index, (min_capacity, "")):]]
+        yield from selected
+
+    def find_free_room(self, people: int, start: datetime.datetime, end: datetime.datetime) -> str | None:
+        """
+        people 명 이상 수용 가능하고 [start, end) 에 비어 있는 가장 작은 회의실 이름 (없으면 None)
+        - 수용 인원 색인에서 people 이상인 첫 회의실부터 작은 순으로 확인합니다.
+        """
+        start_key, end_key = _to_key(start), _to_key(end)
+        for room in self.rooms_by_capacity(people):
+            if room.conflict(start_key, end_key) < 0:
+                return room.name
+        return None
+
+    # ------------------------------------------------------------------
+    # 예약 / 취소
+    # ------------------------------------------------------------------
+    def reserve(self, room_name: str, start: datetime.datetime, end: datetime.datetime, user_name: str = "Guest") -> dict:
+        """
+        회의실 예약 (회의실 단위 lock 안에서 겹침 확인 -> DB 저장 -> 메모리 반영)
+        Argument:
+            - room_name (str): 회의실 이름 (대소문자 무시)
+            - start / end (datetime): 예약 구간 [start, end)
+            - user_name (str): 예약자
+        Returns:
+            - dict: {"status": "success" | "fail", "message": str}
+        """
+        room = self.room(room_name)
+        if room is None:
+            return {"status": "fail", "message": f"{room_name} 회의실을 찾을 수 없음"}
+        start_key, end_key = _to_key(start), _to_key(end)
+        if start_key >= end_key:
+            return {"status": "fail", "message": "예약 종료 시간이 시작 시간보다 빨라야 합니다."}
+
+        period = f"{start:%Y-%m-%d %H:%M}~{end:%H:%M}"
+        with room.lock:
+            self._sync_room(room, start)
+            index = room.conflict(start_key, end_key)
+            if index >= 0:
+                booked = f"{_from_key(room.starts[index]):%H:%M}~{_from_key(room.ends[index]):%H:%M}"
+                return {"status": "fail", "message": f"{room.name}은 {booked}에 이미 예약됨 ({room.users[index]})"}
+            if not self._persist(meeting_crud.insert_booking, room.name, user_name, start, end):
+                return {"status": "fail", "message": f"{room.name}은 {period}에 이미 예약됨"}
+            room.insert(start_key, end_key, user_name)
+        return {"status": "success", "message": f"{user_name}님이 {room.name} 회의실을 {period}에 예약 완료"}
+
+    def reserve_smallest(self, people: int, start: datetime.datetime, end: datetime.datetime, user_name: str = "Guest") -> dict:
+        """
+        people 명 이상, [start, end) 에 비어 있는 가장 작은 회의실 예약
+        - 찾은 회의실을 다른 요청이 먼저 예약했으면 다음으로 작은 회의실을 시도합니다.
+        """
+        start_key, end_key = _to_key(start), _to_key(end)
+        for room in self.rooms_by_capacity(people):
+            if room.conflict(start_key, end_key) >= 0:
+                continue
+            result = self.reserve(room.name, start, end, user_name)
+            if result["status"] == "success":
+                return result
+        return {"status": "fail", "message": f"{people}명 이상 사용할 수 있는 빈 회의실이 없습니다."}
+
+    def cancel(self, room_name: str, start: datetime.datetime, end: datetime.datetime, user_name: str = None) -> dict:
+        """
+        예약 취소 (정확히 [start, end) 인 예약)
+        - user_name 을 지정하면 본인 예약만 취소합니다.
+        - DB 에서 삭제된 예약이 없으면 (다른 워커가 먼저 취소) 실패를 반환합니다.
+        Returns:
+            - dict: {"status": "success" | "fail", "message": str}
+        """
+        room = self.room(room_name)
+        if room is None:
+            return {"status": "fail", "message": f"{room_name} 회의실을 찾을 수 없음"}
+
+        period = f"{start:%Y-%m-%d %H:%M}~{end:%H:%M}"
+        with room.lock:
+            self._sync_room(room, start)
+            index = room.find(_to_key(start), _to_key(end))
+            if index < 0:
+                return {"status": "fail", "message": f"{room.name} 회의실의 {period} 예약을 찾을 수 없음"}
+            if user_name is not None and room.users[index] != user_name:
+                return {"status": "fail", "message": f"{room.name} 회의실의 {period} 예약은 {room.users[index]}님의 예약입니다."}
+            deleted = self._persist(meeting_crud.delete_booking, room.name, start)
+            # 메모리에서는 지움 (0건이면 이미 DB 에 없는 예약이므로 메모리도 DB 와 맞춤)
+            room.remove(index)
+            if not deleted:
+                return {"status": "fail", "message": f"{room.name} 회의실의 {period} 예약은 이미 취소되었습니다."}
+        return {"status": "success", "message": f"{room.name} 회의실의 {period} 예약 취소 완료"}
+
+    def _sync_room(self, room: RoomSchedule, start: datetime.datetime) -> None:
+        """
+        회의실 하나의 예약을 DB 에서 다시 읽어 메모리 목록을 교체 (room.lock 을 잡은 상태에서 호출, DB 를 쓰지 않으면 생략)
+        - 다른 워커의 예약/취소는 이 프로세스의 메모리에 반영되지 않으므로 예약/취소 직전에 맞춥니다.
+        - 이미 끝난 예약은 읽지 않지만, 요청 구간(start)이 과거이면 그 이후에 끝나는 예약까지 읽습니다.
+        """
+        if self.session_factory is None:
+            return
+        db = self.session_factory()
+        try:
+            bookings = meeting_crud.get_bookings(db, min(start, datetime.datetime.now()), room_name=room.name)
+        finally:
+            db.close()
+        room.reset((_to_key(s), _to_key(e), user) for _, s, e, user in bookings)
+
+    def _persist(self, operation, *args):
+        """
+        DB 저장 (session_factory 가 없으면 생략)
+        Returns:
+            - operation 의 반환값 (DB 를 쓰지 않으면 True), 제약 위반이면 False
+        """
+        if self.session_factory is None:
+            return True
+        db = self.session_factory()
+        try:
+            result = operation(db, *args)
+            db.commit()
+            return result
+        except IntegrityError:
+            db.rollback()
+            return False
+        finally:
+            db.close()
+
+    # ------------------------------------------------------------------
+    # DB 적재
+    # ------------------------------------------------------------------
+    def load(self, session_factory: Callable[[], Session] = None, now: datetime.datetime = None) -> None:
+        """
+        DB 의 회의실 / 끝나지 않은 예약을 읽어 오고, 이후 예약/취소를 DB 에 저장 (서버 시작 시)
+        - DB 에 회의실이 하나도 없으면 메모리에 있는 회의실(기본 회의실 목록)을 DB 에 추가합니다.
+        """
+        session_factory = session_factory or self.session_factory
+        db = session_factory()
+        try:
+            rooms = meeting_crud.get_rooms(db)
+            if not rooms:
+                rooms = [(room.name, room.capacity) for room in self.rooms()]
+                meeting_crud.add_rooms(db, rooms)
+                db.commit()
+            bookings = meeting_crud.get_bookings(db, now or datetime.datetime.now())
+        finally:
+            db.close()
+
+        # DB 의 회의실 목록으로 교체 (DB 에 없는 회의실에는 예약을 저장할 수 없으므로 메모리에서도 제외)
+        loaded = {name.lower(): RoomSchedule(name, capacity) for name, capacity in rooms}
+        by_room = {}
+        for room_name, start, end, user in bookings:
+            by_room.setdefault(room_name.lower(), []).append((_to_key(start), _to_key(end), user))
+        for key, room_bookings in by_room.items():
+            if key in loaded:
+                loaded[key].load(room_bookings)
+        with self._lock:
+            self._rooms = loaded
+            self._by_capacity = sorted((room.capacity, key) for key, room in loaded.items())
+        self.session_factory = session_factory
+        logger.info("회의실 %d개, 예약 %d건을 불러왔습니다.", len(self._rooms), len(bookings))
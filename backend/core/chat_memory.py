@@ -1,41 +1,63 @@
 # backend/core/chat_memory.py
+import json
+from typing import List
+
 from langchain_classic.chains import ConversationChain
 from langchain_classic.memory import ConversationBufferMemory
 from langchain_community.chat_message_histories import RedisChatMessageHistory
-from langchain_openai import ChatOpenAI
-from backend.core.env_loader import REDIS_HOST, REDIS_PORT, REDIS_DB
+from langchain_core.messages import BaseMessage, messages_from_dict
+from backend.core.llm_clients import llm_clients
+from backend.core.redis_cache import redis_pools
 
 
-def get_conversation_chain(user_id: str):
+class PooledRedisChatMessageHistory(RedisChatMessageHistory):
+    """
+    RedisChatMessageHistory 와 동일한 key/포맷을 사용하지만,
+    요청마다 URL로 새 Redis 클라이언트(=새 커넥션)를 만들지 않고 공유 커넥션 풀(redis_pools)의 클라이언트를 사용합니다.
+    """
+    def __init__(self, session_id: str, client=None, key_prefix: str = "message_store:", ttl: int = None):
+        self.redis_client = client or redis_pools.client()
+        self.session_id = session_id
+        self.key_prefix = key_prefix
+        self.ttl = ttl
+
+    @property
+    def messages(self) -> List[BaseMessage]:
+        """Redis 에서 메세지 조회 (공유 풀은 decode_responses=True 이므로 str 로 반환됨)"""
+        items = self.redis_client.lrange(self.key, 0, -1)
+        return messages_from_dict([
+            json.loads(m.decode("utf-8") if isinstance(m, bytes) else m) for m in items[::-1]
+        ])
+
+
+def get_conversation_chain(user_id: str, streaming: bool = False):
     """
     Redis 기반 LangChain Memory + ConversationChain 생성기
     LangChain 1.x (classic + community) 버전 기준
+    - LLM 클라이언트는 프로세스 공유 레지스트리(llm_clients)에서 가져오고,
+      요청마다 새로 만드는 것은 사용자별 memory 와 이를 묶는 가벼운 체인 객체뿐입니다.
     """
 
-    # 1️⃣ Redis 연결 URL 구성
-    redis_url = f"redis://{REDIS_HOST}:{REDIS_PORT}/{REDIS_DB}"
-
-    # 2️⃣ Redis에 대화 이력 관리 (최신 10개 자동 유지)
-    history = RedisChatMessageHistory(
+    # 1️⃣ Redis에 대화 이력 관리 (공유 커넥션 풀 사용, 1시간 TTL)
+    history = PooledRedisChatMessageHistory(
         session_id=f"user:{user_id}",
-        url=redis_url,
         ttl=3600  # 1시간 TTL
     )
 
-    # 3️⃣ Memory 구성 — LangChain의 ConversationBufferMemory
+    # 2️⃣ Memory 구성 — LangChain의 ConversationBufferMemory
     memory = ConversationBufferMemory(
         chat_memory=history,
         return_messages=True  # 반드시 True로 설정
     )
 
-    # 4️⃣ LLM 초기화 — OpenAI Chat Model 사용
-    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.3)
+    # 3️⃣ LLM — 공유 OpenAI Chat Model (요청마다 새 클라이언트/커넥션을 만들지 않음)
+    llm = llm_clients.get("gpt-4o-mini", temperature=0.3, streaming=streaming)
 
-    # 5️⃣ LLM + Memory를 결합한 ConversationChain
+    # 4️⃣ LLM + Memory를 결합한 ConversationChain
     chain = ConversationChain(
         llm=llm,
         memory=memory,
         verbose=False
     )
 
-    return chain
\ No newline at end of file
+    return chain
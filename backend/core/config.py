@@ -9,6 +9,14 @@ class Settings(BaseSettings):
     # 여기에 필요한 모든 환경 변수를 "타입 힌트"와 함께 정의합니다.
     # pydantic이 자동으로 .env 파일에서 이 변수 이름(대소문자 무시)을 찾아 값을 채워줍니다.
     DATABASE_URL: str
+    ASYNC_DATABASE_URL: str | None = None   # 비워두면 DATABASE_URL 의 드라이버만 asyncpg / aiosqlite 로 바꿔 사용
+
+    # DB 커넥션 풀 settings (sync / async 엔진 각각 적용, SQLite 는 풀 크기 설정을 사용하지 않음)
+    DB_POOL_SIZE: int = 5             # 항상 유지하는 커넥션 수
+    DB_MAX_OVERFLOW: int = 10         # 풀이 가득 찼을 때 추가로 열 수 있는 커넥션 수
+    DB_POOL_TIMEOUT: float = 30.0     # 커넥션을 기다리는 최대 시간(초)
+    DB_POOL_RECYCLE: int = 1800       # 이 시간(초)보다 오래된 커넥션은 다시 연결 (DB/프록시 idle timeout 대비)
+    DB_POOL_PRE_PING: bool = True     # 풀에서 꺼낼 때 연결이 살아있는지 확인 (끊긴 커넥션으로 인한 요청 실패 방지)
 
     # OpenAI 설정
     OPENAI_API_KEY: str
@@ -26,10 +34,86 @@ class Settings(BaseSettings):
     REDIS_HOST:str = "localhost"
     REDIS_PORT: int = 6379
     REDIS_DB: int = 0
+    REDIS_MAX_CONNECTIONS: int = 50          # 프로세스 단위 Redis 커넥션 풀 크기 (sync / asyncio 각각)
+    REDIS_POOL_TIMEOUT: float = 5.0          # 풀이 가득 찼을 때 커넥션을 기다리는 최대 시간(초)
+    REDIS_SOCKET_TIMEOUT: float = 0.5        # Redis 명령/연결 timeout(초) (Redis 가 느려도 요청이 오래 막히지 않도록)
+
+    # Redis 세션 캐시 (최근 대화 이력 + sequence 카운터, backend/core/session_cache.py)
+    SESSION_CACHE_ENABLED: bool = True
+    SESSION_CACHE_TTL: int = 3600            # 마지막 대화 이후 이 시간(초)이 지나면 캐시에서 제거
+    SESSION_CACHE_RETRY_AFTER: float = 30.0  # Redis 장애 시 이 시간(초) 동안은 Redis를 건너뛰고 DB만 사용
+
+    # Chat history settings (LLM에 전달하는 대화 이력 window)
+    CHAT_HISTORY_MAX_TURNS: int = 20                 # 최근 N턴(user+assistant)까지만 전달 (0: 제한 없음)
+    CHAT_HISTORY_TOKEN_RATIO: float = 0.5            # 대화 이력에 사용할 토큰 예산 = 모델 max_tokens x 비율
+    CHAT_HISTORY_DEFAULT_MAX_TOKENS: int = 8192      # llm_model 테이블에 max_tokens 가 없을 때 사용
+    CHAT_HISTORY_SUMMARY: bool = False               # True: window 밖의 오래된 대화를 요약하여 프롬프트에 포함
+    CHAT_HISTORY_SUMMARY_MIN_MESSAGES: int = 20      # 요약되지 않은 오래된 메세지가 이 개수 이상 쌓이면 요약 갱신
+
+    # LLM 응답 캐시 (opt-in, backend/core/response_cache.py)
+    LLM_CACHE_AGENTS: list[str] = []                 # 응답 캐시를 사용할 에이전트 이름 (예: '["ChatAgent","MeetingAgent"]')
+    LLM_CACHE_TTL: int = 3600                        # 캐시된 답변 유지 시간(초)
+    LLM_CACHE_MAXSIZE: int = 1024                    # 최대 캐시 항목 수 (LRU)
+    LLM_CACHE_SEMANTIC: bool = True                  # True: 정확히 같은 질문이 없으면 임베딩 유사도로 비슷한 질문 검색
+    LLM_CACHE_SIMILARITY: float = 0.95               # semantic hit 로 판단하는 최소 코사인 유사도
+    LLM_CACHE_HISTORY_MESSAGES: int = 4              # 유사도 비교에 포함하는 최근 대화 메세지 수
+
+    # LLM function calling (backend/core/llm_core.py acall_llm_tools)
+    LLM_TOOL_MAX_ROUNDS: int = 5                     # 한 요청에서 도구 호출 -> 재호출을 반복하는 최대 횟수
 
     # Naver API 
     NAVER_CLIENT_ID: str 
     NAVER_CLIENT_SECRET: str
+    NAVER_NEWS_URL: str = "https://openapi.naver.com/v1/search/news.json"
+    NAVER_TIMEOUT: float = 5.0              # 요청 timeout(초) (연결/응답 대기)
+    NAVER_MAX_CONNECTIONS: int = 20         # 공유 HTTP 커넥션 풀 크기 (keep-alive 로 TLS 연결 재사용)
+    NAVER_RETRIES: int = 2                  # 네트워크 오류/429/5xx 응답 시 재시도 횟수
+    NAVER_RETRY_BACKOFF: float = 0.2        # 재시도 대기(초) = backoff x 2^(시도-1)
+    NAVER_MAX_ARTICLES: int = 30            # 여러 키워드를 동시에 검색할 때 합친 결과의 최대 기사 수
+    # 뉴스 검색 결과 캐시 (프로세스 LRU + Redis, backend/core/result_cache.py)
+    NAVER_CACHE_ENABLED: bool = True
+    NAVER_CACHE_TTL: int = 300              # 같은 (keyword, display, sort) 검색 결과 재사용 시간(초)
+    NAVER_CACHE_MAXSIZE: int = 1024         # 프로세스 내부 LRU 최대 항목 수
+    NAVER_CACHE_REDIS: bool = True          # True: Redis 에도 저장하여 여러 워커가 공유
+
+    # 뉴스 백그라운드 수집 (구독 키워드 검색 -> 정규화 -> 임베딩 -> 중복 검사 -> 저장, backend/core/news_ingest.py)
+    NEWS_INGEST_ENABLED: bool = True        # False: 수집 스케줄러를 시작하지 않음 (/api/news 는 이미 수집된 기사만 조회)
+    NEWS_INGEST_INTERVAL: float = 300.0     # 전체 구독 키워드 수집 주기(초) (새 구독은 바로 수집)
+    NEWS_INGEST_DISPLAY: int = 20           # 키워드당 검색 기사 수
+    NEWS_INGEST_BATCH_SIZE: int = 64        # 한 번에 임베딩하는 기사 수
+    NEWS_INGEST_QUEUE_SIZE: int = 8         # 단계 사이 대기열 크기(batch 수) (가득 차면 앞 단계가 대기)
+    NEWS_DELIVER_LIMIT: int = 3             # /api/news 요청 한 번에 전달하는 최대 기사 수
+    NEWS_FIRST_INGEST_TIMEOUT: float = 5.0  # 새 구독 키워드를 요청 중에 수집할 때 기다리는 최대 시간(초) (넘으면 백그라운드 수집으로 넘김)
+
+    # 로깅 settings (backend/core/logging_config.py, 출력은 별도 스레드에서 수행)
+    LOG_LEVEL: str = "INFO"                 # backend.* 로거 기본 레벨 (DEBUG 이면 LLM 프롬프트/이력 등 상세 로그 출력)
+    LOG_LEVELS: dict[str, str] = {}         # 모듈별 레벨 (예: '{"backend.core.llm_core": "DEBUG"}')
+    LOG_FORMAT: str = "text"                # "text" / "json"
+    LOG_MAX_FIELD_CHARS: int = 500          # 프롬프트/대화 이력 등 큰 값은 이 글자 수까지만 출력
+
+    # 지연 시간 계측 (span 히스토그램 + Server-Timing 헤더, backend/core/metrics.py)
+    METRICS_ENABLED: bool = True            # False: span 기록/Server-Timing/요청 히스토그램 모두 끔 (/api/metrics 는 빈 값)
+
+    # 회의실 예약 엔진 (backend/core/booking_engine.py)
+    BOOKING_PERSIST: bool = True            # True: 서버 시작 시 DB(llm_agent.meeting_room / meeting_booking)에서 불러오고 예약/취소를 DB 에 저장
+
+    # Embedding (SentenceTransformer) settings
+    EMBEDDING_MODEL_NAME: str = "sentence-transformers/all-MiniLM-L6-v2"
+    EMBEDDING_WARMUP: bool = False  # True: 서버 시작(lifespan) 시 모델을 미리 로드
+    # 동시 요청의 encode 를 모아 한 번에 계산 (micro-batching, backend/core/embedding_service.py EmbeddingBatcher)
+    EMBEDDING_BATCH_ENABLED: bool = True
+    EMBEDDING_BATCH_WINDOW_MS: float = 2.0     # 첫 요청부터 다른 요청을 기다리는 시간(ms) (0: 이미 대기 중인 요청만 모음)
+    EMBEDDING_BATCH_MAX_TEXTS: int = 256       # 한 번에 encode 하는 최대 텍스트 수 (넘으면 window 전에 바로 실행)
+    EMBEDDING_QUEUE_SIZE: int = 1024           # 대기열 최대 요청 수 (가득 차면 호출하는 쪽이 대기)
+    # 임베딩 계산 위치: "thread"(현재 프로세스) / "process"(자식 프로세스 풀, 여러 코어 사용, backend/core/embedding_pool.py)
+    EMBEDDING_BACKEND: str = "thread"
+    EMBEDDING_PROCESS_WORKERS: int = 0         # 자식 프로세스 수 (0: CPU 코어 수), 프로세스마다 모델을 한 번 로드 (MiniLM 약 100MB)
+    EMBEDDING_PROCESS_CHUNK_SIZE: int = 64     # 자식 프로세스 하나에 보내는 텍스트 수
+
+    # 뉴스 중복 검사용 벡터 인덱스 settings (사용자별 파티션, 디스크에 저장)
+    VECTOR_INDEX_BACKEND: str = "numpy"   # "numpy"(정확, 기본) / "hnswlib" / "faiss" (근사, CPU)
+    VECTOR_INDEX_DIR: str = "./vector_index"
+    VECTOR_INDEX_SAVE_EVERY: int = 100    # 이 개수만큼 추가될 때마다 디스크에 저장 (종료 시에도 저장)
 
 
 # 설정 클래스의 인스턴스를 만들어 다른 파일에서 쉽게 가져다 쓸 수 있도록 합니다.
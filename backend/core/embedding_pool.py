@@ -0,0 +1,146 @@
+# backend/core/embedding_pool.py
+import multiprocessing
+import os
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
+from typing import Callable
+
+import numpy as np
+
+from backend.core.metrics import timed
+
+# ------------------------------------------------------------------
+# 프로세스 풀 임베딩 backend (EMBEDDING_BACKEND="process")
+# - SentenceTransformer.encode 는 CPU 작업이라 uvicorn 워커 하나에서는 (GIL / torch 스레드 경합으로) 코어 하나 정도만 사용합니다.
+#   ProcessPoolExecutor 의 자식 프로세스마다 모델을 한 번 로드하고, 텍스트를 chunk_size 개씩 나눠 여러 코어에서 동시에 계산합니다.
+# - 결과 벡터는 pickle 로 돌려받지 않고, 부모가 만든 공유 메모리(multiprocessing.shared_memory)의
+#   자기 chunk 위치에 자식이 직접 씁니다. (자식 -> 부모로는 쓴 행 수만 전달)
+# - 자식 프로세스는 spawn 으로 시작합니다. (torch / 스레드를 가진 부모를 fork 하면 교착될 수 있음)
+# ------------------------------------------------------------------
+
+# 자식 프로세스의 모델 (initializer 에서 한 번 로드)
+_worker_model = None
+
+
+def load_sentence_transformer(model_name: str):
+    """자식 프로세스 기본 모델 (torch 스레드는 1개: 병렬화는 프로세스 수로)"""
+    import torch
+    from sentence_transformers import SentenceTransformer
+    torch.set_num_threads(1)
+    return SentenceTransformer(model_name)
+
+
+def _init_worker(model_factory: Callable, model_name: str) -> None:
+    global _worker_model
+    _worker_model = model_factory(model_name)
+
+
+def _worker_dim() -> int:
+    return int(_worker_model.encode(["dim"], convert_to_numpy=True).shape[1])
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """
+    부모가 만든 공유 메모리 열기 (해제(unlink)는 부모가 함)
+    - 3.12 이하는 열 때도 resource tracker 에 등록되지만, spawn 자식은 부모와 같은 tracker 를 쓰므로
+      같은 이름이 한 번만 기록되고 부모의 unlink 에서 해제됩니다.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    return shared_memory.SharedMemory(name=name)
+
+
+def _worker_encode(shm_name: str, rows: int, dim: int, offset: int, texts: list[str], normalize: bool) -> int:
+    """texts 를 encode 하여 공유 메모리 (rows, dim) 행렬의 [offset, offset + len(texts)) 행에 기록"""
+    vectors = _worker_model.encode(texts, convert_to_numpy=True, normalize_embeddings=normalize)
+    shm = _attach(shm_name)
+    try:
+        out = np.ndarray((rows, dim), dtype=np.float32, buffer=shm.buf)
+        out[offset:offset + len(texts)] = vectors
+        del out
+    finally:
+        shm.close()
+    return len(texts)
+
+
+class EmbeddingProcessPool:
+    """
+    EmbeddingService 와 같은 encode 인터페이스의 프로세스 풀 backend
+    - 자식 프로세스는 첫 encode(또는 warm_up) 시점에 시작하고, 각자 모델을 한 번만 로드합니다.
+    - model_factory(model_name) 는 자식 프로세스에서 모델을 만드는 함수입니다. (spawn 으로 넘기므로 모듈 최상위 함수)
+    """
+    def __init__(self, model_name: str, workers: int = None, chunk_size: int = 64,
+                 model_factory: Callable = load_sentence_transformer):
+        self.model_name = model_name
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.model_factory = model_factory
+        self._executor = None
+        self._dim = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._executor is not None
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                        initializer=_init_worker,
+                        initargs=(self.model_factory, self.model_name),
+                    )
+        return self._executor
+
+    @property
+    def dim(self) -> int:
+        if self._dim is None:
+            self._dim = self.executor.submit(_worker_dim).result()
+        return self._dim
+
+    @timed("embedding", "encode")
+    def encode(self, texts, normalize_embeddings: bool = False, **kwargs) -> np.ndarray:
+        """
+        SentenceTransformer.encode 와 같은 결과 (float32 numpy), chunk_size 개씩 나눠 자식 프로세스에서 동시에 계산
+        - texts 가 str 하나면 1차원 벡터 반환
+        """
+        if isinstance(texts, str):
+            return self.encode([texts], normalize_embeddings=normalize_embeddings)[0]
+        texts = list(texts)
+        dim = self.dim
+        if not texts:
+            return np.empty((0, dim), dtype=np.float32)
+
+        shm = shared_memory.SharedMemory(create=True, size=len(texts) * dim * 4)
+        try:
+            futures = [
+                self.executor.submit(_worker_encode, shm.name, len(texts), dim, offset,
+                                     texts[offset:offset + self.chunk_size], normalize_embeddings)
+                for offset in range(0, len(texts), self.chunk_size)
+            ]
+            # 실패한 chunk 가 있어도 나머지가 공유 메모리에 쓰기를 마칠 때까지 기다린 뒤 해제
+            wait(futures)
+            for future in futures:
+                future.result()
+            return np.ndarray((len(texts), dim), dtype=np.float32, buffer=shm.buf).copy()
+        finally:
+            shm.close()
+            shm.unlink()
+
+    def warm_up(self) -> None:
+        """자식 프로세스를 모두 시작하고 모델을 로드 (첫 요청 지연을 없앰)"""
+        for future in [self.executor.submit(_worker_dim) for _ in range(self.workers)]:
+            self._dim = future.result()
+
+    def close(self) -> None:
+        """자식 프로세스 종료 (서버 종료 시)"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
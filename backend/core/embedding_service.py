@@ -0,0 +1,233 @@
+# backend/core/embedding_service.py
+import asyncio
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+import numpy as np
+from backend.core.config import settings
+from backend.core.metrics import timed
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingService:
+    """
+    프로세스 전역 SentenceTransformer 임베딩 서비스
+    - 모듈 import 시점에는 모델(및 torch)을 로드하지 않고, 처음 encode 할 때 한 번만 로드합니다.
+    - 여러 스레드에서 동시에 처음 호출해도 모델은 한 번만 생성됩니다.
+    - FastAPI lifespan 에서 warm_up()을 호출하면 첫 요청 전에 미리 로드할 수 있습니다.
+    """
+    def __init__(self, model_name: str):
+        self.model_name = model_name
+        self._model = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._model is not None
+
+    @property
+    def model(self):
+        if self._model is None:
+            with self._lock:
+                if self._model is None:
+                    # 무거운 import(torch 포함)도 실제로 필요할 때만 수행
+                    from sentence_transformers import SentenceTransformer
+                    self._model = SentenceTransformer(self.model_name)
+        return self._model
+
+    @property
+    def dim(self) -> int:
+        return self.model.get_sentence_embedding_dimension()
+
+    @timed("embedding", "encode")
+    def encode(self, texts, **kwargs) -> np.ndarray:
+        """SentenceTransformer.encode 래퍼 (numpy 반환)"""
+        return self.model.encode(texts, convert_to_numpy=True, **kwargs)
+
+    def warm_up(self) -> None:
+        """모델 로드 + 1회 추론으로 첫 요청 지연을 없앰"""
+        self.encode(["warm up"])
+
+    def close(self) -> None:
+        """정리할 자원 없음 (EmbeddingProcessPool 과 같은 인터페이스)"""
+
+
+class _EncodeRequest:
+    __slots__ = ("texts", "normalize", "future")
+
+    def __init__(self, texts: list[str], normalize: bool):
+        self.texts = texts
+        self.normalize = normalize
+        self.future = Future()
+
+
+_STOP = object()
+
+
+class EmbeddingBatcher:
+    """
+    임베딩 micro-batching 워커
+    - 여러 요청(스레드/코루틴)이 동시에 encode 하면 각자 모델을 호출하지 않고, 전용 스레드 하나가
+      첫 요청부터 window 초 동안 들어온 요청을 모아 (최대 max_batch 개 텍스트) 한 번의 batched encode 로 처리합니다.
+    - 같은 batch 안의 중복 텍스트는 한 번만 계산하고(request coalescing), 요청마다 자기 텍스트의 결과 행만 Future 로 돌려받습니다.
+    - 대기열은 queue_size 개 요청으로 제한되어, 모델이 밀리면 호출하는 쪽이 기다립니다. (async 호출은 이벤트 루프를 막지 않도록 스레드에서 대기)
+    - enabled=False 이면 batching 없이 호출한 스레드에서 바로 encode 합니다.
+    """
+    def __init__(self, service: EmbeddingService, window: float = None, max_batch: int = None,
+                 queue_size: int = None, enabled: bool = None):
+        self.service = service
+        self.window = settings.EMBEDDING_BATCH_WINDOW_MS / 1000 if window is None else window
+        self.max_batch = max_batch or settings.EMBEDDING_BATCH_MAX_TEXTS
+        self.enabled = settings.EMBEDDING_BATCH_ENABLED if enabled is None else enabled
+        self._queue = queue.Queue(maxsize=queue_size or settings.EMBEDDING_QUEUE_SIZE)
+        self._worker = None
+        self._lock = threading.Lock()
+        # 카운터 (프로세스 단위)
+        self.batches = 0
+        self.requests = 0
+        self.texts = 0
+
+    @property
+    def dim(self) -> int:
+        return self.service.dim
+
+    def stats(self) -> dict:
+        return {
+            "batches": self.batches,
+            "requests": self.requests,
+            "texts": self.texts,
+            "requests_per_batch": self.requests / self.batches if self.batches else 0.0,
+            "queued": self._queue.qsize(),
+        }
+
+    # ------------------------------------------------------------------
+    # 호출
+    # ------------------------------------------------------------------
+    def submit(self, texts: list[str], normalize: bool = False) -> Future:
+        """encode 요청을 대기열에 넣고 Future((len(texts), dim) 행렬) 반환 (대기열이 가득 차면 자리가 날 때까지 대기)"""
+        request = _EncodeRequest(list(texts), normalize)
+        self._ensure_worker()
+        self._queue.put(request)
+        return request.future
+
+    def encode(self, texts, normalize: bool = False) -> np.ndarray:
+        """
+        batching 을 거친 encode (sync, 워커 스레드에서 호출)
+        Argument:
+            - texts (list[str] | str): 텍스트 (str 하나면 1차원 벡터 반환)
+            - normalize (bool): L2 정규화 여부 (SentenceTransformer normalize_embeddings)
+        Returns:
+            - np.ndarray: (len(texts), dim)
+        """
+        single = isinstance(texts, str)
+        batch = [texts] if single else list(texts)
+        if not self.enabled or not batch:
+            vectors = self.service.encode(batch, normalize_embeddings=normalize)
+        else:
+            vectors = self.submit(batch, normalize).result()
+        return vectors[0] if single else vectors
+
+    async def aencode(self, texts: list[str], normalize: bool = False) -> np.ndarray:
+        """encode 의 async 버전 (결과를 기다리는 동안 이벤트 루프를 막지 않음)"""
+        if not self.enabled or not texts:
+            return await asyncio.to_thread(self.encode, texts, normalize)
+        request = _EncodeRequest(list(texts), normalize)
+        self._ensure_worker()
+        try:
+            self._queue.put_nowait(request)
+        except queue.Full:
+            await asyncio.to_thread(self._queue.put, request)
+        return await asyncio.wrap_future(request.future)
+
+    # ------------------------------------------------------------------
+    # 워커 스레드
+    # ------------------------------------------------------------------
+    def _ensure_worker(self) -> None:
+        if self._worker is None or not self._worker.is_alive():
+            with self._lock:
+                if self._worker is None or not self._worker.is_alive():
+                    self._worker = threading.Thread(target=self._run, name="embedding-batcher", daemon=True)
+                    self._worker.start()
+
+    def close(self, timeout: float = 5.0) -> None:
+        """대기 중인 요청을 처리한 뒤 워커 스레드 종료 (서버 종료 시)"""
+        with self._lock:
+            worker, self._worker = self._worker, None
+        if worker is not None and worker.is_alive():
+            self._queue.put(_STOP)
+            worker.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            request = self._queue.get()
+            if request is _STOP:
+                return
+            batch, count, stop = [request], len(request.texts), False
+            # 첫 요청부터 window 동안 (또는 max_batch 개 텍스트가 찰 때까지) 모음
+            deadline = time.monotonic() + self.window
+            while count < self.max_batch:
+                remaining = deadline - time.monotonic()
+                try:
+                    request = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if request is _STOP:
+                    stop = True
+                    break
+                batch.append(request)
+                count += len(request.texts)
+            self._encode_batch(batch)
+            if stop:
+                return
+
+    def _encode_batch(self, batch: list[_EncodeRequest]) -> None:
+        """normalize 옵션별로 중복을 제거한 텍스트를 한 번에 encode 하고 요청별 결과 행을 Future 에 전달"""
+        batch = [request for request in batch if request.future.set_running_or_notify_cancel()]
+        for normalize in (False, True):
+            group = [request for request in batch if request.normalize is normalize]
+            if not group:
+                continue
+            positions = {}  # 텍스트 -> unique 목록에서의 위치
+            for request in group:
+                for text in request.texts:
+                    positions.setdefault(text, len(positions))
+            try:
+                vectors = self.service.encode(list(positions), normalize_embeddings=normalize)
+            except Exception as e:
+                logger.exception("임베딩 batch 실패 (requests=%d, texts=%d)", len(group), len(positions))
+                for request in group:
+                    request.future.set_exception(e)
+                continue
+            for request in group:
+                request.future.set_result(vectors[[positions[text] for text in request.texts]])
+            self.batches += 1
+            self.requests += len(group)
+            self.texts += len(positions)
+
+
+def create_embedding_backend():
+    """
+    settings.EMBEDDING_BACKEND 에 맞는 임베딩 backend
+    - "thread" : 현재 프로세스에서 계산 (embedding_service)
+    - "process": 자식 프로세스 EMBEDDING_PROCESS_WORKERS 개에서 계산 (backend/core/embedding_pool.py)
+    """
+    if settings.EMBEDDING_BACKEND == "process":
+        from backend.core.embedding_pool import EmbeddingProcessPool
+        return EmbeddingProcessPool(
+            settings.EMBEDDING_MODEL_NAME,
+            workers=settings.EMBEDDING_PROCESS_WORKERS or None,
+            chunk_size=settings.EMBEDDING_PROCESS_CHUNK_SIZE,
+        )
+    if settings.EMBEDDING_BACKEND != "thread":
+        raise ValueError(f"알 수 없는 EMBEDDING_BACKEND 입니다: {settings.EMBEDDING_BACKEND} (thread / process)")
+    return embedding_service
+
+
+embedding_service = EmbeddingService(settings.EMBEDDING_MODEL_NAME)
+# 실제 encode 를 수행하는 backend (기본: embedding_service)
+embedding_backend = create_embedding_backend()
+# 동시 요청의 encode 를 모아서 처리하는 공유 워커 (news_db_manager.embed_texts, LLM 응답 캐시 임베딩에서 사용)
+embedding_batcher = EmbeddingBatcher(embedding_backend)
@@ -0,0 +1,56 @@
+# backend/core/llm_clients.py
+import threading
+
+from langchain_openai import ChatOpenAI
+from backend.core.config import settings
+
+
+class LLMClientRegistry:
+    """
+    프로세스 전역 LangChain LLM 클라이언트 레지스트리
+    - (model, temperature, streaming) 조합마다 ChatOpenAI 를 한 번만 만들고 모든 요청이 공유합니다.
+      (요청마다 ChatOpenAI 를 새로 만들면 OpenAI 클라이언트/HTTP 커넥션 풀도 새로 만들어져 TLS 연결을 재사용하지 못함)
+    - ChatOpenAI 는 호출 간 상태가 없으므로 여러 요청/스레드에서 동시에 사용해도 안전합니다.
+      요청별 콜백은 생성자에 넣지 말고 호출 시 config={"callbacks": [...]} 로 전달해야 합니다.
+    - 사용자별 대화 이력(memory)은 여기에 두지 않고 요청 시점에 체인에 결합합니다. (chat_memory.get_conversation_chain)
+    """
+    def __init__(self, factory=None):
+        # factory: (model, temperature, streaming) -> LLM, 테스트/벤치마크에서 가짜 LLM 으로 바꿔 끼울 때 사용
+        self._factory = factory or self._create_chat_openai
+        self._clients = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _create_chat_openai(model: str, temperature: float, streaming: bool) -> ChatOpenAI:
+        return ChatOpenAI(model=model, temperature=temperature, streaming=streaming)
+
+    def get(self, model: str = None, temperature: float = 0.3, streaming: bool = False):
+        """
+        공유 LLM 클라이언트 반환 (없으면 생성)
+        Argument:
+            - model (str): 모델명 (None 이면 settings.DEFAULT_LLM_MODEL)
+            - temperature (float): temperature
+            - streaming (bool): 토큰 단위 스트리밍 여부
+        Returns:
+            - ChatOpenAI
+        """
+        key = (model or settings.DEFAULT_LLM_MODEL, float(temperature), bool(streaming))
+        client = self._clients.get(key)
+        if client is None:
+            with self._lock:
+                client = self._clients.get(key)
+                if client is None:
+                    client = self._factory(*key)
+                    self._clients[key] = client
+        return client
+
+    def clear(self) -> None:
+        """등록된 클라이언트 모두 제거 (테스트용)"""
+        with self._lock:
+            self._clients.clear()
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+
+llm_clients = LLMClientRegistry()
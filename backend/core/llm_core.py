@@ -1,12 +1,20 @@
 # backend/core/llm_core
+import functools
+import inspect
+import json
+import logging
 import os
-from typing import Dict, List, Optional
-from openai import OpenAI
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+import anyio
+from openai import OpenAI, AsyncOpenAI
 from google import genai
 from google.genai import types as genai_types
 # from backend.core.env_loader import load_dotenv
 # env_loader 대신에 pydantic_settings로 전환
 from backend.core.config import settings
+from backend.core.logging_config import truncate
+from backend.core.metrics import span
+from backend.core.response_cache import llm_response_cache
 
 # .env 파일 로드
 # env_loader 대신에 pydantic_settings로 전환
@@ -21,6 +29,21 @@ gemini_default_model=settings.GEMINI_DEFAULT_MODEL
 client = OpenAI(api_key=api_key)
 clientGemini = genai.Client(api_key=gemini_api_key)
 
+# 비동기 클라이언트: async 라우트에서 이벤트 루프를 막지 않고 LLM 응답을 기다리기 위해 사용
+# (Gemini는 동일 클라이언트의 clientGemini.aio 를 사용)
+aclient = AsyncOpenAI(api_key=api_key)
+
+logger = logging.getLogger(__name__)
+
+# 호출 인자 debug 로그 (레벨이 꺼져 있으면 문자열을 만들지 않고, 큰 값은 LOG_MAX_FIELD_CHARS 로 잘라서 출력)
+_CALL_LOG_FORMAT = "%s model=%s temperature=%s prompt=%s message=%s chat_history(%d)=%s"
+
+
+def _log_call(name: str, model, prompt, message, temperature, chat_history) -> None:
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(_CALL_LOG_FORMAT, name, model, temperature, truncate(prompt), truncate(message),
+                     len(chat_history or []), truncate(chat_history))
+
 
 def call_gemini(model, prompt, chat_history, message):
     return None
@@ -28,6 +51,56 @@ def call_gemini(model, prompt, chat_history, message):
 def call_gpt(model, prompt, chat_history, message, temperature):
     return None
 
+
+def _build_gemini_contents(message: str, chat_history: List[Dict] = None) -> list:
+    """대화 이력 + 신규 메세지를 google api 포멧(Content 리스트)으로 변환"""
+    # 대화 이력(history)가 있다면 꺼내서 gooogle api 포멧에 맞게 변환 
+    gemini_contents = []
+    if chat_history != None:
+        for item in chat_history:
+            gemini_contents.append(
+                genai_types.Content(
+                    role=item["role"] if item["role"].lower() == "user" else "model",
+                    parts=[genai_types.Part(text=item["content"])]
+                )
+            )
+
+    # 현재의 새로운 사용자 메시지를 가장 마지막에 추가
+    gemini_contents.append(
+        genai_types.Content(
+            role="user",
+            parts=[genai_types.Part(text=message)]
+        )
+    )
+    return gemini_contents
+
+
+def _build_gpt_messages(prompt: str, message: str, chat_history: List[Dict] = None) -> list[dict]:
+    """gpt에 전달할 마세지 리스트 프롬프트 + 이력 + 신규 메세지 순으로 추가"""
+    gpt_messages = []
+
+    # 제일 먼저 프롬프트 추가 
+    gpt_messages.append({
+        "role": 'system',
+        "content": prompt
+    })
+        
+    # 현재 대화의 히스토라가 있다면 llm 메세지에 추가
+    if chat_history:
+        for item in chat_history:
+            gpt_messages.append({
+                "role": item["role"],
+                "content": item["content"]
+            })
+
+    # 마지막 사용자의 신규 메시지 추가 
+    gpt_messages.append({
+        "role": "user",
+        "content": message
+    })
+    return gpt_messages
+
+
 def call_llm( model: str , prompt: str, message: str, temperature: float = 0.3, chat_history: List[Dict] = None ):
     """
     공통 LLM 호출 함수
@@ -40,14 +113,7 @@ def call_llm( model: str , prompt: str, message: str, temperature: float = 0.3,
     Return:
         - str
     """
-    print( 
-        f'[llm_core.py] >>>>>> call_llm( model, prompt, message, temperature, chat_history)  \n' 
-        f'  - model: {model} \n'
-        f'  - prompt: {prompt} \n'
-        f'  - message: {message} \n'
-        f'  - temperature: {temperature} \n'
-        f'  - chat_history: {chat_history} \n'
-        )
+    _log_call("call_llm", model, prompt, message, temperature, chat_history)
 
     model = model or default_model
 
@@ -56,70 +122,276 @@ def call_llm( model: str , prompt: str, message: str, temperature: float = 0.3,
     if model.startswith('gemini'):
         # refactoring 예정 gemini 함수 분리
         # return call_gemini(model, prompt, chat_history, message)
+        gemini_contents = _build_gemini_contents(message, chat_history)
 
-        # 대화 이력(history)가 있다면 꺼내서 gooogle api 포멧에 맞게 변환 
-        gemini_contents = []
-        if chat_history != None:
-            for item in chat_history:
-                gemini_contents.append(
-                    genai_types.Content(
-                        role=item["role"] if item["role"].lower() == "user" else "model",
-                        parts=[genai_types.Part(text=item["content"])]
-                    )
+        with span("llm", "call_llm"):
+            response = clientGemini.models.generate_content(
+                model=model,
+                contents = gemini_contents,
+                config=genai.types.GenerateContentConfig(
+                    system_instruction=prompt
                 )
-
-        # 현재의 새로운 사용자 메시지를 가장 마지막에 추가
-        gemini_contents.append(
-            genai_types.Content(
-                role="user",
-                parts=[genai_types.Part(text=message)]
             )
+        return response.text
+
+    # 나머지 default = gpt 계열의 모델의 경우 
+    gpt_messages = _build_gpt_messages(prompt, message, chat_history)
+
+    with span("llm", "call_llm"):
+        response = client.chat.completions.create(
+            model=model,
+            messages=gpt_messages,
+            temperature=temperature,
         )
 
-        response = clientGemini.models.generate_content(
+
+    return response.choices[0].message.content
+    # refactoring 예정 gpt 호출 함수 분리
+    # return call_gpt(model, prompt, chat_history, message, temperature)
+
+
+async def acall_llm( model: str , prompt: str, message: str, temperature: float = 0.3, chat_history: List[Dict] = None, cache: bool = False ) -> str:
+    """
+    공통 LLM 호출 함수 (async 버전)
+    - call_llm과 인자/반환값은 동일하지만 AsyncOpenAI / clientGemini.aio 를 사용하므로
+      LLM 응답을 기다리는 동안 이벤트 루프가 다른 요청을 처리할 수 있습니다.
+    Argmuent:
+        - model (str): 선택된 llm 모델
+        - prompt (str): 시스템 role prompt 설정
+        - message (str): 이번에 입력되는 사용자 메세지
+        - temperature (float): 유사도 temperature
+        - chat_history (List[Dict]): 현재 대화 세션에 참고해야할 이전 대화 히스토리 
+        - cache (bool): True 이면 응답 캐시(exact -> semantic)를 먼저 확인 (backend/core/response_cache.py)
+    Return:
+        - str
+    """
+    if cache:
+        return await llm_response_cache.get_or_call(
+            model or default_model, prompt, message, temperature, chat_history,
+            lambda: acall_llm(model, prompt, message, temperature, chat_history),
+        )
+
+    _log_call("acall_llm", model, prompt, message, temperature, chat_history)
+
+    model = model or default_model
+
+    # 실제 LLM 호출 구간만 계측 (캐시 hit 은 llm 시간에 포함하지 않음)
+    with span("llm", "acall_llm"):
+        # gemini 계열 모델의 경우 
+        if model.startswith('gemini'):
+            response = await clientGemini.aio.models.generate_content(
+                model=model,
+                contents=_build_gemini_contents(message, chat_history),
+                config=genai.types.GenerateContentConfig(
+                    system_instruction=prompt
+                )
+            )
+            return response.text
+
+        # 나머지 default = gpt 계열의 모델의 경우 
+        response = await aclient.chat.completions.create(
             model=model,
-            contents = gemini_contents,
-            config=genai.types.GenerateContentConfig(
-                system_instruction=prompt
+            messages=_build_gpt_messages(prompt, message, chat_history),
+            temperature=temperature,
+        )
+    return response.choices[0].message.content
+
+
+class LLMTool:
+    """
+    LLM function calling 도구 (acall_llm_tools 에서 사용)
+    - parameters: 인자 JSON schema (OpenAI tools / Gemini FunctionDeclaration 에 그대로 전달)
+    - handler: 인자를 keyword 로 받아 JSON 으로 바꿀 수 있는 값을 반환하는 함수 (sync 함수는 스레드에서 실행)
+    """
+    def __init__(self, name: str, description: str, parameters: dict, handler: Callable[..., Any]):
+        self.name = name
+        self.description = description
+        self.parameters = parameters
+        self.handler = handler
+
+    def openai_schema(self) -> dict:
+        return {"type": "function", "function": {"name": self.name, "description": self.description, "parameters": self.parameters}}
+
+    def gemini_declaration(self) -> genai_types.FunctionDeclaration:
+        return genai_types.FunctionDeclaration(name=self.name, description=self.description, parameters_json_schema=self.parameters)
+
+    async def run(self, arguments: dict) -> Any:
+        """
+        도구 실행, 실패하면 {"error": ...} 를 반환하여 모델이 고쳐서 다시 호출하거나 사용자에게 알리도록 함
+        - 인자 오류뿐 아니라 handler 내부 오류(DB 등)도 대화 전체를 실패시키지 않고 모델에 전달합니다.
+        """
+        try:
+            if inspect.iscoroutinefunction(self.handler):
+                return await self.handler(**arguments)
+            return await anyio.to_thread.run_sync(functools.partial(self.handler, **arguments))
+        except Exception as e:
+            logger.exception("도구 %s 호출 실패 (arguments=%s)", self.name, truncate(arguments))
+            return {"error": f"{type(e).__name__}: {e}"}
+
+
+async def _run_tool(tools: Dict[str, LLMTool], name: str, arguments) -> Any:
+    """모델이 요청한 도구 실행 (arguments: OpenAI 는 JSON 문자열, Gemini 는 dict)"""
+    tool = tools.get(name)
+    if tool is None:
+        return {"error": f"unknown tool: {name}"}
+    if isinstance(arguments, str):
+        try:
+            arguments = json.loads(arguments or "{}")
+        except json.JSONDecodeError as e:
+            return {"error": f"invalid arguments: {e}"}
+    logger.debug("도구 호출 %s(%s)", name, truncate(arguments))
+    return await tool.run(arguments or {})
+
+
+async def _gpt_tool_loop(model, prompt, message, tools, temperature, chat_history, max_rounds) -> tuple[str, int]:
+    messages = _build_gpt_messages(prompt, message, chat_history)
+    schemas = [tool.openai_schema() for tool in tools.values()]
+    calls = 0
+    for round_ in range(max_rounds + 1):
+        # 마지막 차례에는 도구를 더 호출하지 못하게 하여 반드시 답변을 받음
+        final = round_ == max_rounds
+        with span("llm", "acall_llm_tools"):
+            response = await aclient.chat.completions.create(
+                model=model,
+                messages=messages,
+                temperature=temperature,
+                tools=schemas,
+                tool_choice="none" if final else "auto",
             )
+        reply = response.choices[0].message
+        if final or not reply.tool_calls:
+            return reply.content or "", calls
+
+        messages.append({
+            "role": "assistant",
+            "content": reply.content,
+            "tool_calls": [
+                {"id": c.id, "type": "function", "function": {"name": c.function.name, "arguments": c.function.arguments}}
+                for c in reply.tool_calls
+            ],
+        })
+        # 예약 -> 취소처럼 순서가 의미 있을 수 있으므로 요청 순서대로 하나씩 실행
+        for c in reply.tool_calls:
+            result = await _run_tool(tools, c.function.name, c.function.arguments)
+            messages.append({"role": "tool", "tool_call_id": c.id, "content": json.dumps(result, ensure_ascii=False, default=str)})
+            calls += 1
+    return "", calls
+
+
+async def _gemini_tool_loop(model, prompt, message, tools, chat_history, max_rounds) -> tuple[str, int]:
+    contents = _build_gemini_contents(message, chat_history)
+    declarations = [genai_types.Tool(function_declarations=[tool.gemini_declaration() for tool in tools.values()])]
+    calls = 0
+    for round_ in range(max_rounds + 1):
+        final = round_ == max_rounds
+        with span("llm", "acall_llm_tools"):
+            response = await clientGemini.aio.models.generate_content(
+                model=model,
+                contents=contents,
+                config=genai_types.GenerateContentConfig(
+                    system_instruction=prompt,
+                    tools=declarations,
+                    # SDK 가 python 함수를 직접 호출하지 않도록 끄고, 도구 실행은 이 루프에서 수행
+                    automatic_function_calling=genai_types.AutomaticFunctionCallingConfig(disable=True),
+                    tool_config=genai_types.ToolConfig(
+                        function_calling_config=genai_types.FunctionCallingConfig(mode="NONE" if final else "AUTO")
+                    ),
+                ),
+            )
+        function_calls = response.function_calls
+        if final or not function_calls:
+            return response.text or "", calls
+
+        contents.append(response.candidates[0].content)
+        parts = []
+        for fc in function_calls:
+            result = await _run_tool(tools, fc.name, fc.args)
+            parts.append(genai_types.Part.from_function_response(name=fc.name, response={"result": result}))
+            calls += 1
+        contents.append(genai_types.Content(role="user", parts=parts))
+    return "", calls
+
+
+async def acall_llm_tools( model: str , prompt: str, message: str, tools: List[LLMTool], temperature: float = 0.3,
+                           chat_history: List[Dict] = None, max_rounds: int = None, cache: bool = False ) -> str:
+    """
+    function calling LLM 호출 (async)
+    - 모델이 도구 호출을 요청하면 도구를 실행하고 결과를 대화에 붙여 다시 호출하는 것을, 텍스트 답변이 나올 때까지 반복합니다.
+      (최대 max_rounds 번, 마지막 호출은 도구 없이 답변하도록 강제)
+    - 필요한 데이터(예: 회의실 목록)는 모델이 도구로 필요한 만큼만 조회하므로 prompt 에 미리 넣지 않아도 됩니다.
+    Argmuent:
+        - model / prompt / message / temperature / chat_history: acall_llm 과 동일
+        - tools (List[LLMTool]): 사용할 수 있는 도구
+        - max_rounds (int): 도구 호출 최대 반복 횟수 (기본 settings.LLM_TOOL_MAX_ROUNDS)
+        - cache (bool): True 이면 응답 캐시 사용 (도구를 호출하지 않은 답변만 저장: 도구 결과는 그때그때 달라짐)
+    Return:
+        - str
+    """
+    if cache:
+        tool_calls = []
+
+        async def call():
+            reply, calls = await _acall_llm_tools(model, prompt, message, tools, temperature, chat_history, max_rounds)
+            tool_calls.append(calls)
+            return reply
+
+        return await llm_response_cache.get_or_call(
+            model or default_model, prompt, message, temperature, chat_history, call,
+            cacheable=lambda reply: bool(reply) and not tool_calls[-1],
         )
-        return response.text
+    reply, _ = await _acall_llm_tools(model, prompt, message, tools, temperature, chat_history, max_rounds)
+    return reply
 
-    # 나머지 default = gpt 계열의 모델의 경우 
-    # gpt에 전달할 마세지 리스트 프롬프트 + 이력 + 신규 메세지 순으로 추가 
-    
-      
-    gpt_messages = []
 
-    # 제일 먼저 프롬프트 추가 
-    gpt_messages.append({
-        "role": 'system',
-        "content": prompt
-    })
-        
-    # 현재 대화의 히스토라가 있다면 llm 메세지에 추가
-    if chat_history:
-        for item in chat_history:
-            gpt_messages.append({
-                "role": item["role"],
-                "content": item["content"]
-            })
+async def _acall_llm_tools(model, prompt, message, tools, temperature, chat_history, max_rounds) -> tuple[str, int]:
+    """(답변, 도구 호출 횟수)"""
+    _log_call("acall_llm_tools", model, prompt, message, temperature, chat_history)
+    model = model or default_model
+    max_rounds = settings.LLM_TOOL_MAX_ROUNDS if max_rounds is None else max_rounds
+    by_name = {tool.name: tool for tool in tools}
 
-    # 마지막 사용자의 신규 메시지 추가 
-    gpt_messages.append({
-        "role": "user",
-        "content": message
-    })
+    # gemini 계열 모델의 경우
+    if model.startswith('gemini'):
+        return await _gemini_tool_loop(model, prompt, message, by_name, chat_history, max_rounds)
+    # 나머지 default = gpt 계열의 모델의 경우
+    return await _gpt_tool_loop(model, prompt, message, by_name, temperature, chat_history, max_rounds)
 
-    print(f'    - gpt_messages: {gpt_messages}')
 
-    response = client.chat.completions.create(
-        model=model,
-        messages=gpt_messages,
-        temperature=temperature,
-    )
+async def acall_llm_stream( model: str , prompt: str, message: str, temperature: float = 0.3, chat_history: List[Dict] = None ) -> AsyncIterator[str]:
+    """
+    공통 LLM 스트리밍 호출 함수 (async generator)
+    - 응답 전체를 기다리지 않고 모델이 생성하는 텍스트 조각(chunk)을 도착하는 즉시 yield 합니다.
+    - 인자는 acall_llm과 동일합니다.
+    Return:
+        - AsyncIterator[str]: 응답 텍스트 조각
+    """
+    model = model or default_model
 
+    # 스트림이 열릴 때까지(첫 응답 대기)만 llm 시간으로 계측 (이후 chunk 사이 시간은 클라이언트 전송 속도에 좌우됨)
+    # gemini 계열 모델의 경우 
+    if model.startswith('gemini'):
+        with span("llm", "acall_llm_stream"):
+            stream = await clientGemini.aio.models.generate_content_stream(
+                model=model,
+                contents=_build_gemini_contents(message, chat_history),
+                config=genai.types.GenerateContentConfig(
+                    system_instruction=prompt
+                )
+            )
+        async for chunk in stream:
+            if chunk.text:
+                yield chunk.text
+        return
 
-    return response.choices[0].message.content
-    # refactoring 예정 gpt 호출 함수 분리
-    # return call_gpt(model, prompt, chat_history, message, temperature)
\ No newline at end of file
+    # 나머지 default = gpt 계열의 모델의 경우 
+    with span("llm", "acall_llm_stream"):
+        stream = await aclient.chat.completions.create(
+            model=model,
+            messages=_build_gpt_messages(prompt, message, chat_history),
+            temperature=temperature,
+            stream=True,
+        )
+    async for chunk in stream:
+        # 마지막 chunk(usage 등)는 choices가 비어있거나 content가 None 일 수 있음
+        if chunk.choices and chunk.choices[0].delta.content:
+            yield chunk.choices[0].delta.content
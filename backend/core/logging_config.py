@@ -0,0 +1,125 @@
+# backend/core/logging_config.py
+import atexit
+import json
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+
+from backend.core.config import settings
+
+# ------------------------------------------------------------------
+# 애플리케이션 로깅 (backend.* 로거)
+# - 요청 처리 스레드/이벤트 루프에서는 QueueHandler 로 레코드를 큐에 넣기만 하고,
+#   실제 출력(stdout 쓰기)은 QueueListener 의 별도 스레드에서 수행합니다.
+# - logger.debug("... %s", value) 처럼 인자를 넘기면 해당 레벨이 꺼져 있을 때 문자열을 만들지 않습니다. (lazy formatting)
+# - 프롬프트/대화 이력처럼 큰 값은 truncate() 로 감싸서 최대 LOG_MAX_FIELD_CHARS 글자까지만 출력합니다.
+# - 레벨: LOG_LEVEL (backend 전체), LOG_LEVELS (모듈별, 예: '{"backend.core.llm_core": "DEBUG"}')
+# - 형식: LOG_FORMAT = "text" / "json" (json: 한 줄에 하나의 JSON 객체, 로그 수집기용)
+# ------------------------------------------------------------------
+ROOT_LOGGER = "backend"
+TEXT_FORMAT = "%(asctime)s %(levelname)-7s %(name)s | %(message)s"
+
+_listener: QueueListener | None = None
+
+
+def _bounded_repr(value, limit: int) -> str:
+    """list/tuple 은 limit 글자를 넘을 때까지만 원소를 repr (대화 이력 전체를 문자열로 만들지 않음)"""
+    if not isinstance(value, (list, tuple)):
+        return repr(value)
+    parts, size = [], 0
+    for item in value:
+        parts.append(repr(item))
+        size += len(parts[-1]) + 2
+        if size > limit:
+            break
+    return "[" + ", ".join(parts) + ("]" if len(parts) == len(value) else ", ...")
+
+
+class truncate:
+    """
+    로그 인자를 출력할 때만 문자열로 바꾸고 limit 글자로 자르는 래퍼 (레벨이 꺼져 있으면 변환하지 않음)
+    예) logger.debug("chat_history=%s", truncate(chat_history))
+    """
+    __slots__ = ("value", "limit")
+
+    def __init__(self, value, limit: int = None):
+        self.value = value
+        self.limit = limit or settings.LOG_MAX_FIELD_CHARS
+
+    def __str__(self) -> str:
+        if isinstance(self.value, str):
+            if len(self.value) <= self.limit:
+                return self.value
+            return f"{self.value[:self.limit]}...(+{len(self.value) - self.limit} chars)"
+        text = _bounded_repr(self.value, self.limit)
+        return text if len(text) <= self.limit else f"{text[:self.limit]}...(truncated)"
+
+    __repr__ = __str__
+
+
+class JsonFormatter(logging.Formatter):
+    """한 줄 JSON 로그 (time, level, logger, message + extra 로 넘긴 필드)"""
+    _RESERVED = set(logging.LogRecord("", 0, "", 0, "", None, None).__dict__) | {"message", "asctime"}
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        entry.update({k: v for k, v in record.__dict__.items() if k not in self._RESERVED})
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+def setup_logging(level: str = None, module_levels: dict = None, fmt: str = None, handler: logging.Handler = None) -> QueueListener:
+    """
+    backend.* 로거를 QueueHandler -> QueueListener(출력 스레드) 로 구성하고 listener 반환 (이미 구성되어 있으면 다시 구성)
+    Argument:
+        - level (str): backend 전체 레벨 (기본 settings.LOG_LEVEL)
+        - module_levels (dict): 모듈별 레벨 (기본 settings.LOG_LEVELS)
+        - fmt (str): "text" / "json" (기본 settings.LOG_FORMAT)
+        - handler (logging.Handler): 실제 출력 handler (기본 stdout StreamHandler, 테스트/벤치마크에서 교체)
+    """
+    global _listener
+    shutdown_logging()
+
+    handler = handler or logging.StreamHandler(sys.stdout)
+    if (fmt or settings.LOG_FORMAT) == "json":
+        handler.setFormatter(JsonFormatter())
+    else:
+        handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger(ROOT_LOGGER)
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel((level or settings.LOG_LEVEL).upper())
+    root.propagate = False  # uvicorn/root 로거 설정과 중복 출력하지 않음
+
+    for name, module_level in (settings.LOG_LEVELS if module_levels is None else module_levels).items():
+        logging.getLogger(name).setLevel(str(module_level).upper())
+
+    _listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def shutdown_logging() -> None:
+    """
+    큐에 남은 로그를 모두 출력하고 출력 스레드 종료 (서버 종료 시)
+    - QueueHandler 도 제거하여, 이후의 로그가 아무도 읽지 않는 큐에 쌓이지 않고 기본 logging 동작(root 로거)으로 돌아갑니다.
+    """
+    global _listener
+    listener, _listener = _listener, None
+    root = logging.getLogger(ROOT_LOGGER)
+    for handler in [h for h in root.handlers if isinstance(h, QueueHandler)]:
+        root.removeHandler(handler)
+    root.propagate = True
+    if listener is not None:
+        listener.stop()
+
+
+atexit.register(shutdown_logging)
@@ -0,0 +1,237 @@
+# backend/core/metrics.py
+import functools
+import inspect
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+
+from backend.core.config import settings
+
+# ------------------------------------------------------------------
+# 요청 단위 지연 시간 계측 (timing span)
+# - span(component, operation) / @timed(component) 로 감싼 구간의 실행 시간을
+#   1) 프로세스 단위 히스토그램에 누적하여 /api/metrics 에서 Prometheus text format 으로 노출하고
+#   2) 현재 요청(ContextVar)의 구간 목록에 기록하여 Server-Timing 응답 헤더로 보냅니다. (MetricsMiddleware)
+# - component: db / redis / embedding / http(외부 API) / llm  (Server-Timing 항목 이름)
+# - operation: 함수 이름 등 (라벨 종류가 무한히 늘어나지 않도록 사용자 입력 값은 넣지 않음)
+# - 구간 하나당 perf_counter 2회 + lock 1회 + bisect 정도의 비용이므로 운영 환경에서 켜 두어도 됩니다.
+#   (benchmarks/bench_metrics.py)
+# ------------------------------------------------------------------
+
+# 히스토그램 bucket 상한(초): 1ms (Redis) ~ 60s (LLM)
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# 현재 요청에서 측정된 구간 [(component, 초), ...] (MetricsMiddleware 가 요청마다 새 리스트를 넣음)
+# anyio.to_thread / asyncio task 는 context 를 복사하므로 같은 리스트에 기록됩니다. (list.append 는 스레드 안전)
+request_spans: ContextVar[list | None] = ContextVar("request_spans", default=None)
+
+
+class Histogram:
+    """누적 bucket 히스토그램 (스레드 안전)"""
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # 마지막 칸: +Inf
+        self.sum = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    def snapshot(self) -> tuple[list[int], float, int]:
+        """(누적 bucket 개수, 합계, 개수)"""
+        with self._lock:
+            counts, total, count = list(self.counts), self.sum, self.count
+        cumulative, running = [], 0
+        for c in counts:
+            running += c
+            cumulative.append(running)
+        return cumulative, total, count
+
+
+def _label_value(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_le(bound: float) -> str:
+    return "+Inf" if bound == float("inf") else repr(float(bound))
+
+
+class MetricsRegistry:
+    """
+    프로세스 단위 지연 시간 히스토그램 모음
+    - span   : app_span_duration_seconds{component, operation}
+    - request: http_request_duration_seconds{method, route, status}
+    """
+    SPAN_METRIC = "app_span_duration_seconds"
+    REQUEST_METRIC = "http_request_duration_seconds"
+
+    def __init__(self, buckets=DEFAULT_BUCKETS, enabled: bool = None):
+        self.buckets = tuple(buckets)
+        self.enabled = settings.METRICS_ENABLED if enabled is None else enabled
+        self._spans = {}     # (component, operation) -> Histogram
+        self._requests = {}  # (method, route, status) -> Histogram
+        self._lock = threading.Lock()
+
+    def _histogram(self, table: dict, key: tuple) -> Histogram:
+        histogram = table.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = table.setdefault(key, Histogram(self.buckets))
+        return histogram
+
+    def observe_span(self, component: str, operation: str, seconds: float) -> None:
+        self._histogram(self._spans, (component, operation)).observe(seconds)
+
+    def observe_request(self, method: str, route: str, status: int, seconds: float) -> None:
+        self._histogram(self._requests, (method, route, str(status))).observe(seconds)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._spans.clear()
+            self._requests.clear()
+
+    def render(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)"""
+        lines = []
+        for metric, help_text, label_names, table in (
+            (self.SPAN_METRIC, "Time spent in instrumented operations (DB, Redis, embedding, upstream HTTP, LLM).",
+             ("component", "operation"), self._spans),
+            (self.REQUEST_METRIC, "HTTP request latency.", ("method", "route", "status"), self._requests),
+        ):
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} histogram")
+            with self._lock:
+                items = sorted(table.items())
+            for key, histogram in items:
+                labels = ",".join(f'{name}="{_label_value(value)}"' for name, value in zip(label_names, key))
+                cumulative, total, count = histogram.snapshot()
+                for bound, value in zip(self.buckets + (float("inf"),), cumulative):
+                    lines.append(f'{metric}_bucket{{{labels},le="{_format_le(bound)}"}} {value}')
+                lines.append(f"{metric}_sum{{{labels}}} {total}")
+                lines.append(f"{metric}_count{{{labels}}} {count}")
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry()
+
+
+def record_span(component: str, operation: str, seconds: float) -> None:
+    """측정된 구간을 히스토그램 + 현재 요청의 구간 목록에 기록"""
+    if not metrics.enabled:
+        return
+    metrics.observe_span(component, operation, seconds)
+    spans = request_spans.get()
+    if spans is not None:
+        spans.append((component, seconds))
+
+
+class span:
+    """
+    with 블록의 실행 시간을 기록 (예외가 나도 기록)
+    - contextlib.contextmanager(generator) 보다 호출 비용이 작도록 클래스로 구현
+    Argument:
+        - component (str): db / redis / embedding / http / llm
+        - operation (str): 세부 작업 이름 (예: save_turn)
+    """
+    __slots__ = ("component", "operation", "started")
+
+    def __init__(self, component: str, operation: str):
+        self.component = component
+        self.operation = operation
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        record_span(self.component, self.operation, time.perf_counter() - self.started)
+        return False
+
+
+def timed(component: str, operation: str = None):
+    """
+    함수 실행 시간을 기록하는 decorator (sync / async 함수 모두 지원)
+    - operation 을 생략하면 함수 이름을 사용합니다.
+    """
+    def decorator(func):
+        name = operation or func.__name__
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                started = time.perf_counter()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    record_span(component, name, time.perf_counter() - started)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record_span(component, name, time.perf_counter() - started)
+        return wrapper
+    return decorator
+
+
+def server_timing(spans: list, total: float = None) -> str:
+    """
+    Server-Timing 헤더 값 (component 별 합계, ms)
+    예) db;dur=3.2;desc="4 calls", llm;dur=812.0;desc="1 call", total;dur=820.5
+    """
+    durations, calls = {}, {}
+    for component, seconds in list(spans):
+        durations[component] = durations.get(component, 0.0) + seconds
+        calls[component] = calls.get(component, 0) + 1
+    entries = [
+        f'{component};dur={durations[component] * 1000:.1f};desc="{calls[component]} call{"s" if calls[component] > 1 else ""}"'
+        for component in durations
+    ]
+    if total is not None:
+        entries.append(f"total;dur={total * 1000:.1f}")
+    return ", ".join(entries)
+
+
+class MetricsMiddleware:
+    """
+    요청마다 구간 목록을 준비하고, 응답 헤더에 Server-Timing 을 추가한 뒤 요청 지연 시간을 히스토그램에 기록 (ASGI middleware)
+    - BaseHTTPMiddleware 와 달리 응답 본문을 감싸지 않으므로 StreamingResponse(SSE)도 그대로 흘려보냅니다.
+      (스트리밍 응답의 Server-Timing 은 첫 이벤트를 보내기 전까지 측정된 구간만 포함)
+    - route 라벨은 경로 템플릿(/api/chat 등)을 사용하고, 매칭되지 않은 경로는 하나로 묶습니다.
+    """
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not metrics.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        spans = []
+        token = request_spans.set(spans)
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_timing(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                header = server_timing(spans, time.perf_counter() - started)
+                message = {**message, "headers": [*message.get("headers", []), (b"server-timing", header.encode("latin-1"))]}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            request_spans.reset(token)
+            route = getattr(scope.get("route"), "path", None) or "<unmatched>"
+            metrics.observe_request(scope["method"], route, status, time.perf_counter() - started)
@@ -1,51 +1,154 @@
-import os
-import requests
-import urllib.parse
-
-from backend.core.env_loader import load_dotenv
-
-# .env 파일 로드
-load_dotenv()
-
-# 네이버 API 인증 정보
-CLIENT_ID = os.getenv("NAVER_CLIENT_ID") # "jFgOLYH8gUFQ2_0DhekQ"
-CLIENT_SECRET = os.getenv("NAVER_CLIENT_SECRET") # "Y1xqeZZfF4"
-
-
-
-def search_naver_news(keyword, display=5, sort="sim"):
-    base_url = "https://openapi.naver.com/v1/search/news.json"
-    query = urllib.parse.quote(keyword)
-    url = f"{base_url}?query={query}&display={display}&start=100&sort={sort}"
-
-    headers = {
-        "X-Naver-Client-Id": CLIENT_ID,
-        "X-Naver-Client-Secret": CLIENT_SECRET,
-        "Accept": "*/*",
-        "Host": "openapi.naver.com",
-        "Accept-Encoding": "gzip, deflate, br",
-        "Connection": "keep-alive"
-    }
-
-    response = requests.get(url, headers=headers, verify=False)
-    
-    serch_count = 0
-    if response.status_code == 200:
-        result = response.json()
-        articles = []
-        for item in result['items']:
-            articles.append({
-                "keyword":keyword,
-                "title": item['title'].replace("<b>", "").replace("</b>", ""),
-                "link": item['link'],
-                "description": item['description'].replace("<b>", "").replace("</b>", ""),
-                "pubDate": item['pubDate']
-            })
-            serch_count+=1
-        print(f"="*60)    
-        print(f"키워드 '{urllib.parse.unquote(query)}'으로 기사 {serch_count}개 검색 하였습니다.")
-        print(f"="*60)    
+import asyncio
+import logging
+import httpx
+
+from backend.core.config import settings
+from backend.core.metrics import timed
+from backend.core.result_cache import ResultCache
+
+logger = logging.getLogger(__name__)
+
+# 재시도 대상 응답 코드 (요청 한도 초과 / 서버 오류)
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+def _strip_tags(text: str) -> str:
+    return text.replace("<b>", "").replace("</b>", "")
+
+
+class NaverNewsClient:
+    """
+    네이버 뉴스 검색 API 비동기 클라이언트
+    - 요청마다 새 TCP+TLS 연결을 맺지 않도록 httpx.AsyncClient(keep-alive 커넥션 풀)를 하나 만들어 재사용합니다.
+    - 모든 요청에 timeout 을 적용하고, 네트워크 오류/429/5xx 응답은 지수 backoff 로 재시도합니다.
+    - 여러 키워드는 asyncio.gather 로 동시에 검색합니다. (search_many)
+    - cache(ResultCache)를 지정하면 (keyword, display, sort, start) 단위로 검색 결과를 재사용합니다.
+    """
+    def __init__(self, url: str = None, client_id: str = None, client_secret: str = None,
+                 timeout: float = None, max_connections: int = None, retries: int = None, backoff: float = None,
+                 cache: ResultCache = None):
+        self.url = url or settings.NAVER_NEWS_URL
+        self.headers = {
+            "X-Naver-Client-Id": client_id or settings.NAVER_CLIENT_ID,
+            "X-Naver-Client-Secret": client_secret or settings.NAVER_CLIENT_SECRET,
+            "Accept": "*/*",
+        }
+        self.timeout = timeout if timeout is not None else settings.NAVER_TIMEOUT
+        self.max_connections = max_connections or settings.NAVER_MAX_CONNECTIONS
+        self.retries = retries if retries is not None else settings.NAVER_RETRIES
+        self.backoff = backoff if backoff is not None else settings.NAVER_RETRY_BACKOFF
+        self.cache = cache
+        self._client = None
+        self._loop = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """현재 이벤트 루프에서 사용할 AsyncClient (루프가 바뀌면 새로 생성: 커넥션은 루프에 묶여 있음)"""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop:
+            self._client = httpx.AsyncClient(
+                headers=self.headers,
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=self.max_connections, max_keepalive_connections=self.max_connections),
+            )
+            self._loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        """커넥션 풀 정리 (서버 종료 시)"""
+        client, self._client, self._loop = self._client, None, None
+        if client is not None:
+            await client.aclose()
+
+    async def _get_with_retry(self, params: dict) -> httpx.Response | None:
+        """GET 요청 (실패 시 재시도), 끝내 실패하면 None"""
+        client = self._get_client()
+        for attempt in range(self.retries + 1):
+            if attempt > 0:
+                await asyncio.sleep(self.backoff * 2 ** (attempt - 1))
+            try:
+                response = await client.get(self.url, params=params)
+            except httpx.TransportError as e:  # 연결 실패 / timeout 등
+                logger.warning("요청 실패 (%d/%d): %r", attempt + 1, self.retries + 1, e)
+                continue
+            if response.status_code not in RETRY_STATUS_CODES:
+                return response
+            logger.warning("Error Code: %s (%d/%d)", response.status_code, attempt + 1, self.retries + 1)
+        return None
+
+    async def search(self, keyword: str, display: int = 5, sort: str = "sim", start: int = 100, cache: bool = True) -> list[dict]:
+        """
+        키워드 뉴스 검색
+        Argument:
+            - keyword (str): 검색 키워드
+            - display (int): 검색 기사 수
+            - sort (str): 정렬 (sim: 정확도순, date: 날짜순)
+            - start (int): 검색 시작 위치
+            - cache (bool): False 이면 검색 결과 캐시를 거치지 않고 항상 네이버 API 호출 (뉴스 수집)
+        Returns:
+            - list[dict]: keyword, title, link, description, pubDate (실패 시 빈 리스트)
+        """
+        if self.cache is None or not cache:
+            return await self._fetch(keyword, display, sort, start)
+        # 동시에 같은 검색이 들어오면 네이버 API 는 한 번만 호출 (빈 결과/실패는 캐시하지 않음)
+        return await self.cache.get_or_load(
+            (keyword, display, sort, start), lambda: self._fetch(keyword, display, sort, start)
+        )
+
+    @timed("http", "naver_news_search")
+    async def _fetch(self, keyword: str, display: int, sort: str, start: int) -> list[dict]:
+        """네이버 API 호출 (캐시 없이)"""
+        params = {"query": keyword, "display": display, "start": start, "sort": sort}
+        response = await self._get_with_retry(params)
+        if response is None:
+            return []
+        if response.status_code != 200:
+            logger.warning("Error Code: %s (keyword=%r)", response.status_code, keyword)
+            return []
+
+        # 200 이어도 본문이 JSON 이 아니거나 items 가 없으면 빈 결과 (search_many 의 다른 키워드 결과까지 실패시키지 않도록)
+        try:
+            articles = [
+                {
+                    "keyword": keyword,
+                    "title": _strip_tags(item['title']),
+                    "link": item['link'],
+                    "description": _strip_tags(item['description']),
+                    "pubDate": item['pubDate'],
+                }
+                for item in response.json()['items']
+            ]
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning("잘못된 응답 (keyword=%r): %r", keyword, e)
+            return []
+        logger.debug("키워드 '%s'으로 기사 %d개 검색 하였습니다.", keyword, len(articles))
         return articles
-    else:
-        print("Error Code:", response.status_code)
-        return []
\ No newline at end of file
+
+    async def search_many(self, keywords: list[str], display: int = 5, max_results: int = None, **kwargs) -> list[list[dict]]:
+        """
+        여러 키워드를 동시에 검색 (키워드 순서대로 결과 반환)
+        - 결과 합계가 max_results(기본 settings.NAVER_MAX_ARTICLES)를 넘으면 앞 키워드부터 채우고 나머지는 버립니다.
+        Returns:
+            - list[list[dict]]: 키워드별 기사 리스트
+        """
+        max_results = max_results or settings.NAVER_MAX_ARTICLES
+        results = await asyncio.gather(*[self.search(keyword, display, **kwargs) for keyword in keywords])
+        capped = []
+        for articles in results:
+            capped.append(articles[:max(max_results, 0)])
+            max_results -= len(capped[-1])
+        return capped
+
+
+news_search_cache = ResultCache(
+    "naver_news",
+    ttl=settings.NAVER_CACHE_TTL,
+    maxsize=settings.NAVER_CACHE_MAXSIZE,
+    use_redis=settings.NAVER_CACHE_REDIS,
+    enabled=settings.NAVER_CACHE_ENABLED,
+)
+naver_client = NaverNewsClient(cache=news_search_cache)
+
+
+async def search_naver_news(keyword, display=5, sort="sim", start=100, cache=True):
+    """공유 NaverNewsClient 로 키워드 뉴스 검색 (async, cache=False 이면 검색 결과 캐시를 사용하지 않음)"""
+    return await naver_client.search(keyword, display=display, sort=sort, start=start, cache=cache)
@@ -1,73 +1,336 @@
-from sqlalchemy import create_engine, Column, String, Integer, DateTime, Text, LargeBinary, Float
+from sqlalchemy import create_engine, Column, String, Integer, DateTime, Text, LargeBinary, Float, UniqueConstraint, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import declarative_base, sessionmaker
 from datetime import datetime
-import pickle
+from email.utils import parsedate_to_datetime
+import threading
 import numpy as np
-from sentence_transformers import SentenceTransformer, util
+from backend.core.config import settings
+from backend.core.embedding_service import embedding_batcher
+from backend.core.user_vector_cache import normalize
+from backend.core.vector_codec import decode_vectors, encode_vector
+from backend.core.vector_index import (
+    VectorIndex, create_vector_index, index_path, load_vector_index, save_vector_index,
+)
 
 
 DB_PATH = "sqlite:///./mydb.db"
 
+# 벡터 저장 타입: "float32" (기본, 무손실) / "float16" / "int8" (용량 절감, 근사값)
+VECTOR_STORAGE_DTYPE = "float32"
+
 engine = create_engine(DB_PATH, connect_args={"check_same_thread": False})
 SessionLocal = sessionmaker(bind=engine)
 Base = declarative_base()
 
-# SentenceTransformer 모델
-model = SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2")
+# SentenceTransformer 모델은 embedding_service(또는 EMBEDDING_BACKEND=process 이면 자식 프로세스)에서 처음 사용할 때 로드 (import 시점에 로드하지 않음)
 
 class NewsVector(Base):
     __tablename__ = "news"
 
     news_id = Column(Integer, primary_key=True, index=True, autoincrement=True)
-    user_name = Column(String(30))
+    user_name = Column(String(30), index=True)
     keyword = Column(String(100))
     title = Column(String(255))
     description = Column(Text)
     link = Column(String(255))
     pubDate = Column(DateTime, default=datetime.now)
-    vector = Column(LargeBinary)  # 벡터는 binary로 저장
+    vector = Column(LargeBinary)  # 벡터는 binary로 저장 (포맷: backend/core/vector_codec.py)
     similarity = Column(Float, default=0.0)
 
+
+class NewsSubscription(Base):
+    """
+    사용자별 구독 키워드 (백그라운드 수집 대상, backend/core/news_ingest.py)
+    - delivered_id: 사용자에게 전달한 마지막 news_id (이후에 저장된 기사가 미전달 기사)
+    """
+    __tablename__ = "news_subscription"
+    __table_args__ = (UniqueConstraint("user_name", "keyword"),)
+
+    subscription_id = Column(Integer, primary_key=True, autoincrement=True)
+    user_name = Column(String(30), index=True)
+    keyword = Column(String(100))
+    delivered_id = Column(Integer, default=0)
+    created_at = Column(DateTime, default=datetime.now)
+
 Base.metadata.create_all(bind=engine)
 
+# 사용자별 벡터 인덱스 (프로세스 단위)
+# - 처음 조회 시 디스크(VECTOR_INDEX_DIR)에서 로드하고, 없으면 news 테이블에서 만듭니다.
+# - 이후에는 마지막으로 반영한 news_id 이후의 행만 DB에서 읽어 증분 추가합니다.
+_user_indexes: dict[str, VectorIndex] = {}
+_user_indexes_lock = threading.Lock()
+
+def article_text(article: dict) -> str:
+    """임베딩 대상 텍스트 (제목 + 설명)"""
+    return f"{article['title']} {article['description']}"
+
+
+def embed_texts(texts: list[str]) -> np.ndarray:
+    """
+    여러 텍스트를 한 번의 batched encode 호출로 임베딩
+    - L2 정규화된 float32 (k, dim) 행렬 반환 (유사도 검사와 DB 저장에 같은 벡터를 재사용)
+    - 동시에 들어온 다른 요청의 텍스트와 함께 한 번에 계산됩니다. (embedding_batcher)
+    """
+    if not texts:
+        return np.empty((0, embedding_batcher.dim), dtype=np.float32)
+    return embedding_batcher.encode(texts, normalize=True).astype(np.float32)
+
+
+def parse_pub_date(value: str) -> datetime | None:
+    """
+    네이버 검색 API 의 pubDate (RFC 2822, 예: "Mon, 19 Oct 2026 09:30:00 +0900") -> 서버 로컬 시각 (naive datetime)
+    - 비어 있거나 형식이 맞지 않으면 None
+    """
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).astimezone().replace(tzinfo=None)
+    except (TypeError, ValueError):
+        return None
+
+
+def record_news_batch(articles: list[dict], vectors: np.ndarray, user_name, user_keywords) -> list[int]:
+    """
+    전송된 뉴스 여러 건을 한 번에 DB에 기록 (단일 트랜잭션 bulk insert)
+    - vectors: embed_texts로 이미 계산된 기사별 벡터 (다시 encode 하지 않음)
+    - pubDate: 기사의 발행 시각 (없거나 형식이 맞지 않으면 저장 시각)
+    Returns:
+        - 저장된 news_id 리스트
+    """
+    if not articles:
+        return []
+    session = SessionLocal()
+    items = [
+        NewsVector(
+            user_name=user_name, 
+            keyword=user_keywords, 
+            title=article['title'], 
+            description=article['description'], 
+            link=article['link'],
+            pubDate=parse_pub_date(article.get('pubDate')) or datetime.now(),
+            vector=encode_vector(vec, VECTOR_STORAGE_DTYPE)
+        )
+        for article, vec in zip(articles, vectors)
+    ]
+    session.add_all(items)
+    session.flush()
+    news_ids = [item.news_id for item in items]
+    session.commit()
+    session.close()
+
+    # 이미 메모리에 로드된 사용자라면 인덱스에도 바로 반영
+    # (id를 건너뛰지 않도록 직접 add 하지 않고 DB에서 max_id 이후 행을 순서대로 동기화)
+    index = _user_indexes.get(user_name)
+    if index is not None:
+        with index.lock:
+            _sync_user_index(user_name, index)
+            _maybe_save_index(user_name, index)
+    return news_ids
+
+
+def subscribe_news(user_name: str, keyword: str) -> bool:
+    """
+    사용자 키워드 구독 등록
+    Returns:
+        - bool: 새로 등록했으면 True (이미 구독 중이면 False)
+    """
+    session = SessionLocal()
+    try:
+        exists = session.query(NewsSubscription.subscription_id)\
+                        .filter(NewsSubscription.user_name == user_name, NewsSubscription.keyword == keyword)\
+                        .first()
+        if exists:
+            return False
+        session.add(NewsSubscription(user_name=user_name, keyword=keyword))
+        session.commit()
+        return True
+    except IntegrityError:  # 같은 구독을 동시에 등록한 경우
+        session.rollback()
+        return False
+    finally:
+        session.close()
+
+
+def get_subscriptions() -> dict[str, list[str]]:
+    """구독 키워드별 사용자 목록 {keyword: [user_name, ...]}"""
+    session = SessionLocal()
+    rows = session.query(NewsSubscription.keyword, NewsSubscription.user_name)\
+                  .order_by(NewsSubscription.subscription_id.asc())\
+                  .all()
+    session.close()
+    subscriptions = {}
+    for keyword, user_name in rows:
+        subscriptions.setdefault(keyword, []).append(user_name)
+    return subscriptions
+
+
+def fetch_pending_news(user_name: str, keyword: str, limit: int = 3) -> list[dict]:
+    """
+    수집되었지만 아직 전달하지 않은 기사를 오래된 순으로 limit 건 꺼내고 전달 위치(delivered_id)를 옮김
+    - 같은 사용자의 요청이 동시에 들어와도 같은 기사를 두 번 전달하지 않도록
+      delivered_id 가 읽은 값 그대로일 때만 갱신합니다. (다른 요청이 먼저 옮겼으면 다시 읽음)
+    Returns:
+        - list[dict]: news_id, title, description, link, pubDate
+    """
+    session = SessionLocal()
+    try:
+        while True:
+            delivered_id = session.query(NewsSubscription.delivered_id)\
+                                  .filter(NewsSubscription.user_name == user_name, NewsSubscription.keyword == keyword)\
+                                  .scalar()
+            if delivered_id is None:
+                return []
+            rows = session.query(NewsVector.news_id, NewsVector.title, NewsVector.description,
+                                 NewsVector.link, NewsVector.pubDate)\
+                          .filter(NewsVector.user_name == user_name, NewsVector.keyword == keyword,
+                                  NewsVector.news_id > delivered_id)\
+                          .order_by(NewsVector.news_id.asc())\
+                          .limit(limit)\
+                          .all()
+            if not rows:
+                return []
+            moved = session.execute(
+                update(NewsSubscription)
+                .where(NewsSubscription.user_name == user_name, NewsSubscription.keyword == keyword,
+                       NewsSubscription.delivered_id == delivered_id)
+                .values(delivered_id=rows[-1].news_id)
+            ).rowcount
+            session.commit()
+            if moved:
+                return [dict(row._mapping) for row in rows]
+    finally:
+        session.close()
+
+
 def record_news(article,user_name,user_keywords):
     """전송된 뉴스 DB에 기록"""
-    text = f"{article['title']} {article['description']}"
-    vec = model.encode(text, convert_to_numpy=True)
+    vectors = embed_texts([article_text(article)])
+    record_news_batch([article], vectors, user_name, user_keywords)
+
+
+def _user_index_path(user_name: str) -> str:
+    return index_path(settings.VECTOR_INDEX_DIR, settings.VECTOR_INDEX_BACKEND, user_name)
+
+
+def _maybe_save_index(user_name: str, index: VectorIndex, force: bool = False) -> None:
+    """추가된 벡터가 VECTOR_INDEX_SAVE_EVERY 이상 쌓이면 디스크에 저장 (index.lock 안에서 호출)"""
+    if index.unsaved and (force or index.unsaved >= settings.VECTOR_INDEX_SAVE_EVERY):
+        save_vector_index(index, _user_index_path(user_name))
+
+
+def _sync_user_index(user_name: str, index: VectorIndex) -> None:
+    """index.max_id 이후에 저장된 행을 DB에서 읽어 추가 (다른 워커 프로세스가 저장한 기사도 반영)"""
     session = SessionLocal()
-    # print(article)
-    # print(text)
-    item = NewsVector(
-        user_name=user_name, 
-        keyword=user_keywords, 
-        title=article['title'], 
-        description=article['description'], 
-        link=article['link'],
-        vector=pickle.dumps(vec)
-    )
-    session.add(item)
-    session.commit()
+    # ORM 객체 대신 필요한 컬럼만 조회
+    rows = session.query(NewsVector.news_id, NewsVector.vector)\
+                  .filter(NewsVector.user_name == user_name, NewsVector.news_id > index.max_id)\
+                  .order_by(NewsVector.news_id.asc())\
+                  .all()
     session.close()
+    if rows:
+        index.add([r.news_id for r in rows], decode_vectors([r.vector for r in rows]))
 
 
-def find_similar_news(user_name, text, threshold=0.82):
-    """입력 문장과 가장 유사한 기존 뉴스 반환"""
+def get_user_index(user_name: str, dim: int) -> VectorIndex:
+    """
+    사용자의 벡터 인덱스 반환 (DB와 동기화된 상태)
+    Argument:
+        - user_name: 파티션 키 (사용자별로 별도 인덱스/파일)
+        - dim: 임베딩 차원 (새 인덱스 생성 및 HNSW 파일 로드에 필요)
+    """
+    with _user_indexes_lock:
+        index = _user_indexes.get(user_name)
+        if index is None:
+            index = load_vector_index(settings.VECTOR_INDEX_BACKEND, _user_index_path(user_name), dim)\
+                    or create_vector_index(settings.VECTOR_INDEX_BACKEND, dim)
+            _user_indexes[user_name] = index
+
+    with index.lock:
+        _sync_user_index(user_name, index)
+        _maybe_save_index(user_name, index)
+    return index
+
+
+def rebuild_user_index(user_name: str, dim: int) -> VectorIndex:
+    """news 테이블에서 사용자 인덱스를 처음부터 다시 만들고 디스크에 저장"""
+    index = create_vector_index(settings.VECTOR_INDEX_BACKEND, dim)
+    with index.lock:
+        _sync_user_index(user_name, index)
+        _maybe_save_index(user_name, index, force=True)
+    with _user_indexes_lock:
+        _user_indexes[user_name] = index
+    return index
+
+
+def save_user_indexes() -> None:
+    """메모리의 모든 사용자 인덱스 중 저장되지 않은 변경분을 디스크에 저장 (서버 종료 시 호출)"""
+    with _user_indexes_lock:
+        items = list(_user_indexes.items())
+    for user_name, index in items:
+        with index.lock:
+            _maybe_save_index(user_name, index, force=True)
+
+
+def _get_titles(news_ids: list[int]) -> dict[int, str]:
+    if not news_ids:
+        return {}
     session = SessionLocal()
-    existing = session.query(NewsVector).filter(NewsVector.user_name == user_name).all()
-    query_vec = model.encode(text, convert_to_numpy=True)
-    best_score = 0
-    best_news = None
-    for item in existing:
-        vec = pickle.loads(item.vector)
-        score = util.cos_sim(query_vec, vec).item()
-        if score > best_score:
-            best_score = score
-            best_news = item
+    rows = session.query(NewsVector.news_id, NewsVector.title).filter(NewsVector.news_id.in_(news_ids)).all()
     session.close()
+    return {r.news_id: r.title for r in rows}
+
+
+def find_similar_vectors(user_name, vectors: np.ndarray, threshold=0.82) -> list[dict | None]:
+    """
+    이미 임베딩된 여러 후보 기사를 한 번에 중복 검사
+    - 사용자 벡터 인덱스에서 후보별 최근접 1건을 한 번에 검색합니다.
+      (VECTOR_INDEX_BACKEND=numpy 이면 정확 검색, hnswlib/faiss 이면 HNSW 근사 검색)
+    - 같은 배치 안에서 앞선 (신규) 후보와 유사한 후보도 중복으로 판단합니다.
+      (한 건씩 검사하며 저장하던 기존 동작과 동일한 결과)
+    Returns:
+        - 후보별 결과 리스트: 중복이면 {"id", "title", "score"}, 신규면 None
+          (배치 내 중복은 id=None, batch_index=앞선 후보 인덱스)
+    """
+    if len(vectors) == 0:
+        return []
+
+    index = get_user_index(user_name, vectors.shape[1])
+    with index.lock:
+        scores, ids = index.search(vectors, k=1)
+    scores, ids = scores[:, 0], ids[:, 0]
+    hits = [int(i) for i, score in zip(ids, scores) if i >= 0 and score >= threshold]
+    titles = _get_titles(hits)
+    matches = [
+        {"id": int(i), "title": titles.get(int(i)), "score": float(score)}
+        if i >= 0 and score >= threshold else None
+        for i, score in zip(ids, scores)
+    ]
 
-    if best_news and best_score >= threshold:
-        return {"id": best_news.news_id, "title": best_news.title, "score": best_score}
-    return None
+    # 같은 배치 내 후보끼리의 유사도 (k x k)
+    normalized = normalize(vectors)
+    batch_scores = normalized @ normalized.T
+    accepted = []
+    for i, match in enumerate(matches):
+        if match is not None:
+            continue
+        for j in accepted:
+            if batch_scores[i, j] >= threshold:
+                matches[i] = {"id": None, "title": None, "score": float(batch_scores[i, j]), "batch_index": j}
+                break
+        else:
+            accepted.append(i)
+    return matches
+
+
+def find_similar_news_batch(user_name, texts: list[str], threshold=0.82) -> list[dict | None]:
+    """여러 후보 기사 텍스트를 한 번에 임베딩한 뒤 중복 검사 (find_similar_vectors 참고)"""
+    return find_similar_vectors(user_name, embed_texts(texts), threshold)
+
+
+def find_similar_news(user_name, text, threshold=0.82):
+    """입력 문장과 가장 유사한 기존 뉴스 반환"""
+    return find_similar_news_batch(user_name, [text], threshold)[0]
 
 def get_user_news_ids(user_name: str):
     """사용자가 이미 받은 뉴스 ID 목록"""
@@ -78,6 +341,5 @@ def get_user_news_ids(user_name: str):
 
 
 def embed(text):
-    # 벡터화 예시 (실제로는 sentence_transformers 사용)
-    model = SentenceTransformer("all-MiniLM-L6-v2")
-    return model.encode(text, convert_to_numpy=True)
\ No newline at end of file
+    # 공유 임베딩 서비스 사용 (호출마다 모델을 새로 만들지 않음, 동시 요청은 batcher 에서 모아서 계산)
+    return embedding_batcher.encode(text)
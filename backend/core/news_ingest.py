@@ -0,0 +1,373 @@
+# backend/core/news_ingest.py
+import asyncio
+import functools
+import html
+import logging
+import re
+import time
+from typing import AsyncIterator, Awaitable, Callable
+
+import numpy as np
+
+from backend.core.config import settings
+from backend.core.embedding_service import embedding_batcher
+from backend.core.metrics import record_span
+from backend.core.naver_news_api import search_naver_news
+from backend.core.news_db_manager import article_text, find_similar_vectors, get_subscriptions, record_news_batch
+
+logger = logging.getLogger(__name__)
+
+# ------------------------------------------------------------------
+# 뉴스 백그라운드 수집 (요청 경로 밖에서 검색 / 임베딩 / 중복 검사 / 저장)
+# - 스케줄러(NewsIngestScheduler)가 NEWS_INGEST_INTERVAL 마다 구독 키워드 전체를, 새 구독은 바로 수집합니다.
+# - 수집 한 번은 단계별 async generator 를 bounded asyncio.Queue 로 연결한 pipeline 입니다.
+#     fetch -> normalize -> embed -> dedup -> store
+#   앞 단계가 다음 키워드를 검색하는 동안 뒤 단계가 이전 batch 를 임베딩/저장하고,
+#   대기열이 가득 차면 앞 단계가 기다립니다. (느린 단계 때문에 메모리가 늘지 않음)
+# - 단계별 처리 건수 / 실행 시간(대기 시간 제외)을 누적합니다. (GET /api/news/ingest, /api/metrics 의 ingest span)
+# - /api/news (NewsAgent)는 이미 임베딩 / 중복 검사를 마치고 저장된 기사만 조회합니다.
+# ------------------------------------------------------------------
+
+# 단계 사이 대기열의 종료 표시
+_END = object()
+
+_TAG_PATTERN = re.compile(r"<[^>]+>")
+
+
+class ArticleBatch:
+    """
+    단계 사이에 전달되는 기사 묶음
+    - vectors: embed 단계 이후 기사별 L2 정규화 벡터 (len(articles), dim)
+    - user_name / keyword: dedup 단계 이후 저장 대상 사용자 / 구독 키워드
+    """
+    __slots__ = ("articles", "vectors", "user_name", "keyword")
+
+    def __init__(self, articles: list[dict], vectors: np.ndarray = None, user_name: str = None, keyword: str = None):
+        self.articles = articles
+        self.vectors = vectors
+        self.user_name = user_name
+        self.keyword = keyword
+
+    def __len__(self) -> int:
+        return len(self.articles)
+
+
+class StageStats:
+    """단계별 누적 처리량 (items_in: 받은 기사 수(fetch 는 키워드 수), items_out: 내보낸 기사 수, seconds: 대기 시간을 뺀 실행 시간)"""
+    __slots__ = ("name", "items_in", "items_out", "seconds")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.items_in = 0
+        self.items_out = 0
+        self.seconds = 0.0
+
+    def add(self, other: "StageStats") -> None:
+        self.items_in += other.items_in
+        self.items_out += other.items_out
+        self.seconds += other.seconds
+
+    def as_dict(self) -> dict:
+        return {
+            "items_in": self.items_in,
+            "items_out": self.items_out,
+            "seconds": round(self.seconds, 6),
+            "items_per_second": self.items_out / self.seconds if self.seconds > 0 else 0.0,
+        }
+
+
+def clean_text(text: str) -> str:
+    """HTML 태그 / entity 제거, 공백 정리"""
+    return " ".join(html.unescape(_TAG_PATTERN.sub("", text or "")).split())
+
+
+def normalize_article(article: dict) -> dict | None:
+    """검색 결과 기사 정리 (제목/링크가 없으면 None, 제목은 news.title 컬럼 길이(255)까지)"""
+    title = clean_text(article.get("title"))[:255]
+    link = (article.get("link") or "").strip()
+    if not title or not link:
+        return None
+    return {**article, "title": title, "link": link, "description": clean_text(article.get("description"))}
+
+
+async def _embed_articles(texts: list[str]) -> np.ndarray:
+    """기본 임베딩 함수 (공유 micro-batcher, 이벤트 루프를 막지 않음)"""
+    return (await embedding_batcher.aencode(texts, normalize=True)).astype(np.float32)
+
+
+class NewsIngestPipeline:
+    """
+    구독 키워드 수집 pipeline (fetch -> normalize -> embed -> dedup -> store)
+    - search(keyword, display, sort=..., start=...) : 기사 검색 (기본 search_naver_news, 테스트에서는 로컬 서버를 가리키는 NaverNewsClient.search)
+      기본 검색은 검색 결과 캐시를 사용하지 않습니다. (캐시 TTL 안에 다시 수집하면 새 기사 대신 캐시된 결과를 받음)
+    - embed(texts) : 텍스트 -> L2 정규화 벡터 (async)
+    """
+    STAGES = ("fetch", "normalize", "embed", "dedup", "store")
+
+    def __init__(self, search: Callable[..., Awaitable[list[dict]]] = None, embed: Callable[[list[str]], Awaitable[np.ndarray]] = None,
+                 display: int = None, batch_size: int = None, queue_size: int = None, threshold: float = 0.82):
+        self.search = search or functools.partial(search_naver_news, cache=False)
+        self.embed = embed or _embed_articles
+        self.display = display or settings.NEWS_INGEST_DISPLAY
+        self.batch_size = batch_size or settings.NEWS_INGEST_BATCH_SIZE
+        self.queue_size = queue_size or settings.NEWS_INGEST_QUEUE_SIZE
+        self.threshold = threshold
+        self.runs = 0
+        self.totals = {name: StageStats(name) for name in self.STAGES}
+
+    def stats(self) -> dict:
+        """누적 단계별 처리량"""
+        return {"runs": self.runs, "stages": {name: stats.as_dict() for name, stats in self.totals.items()}}
+
+    async def run(self, subscriptions: dict[str, list[str]]) -> dict:
+        """
+        수집 한 번 실행
+        Argument:
+            - subscriptions (dict): {keyword: [user_name, ...]} (get_subscriptions)
+        Returns:
+            - dict: 이번 실행의 단계별 처리량 {stage: {items_in, items_out, seconds, items_per_second}}
+        """
+        stats = {name: StageStats(name) for name in self.STAGES}
+        queues = [asyncio.Queue(self.queue_size) for _ in range(len(self.STAGES) - 1)]
+        stats["fetch"].items_in = len(subscriptions)
+        # dedup 단계에서 이번 실행 중 통과시킨(아직 저장 전일 수 있는) 사용자별 벡터
+        accepted: dict[str, np.ndarray] = {}
+        tasks = [
+            asyncio.ensure_future(self._stage(stats["fetch"], self._fetch(list(subscriptions)), None, queues[0])),
+            asyncio.ensure_future(self._stage(stats["normalize"], self._normalize, queues[0], queues[1])),
+            asyncio.ensure_future(self._stage(stats["embed"], self._embed, queues[1], queues[2])),
+            asyncio.ensure_future(self._stage(stats["dedup"], lambda batches: self._dedup(batches, subscriptions, accepted), queues[2], queues[3])),
+            asyncio.ensure_future(self._stage(stats["store"], self._store, queues[3], None)),
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            # 한 단계가 실패하면 나머지 단계도 중단 (대기열에서 기다리는 단계가 남지 않도록)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        finally:
+            self.runs += 1
+            for name, stage_stats in stats.items():
+                self.totals[name].add(stage_stats)
+                record_span("ingest", name, stage_stats.seconds)
+
+        logger.info(
+            "뉴스 수집 완료: 키워드 %d개, 검색 %d건, 임베딩 %d건, 저장 %d건",
+            len(subscriptions), stats["fetch"].items_out, stats["embed"].items_out, stats["store"].items_out,
+        )
+        return {name: stage_stats.as_dict() for name, stage_stats in stats.items()}
+
+    # ------------------------------------------------------------------
+    # 단계 실행 (대기열 연결 + 처리량 측정)
+    # ------------------------------------------------------------------
+    @staticmethod
+    async def _receive(stats: StageStats, inbox: asyncio.Queue) -> AsyncIterator[ArticleBatch]:
+        """앞 단계 대기열에서 batch 를 꺼냄 (기다린 시간은 단계 실행 시간에서 뺌)"""
+        while True:
+            started = time.perf_counter()
+            batch = await inbox.get()
+            stats.seconds -= time.perf_counter() - started
+            if batch is _END:
+                return
+            stats.items_in += len(batch)
+            yield batch
+
+    async def _stage(self, stats: StageStats, transform, inbox: asyncio.Queue | None, outbox: asyncio.Queue | None) -> None:
+        """
+        단계 하나 실행: transform(앞 단계 batch iterator) 이 내보내는 batch 를 다음 단계 대기열에 넣음
+        - inbox 가 None 이면 transform 은 이미 만들어진 async iterator (첫 단계)
+        - 다음 단계 대기열이 가득 차면 자리가 날 때까지 대기 (backpressure)
+        """
+        outputs = transform if inbox is None else transform(self._receive(stats, inbox))
+        while True:
+            started = time.perf_counter()
+            try:
+                batch = await anext(outputs)
+            except StopAsyncIteration:
+                break
+            finally:
+                stats.seconds += time.perf_counter() - started
+            if not len(batch):
+                continue
+            stats.items_out += len(batch)
+            if outbox is not None:
+                await outbox.put(batch)
+        if outbox is not None:
+            await outbox.put(_END)
+
+    # ------------------------------------------------------------------
+    # 단계
+    # ------------------------------------------------------------------
+    async def _fetch(self, keywords: list[str]) -> AsyncIterator[ArticleBatch]:
+        """키워드를 동시에 검색하고 먼저 끝난 키워드부터 내보냄 (최신순 첫 페이지, start=1 부터 display 건)"""
+        async def search(keyword: str) -> ArticleBatch:
+            return ArticleBatch(await self.search(keyword, self.display, sort="date", start=1), keyword=keyword)
+
+        tasks = [asyncio.ensure_future(search(keyword)) for keyword in keywords]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _normalize(self, batches: AsyncIterator[ArticleBatch]) -> AsyncIterator[ArticleBatch]:
+        """HTML 정리, 제목/링크 없는 기사와 같은 키워드 안의 중복 링크 제거 (기사의 keyword 는 구독 키워드로 맞춤)"""
+        async for batch in batches:
+            links, articles = set(), []
+            for article in batch.articles:
+                article = normalize_article(article)
+                if article is None or article["link"] in links:
+                    continue
+                links.add(article["link"])
+                articles.append({**article, "keyword": batch.keyword})
+            yield ArticleBatch(articles, keyword=batch.keyword)
+
+    async def _embed(self, batches: AsyncIterator[ArticleBatch]) -> AsyncIterator[ArticleBatch]:
+        """여러 키워드의 기사를 batch_size 개씩 모아 한 번에 임베딩 (마지막에 남은 기사도 임베딩)"""
+        pending = []
+        async for batch in batches:
+            pending.extend(batch.articles)
+            while len(pending) >= self.batch_size:
+                articles, pending = pending[:self.batch_size], pending[self.batch_size:]
+                yield ArticleBatch(articles, await self.embed([article_text(a) for a in articles]))
+        if pending:
+            yield ArticleBatch(pending, await self.embed([article_text(a) for a in pending]))
+
+    async def _dedup(self, batches: AsyncIterator[ArticleBatch], subscriptions: dict[str, list[str]],
+                     accepted: dict[str, np.ndarray]) -> AsyncIterator[ArticleBatch]:
+        """구독 사용자별 중복 검사 -> (사용자, 키워드)별 신규 기사 묶음 (DB 조회/행렬곱은 스레드에서 실행)"""
+        async for batch in batches:
+            for new_batch in await asyncio.to_thread(self._dedup_batch, batch, subscriptions, accepted):
+                yield new_batch
+
+    def _dedup_batch(self, batch: ArticleBatch, subscriptions: dict[str, list[str]],
+                     accepted: dict[str, np.ndarray]) -> list[ArticleBatch]:
+        """
+        batch 를 구독 사용자별로 나눠 중복 검사
+        - 사용자 이력(벡터 인덱스)과 batch 안의 후보끼리는 find_similar_vectors 로,
+          이번 실행에서 먼저 통과한(store 단계에서 아직 저장 중일 수 있는) 기사와는 accepted 벡터로 비교합니다.
+        """
+        user_indexes = {}  # user_name -> batch 안의 기사 위치
+        for i, article in enumerate(batch.articles):
+            for user_name in subscriptions.get(article["keyword"], ()):
+                user_indexes.setdefault(user_name, []).append(i)
+
+        results = []
+        for user_name, indexes in user_indexes.items():
+            vectors = batch.vectors[indexes]
+            new = [j for j, match in enumerate(find_similar_vectors(user_name, vectors, self.threshold)) if match is None]
+            earlier = accepted.get(user_name)
+            if earlier is not None and new:
+                scores = (vectors[new] @ earlier.T).max(axis=1)
+                new = [j for j, score in zip(new, scores) if score < self.threshold]
+            if not new:
+                continue
+            accepted[user_name] = vectors[new] if earlier is None else np.vstack([earlier, vectors[new]])
+
+            by_keyword = {}
+            for j in new:
+                by_keyword.setdefault(batch.articles[indexes[j]]["keyword"], []).append(j)
+            for keyword, positions in by_keyword.items():
+                results.append(ArticleBatch(
+                    [batch.articles[indexes[j]] for j in positions], vectors[positions], user_name=user_name, keyword=keyword,
+                ))
+        return results
+
+    async def _store(self, batches: AsyncIterator[ArticleBatch]) -> AsyncIterator[ArticleBatch]:
+        """(사용자, 키워드)별 신규 기사를 한 트랜잭션으로 저장 (bulk insert, 사용자 벡터 인덱스도 갱신)"""
+        async for batch in batches:
+            await asyncio.to_thread(record_news_batch, batch.articles, batch.vectors, batch.user_name, batch.keyword)
+            yield batch
+
+
+class NewsIngestScheduler:
+    """
+    구독 키워드 주기 수집 (서버 이벤트 루프의 background task)
+    - interval 초마다 전체 구독 키워드를 수집하고, request(keyword) 로 요청된 키워드는 바로 수집합니다.
+    - 수집 중 오류는 로그만 남기고 다음 주기에 다시 시도합니다.
+    - run_once 는 한 번에 하나씩만 실행합니다. (NewsAgent 의 새 구독 수집과 주기 수집이 겹쳐 같은 기사를 두 번 저장하지 않도록)
+    """
+    def __init__(self, pipeline: NewsIngestPipeline, interval: float = None, enabled: bool = None):
+        self.pipeline = pipeline
+        self.interval = interval if interval is not None else settings.NEWS_INGEST_INTERVAL
+        self.enabled = settings.NEWS_INGEST_ENABLED if enabled is None else enabled
+        self._task = None
+        self._wake = None
+        self._requested = set()
+        self._run_lock = asyncio.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """수집 task 시작 (이벤트 루프 안에서 호출, 서버 시작 시)"""
+        if not self.enabled or self.running:
+            return
+        self._wake = asyncio.Event()
+        self._task = asyncio.create_task(self._loop(), name="news-ingest")
+
+    async def stop(self) -> None:
+        """수집 task 종료 (진행 중인 수집은 취소, 서버 종료 시)"""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    def request(self, keyword: str) -> None:
+        """keyword 를 다음 주기를 기다리지 않고 바로 수집 (새 구독의 첫 수집이 실패했을 때, 스케줄러가 실행 중일 때만)"""
+        if self.running:
+            self._requested.add(keyword)
+            self._wake.set()
+
+    async def run_once(self, keywords: list[str] = None) -> dict:
+        """
+        구독 키워드 수집 한 번 실행
+        Argument:
+            - keywords (list[str]): 수집할 키워드 (None 이면 전체 구독 키워드)
+        Returns:
+            - dict: 단계별 처리량 (구독이 없으면 빈 dict)
+        """
+        async with self._run_lock:
+            subscriptions = await asyncio.to_thread(get_subscriptions)
+            if keywords is not None:
+                subscriptions = {keyword: subscriptions[keyword] for keyword in keywords if keyword in subscriptions}
+            if not subscriptions:
+                return {}
+            return await self.pipeline.run(subscriptions)
+
+    async def _loop(self) -> None:
+        """
+        전체 수집 기한(deadline, monotonic)을 두고, 요청된 키워드 수집으로 깨어나도 기한은 다시 늘리지 않음
+        - 요청이 interval 보다 자주 들어와도 전체 수집이 밀리지 않고, 기한이 지났으면 요청보다 전체 수집을 먼저 실행합니다.
+          (전체 수집에 요청된 키워드도 포함되므로 요청 목록은 비움)
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()  # 시작하자마자 전체 수집
+        while True:
+            now = loop.time()
+            if now >= deadline:
+                keywords = None
+                deadline = now + self.interval
+            elif self._wake.is_set():
+                keywords = list(self._requested)
+            else:
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=deadline - now)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            # 수집 중에 들어온 요청은 다음 반복에서 실행
+            self._wake.clear()
+            self._requested.clear()
+            try:
+                await self.run_once(keywords)
+            except Exception:
+                logger.exception("뉴스 수집 실패 (keywords=%s)", "all" if keywords is None else len(keywords))
+
+
+news_ingest_pipeline = NewsIngestPipeline()
+news_ingest_scheduler = NewsIngestScheduler(news_ingest_pipeline)
@@ -1,31 +1,139 @@
 import datetime
+import re
 
-# 가짜 회의실 데이터
+from backend.core.booking_engine import BookingEngine
+
+# 기본 회의실 목록 (이름, 수용 인원)
+# - BOOKING_PERSIST=True 이면 서버 시작 시 DB(llm_agent.meeting_room)의 목록으로 교체되고,
+#   DB 에 회의실이 없으면 이 목록을 DB 에 추가합니다. (BookingEngine.load)
 MEETING_ROOMS = [
-    {"name": "A", "capacity": 6,  "available": True, "user": None},
-    {"name": "B", "capacity": 10, "available": False, "user": "Leo"},
-    {"name": "C", "capacity": 4,  "available": True, "user": None},
-    {"name": "D", "capacity": 7,  "available": True, "user": None},
-    {"name": "E", "capacity": 20, "available": True, "user": None},
-    {"name": "F", "capacity": 4,  "available": True, "user": None},
+    ("A", 6),
+    ("B", 10),
+    ("C", 4),
+    ("D", 7),
+    ("E", 20),
+    ("F", 4),
 ]
 
-def get_meeting_rooms():
-    """현재 회의실 목록 조회"""
-    return MEETING_ROOMS
-
-def reserve_meeting_room(room_name: str, user_name: str = "Guest"):
-    """회의실 예약 (mock)"""
-    for room in MEETING_ROOMS:
-        if room["name"].lower() == room_name.lower():
-            if not room["available"]:
-                return {"status": "fail", "message": f"{room_name}은 이미 예약됨"}
-            room["available"] = False
-            room["user"] = user_name
-            time = datetime.datetime.now().strftime("%Y-%m-%d %H:%M")
-            return {"status": "success", "message": f"{user_name}님이 {room_name} 회의실을 {time}에 예약 완료"}
-    return {"status": "fail", "message": f"{room_name} 회의실을 찾을 수 없음"}
-
-
-def cancel_meeting_room(room_name: str, user_name: str = "Guest"):
-    return {"status": "fail", "message": f"아직 회의실 예약 취소 기능은 구현되어 있지 않습니다."}
+# 예약 시간을 지정하지 않으면 지금부터 이 시간 동안 예약
+DEFAULT_DURATION = datetime.timedelta(hours=1)
+
+# "15:00~17:00", "9:30 ~ 10:00" (24:00 은 다음 날 00:00)
+_TIME_RANGE = re.compile(r"(\d{1,2}):(\d{2})\s*~\s*(\d{1,2}):(\d{2})")
+
+
+def new_booking_engine() -> BookingEngine:
+    """기본 회의실 목록으로 채운 예약 엔진 (DB 미연결)"""
+    engine = BookingEngine()
+    engine.add_rooms(MEETING_ROOMS)
+    return engine
+
+
+# 프로세스 공유 예약 엔진 (main.py lifespan 에서 DB 연결: booking_engine.load(SessionLocal))
+booking_engine = new_booking_engine()
+
+
+def parse_time_range(text: str, day: datetime.date = None) -> tuple[datetime.datetime, datetime.datetime]:
+    """
+    "HH:MM~HH:MM" 을 day(기본 오늘)의 (시작, 종료) datetime 으로 변환
+    - 형식이 맞지 않으면 ValueError
+    """
+    match = _TIME_RANGE.search(text)
+    if match is None:
+        raise ValueError(f"예약 시간 형식이 아닙니다: {text!r} (예: 15:00~17:00)")
+    day = day or datetime.date.today()
+    start_hour, start_minute, end_hour, end_minute = (int(v) for v in match.groups())
+    midnight = datetime.datetime.combine(day, datetime.time())
+    start = midnight + datetime.timedelta(hours=start_hour, minutes=start_minute)
+    end = midnight + datetime.timedelta(hours=end_hour, minutes=end_minute)
+    if start_hour > 23 or end_hour > 24 or start_minute > 59 or end_minute > 59 or start >= end:
+        raise ValueError(f"예약 시간이 올바르지 않습니다: {match.group(0)}")
+    return start, end
+
+
+def _default_period(start: datetime.datetime = None, end: datetime.datetime = None):
+    start = start or datetime.datetime.now().replace(second=0, microsecond=0)
+    return start, end or start + DEFAULT_DURATION
+
+
+def get_meeting_rooms(now: datetime.datetime = None) -> list[dict]:
+    """
+    현재 회의실 목록 조회
+    Returns:
+        - list[dict]: name, capacity, available(지금 비어 있는지), user(지금 사용 중인 예약자),
+                      bookings(오늘 남은 예약 [{"start": "HH:MM", "end": "HH:MM", "user": str}])
+    """
+    now = now or datetime.datetime.now()
+    end_of_day = datetime.datetime.combine(now.date() + datetime.timedelta(days=1), datetime.time())
+    rooms = []
+    for room in booking_engine.rooms():
+        bookings = booking_engine.bookings(room.name, now, end_of_day)
+        current = bookings[0] if bookings and bookings[0]["start"] <= now else None
+        rooms.append({
+            "name": room.name,
+            "capacity": room.capacity,
+            "available": current is None,
+            "user": current["user"] if current else None,
+            "bookings": [{"start": f"{b['start']:%H:%M}", "end": f"{b['end']:%H:%M}", "user": b["user"]} for b in bookings],
+        })
+    return rooms
+
+
+def list_meeting_rooms(min_capacity: int = 1, start: datetime.datetime = None, end: datetime.datetime = None,
+                       only_free: bool = False, limit: int = 10) -> list[dict]:
+    """
+    min_capacity 명 이상 회의실을 수용 인원 오름차순으로 최대 limit 개 조회 (MeetingAgent 의 list_rooms 도구)
+    - 회의실 전체가 아니라 조건에 맞는 회의실만 돌려주므로 LLM 에 전달하는 토큰이 회의실 수에 비례해 늘지 않습니다.
+    Returns:
+        - list[dict]: name, capacity, free([start, end) 에 비어 있는지, 기본 지금부터 1시간),
+                      bookings(그날 start 이후 예약 [{"start": "HH:MM", "end": "HH:MM", "user": str}])
+    """
+    start, end = _default_period(start, end)
+    end_of_day = datetime.datetime.combine(start.date() + datetime.timedelta(days=1), datetime.time())
+    rooms = []
+    for room in booking_engine.rooms_by_capacity(min_capacity):
+        free = booking_engine.is_free(room.name, start, end)
+        if only_free and not free:
+            continue
+        bookings = booking_engine.bookings(room.name, start, end_of_day)
+        rooms.append({
+            "name": room.name,
+            "capacity": room.capacity,
+            "free": free,
+            "bookings": [{"start": f"{b['start']:%H:%M}", "end": f"{b['end']:%H:%M}", "user": b["user"]} for b in bookings],
+        })
+        if len(rooms) >= limit:
+            break
+    return rooms
+
+
+def find_meeting_room(people: int, start: datetime.datetime = None, end: datetime.datetime = None) -> str | None:
+    """people 명 이상, [start, end) 에 비어 있는 가장 작은 회의실 이름 (기본: 지금부터 1시간)"""
+    return booking_engine.find_free_room(people, *_default_period(start, end))
+
+
+def reserve_meeting_room(room_name: str, user_name: str = "Guest",
+                         start: datetime.datetime = None, end: datetime.datetime = None) -> dict:
+    """
+    회의실 예약 (시간을 지정하지 않으면 지금부터 1시간)
+    Returns:
+        - dict: {"status": "success" | "fail", "message": str}
+    """
+    return booking_engine.reserve(room_name, *_default_period(start, end), user_name)
+
+
+def cancel_meeting_room(room_name: str, user_name: str = "Guest",
+                        start: datetime.datetime = None, end: datetime.datetime = None) -> dict:
+    """
+    회의실 예약 취소 (본인 예약만)
+    - 시간을 지정하지 않으면 해당 회의실에서 아직 끝나지 않은 user_name 의 가장 빠른 예약을 취소합니다.
+    Returns:
+        - dict: {"status": "success" | "fail", "message": str}
+    """
+    if start is None:
+        now = datetime.datetime.now()
+        mine = [b for b in booking_engine.bookings(room_name, now, now + datetime.timedelta(days=365)) if b["user"] == user_name]
+        if not mine:
+            return {"status": "fail", "message": f"{user_name}님의 {room_name} 회의실 예약을 찾을 수 없음"}
+        start, end = mine[0]["start"], mine[0]["end"]
+    return booking_engine.cancel(room_name, start, end or start + DEFAULT_DURATION, user_name)
@@ -1,35 +1,235 @@
 #  backend/core/redis_cache.py
 import redis
+import redis.asyncio as aioredis
 import json
+import logging
+import threading
+import time
 # from backend.core.env_loader import REDIS_HOST, REDIS_PORT, REDIS_DB
 from backend.core.config import settings
+from backend.core.metrics import span
+
+logger = logging.getLogger(__name__)
 
 REDIS_HOST=settings.REDIS_HOST
 REDIS_PORT=settings.REDIS_PORT
 REDIS_DB=settings.REDIS_DB
 
+
+# ------------------------------------------------------------------
+# 프로세스 단위 Redis 커넥션 풀 (sync / asyncio)
+# - 요청/호출마다 redis.Redis(...) 를 새로 만들면 매번 TCP 연결을 새로 맺고 끊게 되어
+#   커넥션 churn 과 TIME_WAIT 소켓이 쌓입니다. 모든 Redis 사용처는 아래 redis_pools 의 클라이언트를 공유합니다.
+# - FastAPI lifespan 에서 open() / close() 하며, lifespan 밖(스크립트/테스트)에서는 처음 사용할 때 생성합니다.
+# - BlockingConnectionPool: 커넥션이 REDIS_MAX_CONNECTIONS 개를 넘으면 새로 만들지 않고 반납될 때까지 기다립니다.
+# ------------------------------------------------------------------
+class PoolMetrics:
+    """커넥션 풀 사용량 지표"""
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.created = 0          # 지금까지 새로 연결한 커넥션 수
+        self.checkouts = 0        # 풀에서 커넥션을 꺼낸 횟수
+        self.in_use = 0           # 현재 사용 중인 커넥션 수
+        self.peak_in_use = 0      # 최대 동시 사용 커넥션 수
+        self.wait_seconds = 0.0   # 커넥션을 꺼내기까지 기다린 시간 합계
+
+    def on_create(self):
+        with self._lock:
+            self.created += 1
+
+    def on_checkout(self, waited: float):
+        with self._lock:
+            self.checkouts += 1
+            self.in_use += 1
+            self.peak_in_use = max(self.peak_in_use, self.in_use)
+            self.wait_seconds += waited
+
+    def on_release(self):
+        with self._lock:
+            self.in_use -= 1
+
+    def as_dict(self, max_connections: int) -> dict:
+        return {
+            "max_connections": max_connections,
+            "created": self.created,
+            "checkouts": self.checkouts,
+            "in_use": self.in_use,
+            "peak_in_use": self.peak_in_use,
+            "avg_wait_ms": self.wait_seconds / self.checkouts * 1000 if self.checkouts else 0.0,
+        }
+
+
+class MeteredConnectionPool(redis.BlockingConnectionPool):
+    """사용량 지표를 기록하는 sync 커넥션 풀"""
+    def __init__(self, **kwargs):
+        self.metrics = PoolMetrics()
+        super().__init__(**kwargs)
+
+    def make_connection(self):
+        self.metrics.on_create()
+        return super().make_connection()
+
+    def get_connection(self, *args, **kwargs):
+        started = time.perf_counter()
+        connection = super().get_connection(*args, **kwargs)
+        self.metrics.on_checkout(time.perf_counter() - started)
+        return connection
+
+    def release(self, connection):
+        super().release(connection)
+        self.metrics.on_release()
+
+
+class MeteredAsyncConnectionPool(aioredis.BlockingConnectionPool):
+    """사용량 지표를 기록하는 asyncio 커넥션 풀"""
+    def __init__(self, **kwargs):
+        self.metrics = PoolMetrics()
+        super().__init__(**kwargs)
+
+    def make_connection(self):
+        self.metrics.on_create()
+        return super().make_connection()
+
+    async def get_connection(self, *args, **kwargs):
+        started = time.perf_counter()
+        connection = await super().get_connection(*args, **kwargs)
+        self.metrics.on_checkout(time.perf_counter() - started)
+        return connection
+
+    async def release(self, connection):
+        await super().release(connection)
+        self.metrics.on_release()
+
+
+# ------------------------------------------------------------------
+# 명령 실행 시간 계측 클라이언트 (backend/core/metrics.py, component="redis")
+# - 단일 명령은 명령 이름(get, rpush ...)으로, pipeline 은 "pipeline" 으로 기록합니다.
+# ------------------------------------------------------------------
+class MeteredPipeline(redis.client.Pipeline):
+    def execute(self, raise_on_error: bool = True):
+        with span("redis", "pipeline"):
+            return super().execute(raise_on_error)
+
+
+class MeteredRedis(redis.Redis):
+    def execute_command(self, *args, **options):
+        with span("redis", str(args[0]).lower()):
+            return super().execute_command(*args, **options)
+
+    def pipeline(self, transaction=True, shard_hint=None) -> MeteredPipeline:
+        return MeteredPipeline(self.connection_pool, self.response_callbacks, transaction, shard_hint)
+
+
+class MeteredAsyncPipeline(aioredis.client.Pipeline):
+    async def execute(self, raise_on_error: bool = True):
+        with span("redis", "pipeline"):
+            return await super().execute(raise_on_error)
+
+
+class MeteredAsyncRedis(aioredis.Redis):
+    async def execute_command(self, *args, **options):
+        with span("redis", str(args[0]).lower()):
+            return await super().execute_command(*args, **options)
+
+    def pipeline(self, transaction=True, shard_hint=None) -> MeteredAsyncPipeline:
+        return MeteredAsyncPipeline(self.connection_pool, self.response_callbacks, transaction, shard_hint)
+
+
+class RedisPools:
+    """
+    sync / asyncio Redis 커넥션 풀과 공유 클라이언트
+    - client(): redis.Redis (스레드/동기 코드용), async_client(): redis.asyncio.Redis (async 라우트/에이전트용)
+    - 클라이언트 객체는 풀을 감싼 가벼운 객체이므로 하나를 만들어 계속 재사용합니다.
+    """
+    def __init__(self, max_connections: int = None, connection_class=None, async_connection_class=None, **connection_kwargs):
+        self.max_connections = max_connections or settings.REDIS_MAX_CONNECTIONS
+        # connection_class / async_connection_class: 테스트에서 fakeredis 커넥션으로 바꿔 끼울 때 사용
+        self.connection_class = connection_class or redis.Connection
+        self.async_connection_class = async_connection_class or aioredis.Connection
+        self.connection_kwargs = {
+            "host": REDIS_HOST,
+            "port": REDIS_PORT,
+            "db": REDIS_DB,
+            "decode_responses": True,
+            "socket_timeout": settings.REDIS_SOCKET_TIMEOUT,
+            "socket_connect_timeout": settings.REDIS_SOCKET_TIMEOUT,
+            **connection_kwargs,
+        }
+        self._lock = threading.Lock()
+        self._client = None
+        self._async_client = None
+
+    def open(self) -> None:
+        """sync / asyncio 풀 생성 (이미 있으면 그대로 사용)"""
+        with self._lock:
+            if self._client is None:
+                pool = MeteredConnectionPool(
+                    max_connections=self.max_connections, timeout=settings.REDIS_POOL_TIMEOUT,
+                    connection_class=self.connection_class, **self.connection_kwargs,
+                )
+                self._client = MeteredRedis(connection_pool=pool)
+            if self._async_client is None:
+                pool = MeteredAsyncConnectionPool(
+                    max_connections=self.max_connections, timeout=settings.REDIS_POOL_TIMEOUT,
+                    connection_class=self.async_connection_class, **self.connection_kwargs,
+                )
+                self._async_client = MeteredAsyncRedis(connection_pool=pool)
+
+    async def close(self) -> None:
+        """풀의 모든 커넥션 정리 (서버 종료 시)"""
+        with self._lock:
+            client, async_client = self._client, self._async_client
+            self._client = self._async_client = None
+        if async_client is not None:
+            await async_client.connection_pool.disconnect()
+        if client is not None:
+            client.connection_pool.disconnect()
+
+    def client(self) -> redis.Redis:
+        if self._client is None:
+            self.open()
+        return self._client
+
+    def async_client(self) -> aioredis.Redis:
+        if self._async_client is None:
+            self.open()
+        return self._async_client
+
+    def stats(self) -> dict:
+        """풀 사용량 지표 (풀이 아직 만들어지지 않았으면 빈 dict)"""
+        result = {}
+        if self._client is not None:
+            result["sync"] = self._client.connection_pool.metrics.as_dict(self.max_connections)
+        if self._async_client is not None:
+            result["async"] = self._async_client.connection_pool.metrics.as_dict(self.max_connections)
+        return result
+
+
+redis_pools = RedisPools()
+
+
+# FastAPI 의존성 주입용 (Depends(get_redis) / Depends(get_async_redis))
+def get_redis() -> redis.Redis:
+    return redis_pools.client()
+
+
+def get_async_redis() -> aioredis.Redis:
+    return redis_pools.async_client()
+
+
 def get_redis_connection():
+    """공유 풀의 Redis 클라이언트 반환 (연결 확인 실패 시 None), 호출마다 새 커넥션을 만들지 않습니다."""
     try:
-        conn = redis.Redis(
-            host=REDIS_HOST,
-            port=REDIS_PORT,
-            db=REDIS_DB,
-            decode_responses=True
-        )
+        conn = redis_pools.client()
         conn.ping()
-        print(f"✅ Redis connected at {REDIS_HOST}:{REDIS_PORT}")
         return conn
-    except redis.ConnectionError:
-        print("❌ Redis connection failed")
+    except redis.RedisError:
+        logger.warning("❌ Redis connection failed")
         return None
 
 class RedisChatMemory:
-    def __init__(self):
-        self.client = redis.Redis(
-            host=REDIS_HOST,
-            port=REDIS_PORT,
-            decode_responses=True
-        )
+    def __init__(self, client: redis.Redis = None):
+        self.client = client or redis_pools.client()
         self.key = "chat_memory"
 
     def add_message(self, role: str, content: str):
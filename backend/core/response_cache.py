@@ -0,0 +1,165 @@
+# backend/core/response_cache.py
+import asyncio
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from typing import Awaitable, Callable, Dict, List
+
+import numpy as np
+
+from backend.core.config import settings
+from backend.core.result_cache import TTLCache
+from backend.core.user_vector_cache import normalize
+
+# 현재 요청(asyncio task)에서 마지막 LLM 호출의 캐시 결과: "hit-exact" / "hit-semantic" / "miss" (캐시 미사용이면 None)
+# 라우트에서 llm_cache_headers() 로 응답 헤더(X-LLM-Cache)에 실어 보냅니다.
+llm_cache_status: ContextVar[str | None] = ContextVar("llm_cache_status", default=None)
+
+CACHE_HEADER = "X-LLM-Cache"
+
+
+def llm_cache_headers() -> dict:
+    """현재 요청의 LLM 캐시 결과 응답 헤더 (캐시를 사용하지 않았으면 빈 dict)"""
+    status = llm_cache_status.get()
+    return {CACHE_HEADER: status} if status else {}
+
+
+def _hash(value) -> str:
+    return hashlib.sha256(json.dumps(value, ensure_ascii=False, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """
+    LLM 응답 캐시 (opt-in, 프로세스 단위)
+    1) exact    : (model, system prompt, temperature, 대화 이력, 메세지) 전체의 해시가 같으면 저장된 답변 재사용
+    2) semantic : 같은 (model, system prompt, temperature) 안에서 "최근 대화 이력 + 메세지" 임베딩의
+                  코사인 유사도가 threshold 이상인 이전 질문이 있으면 그 답변 재사용 (MiniLM, embedding_service)
+    - 두 단계 모두 ttl 초가 지나면 만료되고, maxsize 를 넘으면 가장 오래 사용하지 않은 항목부터 제거합니다.
+    - system prompt 가 다르면(예: 회의실 현황, 대화 요약이 바뀜) 다른 질문으로 취급하므로 오래된 상태의 답변을 재사용하지 않습니다.
+    - 임베딩 계산은 CPU 작업이므로 스레드에서 실행합니다.
+    """
+    def __init__(self, ttl: float = None, maxsize: int = None, threshold: float = None, history_messages: int = None,
+                 semantic: bool = None, embed: Callable[[list[str]], np.ndarray] = None):
+        self.ttl = ttl or settings.LLM_CACHE_TTL
+        self.maxsize = maxsize or settings.LLM_CACHE_MAXSIZE
+        self.threshold = threshold if threshold is not None else settings.LLM_CACHE_SIMILARITY
+        self.history_messages = history_messages if history_messages is not None else settings.LLM_CACHE_HISTORY_MESSAGES
+        self.semantic = settings.LLM_CACHE_SEMANTIC if semantic is None else semantic
+        # embed: 텍스트 리스트 -> (n, dim) 벡터, 기본값은 공유 SentenceTransformer (테스트에서는 가짜 함수 주입)
+        self._embed = embed
+        self.exact = TTLCache(self.maxsize, self.ttl)
+        self._semantic = OrderedDict()  # exact key -> (scope, 만료시각, 정규화 벡터, 답변)
+        self._lock = threading.Lock()
+        # 카운터 (프로세스 단위)
+        self.exact_hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict:
+        hits = self.exact_hits + self.semantic_hits
+        total = hits + self.misses
+        return {
+            "exact_hits": self.exact_hits,
+            "semantic_hits": self.semantic_hits,
+            "misses": self.misses,
+            "hit_ratio": hits / total if total else 0.0,
+            "size": len(self.exact),
+        }
+
+    def clear(self) -> None:
+        self.exact.clear()
+        with self._lock:
+            self._semantic.clear()
+
+    # ------------------------------------------------------------------
+    # key / 임베딩
+    # ------------------------------------------------------------------
+    @staticmethod
+    def exact_key(model: str, prompt: str, message: str, temperature: float, chat_history: List[Dict] = None) -> str:
+        history = [(m["role"], m["content"]) for m in chat_history or []]
+        return _hash([model, prompt, float(temperature), history, message])
+
+    @staticmethod
+    def scope_key(model: str, prompt: str, temperature: float) -> str:
+        return _hash([model, prompt, float(temperature)])
+
+    def semantic_text(self, message: str, chat_history: List[Dict] = None) -> str:
+        """유사도 비교용 텍스트: 최근 history_messages 건의 대화 + 신규 메세지"""
+        recent = (chat_history or [])[-self.history_messages:] if self.history_messages > 0 else []
+        return "\n".join([f"{m['role']}: {m['content']}" for m in recent] + [f"user: {message}"])
+
+    def _embed_text(self, text: str) -> np.ndarray:
+        if self._embed is None:
+            from backend.core.embedding_service import embedding_batcher
+            self._embed = embedding_batcher.encode
+        return normalize(self._embed([text]))[0]
+
+    # ------------------------------------------------------------------
+    # semantic 저장소
+    # ------------------------------------------------------------------
+    def _semantic_lookup(self, scope: str, vector: np.ndarray) -> str | None:
+        """같은 scope 에서 유사도가 threshold 이상인 가장 가까운 답변"""
+        now = time.monotonic()
+        with self._lock:
+            for key in [k for k, entry in self._semantic.items() if entry[1] <= now]:
+                del self._semantic[key]
+            candidates = [(key, entry) for key, entry in self._semantic.items() if entry[0] == scope]
+            if not candidates:
+                return None
+            scores = np.stack([entry[2] for _, entry in candidates]) @ vector
+            best = int(scores.argmax())
+            if scores[best] < self.threshold:
+                return None
+            key, entry = candidates[best]
+            self._semantic.move_to_end(key)
+            return entry[3]
+
+    def _semantic_store(self, key: str, scope: str, vector: np.ndarray, reply: str) -> None:
+        with self._lock:
+            self._semantic[key] = (scope, time.monotonic() + self.ttl, vector, reply)
+            self._semantic.move_to_end(key)
+            while len(self._semantic) > self.maxsize:
+                self._semantic.popitem(last=False)
+
+    # ------------------------------------------------------------------
+    # 조회 + 호출
+    # ------------------------------------------------------------------
+    async def get_or_call(self, model: str, prompt: str, message: str, temperature: float,
+                          chat_history: List[Dict], call: Callable[[], Awaitable[str]],
+                          cacheable: Callable[[str], bool] = bool) -> str:
+        """
+        캐시된 답변 반환, 없으면 call()(실제 LLM 호출) 결과를 저장 후 반환
+        - 결과(hit-exact / hit-semantic / miss)는 llm_cache_status 에 기록합니다.
+        - cacheable(답변) 이 False 이면 저장하지 않습니다. (기본: 빈 답변은 저장하지 않음)
+        """
+        key = self.exact_key(model, prompt, message, temperature, chat_history)
+        reply = self.exact.get(key)
+        if reply is not None:
+            self.exact_hits += 1
+            llm_cache_status.set("hit-exact")
+            return reply
+
+        scope = vector = None
+        if self.semantic:
+            scope = self.scope_key(model, prompt, temperature)
+            vector = await asyncio.to_thread(self._embed_text, self.semantic_text(message, chat_history))
+            reply = self._semantic_lookup(scope, vector)
+            if reply is not None:
+                self.semantic_hits += 1
+                llm_cache_status.set("hit-semantic")
+                return reply
+
+        self.misses += 1
+        llm_cache_status.set("miss")
+        reply = await call()
+        if cacheable(reply):
+            self.exact.set(key, reply)
+            if vector is not None:
+                self._semantic_store(key, scope, vector, reply)
+        return reply
+
+
+llm_response_cache = LLMResponseCache()
@@ -0,0 +1,187 @@
+# backend/core/result_cache.py
+import asyncio
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+import redis.asyncio as aioredis
+
+from backend.core.redis_cache import redis_pools
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    프로세스 내부 LRU + TTL 캐시 (스레드 안전)
+    - maxsize 를 넘으면 가장 오래 사용하지 않은 항목부터 제거합니다.
+    - 만료된 항목은 조회 시점에 제거합니다.
+    """
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()  # key -> (만료시각, 값)
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl: float = None) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + (ttl or self.ttl), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class ResultCache:
+    """
+    외부 API 결과용 2단계 캐시 (async)
+    - 1단계: 프로세스 내부 TTLCache (가장 빠름, 워커마다 따로 보관)
+    - 2단계: Redis (선택, 여러 워커가 공유) - key: cache:{namespace}:{key}, JSON 으로 저장
+    - single-flight: 같은 key 로 동시에 miss 가 나면 loader 는 한 번만 실행하고 나머지 요청은 그 결과를 함께 기다립니다.
+
+    Redis 에 문제가 생기면 retry_after 초 동안 Redis 단계를 건너뛰고 로컬 캐시 + loader 만 사용합니다.
+    """
+    def __init__(self, namespace: str, ttl: float, maxsize: int = 1024, use_redis: bool = True,
+                 enabled: bool = True, client: aioredis.Redis = None, retry_after: float = 30.0):
+        self.namespace = namespace
+        self.ttl = ttl
+        self.local = TTLCache(maxsize, ttl)
+        self.use_redis = use_redis
+        self.enabled = enabled
+        self.retry_after = retry_after
+        self._client = client
+        self._down_until = 0.0
+        self._inflight = {}  # key -> asyncio.Future (진행 중인 loader 결과)
+        # 카운터 (프로세스 단위)
+        self.local_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.errors = 0
+
+    @property
+    def client(self) -> aioredis.Redis:
+        # 기본값: 프로세스 공유 asyncio 커넥션 풀의 클라이언트 (backend/core/redis_cache.py)
+        return self._client or redis_pools.async_client()
+
+    @property
+    def redis_available(self) -> bool:
+        return self.use_redis and time.monotonic() >= self._down_until
+
+    def stats(self) -> dict:
+        hits = self.local_hits + self.redis_hits
+        total = hits + self.misses + self.coalesced
+        return {
+            "local_hits": self.local_hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "errors": self.errors,
+            "hit_ratio": (hits + self.coalesced) / total if total else 0.0,
+            "local_size": len(self.local),
+        }
+
+    def clear(self) -> None:
+        """로컬 캐시 비우기 (Redis 는 ttl 로 만료)"""
+        self.local.clear()
+
+    def _redis_key(self, key) -> str:
+        parts = key if isinstance(key, tuple) else (key,)
+        return f"cache:{self.namespace}:" + ":".join(str(p) for p in parts)
+
+    def _failed(self, e: Exception) -> None:
+        self.errors += 1
+        self._down_until = time.monotonic() + self.retry_after
+        logger.warning("[%s] Redis unavailable, skipping Redis tier for %.0fs: %s", self.namespace, self.retry_after, e)
+
+    async def _redis_get(self, key):
+        if not self.redis_available:
+            return _MISSING
+        try:
+            raw = await self.client.get(self._redis_key(key))
+        except aioredis.RedisError as e:
+            self._failed(e)
+            return _MISSING
+        return _MISSING if raw is None else json.loads(raw)
+
+    async def _redis_set(self, key, value) -> None:
+        if not self.redis_available:
+            return
+        try:
+            await self.client.set(self._redis_key(key), json.dumps(value, ensure_ascii=False), ex=int(self.ttl))
+        except aioredis.RedisError as e:
+            self._failed(e)
+
+    async def get_or_load(self, key, loader, cacheable=bool):
+        """
+        캐시 조회, 없으면 loader() 결과를 저장 후 반환
+        Argument:
+            - key (hashable): 캐시 key (tuple 이면 Redis key 에서 ':' 로 연결)
+            - loader: 인자 없는 async 함수 (원본 조회)
+            - cacheable: 결과를 저장할지 판단하는 함수 (기본: 빈 결과/실패는 저장하지 않음)
+        Returns:
+            - 캐시 또는 loader 결과
+        """
+        if not self.enabled:
+            return await loader()
+
+        value = self.local.get(key, _MISSING)
+        if value is not _MISSING:
+            self.local_hits += 1
+            return value
+
+        # 같은 key 를 이미 조회 중이면 그 결과를 함께 기다림 (single-flight)
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.coalesced += 1
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await self._redis_get(key)
+            if value is not _MISSING:
+                self.redis_hits += 1
+                self.local.set(key, value)
+            else:
+                self.misses += 1
+                value = await loader()
+                if cacheable(value):
+                    self.local.set(key, value)
+                    await self._redis_set(key, value)
+            future.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # 기다리는 요청이 없으면 "exception was never retrieved" 경고가 나지 않도록 소비
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
@@ -0,0 +1,205 @@
+# backend/core/session_cache.py
+import json
+import logging
+import time
+
+import redis
+
+from backend.core.config import settings
+from backend.core.redis_cache import redis_pools
+
+logger = logging.getLogger(__name__)
+
+
+class SessionHistoryCache:
+    """
+    채팅 세션의 최근 대화 이력을 Redis에 write-through 로 보관하는 캐시 (PostgreSQL 앞단)
+    - chat:{session_id}:messages : 최근 메세지 JSON 리스트 ({"sequence", "role", "content"}, 최대 max_messages 건)
+    - chat:{session_id}:meta     : hash (seq: 마지막으로 할당된 sequence, summary / summary_until: 대화 요약)
+    - 두 key 모두 마지막 사용 후 ttl 초가 지나면 만료됩니다.
+
+    Redis 에 문제가 생기면 모든 메소드는 None/False 를 반환하고 (호출 측은 DB 경로를 사용),
+    retry_after 초 동안은 Redis 호출을 건너뜁니다.
+    """
+    def __init__(self, client: redis.Redis = None, ttl: int = None, max_messages: int = None, retry_after: float = None, enabled: bool = None):
+        self._client = client
+        self.ttl = ttl or settings.SESSION_CACHE_TTL
+        self.max_messages = max_messages if max_messages is not None else settings.CHAT_HISTORY_MAX_TURNS * 2
+        self.retry_after = retry_after if retry_after is not None else settings.SESSION_CACHE_RETRY_AFTER
+        self.enabled = settings.SESSION_CACHE_ENABLED if enabled is None else enabled
+        self._down_until = 0.0
+        # hit/miss 카운터 (프로세스 단위)
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    @property
+    def client(self) -> redis.Redis:
+        # 기본값: 프로세스 공유 커넥션 풀의 클라이언트 (backend/core/redis_cache.py)
+        return self._client or redis_pools.client()
+
+    @property
+    def available(self) -> bool:
+        return self.enabled and self.max_messages > 0 and time.monotonic() >= self._down_until
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "hit_ratio": self.hits / total if total else 0.0,
+        }
+
+    def _failed(self, e: Exception) -> None:
+        self.errors += 1
+        self._down_until = time.monotonic() + self.retry_after
+        logger.warning("Redis unavailable, falling back to DB for %.0fs: %s", self.retry_after, e)
+
+    @staticmethod
+    def _keys(session_id: str) -> tuple[str, str]:
+        return f"chat:{session_id}:messages", f"chat:{session_id}:meta"
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def get(self, session_id: str, max_messages: int) -> tuple[list[dict], str | None, int] | None:
+        """
+        캐시된 최근 메세지와 요약 반환
+        Argument:
+            - max_messages: 호출 측에서 필요한 최근 메세지 수
+        Returns:
+            - (messages(시간순), summary, summary_until), 캐시에 없거나 필요한 만큼 들고 있지 않으면 None (miss)
+        """
+        if not self.available or max_messages is None or max_messages > self.max_messages:
+            return None
+        messages_key, meta_key = self._keys(session_id)
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            pipe.lrange(messages_key, 0, -1)
+            pipe.hgetall(meta_key)
+            raw_messages, meta = pipe.execute()
+        except redis.RedisError as e:
+            self._failed(e)
+            return None
+
+        messages = sorted((json.loads(m) for m in raw_messages), key=lambda m: m["sequence"])
+        if not self._is_complete(messages, meta, max_messages):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return messages, meta.get("summary") or None, int(meta.get("summary_until") or 0)
+
+    @staticmethod
+    def _is_complete(messages: list[dict], meta: dict, max_messages: int) -> bool:
+        """
+        캐시만으로 최근 max_messages 건을 빠짐없이 돌려줄 수 있는지 확인
+        - 마지막으로 할당된 sequence 까지 모두 반영되어 있어야 하고 (아직 commit 되지 않은 턴이 있으면 miss)
+        - 필요한 개수만큼 들고 있거나, 세션의 첫 메세지부터 들고 있어야 합니다.
+        """
+        if "seq" not in meta:
+            return False
+        last_sequence = int(meta["seq"])
+        if not messages:
+            return last_sequence == 0
+        if messages[-1]["sequence"] != last_sequence:
+            return False
+        if messages[-1]["sequence"] - messages[0]["sequence"] + 1 != len(messages):
+            return False
+        return len(messages) >= max_messages or messages[0]["sequence"] == 1
+
+    # ------------------------------------------------------------------
+    # 저장 (write-through)
+    # ------------------------------------------------------------------
+    def fill(self, session_id: str, messages: list[dict], last_sequence: int, summary: str = None, summary_until: int = 0) -> None:
+        """DB에서 읽은 최근 메세지(시간순)와 마지막 sequence 로 캐시를 새로 채움 (miss 이후 호출)"""
+        if not self.available:
+            return
+        messages_key, meta_key = self._keys(session_id)
+        try:
+            pipe = self.client.pipeline(transaction=True)
+            pipe.delete(messages_key, meta_key)
+            if messages:
+                pipe.rpush(messages_key, *[self._dumps(m) for m in messages[-self.max_messages:]])
+                pipe.expire(messages_key, self.ttl)
+            pipe.hset(meta_key, mapping={"seq": last_sequence, "summary": summary or "", "summary_until": summary_until})
+            pipe.expire(meta_key, self.ttl)
+            pipe.execute()
+        except redis.RedisError as e:
+            self._failed(e)
+
+    def allocate(self, session_id: str, count: int) -> int | None:
+        """
+        sequence 카운터에서 count 개의 연속된 번호를 원자적으로 할당하고 첫 번호 반환
+        - 카운터가 캐시에 없으면 None (호출 측은 DB에서 sequence를 계산)
+        - WATCH/MULTI 낙관적 트랜잭션을 사용하므로 여러 워커가 동시에 할당해도 번호가 겹치지 않습니다.
+        """
+        if not self.available:
+            return None
+        _, meta_key = self._keys(session_id)
+        try:
+            with self.client.pipeline(transaction=True) as pipe:
+                while True:
+                    try:
+                        pipe.watch(meta_key)
+                        current = pipe.hget(meta_key, "seq")
+                        if current is None:
+                            pipe.unwatch()
+                            return None
+                        pipe.multi()
+                        pipe.hset(meta_key, "seq", int(current) + count)
+                        pipe.expire(meta_key, self.ttl)
+                        pipe.execute()
+                        return int(current) + 1
+                    except redis.WatchError:
+                        continue
+        except redis.RedisError as e:
+            self._failed(e)
+            return None
+
+    def append(self, session_id: str, messages: list[dict]) -> None:
+        """commit 된 메세지를 캐시에 추가 (캐시가 만료되어 없으면 아무것도 하지 않음 -> 다음 조회 시 DB에서 채움)"""
+        if not self.available or not messages:
+            return
+        messages_key, meta_key = self._keys(session_id)
+        try:
+            if not self.client.exists(meta_key):
+                return
+            pipe = self.client.pipeline(transaction=True)
+            pipe.rpush(messages_key, *[self._dumps(m) for m in messages])
+            pipe.ltrim(messages_key, -self.max_messages, -1)
+            pipe.expire(messages_key, self.ttl)
+            pipe.expire(meta_key, self.ttl)
+            pipe.execute()
+        except redis.RedisError as e:
+            self._failed(e)
+
+    def set_summary(self, session_id: str, summary: str, summary_until: int) -> None:
+        """대화 요약 갱신 (캐시에 세션이 있을 때만)"""
+        if not self.available:
+            return
+        _, meta_key = self._keys(session_id)
+        try:
+            if self.client.exists(meta_key):
+                self.client.hset(meta_key, mapping={"summary": summary, "summary_until": summary_until})
+        except redis.RedisError as e:
+            self._failed(e)
+
+    def invalidate(self, session_id: str) -> None:
+        """세션 캐시 삭제 (DB와 어긋났을 때)"""
+        if not self.available:
+            return
+        try:
+            self.client.delete(*self._keys(session_id))
+        except redis.RedisError as e:
+            self._failed(e)
+
+    @staticmethod
+    def _dumps(message: dict) -> str:
+        return json.dumps(
+            {"sequence": message["sequence"], "role": message["role"], "content": message["content"]},
+            ensure_ascii=False,
+        )
+
+
+session_cache = SessionHistoryCache()
@@ -0,0 +1,20 @@
+# backend/core/token_counter.py
+
+# 메세지 1건당 role/구분자 등으로 추가되는 토큰 수 (OpenAI chat 포맷 기준 근사값)
+MESSAGE_OVERHEAD_TOKENS = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    텍스트의 토큰 수를 빠르게 근사 (토크나이저 없이 계산)
+    - 영문/숫자(ASCII)는 약 4글자당 1토큰, 한글 등 비 ASCII 문자는 1글자당 약 1토큰으로 계산합니다.
+    - 대화 이력을 토큰 예산 안에서 자를 때 사용하는 값이므로 약간 크게(보수적으로) 잡습니다.
+    Argument:
+        - text: 토큰 수를 셀 텍스트
+    Returns:
+        - int: 근사 토큰 수 (메세지 1건의 overhead 포함)
+    """
+    if not text:
+        return MESSAGE_OVERHEAD_TOKENS
+    ascii_chars = len(text.encode("ascii", "ignore"))
+    return (ascii_chars + 3) // 4 + (len(text) - ascii_chars) + MESSAGE_OVERHEAD_TOKENS
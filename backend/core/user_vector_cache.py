@@ -0,0 +1,96 @@
+# backend/core/user_vector_cache.py
+import threading
+import numpy as np
+
+
+class UserVectorCache:
+    """
+    사용자 1명의 뉴스 임베딩을 메모리에 들고 있는 행렬 캐시
+    - 벡터는 L2 정규화된 float32 (n, dim) 행렬로 보관하므로 코사인 유사도 = 내적(dot) 입니다.
+    - 후보 기사 k개를 한 번의 행렬곱 (k, dim) @ (dim, n) 으로 비교합니다.
+    - 행 추가는 용량을 2배씩 늘리는 버퍼를 사용하여 매번 전체 복사하지 않습니다.
+    """
+    def __init__(self, dim: int = None):
+        self.dim = dim
+        self.size = 0
+        self.last_news_id = 0
+        self._matrix = None
+        self._ids = np.empty(0, dtype=np.int64)
+        self._titles: list[str] = []
+        self.lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self.size
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """현재 저장된 (size, dim) 임베딩 행렬 (view)"""
+        if self._matrix is None:
+            return np.empty((0, self.dim or 0), dtype=np.float32)
+        return self._matrix[:self.size]
+
+    def append(self, news_ids, titles: list[str] | None, vectors: np.ndarray) -> None:
+        """
+        뉴스 (id, 제목, 벡터)를 추가 (벡터는 정규화하여 저장, 제목은 None 이면 보관하지 않음)
+        - 이미 반영된 news_id(last_news_id 이하)는 건너뛰므로 DB 동기화와 record_news 반영이 겹쳐도 중복되지 않습니다.
+        """
+        news_ids = np.asarray(news_ids, dtype=np.int64).reshape(-1)
+        vectors = normalize(vectors)
+        keep = news_ids > self.last_news_id
+        if not keep.all():
+            news_ids, vectors = news_ids[keep], vectors[keep]
+            titles = [t for t, k in zip(titles, keep) if k] if titles is not None else None
+        if len(vectors) == 0:
+            return
+        if self.dim is None:
+            self.dim = vectors.shape[1]
+
+        needed = self.size + len(vectors)
+        if self._matrix is None or needed > len(self._matrix):
+            capacity = max(needed, 2 * (len(self._matrix) if self._matrix is not None else 0), 64)
+            grown = np.empty((capacity, self.dim), dtype=np.float32)
+            grown_ids = np.empty(capacity, dtype=np.int64)
+            if self.size:
+                grown[:self.size] = self._matrix[:self.size]
+                grown_ids[:self.size] = self._ids[:self.size]
+            self._matrix, self._ids = grown, grown_ids
+
+        self._matrix[self.size:needed] = vectors
+        self._ids[self.size:needed] = news_ids
+        if titles is not None:
+            self._titles.extend(titles)
+        self.size = needed
+        self.last_news_id = max(self.last_news_id, int(np.max(news_ids)))
+
+    def best_matches(self, queries: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        후보 벡터들(k, dim) 각각에 대해 가장 유사한 저장 뉴스의 (행 번호, 점수) 반환
+        - 저장된 뉴스가 없으면 행 번호 -1, 점수 0
+        """
+        queries = normalize(queries)
+        if self.size == 0:
+            return np.full(len(queries), -1), np.zeros(len(queries), dtype=np.float32)
+        scores = queries @ self.matrix.T
+        best = scores.argmax(axis=1)
+        return best, scores[np.arange(len(queries)), best]
+
+    @property
+    def ids(self) -> np.ndarray:
+        """현재 저장된 news_id 배열 (view)"""
+        return self._ids[:self.size]
+
+    def news_id(self, row: int) -> int:
+        return int(self._ids[row])
+
+    def title(self, row: int) -> str:
+        return self._titles[row]
+
+
+def normalize(vectors) -> np.ndarray:
+    """(k, dim) float32 로 변환 후 L2 정규화"""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    if vectors.ndim == 1:
+        vectors = vectors.reshape(1, -1)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
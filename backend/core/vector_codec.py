@@ -0,0 +1,101 @@
+# backend/core/vector_codec.py
+import struct
+import numpy as np
+
+# ------------------------------------------------------------------
+# 임베딩 벡터 바이너리 포맷 (NewsVector.vector 컬럼)
+#
+#   | magic "NV" (2B) | version (1B) | dtype code (1B) | dim (uint32) | scale (float32) | padding (4B) | data ... |
+#
+# - 헤더 16바이트 + little-endian 데이터 (float32: dim*4B, float16: dim*2B, int8: dim*1B)
+# - int8 은 값 = int8 * scale 로 복원 (scale = max(|v|) / 127)
+# - 헤더 크기를 16바이트로 맞춰 float32 데이터가 4바이트 정렬되도록 함 (np.frombuffer zero-copy)
+# ------------------------------------------------------------------
+MAGIC = b"NV"
+VERSION = 1
+HEADER = struct.Struct("<2sBBIf4x")
+
+DTYPES = {
+    "float32": (0, np.dtype("<f4")),
+    "float16": (1, np.dtype("<f2")),
+    "int8":    (2, np.dtype("i1")),
+}
+_CODE_TO_DTYPE = {code: (name, dtype) for name, (code, dtype) in DTYPES.items()}
+
+
+def is_encoded(blob: bytes) -> bool:
+    """이 포맷으로 저장된 값인지 여부 (기존 pickle 값 구분용)"""
+    return blob is not None and len(blob) >= HEADER.size and bytes(blob[:2]) == MAGIC
+
+
+def encode_vector(vec, dtype: str = "float32") -> bytes:
+    """1차원 벡터를 헤더 + little-endian 바이트로 인코딩"""
+    if dtype not in DTYPES:
+        raise ValueError(f"지원하지 않는 벡터 저장 타입입니다: {dtype} (가능: {', '.join(DTYPES)})")
+    code, np_dtype = DTYPES[dtype]
+    vec = np.asarray(vec, dtype=np.float32).reshape(-1)
+
+    scale = 1.0
+    if dtype == "int8":
+        max_abs = float(np.abs(vec).max()) if len(vec) else 0.0
+        scale = max_abs / 127 if max_abs > 0 else 1.0
+        data = np.clip(np.round(vec / scale), -127, 127).astype(np_dtype)
+    else:
+        data = vec.astype(np_dtype)
+    return HEADER.pack(MAGIC, VERSION, code, len(vec), scale) + data.tobytes()
+
+
+def _read_header(blob: bytes) -> tuple[str, np.dtype, int, float]:
+    if not is_encoded(blob):
+        raise ValueError(
+            "알 수 없는 벡터 포맷입니다. (기존 pickle 저장 값이라면 "
+            "`python -m backend.database.migrate_news_vectors` 로 변환하세요)"
+        )
+    _, version, code, dim, scale = HEADER.unpack_from(blob)
+    if version != VERSION or code not in _CODE_TO_DTYPE:
+        raise ValueError(f"지원하지 않는 벡터 포맷 버전/타입입니다: version={version}, dtype={code}")
+    name, np_dtype = _CODE_TO_DTYPE[code]
+    return name, np_dtype, dim, scale
+
+
+def decode_vector(blob: bytes) -> np.ndarray:
+    """
+    바이트를 float32 벡터로 디코딩
+    - float32 저장값은 복사 없이 np.frombuffer view (read-only) 를 반환합니다.
+    """
+    name, np_dtype, dim, scale = _read_header(blob)
+    data = np.frombuffer(blob, dtype=np_dtype, count=dim, offset=HEADER.size)
+    if name == "float32":
+        return data
+    if name == "int8":
+        return data.astype(np.float32) * np.float32(scale)
+    return data.astype(np.float32)
+
+
+def decode_vectors(blobs: list[bytes]) -> np.ndarray:
+    """
+    여러 벡터를 (n, dim) float32 행렬로 디코딩
+    - 모두 같은 타입/dim 이면 버퍼를 한 번 이어붙인 뒤 reshape 하여 한 번에 변환합니다.
+      (float32 는 복사 없는 view, float16/int8 은 한 번의 astype)
+    - 타입이 섞여 있으면 행 단위로 디코딩합니다.
+    """
+    if not blobs:
+        return np.empty((0, 0), dtype=np.float32)
+    name, np_dtype, dim, _ = _read_header(blobs[0])
+    row_size = HEADER.size + dim * np_dtype.itemsize
+    prefix = bytes(blobs[0][:4])
+    if not all(len(b) == row_size and bytes(b[:4]) == prefix for b in blobs):
+        return np.stack([decode_vector(b) for b in blobs])
+
+    n = len(blobs)
+    joined = b"".join(blobs)
+    # 헤더(16B)도 itemsize 의 배수이므로 전체를 (n, 헤더칸 + dim) 으로 본 뒤 헤더 열만 잘라냄
+    rows = np.frombuffer(joined, dtype=np_dtype).reshape(n, row_size // np_dtype.itemsize)
+    data = rows[:, HEADER.size // np_dtype.itemsize:]
+    if name == "float32":
+        return data
+    if name == "int8":
+        # 각 행 헤더의 scale(offset 8, float32)만 strided view 로 읽음
+        scales = np.ndarray((n, 1), dtype="<f4", buffer=joined, offset=8, strides=(row_size, 4))
+        return data.astype(np.float32) * scales
+    return data.astype(np.float32)
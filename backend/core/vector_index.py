@@ -0,0 +1,244 @@
+# backend/core/vector_index.py
+import logging
+import os
+import threading
+from abc import ABC, abstractmethod
+import numpy as np
+from backend.core.user_vector_cache import UserVectorCache, normalize
+
+logger = logging.getLogger(__name__)
+
+# ------------------------------------------------------------------
+# 벡터 인덱스 (유사 뉴스 검색용)
+# - 모든 벡터는 L2 정규화 후 내적(inner product) = 코사인 유사도로 비교합니다.
+# - id 는 news.news_id (int64), 이미 추가된 id(max_id 이하)는 다시 추가하지 않습니다.
+# - backend:
+#     "numpy"   : 전체 행렬 brute-force (정확, 외부 의존성 없음)
+#     "hnswlib" : HNSW 근사 검색 (pip install hnswlib)
+#     "faiss"   : faiss IndexHNSWFlat 근사 검색 (pip install faiss-cpu)
+#   라이브러리가 설치되어 있지 않으면 numpy 로 대체합니다. (모두 CPU 전용)
+# ------------------------------------------------------------------
+BACKENDS = ("numpy", "hnswlib", "faiss")
+
+# HNSW 파라미터 (M: 그래프 연결 수, ef: 탐색 후보 수 - 클수록 정확하지만 느림)
+HNSW_M = 16
+HNSW_EF_CONSTRUCTION = 200
+HNSW_EF_SEARCH = 64
+
+
+class VectorIndex(ABC):
+    """벡터 인덱스 공통 인터페이스"""
+    backend = None
+    file_suffix = None
+
+    def __init__(self, dim: int):
+        self.dim = dim
+        self.max_id = 0
+        self.lock = threading.RLock()  # 검색/추가/저장 동시 접근 보호 (호출 측에서 사용)
+        self.unsaved = 0               # 마지막 저장 이후 추가된 벡터 수
+
+    def add(self, ids, vectors) -> int:
+        """(id, 벡터) 추가, 실제로 추가된 개수 반환"""
+        ids = np.asarray(ids, dtype=np.int64).reshape(-1)
+        vectors = normalize(vectors)
+        keep = ids > self.max_id
+        ids, vectors = ids[keep], vectors[keep]
+        if len(ids) == 0:
+            return 0
+        self._add(ids, vectors)
+        self.max_id = int(ids.max())
+        self.unsaved += len(ids)
+        return len(ids)
+
+    def search(self, queries, k: int = 1) -> tuple[np.ndarray, np.ndarray]:
+        """
+        질의 벡터 (q, dim) 각각의 상위 k개 (점수, id) 반환
+        - 결과가 k개보다 적으면 점수 0, id -1 로 채웁니다.
+        """
+        queries = normalize(queries)
+        scores = np.zeros((len(queries), k), dtype=np.float32)
+        ids = np.full((len(queries), k), -1, dtype=np.int64)
+        n = min(k, len(self))
+        if n > 0:
+            scores[:, :n], ids[:, :n] = self._search(queries, n)
+        return scores, ids
+
+    @abstractmethod
+    def __len__(self) -> int: ...
+
+    @abstractmethod
+    def _add(self, ids: np.ndarray, vectors: np.ndarray) -> None: ...
+
+    @abstractmethod
+    def _search(self, queries: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]: ...
+
+    @abstractmethod
+    def save(self, path: str) -> None: ...
+
+    @classmethod
+    @abstractmethod
+    def load(cls, path: str, dim: int) -> "VectorIndex": ...
+
+
+class NumpyVectorIndex(VectorIndex):
+    """정규화 float32 행렬 brute-force (정확 검색)"""
+    backend = "numpy"
+    file_suffix = ".npz"
+
+    def __init__(self, dim: int):
+        super().__init__(dim)
+        self._cache = UserVectorCache(dim)
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def _add(self, ids, vectors):
+        self._cache.append(ids, None, vectors)
+
+    def _search(self, queries, k):
+        scores = queries @ self._cache.matrix.T
+        if k == 1:
+            top = scores.argmax(axis=1).reshape(-1, 1)
+        else:
+            top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        top_scores = np.take_along_axis(scores, top, axis=1)
+        order = np.argsort(-top_scores, axis=1)
+        top = np.take_along_axis(top, order, axis=1)
+        return np.take_along_axis(top_scores, order, axis=1), self._cache.ids[top]
+
+    def save(self, path):
+        np.savez(path, ids=self._cache.ids, vectors=self._cache.matrix)
+
+    @classmethod
+    def load(cls, path, dim):
+        data = np.load(path)
+        index = cls(dim)
+        index.add(data["ids"], data["vectors"])
+        return index
+
+
+class HnswVectorIndex(VectorIndex):
+    """hnswlib HNSW 근사 검색"""
+    backend = "hnswlib"
+    file_suffix = ".hnsw"
+
+    def __init__(self, dim: int, index=None):
+        import hnswlib
+        super().__init__(dim)
+        if index is None:
+            index = hnswlib.Index(space="ip", dim=dim)
+            index.init_index(max_elements=1024, ef_construction=HNSW_EF_CONSTRUCTION, M=HNSW_M)
+        index.set_ef(HNSW_EF_SEARCH)
+        self._index = index
+
+    def __len__(self) -> int:
+        return self._index.get_current_count()
+
+    def _add(self, ids, vectors):
+        needed = len(self) + len(ids)
+        if needed > self._index.get_max_elements():
+            self._index.resize_index(max(needed, 2 * self._index.get_max_elements()))
+        self._index.add_items(vectors, ids)
+
+    def _search(self, queries, k):
+        labels, distances = self._index.knn_query(queries, k=k)
+        # space="ip" 의 distance = 1 - 내적
+        return (1.0 - distances).astype(np.float32), labels.astype(np.int64)
+
+    def save(self, path):
+        self._index.save_index(path)
+
+    @classmethod
+    def load(cls, path, dim):
+        import hnswlib
+        raw = hnswlib.Index(space="ip", dim=dim)
+        raw.load_index(path)
+        index = cls(dim, raw)
+        ids = raw.get_ids_list()
+        index.max_id = int(max(ids)) if len(ids) else 0
+        return index
+
+
+class FaissVectorIndex(VectorIndex):
+    """faiss IndexHNSWFlat(내적) + IndexIDMap2 근사 검색"""
+    backend = "faiss"
+    file_suffix = ".faiss"
+
+    def __init__(self, dim: int, index=None):
+        import faiss
+        super().__init__(dim)
+        if index is None:
+            hnsw = faiss.IndexHNSWFlat(dim, HNSW_M, faiss.METRIC_INNER_PRODUCT)
+            hnsw.hnsw.efConstruction = HNSW_EF_CONSTRUCTION
+            index = faiss.IndexIDMap2(hnsw)
+        faiss.downcast_index(index.index).hnsw.efSearch = HNSW_EF_SEARCH
+        self._index = index
+
+    def __len__(self) -> int:
+        return self._index.ntotal
+
+    def _add(self, ids, vectors):
+        self._index.add_with_ids(vectors, ids)
+
+    def _search(self, queries, k):
+        scores, ids = self._index.search(queries, k)
+        return scores, ids
+
+    def save(self, path):
+        import faiss
+        faiss.write_index(self._index, path)
+
+    @classmethod
+    def load(cls, path, dim):
+        import faiss
+        index = cls(dim, faiss.read_index(path))
+        ids = faiss.vector_to_array(index._index.id_map)
+        index.max_id = int(ids.max()) if len(ids) else 0
+        return index
+
+
+_INDEX_CLASSES = {cls.backend: cls for cls in (NumpyVectorIndex, HnswVectorIndex, FaissVectorIndex)}
+
+
+def resolve_backend(backend: str) -> str:
+    """설치되지 않은 ANN 라이브러리를 요청하면 numpy 로 대체"""
+    if backend not in BACKENDS:
+        raise ValueError(f"지원하지 않는 벡터 인덱스입니다: {backend} (가능: {', '.join(BACKENDS)})")
+    if backend == "numpy":
+        return backend
+    try:
+        __import__(backend)
+        return backend
+    except ImportError:
+        logger.warning("'%s' 가 설치되어 있지 않아 numpy brute-force 인덱스를 사용합니다.", backend)
+        return "numpy"
+
+
+def create_vector_index(backend: str, dim: int) -> VectorIndex:
+    """빈 벡터 인덱스 생성"""
+    return _INDEX_CLASSES[resolve_backend(backend)](dim)
+
+
+def index_path(base_dir: str, backend: str, key: str) -> str:
+    """파티션(사용자) 별 인덱스 파일 경로: <base_dir>/<backend>/<key><suffix>"""
+    backend = resolve_backend(backend)
+    safe_key = "".join(c if c.isalnum() or c in "-_" else f"%{ord(c):x}" for c in key) or "_"
+    return os.path.join(base_dir, backend, safe_key + _INDEX_CLASSES[backend].file_suffix)
+
+
+def save_vector_index(index: VectorIndex, path: str) -> None:
+    """임시 파일에 쓴 뒤 교체 (저장 중 종료되어도 기존 파일 유지)"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp" + index.file_suffix
+    index.save(tmp_path)
+    os.replace(tmp_path, path)
+    index.unsaved = 0
+
+
+def load_vector_index(backend: str, path: str, dim: int) -> VectorIndex | None:
+    """저장된 인덱스 로드 (파일이 없으면 None)"""
+    if not os.path.exists(path):
+        return None
+    index = _INDEX_CLASSES[resolve_backend(backend)].load(path, dim)
+    index.unsaved = 0
+    return index
@@ -5,7 +5,7 @@ from backend.database.db_manager import engine, OrmBase
 # SQLAlchemy가 테이블을 생성하려면, 어떤 모델들이 있는지 알아야 합니다.
 # 따라서 우리가 만든 모든 모델 클래스가 들어있는 파일을 여기서 반드시 import 해야 합니다.
 # 이 import 구문이 없으면, OrmBase는 어떤 자식 클래스가 있는지 몰라서 아무 테이블도 만들지 않습니다.
-from backend.database.models import agent_model, chat_model
+from backend.database.models import agent_model, chat_model, meeting_model
 
 print("Creating tables...")
 
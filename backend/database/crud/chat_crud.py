@@ -1,14 +1,23 @@
 from typing import Optional
-from sqlalchemy import func, text
+from sqlalchemy import func, text, select, insert, update, delete, literal, union_all, String, Text, Integer, UUID
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 import uuid
 
+from backend.core.metrics import timed
+from backend.core.token_counter import estimate_tokens
 # 우리가 6단계에서 만든 모델 클래스들을 import 합니다.
 from backend.database.models.chat_model import ChatSession, SessionMessage
+from backend.database.models.agent_model import LlmModel
+
+# 토큰 예산으로 이력을 읽을 때 한 번에 가져오는 메세지 수 (keyset pagination page 크기)
+HISTORY_PAGE_SIZE = 50
 
 
 # ----------------------------------------------- 
 # ------- Chat Session 대하 생성 (첫 대화) ---------- 
+@timed("db")
 def create_chat_session(db: Session, user_id: str, agent_id: str, model_id: str) -> ChatSession:
     """
     새로운 채팅 세션을 생성하고 DB에 저장합니다.
@@ -39,6 +48,7 @@ def create_chat_session(db: Session, user_id: str, agent_id: str, model_id: str)
 
 # -----------------------------------------------
 # ------- Chat Session 단일 조회 ---------- 
+@timed("db")
 def get_chat_session(db: Session, session_id: uuid.UUID) -> ChatSession | None:
     """
     주어진 session_id로 채팅 세션을 조회합니다.
@@ -50,6 +60,7 @@ def get_chat_session(db: Session, session_id: uuid.UUID) -> ChatSession | None:
 
 # -----------------------------------------------
 # ------- Chat Session 히스토리 불러오기 ---------- 
+@timed("db")
 def get_chat_history(db: Session, session_id: uuid.UUID) -> list[SessionMessage]:
     """
     주어진 session_id에 속한 모든 메시지를 시간 순서대로 조회합니다.
@@ -59,14 +70,183 @@ def get_chat_history(db: Session, session_id: uuid.UUID) -> list[SessionMessage]
     - Returns:
         - lst[SessionMessage]: SeesionMassge(OrmBase) 객채의 리스트 반환
     """
+    # 라우트에서 문자열로 전달되는 session_id 도 허용 (UUID 객체로 변환)
+    session_id = uuid.UUID(str(session_id))
     return db.query(SessionMessage)\
-             .filter(SessionMessage.session_id == session_id)\
+             .filter(SessionMessage.session_id == session_id, SessionMessage.content.isnot(None))\
              .order_by(SessionMessage.sequence.asc())\
              .all()
 
 
+# -----------------------------------------------
+# ------- 최근 대화 이력만 불러오기 (window / 토큰 예산) ---------- 
+@timed("db")
+def get_recent_messages(db: Session, session_id: uuid.UUID, max_messages: int = None, max_tokens: int = None, page_size: int = HISTORY_PAGE_SIZE, whole_turns: bool = True) -> list[dict]:
+    """
+    세션의 최근 메세지를 최신순으로 필요한 만큼만 읽어 시간 순서대로 반환합니다.
+    - ORM 객체 대신 필요한 컬럼(sequence, role, content)만 조회합니다.
+    - (session_id, sequence DESC) keyset pagination: OFFSET 없이 "sequence < 마지막으로 읽은 값" 조건으로 다음 page를 읽으므로
+      세션 메세지가 아무리 많아도 (session_id, sequence) 인덱스에서 읽은 만큼만 비용이 듭니다.
+    - 이력이 assistant 메세지로 시작하지 않도록 (턴 단위로) 맨 앞의 assistant 메세지는 제외합니다.
+    - Args:
+        - db: db 연결정보
+        - session_id: 조회하고자 하는 session_id
+        - max_messages: 최대 메세지 수 (None: 제한 없음)
+        - max_tokens: 메세지 content 의 근사 토큰 합 최대값 (None: 제한 없음)
+        - whole_turns: False 이면 맨 앞의 assistant 메세지도 그대로 반환 (캐시를 채울 때 사용)
+    - Returns:
+        - list[dict]: [{"sequence", "role", "content"}, ...] (sequence 오름차순)
+    """
+    window = _RecentWindow(session_id, max_messages, max_tokens, page_size, whole_turns)
+    while (query := window.next_query()) is not None:
+        window.consume(db.execute(query).all())
+    return window.result()
+
+
+class _RecentWindow:
+    """
+    get_recent_messages / aget_recent_messages 공통 keyset pagination 상태
+    - next_query(): 다음 page 조회 쿼리 (더 읽을 필요가 없으면 None)
+    - consume(rows): 조회 결과 반영 (토큰 예산 초과 / 마지막 page 이면 종료)
+    """
+    def __init__(self, session_id, max_messages, max_tokens, page_size, whole_turns):
+        self.session_id = uuid.UUID(str(session_id))
+        self.max_messages = max_messages
+        self.max_tokens = max_tokens
+        self.page_size = page_size
+        self.finish = _complete_turns if whole_turns else (lambda messages_desc: messages_desc[::-1])
+        self.messages = []
+        self.used_tokens = 0
+        self.before_sequence = None
+        self.limit = None
+        self.done = False
+
+    def next_query(self):
+        if self.done:
+            return None
+        limit = self.page_size if self.max_tokens is not None else self.max_messages
+        if self.max_messages is not None:
+            limit = min(limit, self.max_messages - len(self.messages))
+            if limit <= 0:
+                return None
+        self.limit = limit
+
+        query = select(SessionMessage.sequence, SessionMessage.role, SessionMessage.content)\
+                .where(SessionMessage.session_id == self.session_id, SessionMessage.content.isnot(None))
+        if self.before_sequence is not None:
+            query = query.where(SessionMessage.sequence < self.before_sequence)
+        query = query.order_by(SessionMessage.sequence.desc())
+        if limit is not None:
+            query = query.limit(limit)
+        return query
+
+    def consume(self, rows) -> None:
+        for row in rows:
+            if self.max_tokens is not None:
+                self.used_tokens += estimate_tokens(row.content)
+                if self.used_tokens > self.max_tokens:
+                    self.done = True
+                    return
+            self.messages.append({"sequence": row.sequence, "role": row.role, "content": row.content})
+
+        if self.limit is None or len(rows) < self.limit:
+            self.done = True
+        else:
+            self.before_sequence = rows[-1].sequence
+
+    def result(self) -> list[dict]:
+        return self.finish(self.messages)
+
+
+def window_messages(messages: list[dict], max_messages: int = None, max_tokens: int = None) -> list[dict]:
+    """
+    이미 메모리에 있는 시간순 메세지 목록(예: Redis 캐시)에서 get_recent_messages 와 같은 규칙으로 최근 window 만 선택
+    """
+    selected = []
+    used_tokens = 0
+    for message in reversed(messages):
+        if max_messages is not None and len(selected) >= max_messages:
+            break
+        if max_tokens is not None:
+            used_tokens += estimate_tokens(message["content"])
+            if used_tokens > max_tokens:
+                break
+        selected.append(message)
+    return _complete_turns(selected)
+
+
+def _complete_turns(messages_desc: list[dict]) -> list[dict]:
+    """최신순 메세지를 시간순으로 뒤집고, 맨 앞이 assistant 메세지면 제외 (이전 user 메세지가 잘린 턴)"""
+    messages = messages_desc[::-1]
+    while messages and messages[0]["role"] != "user":
+        messages.pop(0)
+    return messages
+
+
+@timed("db")
+def get_messages_between(db: Session, session_id: uuid.UUID, after_sequence: int, before_sequence: int, limit: int = None) -> list[dict]:
+    """
+    after_sequence < sequence < before_sequence 범위의 메세지를 시간 순서대로 반환 (컬럼만 조회, 대화 요약용)
+    - limit 을 지정하면 범위 안에서 가장 최근 limit 건만 반환합니다.
+    """
+    rows = db.execute(_messages_between_query(session_id, after_sequence, before_sequence, limit)).all()
+    return [{"sequence": r.sequence, "role": r.role, "content": r.content} for r in reversed(rows)]
+
+
+def _messages_between_query(session_id, after_sequence: int, before_sequence: int, limit: int = None):
+    query = select(SessionMessage.sequence, SessionMessage.role, SessionMessage.content)\
+            .where(SessionMessage.session_id == uuid.UUID(str(session_id)),
+                   SessionMessage.sequence > after_sequence,
+                   SessionMessage.sequence < before_sequence,
+                   SessionMessage.content.isnot(None))\
+            .order_by(SessionMessage.sequence.desc())
+    if limit is not None:
+        query = query.limit(limit)
+    return query
+
+
+@timed("db")
+def get_session_summary(db: Session, session_id: uuid.UUID) -> tuple[str | None, int]:
+    """세션의 (요약, 요약에 반영된 마지막 sequence) 반환 (세션이 없으면 (None, 0))"""
+    return _summary_row(db.execute(_session_summary_query(session_id)).first())
+
+
+def _session_summary_query(session_id):
+    return select(ChatSession.summary, ChatSession.summary_until)\
+           .where(ChatSession.session_id == uuid.UUID(str(session_id)))
+
+
+def _summary_row(row) -> tuple[str | None, int]:
+    if row is None:
+        return None, 0
+    return row.summary, row.summary_until or 0
+
+
+@timed("db")
+def update_session_summary(db: Session, session_id: uuid.UUID, summary: str, summary_until: int) -> None:
+    """세션 요약 갱신 (더 최신 요약이 이미 저장되어 있으면 덮어쓰지 않음)"""
+    db.execute(_update_summary_statement(session_id, summary, summary_until))
+
+
+def _update_summary_statement(session_id, summary: str, summary_until: int):
+    return update(ChatSession)\
+           .where(ChatSession.session_id == uuid.UUID(str(session_id)), ChatSession.summary_until < summary_until)\
+           .values(summary=summary, summary_until=summary_until)
+
+
+@timed("db")
+def get_model_max_tokens(db: Session, model_id: str) -> int | None:
+    """llm_model 테이블에 등록된 모델의 max_tokens (없으면 None)"""
+    return db.execute(_model_max_tokens_query(model_id)).scalar()
+
+
+def _model_max_tokens_query(model_id: str):
+    return select(LlmModel.max_tokens).where(LlmModel.model_id == model_id)
+
+
 # -----------------------------------------------
 # ------- message 히스토리 저장하기 ---------- 
+@timed("db")
 def save_message(db: Session, session_id: uuid.UUID, role: str, content: str, sequence: int ) -> SessionMessage:
     """
     새로운 채팅 메시지를 생성하고 DB에 저장합니다.
@@ -120,10 +300,231 @@ def save_message(db: Session, session_id: uuid.UUID, role: str, content: str, se
 
 
 
+# -----------------------------------------------
+# ------- 한 턴(user + assistant) 메세지 저장하기 ---------- 
+@timed("db")
+def save_turn(db: Session, session_id: uuid.UUID, messages: list[tuple[str, str]], first_sequence: int = None) -> list[int]:
+    """
+    한 턴의 메세지 여러 건을 sequence를 DB에서 원자적으로 계산하여 한 번의 multi-row INSERT로 저장합니다.
+    - Args:
+        - db: db 연결정보
+        - session_id: 메세지를 저장할 session_id
+        - messages: [(role, content), ...] 저장 순서대로 (예: [("user", 질문), ("assistant", 답변)])
+        - first_sequence: 이미 할당받은 첫 sequence (Redis 세션 캐시의 sequence 카운터, backend/core/session_cache.py)
+                          주어지면 잠금/MAX 계산 없이 바로 INSERT 하고, 이미 사용 중인 번호라면(unique 위반) 아래 방식으로 다시 저장
+    - Returns:
+        - list[int]: 저장된 메세지들의 sequence (messages 순서)
+
+    get_last_sequence(MAX 조회) -> save_message(add) 방식은 같은 세션에 동시에 요청이 들어오면
+    같은 sequence를 계산할 수 있으므로, 아래처럼 처리합니다.
+    1) chat_session 행을 FOR UPDATE 로 잠가 같은 세션의 턴 저장을 직렬화 (SQLite 는 무시되며 쓰기 자체가 직렬화됨)
+    2) INSERT ... SELECT 로 MAX(sequence)+1, +2 ... 를 INSERT 문 안에서 계산하고 RETURNING 으로 sequence 반환
+
+        INSERT INTO llm_agent.session_message (message_id, session_id, role, content, sequence)
+        SELECT :id_1, :session_id, :role_1, :content_1, (SELECT COALESCE(MAX(sequence), 0) ...) + 1
+        UNION ALL
+        SELECT :id_2, :session_id, :role_2, :content_2, (SELECT COALESCE(MAX(sequence), 0) ...) + 2
+        RETURNING sequence;
+
+    (session_id, sequence) 에는 unique 제약이 있어 어떤 경우에도 같은 sequence가 중복 저장되지 않습니다.
+    """
+    if not messages:
+        return []
+    session_id = uuid.UUID(str(session_id))
+
+    # 0. sequence 를 미리 할당받은 경우: 일반 multi-row INSERT (savepoint 안에서 실행하여 실패해도 트랜잭션 유지)
+    #    (ORM bulk insert 는 NULL 값 컬럼이 있는 행을 다른 INSERT 로 나누므로 Core Table insert 로 한 번에 실행)
+    if first_sequence is not None:
+        sequences = list(range(first_sequence, first_sequence + len(messages)))
+        try:
+            with db.begin_nested():
+                db.execute(insert(SessionMessage.__table__), _turn_rows(session_id, sequences, messages))
+            return sequences
+        except IntegrityError:
+            pass
+
+    # 1. 세션 잠금 (잠금 이후에 실행되는 INSERT 문은 앞선 턴이 commit한 메세지까지 보고 MAX를 계산)
+    db.execute(_lock_session_query(session_id))
+
+    # 2. INSERT ... SELECT ... RETURNING
+    return sorted(db.execute(_insert_turn_statement(session_id, messages)).scalars().all())
+
+
+def _turn_rows(session_id: uuid.UUID, sequences: list[int], messages: list[tuple[str, str]]) -> list[dict]:
+    return [
+        {"message_id": uuid.uuid4(), "session_id": session_id, "role": role, "content": content, "sequence": sequence}
+        for sequence, (role, content) in zip(sequences, messages)
+    ]
+
+
+def _lock_session_query(session_id: uuid.UUID):
+    return select(ChatSession.session_id).where(ChatSession.session_id == session_id).with_for_update()
+
+
+def _insert_turn_statement(session_id: uuid.UUID, messages: list[tuple[str, str]]):
+    last_sequence = select(func.coalesce(func.max(SessionMessage.sequence), 0))\
+                    .where(SessionMessage.session_id == session_id)\
+                    .scalar_subquery()
+    rows = union_all(*[
+        select(
+            literal(uuid.uuid4(), UUID(as_uuid=True)),
+            literal(session_id, UUID(as_uuid=True)),
+            literal(role, String),
+            literal(content, Text),
+            last_sequence + literal(offset, Integer),
+        )
+        for offset, (role, content) in enumerate(messages, start=1)
+    ])
+    return insert(SessionMessage)\
+           .from_select(["message_id", "session_id", "role", "content", "sequence"], rows)\
+           .returning(SessionMessage.sequence)
+
+
+# -----------------------------------------------
+# ------- 예약된 메세지 답변 저장 / 삭제 ---------- 
+@timed("db")
+def complete_message(db: Session, session_id: uuid.UUID, sequence: int, content: str) -> bool:
+    """
+    save_turn 으로 빈 내용(NULL)으로 예약해 둔 메세지에 내용 저장 (ChatAgent.handle: LLM 답변을 받은 뒤 호출)
+    - Returns:
+        - bool: 저장 여부 (이미 내용이 있거나 삭제된 메세지면 False)
+    """
+    return db.execute(_complete_message_statement(session_id, sequence, content)).rowcount == 1
+
+
+def _complete_message_statement(session_id: uuid.UUID, sequence: int, content: str):
+    return update(SessionMessage)\
+           .where(SessionMessage.session_id == uuid.UUID(str(session_id)),
+                  SessionMessage.sequence == sequence,
+                  SessionMessage.content.is_(None))\
+           .values(content=content)
+
+
+@timed("db")
+def discard_messages(db: Session, session_id: uuid.UUID, sequences: list[int]) -> None:
+    """예약한 메세지 삭제 (LLM 호출 실패 시, 실패한 턴은 이력에 남기지 않음)"""
+    if sequences:
+        db.execute(_discard_messages_statement(session_id, sequences))
+
+
+def _discard_messages_statement(session_id: uuid.UUID, sequences: list[int]):
+    return delete(SessionMessage)\
+           .where(SessionMessage.session_id == uuid.UUID(str(session_id)),
+                  SessionMessage.sequence.in_(sequences))
+
+
 # SQL: SELECT coalesce( max(sequence),0) FROM llm_agent.session_message WHERE session_id = :session_id
+@timed("db")
 def get_last_sequence(db: Session, session_id: uuid.UUID) -> int :
     """주어진 세션의 마지막 시퀀스 번호를 조회합니다."""
     # 이 함수는 오직 '조회' 책임만 가집니다.
     return db.query(func.coalesce(func.max(SessionMessage.sequence),0))\
              .filter(SessionMessage.session_id == session_id)\
-             .scalar()
\ No newline at end of file
+             .scalar()
+
+
+# ===============================================
+# async 버전 (AsyncSession, backend/database/db_manager.AsyncSessionLocal)
+# - 함수 이름 앞에 a 를 붙였고, 인자/반환값/SQL 은 위의 sync 함수와 동일합니다.
+# - 쿼리를 기다리는 동안 이벤트 루프가 다른 요청을 처리할 수 있습니다.
+# ===============================================
+@timed("db")
+async def acreate_chat_session(db: AsyncSession, user_id: str, agent_id: str, model_id: str) -> ChatSession:
+    """create_chat_session 의 async 버전"""
+    new_session = ChatSession(user_id=user_id, agent_id=agent_id, model_id=model_id)
+    db.add(new_session)
+    await db.flush()
+    return new_session
+
+
+@timed("db")
+async def aget_chat_session(db: AsyncSession, session_id: uuid.UUID) -> ChatSession | None:
+    """get_chat_session 의 async 버전"""
+    return await db.get(ChatSession, uuid.UUID(str(session_id)))
+
+
+@timed("db")
+async def aget_chat_history(db: AsyncSession, session_id: uuid.UUID) -> list[SessionMessage]:
+    """get_chat_history 의 async 버전"""
+    result = await db.execute(
+        select(SessionMessage)
+        .where(SessionMessage.session_id == uuid.UUID(str(session_id)), SessionMessage.content.isnot(None))
+        .order_by(SessionMessage.sequence.asc())
+    )
+    return list(result.scalars().all())
+
+
+@timed("db")
+async def aget_recent_messages(db: AsyncSession, session_id: uuid.UUID, max_messages: int = None, max_tokens: int = None, page_size: int = HISTORY_PAGE_SIZE, whole_turns: bool = True) -> list[dict]:
+    """get_recent_messages 의 async 버전"""
+    window = _RecentWindow(session_id, max_messages, max_tokens, page_size, whole_turns)
+    while (query := window.next_query()) is not None:
+        window.consume((await db.execute(query)).all())
+    return window.result()
+
+
+@timed("db")
+async def aget_messages_between(db: AsyncSession, session_id: uuid.UUID, after_sequence: int, before_sequence: int, limit: int = None) -> list[dict]:
+    """get_messages_between 의 async 버전"""
+    rows = (await db.execute(_messages_between_query(session_id, after_sequence, before_sequence, limit))).all()
+    return [{"sequence": r.sequence, "role": r.role, "content": r.content} for r in reversed(rows)]
+
+
+@timed("db")
+async def aget_session_summary(db: AsyncSession, session_id: uuid.UUID) -> tuple[str | None, int]:
+    """get_session_summary 의 async 버전"""
+    return _summary_row((await db.execute(_session_summary_query(session_id))).first())
+
+
+@timed("db")
+async def aupdate_session_summary(db: AsyncSession, session_id: uuid.UUID, summary: str, summary_until: int) -> None:
+    """update_session_summary 의 async 버전"""
+    await db.execute(_update_summary_statement(session_id, summary, summary_until))
+
+
+@timed("db")
+async def aget_model_max_tokens(db: AsyncSession, model_id: str) -> int | None:
+    """get_model_max_tokens 의 async 버전"""
+    return (await db.execute(_model_max_tokens_query(model_id))).scalar()
+
+
+@timed("db")
+async def asave_turn(db: AsyncSession, session_id: uuid.UUID, messages: list[tuple[str, str]], first_sequence: int = None) -> list[int]:
+    """save_turn 의 async 버전 (동작/동시성 보장은 save_turn 과 동일)"""
+    if not messages:
+        return []
+    session_id = uuid.UUID(str(session_id))
+
+    if first_sequence is not None:
+        sequences = list(range(first_sequence, first_sequence + len(messages)))
+        try:
+            async with db.begin_nested():
+                await db.execute(insert(SessionMessage.__table__), _turn_rows(session_id, sequences, messages))
+            return sequences
+        except IntegrityError:
+            pass
+
+    await db.execute(_lock_session_query(session_id))
+    return sorted((await db.execute(_insert_turn_statement(session_id, messages))).scalars().all())
+
+
+@timed("db")
+async def acomplete_message(db: AsyncSession, session_id: uuid.UUID, sequence: int, content: str) -> bool:
+    """complete_message 의 async 버전"""
+    return (await db.execute(_complete_message_statement(session_id, sequence, content))).rowcount == 1
+
+
+@timed("db")
+async def adiscard_messages(db: AsyncSession, session_id: uuid.UUID, sequences: list[int]) -> None:
+    """discard_messages 의 async 버전"""
+    if sequences:
+        await db.execute(_discard_messages_statement(session_id, sequences))
+
+
+@timed("db")
+async def aget_last_sequence(db: AsyncSession, session_id: uuid.UUID) -> int:
+    """get_last_sequence 의 async 버전"""
+    return (await db.execute(
+        select(func.coalesce(func.max(SessionMessage.sequence), 0))
+        .where(SessionMessage.session_id == uuid.UUID(str(session_id)))
+    )).scalar()
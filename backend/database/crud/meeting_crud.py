@@ -0,0 +1,79 @@
+import datetime
+import uuid
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import Session
+
+from backend.core.metrics import timed
+from backend.database.models.meeting_model import MeetingBooking, MeetingRoom
+
+
+# -----------------------------------------------
+# ------- 회의실 (BookingEngine.load 에서 사용) ---------
+@timed("db")
+def get_rooms(db: Session) -> list[tuple[str, int]]:
+    """
+    사용 중인 회의실 목록
+    - Returns:
+        - list[tuple[str, int]]: (회의실 이름, 수용 인원)
+    """
+    rows = db.execute(
+        select(MeetingRoom.room_name, MeetingRoom.capacity).where(MeetingRoom.is_active.is_(True))
+    ).all()
+    return [(name, capacity) for name, capacity in rows]
+
+
+@timed("db")
+def add_rooms(db: Session, rooms: list[tuple[str, int]]) -> None:
+    """회의실 추가 (executemany 한 번, commit 은 호출하는 쪽에서)"""
+    if rooms:
+        db.execute(insert(MeetingRoom), [
+            {"room_name": name, "capacity": capacity, "is_active": True} for name, capacity in rooms
+        ])
+
+
+# -----------------------------------------------
+# ------- 회의실 예약 ---------
+@timed("db")
+def get_bookings(db: Session, ends_after: datetime.datetime,
+                 room_name: str = None) -> list[tuple[str, datetime.datetime, datetime.datetime, str]]:
+    """
+    ends_after 이후에 끝나는 예약 (이미 끝난 예약은 읽지 않음)
+    - room_name 을 지정하면 그 회의실의 예약만 읽습니다. (BookingEngine 의 예약/취소 전 DB 와 맞추기)
+    - Returns:
+        - list[tuple]: (회의실 이름, 시작, 종료, 예약자)
+    """
+    query = select(MeetingBooking.room_name, MeetingBooking.start_time, MeetingBooking.end_time, MeetingBooking.user_id)\
+        .where(MeetingBooking.end_time > ends_after)
+    if room_name is not None:
+        query = query.where(MeetingBooking.room_name == room_name)
+    rows = db.execute(query).all()
+    return [tuple(row) for row in rows]
+
+
+@timed("db")
+def insert_booking(db: Session, room_name: str, user_id: str,
+                   start_time: datetime.datetime, end_time: datetime.datetime) -> uuid.UUID:
+    """
+    예약 저장 (commit 은 호출하는 쪽에서)
+    - 다른 워커가 같은 구간을 먼저 예약했으면 commit 시 IntegrityError (unique / exclusion 제약)
+    - Returns:
+        - uuid.UUID: booking_id
+    """
+    booking_id = uuid.uuid4()
+    db.execute(insert(MeetingBooking).values(
+        booking_id=booking_id, room_name=room_name, user_id=user_id, start_time=start_time, end_time=end_time,
+    ))
+    return booking_id
+
+
+@timed("db")
+def delete_booking(db: Session, room_name: str, start_time: datetime.datetime) -> int:
+    """
+    예약 삭제 (commit 은 호출하는 쪽에서)
+    - Returns:
+        - int: 삭제된 예약 수 (이미 다른 워커가 취소했으면 0)
+    """
+    return db.execute(
+        delete(MeetingBooking).where(MeetingBooking.room_name == room_name, MeetingBooking.start_time == start_time)
+    ).rowcount
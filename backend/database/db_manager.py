@@ -1,18 +1,77 @@
+from functools import lru_cache
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 
 # 2단계에서 만든 설정 객체를 import 합니다.
 from backend.core.config import settings
 
+# sync 드라이버 -> async 드라이버
+_ASYNC_DRIVERS = {"postgresql": "postgresql+asyncpg", "sqlite": "sqlite+aiosqlite"}
+
+
+def engine_options(url: str) -> dict:
+    """
+    커넥션 풀 설정 (settings.DB_POOL_*)
+    - SQLite 는 서버 커넥션이 없고 SQLAlchemy 가 파일/메모리 DB 에 맞는 풀을 고르므로 pre_ping 만 적용합니다.
+    """
+    options = {"pool_pre_ping": settings.DB_POOL_PRE_PING}
+    if make_url(url).get_backend_name() != "sqlite":
+        options.update(
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+        )
+    return options
+
+
+def async_database_url(url: str) -> str:
+    """sync DB URL 을 같은 DB 의 async 드라이버 URL 로 변환 (postgresql -> asyncpg, sqlite -> aiosqlite)"""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend not in _ASYNC_DRIVERS:
+        raise ValueError(f"async 드라이버를 알 수 없는 DB 입니다: {backend} (ASYNC_DATABASE_URL 을 직접 지정하세요)")
+    return parsed.set(drivername=_ASYNC_DRIVERS[backend]).render_as_string(hide_password=False)
+
+
 # 1. 데이터베이스 연결 "엔진" 생성
 # 이 엔진은 커넥션 풀을 관리하며, 필요할 때마다 DB 연결을 제공합니다.
-engine = create_engine(settings.DATABASE_URL)
+engine = create_engine(settings.DATABASE_URL, **engine_options(settings.DATABASE_URL))
 
 # 2. 데이터베이스 "세션"을 만드는 클래스 생성
 # 이 클래스를 통해 DB와 실제 대화(쿼리)를 수행하는 세션 객체를 만듭니다.
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# 2-1. async 엔진/세션 (asyncpg / aiosqlite)
+# async 라우트에서 DB 응답을 기다리는 동안 이벤트 루프가 다른 요청을 처리할 수 있습니다.
+# 엔진은 처음 사용할 때 만듭니다. (모델 / create_tables.py / 마이그레이션 스크립트처럼 sync 만 쓰는 곳은 async 드라이버가 필요 없음)
+@lru_cache(maxsize=None)
+def get_async_engine() -> AsyncEngine:
+    """async 엔진 (프로세스 단위로 하나, settings.ASYNC_DATABASE_URL 이 없으면 DATABASE_URL 의 드라이버만 바꿔 사용)"""
+    url = settings.ASYNC_DATABASE_URL or async_database_url(settings.DATABASE_URL)
+    return create_async_engine(url, **engine_options(url))
+
+
+@lru_cache(maxsize=None)
+def get_async_sessionmaker() -> async_sessionmaker:
+    # expire_on_commit=False: commit 이후에도 ORM 객체 속성에 접근할 때 다시 조회(=암묵적 I/O)하지 않도록 함
+    return async_sessionmaker(bind=get_async_engine(), autoflush=False, expire_on_commit=False)
+
+
+def AsyncSessionLocal() -> AsyncSession:
+    """AsyncSession 생성 (SessionLocal 과 같은 방식으로 사용, 첫 호출 시 async 엔진 생성)"""
+    return get_async_sessionmaker()()
+
+
+async def dispose_async_engine() -> None:
+    """async 엔진의 커넥션 풀 정리 (서버 종료 시, 엔진을 만든 적이 없으면 생략)"""
+    if get_async_engine.cache_info().currsize:
+        await get_async_engine().dispose()
+
 # 3. ORM 모델의 기본이 되는 "베이스" 클래스 생성
 # 나중에 우리가 만들 User, Message 같은 DB 테이블 모델들은 모두 이 Base를 상속받게 됩니다.
 OrmBase = declarative_base()
@@ -29,4 +88,13 @@ def get_db():
     try:
         yield db # 2. API 함수(라우트 핸들러)에게 세션을 '양보(yield)'하여 사용하게 함
     finally:
-        db.close() # 3. API 함수 처리가 끝나면 (성공/실패 무관) 반드시 세션을 닫음
\ No newline at end of file
+        db.close() # 3. API 함수 처리가 끝나면 (성공/실패 무관) 반드시 세션을 닫음
+
+
+async def get_async_db():
+    """
+    get_db 의 async 버전 (Depends(get_async_db))
+    - AsyncSession 을 사용하므로 쿼리를 기다리는 동안 이벤트 루프를 막지 않습니다.
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -0,0 +1,60 @@
+# backend/database/migrate_news_vectors.py
+# 기존 news.vector 컬럼의 pickle 저장값을 vector_codec 바이너리 포맷으로 변환하는 1회성 마이그레이션 스크립트
+#
+# 실행 (프로젝트 루트에서):
+#   python -m backend.database.migrate_news_vectors
+#   python -m backend.database.migrate_news_vectors --dtype float16 --db sqlite:///./mydb.db
+#
+# ⚠️ pickle.loads 는 신뢰할 수 있는 (우리가 직접 저장한) DB 파일에만 사용해야 합니다.
+import argparse
+import pickle
+
+from sqlalchemy import create_engine, text
+
+from backend.core.vector_codec import DTYPES, encode_vector, is_encoded
+
+BATCH_SIZE = 1000
+
+
+def migrate(db_url: str, dtype: str = "float32", batch_size: int = BATCH_SIZE) -> int:
+    """pickle 로 저장된 행만 골라 변환, 변환한 행 수 반환 (이미 변환된 행은 건너뜀 -> 재실행 안전)"""
+    engine = create_engine(db_url)
+    converted = 0
+    last_id = 0
+    with engine.connect() as conn:
+        while True:
+            rows = conn.execute(
+                text("SELECT news_id, vector FROM news WHERE news_id > :last_id ORDER BY news_id LIMIT :limit"),
+                {"last_id": last_id, "limit": batch_size},
+            ).fetchall()
+            if not rows:
+                break
+            last_id = rows[-1].news_id
+
+            updates = [
+                {"news_id": row.news_id, "vector": encode_vector(pickle.loads(row.vector), dtype)}
+                for row in rows
+                if row.vector is not None and not is_encoded(row.vector)
+            ]
+            if updates:
+                conn.execute(text("UPDATE news SET vector = :vector WHERE news_id = :news_id"), updates)
+                conn.commit()
+                converted += len(updates)
+            print(f"  ... news_id <= {last_id}: {converted} rows converted")
+    engine.dispose()
+    return converted
+
+
+def main():
+    parser = argparse.ArgumentParser(description="news.vector pickle -> binary vector format migration")
+    parser.add_argument("--db", default="sqlite:///./mydb.db", help="news DB URL (기본: sqlite:///./mydb.db)")
+    parser.add_argument("--dtype", default="float32", choices=list(DTYPES), help="저장 타입 (기본: float32)")
+    args = parser.parse_args()
+
+    print(f"Migrating news vectors in {args.db} -> {args.dtype} ...")
+    converted = migrate(args.db, args.dtype)
+    print(f"Migration finished. {converted} rows converted.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,12 @@
+-- backend/database/migrations/001_session_message_unique_sequence.sql
+-- llm_agent.session_message 에 (session_id, sequence) unique 제약 추가
+-- (chat_crud.save_turn 이 sequence를 INSERT ... SELECT 로 계산하며, 어떤 경우에도 중복 저장되지 않도록 보장)
+--
+-- 실행: psql "$DATABASE_URL" -f backend/database/migrations/001_session_message_unique_sequence.sql
+--
+-- ⚠️ 기존 데이터에 중복 sequence가 있으면 제약 추가가 실패합니다. 먼저 아래 쿼리로 확인하세요.
+--   SELECT session_id, sequence, count(*) FROM llm_agent.session_message
+--   GROUP BY session_id, sequence HAVING count(*) > 1;
+
+ALTER TABLE llm_agent.session_message
+    ADD CONSTRAINT uq_session_message_session_sequence UNIQUE (session_id, sequence);
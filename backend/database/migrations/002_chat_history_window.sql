@@ -0,0 +1,16 @@
+-- backend/database/migrations/002_chat_history_window.sql
+-- 최근 대화 이력 window 조회(chat_crud.get_recent_messages) / 대화 요약 지원
+--
+-- 실행: psql "$DATABASE_URL" -f backend/database/migrations/002_chat_history_window.sql
+
+-- 1. (session_id, sequence DESC) keyset pagination 용 인덱스
+--    WHERE session_id = :id AND sequence < :before ORDER BY sequence DESC LIMIT :n
+--    이 인덱스만 역순으로 읽고 멈추므로 세션 메세지 수와 무관하게 읽은 행 수만큼만 비용이 듭니다.
+--    (001 의 unique 제약 인덱스로도 역방향 스캔이 가능하지만, 001 적용 전 DB에도 바로 적용할 수 있도록 별도로 생성)
+--    CONCURRENTLY: 운영 중 테이블 쓰기를 막지 않음 (트랜잭션 블록 밖에서 실행해야 함)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_session_message_session_sequence_desc
+    ON llm_agent.session_message (session_id, sequence DESC);
+
+-- 2. 오래된 대화 요약 컬럼 (CHAT_HISTORY_SUMMARY=True 일 때 사용)
+ALTER TABLE llm_agent.chat_session ADD COLUMN IF NOT EXISTS summary TEXT;
+ALTER TABLE llm_agent.chat_session ADD COLUMN IF NOT EXISTS summary_until INTEGER NOT NULL DEFAULT 0;
@@ -0,0 +1,8 @@
+-- backend/database/migrations/003_session_message_reserved_content.sql
+-- /api/chat 에서 LLM 호출 전에 턴의 sequence 를 예약 (ChatAgent.handle)
+--
+-- 실행: psql "$DATABASE_URL" -f backend/database/migrations/003_session_message_reserved_content.sql
+
+-- assistant 메세지를 빈 내용(NULL)으로 먼저 저장하고, LLM 답변을 받은 뒤 UPDATE 로 채웁니다.
+-- (DB 커넥션을 LLM 응답 대기 동안 잡고 있지 않기 위함, 이력 조회에서는 content IS NULL 인 메세지를 제외)
+ALTER TABLE llm_agent.session_message ALTER COLUMN content DROP NOT NULL;
@@ -0,0 +1,31 @@
+-- backend/database/migrations/004_meeting_booking.sql
+-- 회의실 / 회의실 예약 테이블 (backend/core/booking_engine.py 의 저장소)
+--
+-- 실행: psql "$DATABASE_URL" -f backend/database/migrations/004_meeting_booking.sql
+
+CREATE TABLE IF NOT EXISTS llm_agent.meeting_room (
+    room_name  varchar(50) PRIMARY KEY,
+    capacity   integer     NOT NULL,
+    is_active  boolean     NOT NULL DEFAULT true
+);
+
+CREATE TABLE IF NOT EXISTS llm_agent.meeting_booking (
+    booking_id  uuid         PRIMARY KEY DEFAULT gen_random_uuid(),
+    room_name   varchar(50)  NOT NULL REFERENCES llm_agent.meeting_room (room_name),
+    user_id     varchar(50)  NOT NULL,
+    start_time  timestamp    NOT NULL,  -- 서버 로컬 시각 (timezone 없음, BookingEngine 의 naive datetime 과 같은 기준)
+    end_time    timestamp    NOT NULL,
+    created_at  timestamptz  DEFAULT now(),
+    CONSTRAINT uq_meeting_booking_room_start UNIQUE (room_name, start_time),
+    CONSTRAINT ck_meeting_booking_range CHECK (start_time < end_time)
+);
+
+-- 서버 시작 시 끝나지 않은 예약만 읽어 옴 (BookingEngine.load)
+CREATE INDEX IF NOT EXISTS ix_meeting_booking_end_time ON llm_agent.meeting_booking (end_time);
+
+-- 같은 회의실의 예약 구간이 겹치지 않도록 보장 (여러 워커가 동시에 예약해도 DB 에서 한 건만 성공)
+-- [start_time, end_time) 구간이므로 15:00~17:00 과 17:00~18:00 은 겹치지 않습니다.
+CREATE EXTENSION IF NOT EXISTS btree_gist;
+ALTER TABLE llm_agent.meeting_booking
+    ADD CONSTRAINT ex_meeting_booking_no_overlap
+    EXCLUDE USING gist (room_name WITH =, tsrange(start_time, end_time, '[)') WITH &&);
@@ -1,4 +1,4 @@
-from sqlalchemy import UUID, Column, String, Text, DateTime, ForeignKey, Integer
+from sqlalchemy import UUID, Column, String, Text, DateTime, ForeignKey, Integer, UniqueConstraint, func
 from sqlalchemy.orm import relationship
 from backend.database.db_manager import OrmBase
 
@@ -35,6 +35,11 @@ class ChatSession(OrmBase):
     start_time = Column(DateTime(timezone=True))
     end_time = Column(DateTime(timezone=True))
 
+    # 대화 이력 요약 (선택): 프롬프트에 넣는 최근 대화 window 보다 오래된 메세지들의 요약
+    # summary_until: 요약에 반영된 마지막 메세지의 sequence (0 = 요약 없음)
+    summary = Column(Text)
+    summary_until = Column(Integer, nullable=False, server_default="0", default=0)
+
 
     # --- 관계(Relationship) 정의 ---
     # 이것은 DB에 실제 컬럼을 만드는 것이 아니라, ORM(SQLAlchemy)에게 객체 간의 연결을 알려주는 설정입니다.
@@ -52,7 +57,11 @@ class ChatSession(OrmBase):
 # ===================================================================
 class SessionMessage(OrmBase):
     __tablename__ = 'session_message'
-    __table_args__ = {'schema': 'llm_agent'}
+    # 같은 세션 안에서 sequence 중복 방지 (기존 DB: backend/database/migrations/001_session_message_unique_sequence.sql)
+    __table_args__ = (
+        UniqueConstraint('session_id', 'sequence', name='uq_session_message_session_sequence'),
+        {'schema': 'llm_agent'},
+    )
     
     message_id = Column(UUID(as_uuid=True), primary_key=True, server_default="gen_random_uuid()")
     # session_id: 이 메시지가 어떤 ChatSession에 속하는지를 가리키는 외래 키(Foreign Key)입니다.
@@ -60,8 +69,10 @@ class SessionMessage(OrmBase):
     session_id =  Column(UUID(as_uuid=True), ForeignKey('llm_agent.chat_session.session_id'), nullable=False)
     sequence = Column(Integer, nullable=False)
     role = Column(String[10], nullable=False)
-    content = Column(Text, nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default="now()")
+    # NULL: 답변 저장 전 sequence 만 예약된 assistant 메세지 (ChatAgent.handle, 이력 조회에서 제외)
+    # 기존 DB: backend/database/migrations/003_session_message_reserved_content.sql
+    content = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
 
      # --- 관계(Relationship) 정의 ---
     # 'SessionMessage' 객체는 하나의 'ChatSession' 객체에 속합니다.
@@ -0,0 +1,37 @@
+from sqlalchemy import UUID, Boolean, Column, DateTime, ForeignKey, Index, Integer, String, UniqueConstraint, func
+from backend.database.db_manager import OrmBase
+
+
+# ===================================================================
+# MeetingRoom 모델: llm_agent.meeting_room 테이블 (회의실 목록)
+# ===================================================================
+class MeetingRoom(OrmBase):
+    __tablename__ = 'meeting_room'
+    __table_args__ = {'schema': 'llm_agent'}
+
+    room_name = Column(String(50), primary_key=True)
+    capacity = Column(Integer, nullable=False)      # 수용 인원
+    is_active = Column(Boolean, nullable=False, default=True)
+
+
+# ===================================================================
+# MeetingBooking 모델: llm_agent.meeting_booking 테이블 (회의실 예약, [start_time, end_time) 구간)
+# - 같은 회의실의 예약 구간이 겹치지 않는 것은 BookingEngine 이 회의실 단위 lock 안에서 보장하고,
+#   PostgreSQL 에서는 여러 워커(프로세스) 사이에서도 겹치지 않도록 exclusion 제약을 추가합니다.
+#   (backend/database/migrations/004_meeting_booking.sql)
+# - start_time / end_time 은 timezone 없는 서버 로컬 시각입니다. (BookingEngine / onspace_api 가 naive datetime 으로 비교)
+# ===================================================================
+class MeetingBooking(OrmBase):
+    __tablename__ = 'meeting_booking'
+    __table_args__ = (
+        UniqueConstraint('room_name', 'start_time', name='uq_meeting_booking_room_start'),
+        Index('ix_meeting_booking_end_time', 'end_time'),
+        {'schema': 'llm_agent'},
+    )
+
+    booking_id = Column(UUID(as_uuid=True), primary_key=True)
+    room_name = Column(String(50), ForeignKey('llm_agent.meeting_room.room_name'), nullable=False)
+    user_id = Column(String(50), nullable=False)
+    start_time = Column(DateTime(), nullable=False)
+    end_time = Column(DateTime(), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -0,0 +1,36 @@
+# backend/database/rebuild_vector_index.py
+# news 테이블에서 사용자별 뉴스 벡터 인덱스(VECTOR_INDEX_DIR)를 다시 만드는 스크립트
+# (VECTOR_INDEX_BACKEND 변경 후, 또는 인덱스 파일이 손상/삭제되었을 때 사용)
+#
+# 실행 (프로젝트 루트에서):
+#   python -m backend.database.rebuild_vector_index            # 모든 사용자
+#   python -m backend.database.rebuild_vector_index --user kim
+import argparse
+
+from backend.core.config import settings
+from backend.core.news_db_manager import NewsVector, SessionLocal, rebuild_user_index
+from backend.core.vector_codec import decode_vector
+
+
+def main():
+    parser = argparse.ArgumentParser(description="rebuild per-user news vector indexes from the news table")
+    parser.add_argument("--user", action="append", help="대상 사용자 (여러 번 지정 가능, 기본: 전체)")
+    args = parser.parse_args()
+
+    session = SessionLocal()
+    users = args.user or [r[0] for r in session.query(NewsVector.user_name).distinct().all()]
+    sample = session.query(NewsVector.vector).filter(NewsVector.vector.isnot(None)).first()
+    session.close()
+    if sample is None:
+        print("No news vectors stored. Nothing to rebuild.")
+        return
+    dim = decode_vector(sample.vector).shape[0]
+
+    print(f"Rebuilding {len(users)} user index(es) -> {settings.VECTOR_INDEX_DIR} ({settings.VECTOR_INDEX_BACKEND}, dim={dim})")
+    for user_name in users:
+        index = rebuild_user_index(user_name, dim)
+        print(f"  {user_name}: {len(index)} vectors")
+
+
+if __name__ == "__main__":
+    main()
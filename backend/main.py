@@ -1,4 +1,5 @@
 # main.py
+import asyncio
 from fastapi import FastAPI
 from contextlib import asynccontextmanager
 from fastapi.middleware.cors import CORSMiddleware # CORSMiddleware 임포트
@@ -10,7 +11,17 @@ from backend.routes.news_routes import router as news_router
 from backend.routes.langchain_chat_routes import router as langchain_router
 from backend.routes.langchain_chatstream_routes import router as langchain_stream_router
 from backend.routes.stream_sample_routes import router as stream_sample_router
-from backend.database.db_manager import engine
+from backend.routes.metrics_routes import router as metrics_router
+from backend.database.db_manager import SessionLocal, dispose_async_engine, engine
+from backend.core.config import settings
+from backend.core.embedding_service import embedding_backend, embedding_batcher, embedding_service
+from backend.core.logging_config import setup_logging, shutdown_logging
+from backend.core.metrics import MetricsMiddleware
+from backend.core.news_db_manager import save_user_indexes
+from backend.core.news_ingest import news_ingest_scheduler
+from backend.core.onspace_api import booking_engine
+from backend.core.redis_cache import redis_pools
+from backend.core.naver_news_api import naver_client
 
 
 # @app.on_event("startup") #on_event(startup / shutdown) 더이상 지원하지 않아 lifespan 으로 변경
@@ -19,6 +30,8 @@ from backend.database.db_manager import engine
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # --- yield 이전: 애플리케이션 시작 시 실행될 코드 ---
+    # backend.* 로거 구성: 출력(stdout)은 QueueListener 스레드에서 수행 (LOG_LEVEL / LOG_LEVELS / LOG_FORMAT)
+    setup_logging()
     # 서버 시작 시 등록된 모든 라우트를 콘솔에 출력하는 디버그용 코드, 데이터베이스 연결 등
     print("--- Lifespan: Server is starting up! ---")
     for route in app.routes:
@@ -35,15 +48,58 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         print(f"--- Lifespan: Database connection failed: {e} ---")
 
+    # 회의실 예약 엔진: DB 의 회의실 / 끝나지 않은 예약을 메모리 색인으로 불러오고, 이후 예약/취소를 DB 에 저장
+    if settings.BOOKING_PERSIST:
+        try:
+            await asyncio.to_thread(booking_engine.load, SessionLocal)
+            print(f"--- Lifespan: Meeting room bookings loaded ({len(booking_engine.rooms())} rooms, {len(booking_engine)} bookings). ---")
+        except Exception as e:
+            print(f"--- Lifespan: Meeting room booking load failed (memory only): {e} ---")
+
+    # 프로세스 공유 Redis 커넥션 풀 (sync / asyncio) 생성: 모든 Redis 사용처가 이 풀을 공유
+    redis_pools.open()
+    print(f"--- Lifespan: Redis connection pools ready (max_connections={redis_pools.max_connections}). ---")
+
+    # 임베딩 모델은 기본적으로 첫 뉴스 요청 시 로드(lazy), EMBEDDING_WARMUP=True 이면 시작 시 미리 로드
+    if settings.EMBEDDING_WARMUP:
+        print(f"--- Lifespan: Warming up embedding model ({embedding_service.model_name}, backend={settings.EMBEDDING_BACKEND})... ---")
+        try:
+            await asyncio.to_thread(embedding_backend.warm_up)
+            print("--- Lifespan: Embedding model ready. ---")
+        except Exception as e:
+            print(f"--- Lifespan: Embedding model warm-up failed: {e} ---")
+
+    # 구독 키워드 뉴스 백그라운드 수집 (검색 -> 임베딩 -> 중복 검사 -> 저장, /api/news 는 수집된 기사만 조회)
+    news_ingest_scheduler.start()
+    if news_ingest_scheduler.running:
+        print(f"--- Lifespan: News ingestion scheduler started (interval={news_ingest_scheduler.interval}s). ---")
 
     yield
 
     # --- yield 이후 : 애플리케이션 종료 시 실행될 코드 ---
     # (예: 데이터베이스 연결 해제, 리소스 정리 등)
     print("--- Lifespan: Server is shutting down! ---")
+    # 진행 중인 뉴스 수집 중단 (다음 시작 시 다시 수집)
+    await news_ingest_scheduler.stop()
+    # 아직 디스크에 저장되지 않은 사용자별 뉴스 벡터 인덱스 저장
+    try:
+        await asyncio.to_thread(save_user_indexes)
+        print("--- Lifespan: Vector indexes saved. ---")
+    except Exception as e:
+        print(f"--- Lifespan: Vector index save failed: {e} ---")
+    # 대기 중인 임베딩 요청을 처리한 뒤 micro-batching 워커 스레드 / 임베딩 자식 프로세스 종료
+    await asyncio.to_thread(embedding_batcher.close)
+    await asyncio.to_thread(embedding_backend.close)
     # 앱이 종료될 때, SQLAlchemy 엔진의 커넥션 풀을 정리합니다.
     engine.dispose()
-    print("--- Lifespan: Database connection pool disposed. ---")
+    await dispose_async_engine()
+    print("--- Lifespan: Database connection pools disposed. ---")
+    await redis_pools.close()
+    print("--- Lifespan: Redis connection pools closed. ---")
+    await naver_client.aclose()
+    print("--- Lifespan: Naver news HTTP client closed. ---")
+    # 큐에 남은 로그 출력 후 로그 출력 스레드 종료
+    shutdown_logging()
 
 
 app = FastAPI(title="RAG Multi-Agent Backend",lifespan=lifespan)
@@ -57,6 +113,10 @@ app.include_router(news_router, prefix="/api")
 app.include_router(langchain_router, prefix="/api")
 app.include_router(langchain_stream_router, prefix="/api")
 app.include_router(stream_sample_router, prefix="/api")
+app.include_router(metrics_router, prefix="/api")
+
+# 요청별 구간 지연 시간 계측: Server-Timing 응답 헤더 + /api/metrics 히스토그램 (backend/core/metrics.py)
+app.add_middleware(MetricsMiddleware)
 
 # 백엔드 (CORS 허용 추가): (React/HTML 등 외부 요청을 허용해야 합니다)
 app.add_middleware(
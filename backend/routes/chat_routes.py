@@ -1,10 +1,10 @@
 # backend/routes/chat_routes.py
 from typing import Optional
-from fastapi import APIRouter, Depends, Request
+from fastapi import APIRouter, Depends, Request, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from backend.agents.chat_agent import ChatAgent
-from backend.database.db_manager import get_db
-from sqlalchemy.orm import Session
+from backend.core.response_cache import llm_cache_headers
 
 router = APIRouter(tags=["Agent API"])
 agent = ChatAgent()
@@ -27,19 +27,41 @@ class ChatResponse(BaseModel):
     
 
 @router.post("/chat")
-async def chat(data: ChatRequest, db: Session = Depends(get_db)):
+async def chat(data: ChatRequest, response: Response):
+    """
+    ChatAgent 대화 API
+    - DB 세션은 Agent 내부에서 LLM 호출 앞뒤로만 짧게 사용하므로 Depends(get_db)를 사용하지 않습니다.
+      (LLM 응답을 기다리는 동안 커넥션을 잡고 있으면 DB 커넥션 풀 크기가 동시 대화 수를 제한함)
+    """
     # data = await request.json()
     # user_input = data.get("message", "")
     # user_input = data.message
-    response_text, session_id = agent.handle(  
-        db=db,
+    response_text, session_id = await agent.handle(  
         session_id=data.session_id, 
         user_id=data.user_id , 
         model=data.model, 
         message=data.message 
     )
+    # LLM 응답 캐시를 사용했다면 결과(hit-exact / hit-semantic / miss)를 X-LLM-Cache 헤더로 전달
+    response.headers.update(llm_cache_headers())
     
     return {
             "agent": agent.name,
             "reply": response_text, 
             "session_id":session_id}
+
+
+@router.post("/chat/stream")
+async def chat_stream(data: ChatRequest):
+    """
+    ChatAgent 스트리밍 API (SSE)
+    - event: session 으로 session_id를 먼저 전송한 뒤, LLM 토큰을 도착하는 즉시 전송합니다.
+    - DB 세션은 Agent 내부에서 시작/종료 시점에만 짧게 사용하므로 Depends(get_db)를 사용하지 않습니다.
+    """
+    stream = agent.handle_stream(
+        session_id=data.session_id,
+        user_id=data.user_id,
+        model=data.model,
+        message=data.message
+    )
+    return StreamingResponse(stream, media_type="text/event-stream")
@@ -1,15 +1,23 @@
-from fastapi import APIRouter
-from backend.core.redis_cache import get_redis_connection
+from fastapi import APIRouter, Depends
+import redis.asyncio as aioredis
+from backend.core.naver_news_api import news_search_cache
+from backend.core.redis_cache import get_async_redis, redis_pools
+from backend.core.response_cache import llm_response_cache
 
 router = APIRouter()
 
 @router.get("/health")
-def health_check():
-    redis_conn = get_redis_connection()
-    redis_status = "connected" if redis_conn else "not connected"
+async def health_check(redis_conn: aioredis.Redis = Depends(get_async_redis)):
+    # 프로브마다 새 커넥션을 만들지 않고 공유 asyncio 커넥션 풀로 PING
+    try:
+        await redis_conn.ping()
+        redis_status = "connected"
+    except aioredis.RedisError:
+        redis_status = "not connected"
     return {
         "status": "ok",
-        "redis": redis_status
+        "redis": redis_status,
+        "redis_pool": redis_pools.stats(),
+        "news_search_cache": news_search_cache.stats(),
+        "llm_response_cache": llm_response_cache.stats(),
     }
-
-
@@ -1,7 +1,8 @@
 # backend/routes/meeting_routes.py
 from typing import Optional
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Request, Response
 from backend.agents.meeting_agent import MeetingAgent
+from backend.core.response_cache import llm_cache_headers
 from pydantic import BaseModel
 
 router = APIRouter(tags=["Agent API"])
@@ -19,10 +20,12 @@ class MeetingRequest(BaseModel):
 
 
 @router.post("/meeting")
-async def meeting(payload: MeetingRequest):
+async def meeting(payload: MeetingRequest, response: Response):
     # user_input = payload.message
     # response = agent.handle(user_input)
-    response_text, session_id = agent.handle(  payload.session_id, payload.user_id , payload.model, payload.message )
+    response_text, session_id = await agent.handle(  payload.session_id, payload.user_id , payload.model, payload.message )
+    # LLM 응답 캐시를 사용했다면 결과(hit-exact / hit-semantic / miss)를 X-LLM-Cache 헤더로 전달
+    response.headers.update(llm_cache_headers())
 
     return {
         "agent": agent.name, 
@@ -0,0 +1,18 @@
+# backend/routes/metrics_routes.py
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from backend.core.metrics import metrics
+
+router = APIRouter(tags=["Monitoring"])
+
+# Prometheus text exposition format
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics_endpoint():
+    """
+    구간별(DB, Redis, embedding, 외부 HTTP, LLM) 지연 시간 히스토그램 + 요청 지연 시간 히스토그램
+    - Prometheus scrape 대상: /api/metrics
+    """
+    return PlainTextResponse(metrics.render(), media_type=PROMETHEUS_CONTENT_TYPE)
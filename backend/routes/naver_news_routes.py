@@ -18,7 +18,7 @@ class NaverNewsRequest(BaseModel):
 async def naver_news(payload: NaverNewsRequest):
     # data = await request.json()
     # user_input = data.get("message", "")
-    response_articles, respnose_text, session_id = agent.handle(payload)
+    response_articles, respnose_text, session_id = await agent.handle(payload)
     return {
         "agent": agent.name, 
         "articles": response_articles, 
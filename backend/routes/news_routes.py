@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Request
 from backend.agents.news_agent import NewsAgent
+from backend.core.news_ingest import news_ingest_pipeline, news_ingest_scheduler
 
 router = APIRouter(tags=["Agent API"])
 agent = NewsAgent()
@@ -9,5 +10,12 @@ async def news(request: Request):
     data = await request.json()
     # user_input = data.get("message", "")
     # user_name = data.get("user_name", "")
-    response = agent.handle(data)
+    # 검색/임베딩/중복 검사/저장은 백그라운드 수집(news_ingest)에서 하고, agent 는 수집된 기사만 조회
+    response = await agent.handle(data)
     return {"agent": agent.name, "reply": response}
+
+
+@router.get("/news/ingest")
+async def news_ingest_stats():
+    """뉴스 백그라운드 수집 상태 + 단계별(fetch/normalize/embed/dedup/store) 누적 처리량"""
+    return {"running": news_ingest_scheduler.running, **news_ingest_pipeline.stats()}
@@ -1,4 +1,5 @@
 # backend/routes/stream_sample_routes.py
+import logging
 from typing import Optional
 from fastapi import APIRouter, Request
 from fastapi.responses import StreamingResponse
@@ -7,6 +8,7 @@ from pydantic import BaseModel
 
 
 router = APIRouter(tags=["Agent API"])
+logger = logging.getLogger(__name__)
 # agent = StreamSample() # ⬅️ 전역 인스턴스 제거 (혹은 주석 처리)
 
 
@@ -34,7 +36,7 @@ async def get_stream_sample(request: Request):
 
     keywords = keywords_str.split(',') if keywords_str else []
     
-    print(f'Received GET request - User ID: {user_id}, Message: {message}, Keywords: {keywords}')
+    logger.debug("Received GET request - user_id=%s message=%s keywords=%s", user_id, message, keywords)
     
     agent = StreamSampleAgent() 
     stream_response = agent.handle(message)
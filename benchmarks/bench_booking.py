@@ -0,0 +1,141 @@
+# benchmarks/bench_booking.py
+"""
+회의실 예약 엔진 벤치마크 - 회의실 ROOMS 개, 예약 ROOMS x BOOKINGS_PER_ROOM 건 (메모리만, DB 저장 없음)
+
+- linear (legacy) : 회의실 목록 / 회의실별 예약 목록을 처음부터 끝까지 훑는 방식 (이전 onspace_api 의 선형 탐색을 시간대 예약으로 확장)
+- engine          : 현재 구현 (backend/core/booking_engine.py)
+                    회의실별 정렬 배열 + bisect 로 겹침 확인, 수용 인원 색인으로 가장 작은 빈 회의실 탐색
+
+측정 항목
+- is_free        : 임의 회의실/시간대의 겹침 확인
+- find_smallest  : N명 이상, 해당 시간대에 비어 있는 가장 작은 회의실 찾기
+- reserve        : THREADS 개 스레드가 동시에 예약 (회의실 단위 lock, 겹치면 실패)
+
+실행:
+    python -m benchmarks.bench_booking
+"""
+import datetime
+import random
+import statistics
+import threading
+import time
+
+from backend.core.booking_engine import BookingEngine
+
+ROOMS = 10_000
+BOOKINGS_PER_ROOM = 100      # 합계 1,000,000 건
+DAYS = 100                   # 예약이 분포하는 기간 (일)
+SLOTS_PER_DAY = 10           # 하루 1시간 단위 슬롯 (09:00 ~ 19:00)
+QUERIES = 2_000
+LEGACY_QUERIES = 200
+THREADS = 8
+RESERVATIONS = 40_000
+
+BASE = datetime.datetime(2026, 1, 1, 9, 0)
+HOUR = 3600
+
+
+def _slot_time(slot: int) -> datetime.datetime:
+    day, hour = divmod(slot, SLOTS_PER_DAY)
+    return BASE + datetime.timedelta(days=day, hours=hour)
+
+
+def _build(rng: random.Random):
+    """회의실 (이름, 수용 인원) + 회의실별 예약 슬롯 번호"""
+    rooms = [(f"R{i:05d}", rng.randint(2, 30)) for i in range(ROOMS)]
+    slots = {name: rng.sample(range(DAYS * SLOTS_PER_DAY), BOOKINGS_PER_ROOM) for name, _ in rooms}
+    return rooms, slots
+
+
+class LinearBooking:
+    """비교용 선형 탐색 구현 (회의실 목록 / 예약 목록을 매번 처음부터 훑음)"""
+    def __init__(self, rooms, slots):
+        self.rooms = [{"name": name, "capacity": capacity} for name, capacity in rooms]
+        self.bookings = {
+            name: [(int(_slot_time(s).timestamp()), int(_slot_time(s).timestamp()) + HOUR) for s in room_slots]
+            for name, room_slots in slots.items()
+        }
+
+    def is_free(self, room_name, start, end):
+        start, end = int(start.timestamp()), int(end.timestamp())
+        return all(e <= start or end <= s for s, e in self.bookings[room_name])
+
+    def find_free_room(self, people, start, end):
+        for room in sorted(self.rooms, key=lambda r: r["capacity"]):
+            if room["capacity"] >= people and self.is_free(room["name"], start, end):
+                return room["name"]
+        return None
+
+
+def _timeit(func, queries) -> float:
+    """호출 1회 평균 (µs)"""
+    started = time.perf_counter()
+    for args in queries:
+        func(*args)
+    return (time.perf_counter() - started) / len(queries) * 1e6
+
+
+def _queries(rng: random.Random, rooms, count: int):
+    is_free, find = [], []
+    for _ in range(count):
+        start = _slot_time(rng.randrange(DAYS * SLOTS_PER_DAY))
+        end = start + datetime.timedelta(hours=1)
+        is_free.append((rooms[rng.randrange(ROOMS)][0], start, end))
+        find.append((rng.randint(10, 25), start, end))
+    return is_free, find
+
+
+def _reserve_concurrently(engine: BookingEngine, rooms, rng: random.Random) -> tuple[float, int]:
+    """THREADS 개 스레드가 RESERVATIONS 건을 나눠 예약 (초당 예약 시도 수, 성공 건수)"""
+    requests = [
+        (rooms[rng.randrange(ROOMS)][0], _slot_time(rng.randrange(DAYS * SLOTS_PER_DAY)))
+        for _ in range(RESERVATIONS)
+    ]
+    success = [0] * THREADS
+    barrier = threading.Barrier(THREADS + 1)
+
+    def worker(index):
+        barrier.wait()
+        for room_name, start in requests[index::THREADS]:
+            if engine.reserve(room_name, start, start + datetime.timedelta(hours=1), f"user{index}")["status"] == "success":
+                success[index] += 1
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(THREADS)]
+    for t in threads:
+        t.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for t in threads:
+        t.join()
+    return RESERVATIONS / (time.perf_counter() - started), sum(success)
+
+
+def main():
+    rng = random.Random(0)
+    rooms, slots = _build(rng)
+    print(f"rooms={ROOMS:,}  bookings={ROOMS * BOOKINGS_PER_ROOM:,}  threads={THREADS}")
+
+    started = time.perf_counter()
+    engine = BookingEngine()
+    engine.add_rooms(rooms)
+    for name, room_slots in slots.items():
+        engine.room(name).load(
+            (int(_slot_time(s).timestamp()), int(_slot_time(s).timestamp()) + HOUR, "seed") for s in room_slots
+        )
+    print(f"engine load   : {time.perf_counter() - started:6.2f}s  ({len(engine):,} bookings)")
+    linear = LinearBooking(rooms, slots)
+
+    is_free, find = _queries(rng, rooms, QUERIES)
+    for name, impl, count in (("linear (legacy)", linear, LEGACY_QUERIES), ("engine", engine, QUERIES)):
+        # 두 구현이 같은 답을 내는지 확인
+        assert [impl.find_free_room(*q) for q in find[:20]] == [engine.find_free_room(*q) for q in find[:20]]
+        free_us = statistics.median(_timeit(impl.is_free, is_free[:count]) for _ in range(3))
+        find_us = statistics.median(_timeit(impl.find_free_room, find[:count]) for _ in range(3))
+        print(f"{name:16s}: is_free {free_us:10.2f}µs   find_smallest {find_us:12.2f}µs")
+
+    per_second, success = _reserve_concurrently(engine, rooms, rng)
+    print(f"engine reserve: {per_second:,.0f} reservations/s ({success:,}/{RESERVATIONS:,} succeeded, total {len(engine):,})")
+
+
+if __name__ == "__main__":
+    main()
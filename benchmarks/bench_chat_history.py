@@ -0,0 +1,81 @@
+# benchmarks/bench_chat_history.py
+"""
+대화 이력 조회 벤치마크 - 메세지 10k 건이 쌓인 세션 1개
+
+- full   : get_chat_history (전체 메세지를 ORM 객체로 조회, 이전 구현)
+- window : get_recent_messages(max_messages=40)  (최근 20턴, 컬럼만 조회 + keyset)
+- budget : get_recent_messages(max_tokens=4096)  (토큰 예산, page 단위 keyset)
+
+SQLite 파일 DB(llm_agent 스키마는 ATTACH)로 측정하며, 조회 시간과 LLM에 전달되는 근사 토큰 수를 출력합니다.
+
+실행:
+    python -m benchmarks.bench_chat_history
+"""
+import os
+import tempfile
+import time
+import uuid
+
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import sessionmaker
+
+from backend.core.token_counter import estimate_tokens
+from backend.database.crud import chat_crud
+from backend.database.db_manager import OrmBase
+from backend.database.models.chat_model import ChatSession, SessionMessage
+
+MESSAGES = 10_000
+OTHER_SESSIONS = 50      # 다른 세션의 메세지도 섞어 테이블 크기를 키움
+REPEAT = 20
+
+
+def _setup(tmp_dir: str):
+    engine = create_engine(f"sqlite:///{os.path.join(tmp_dir, 'main.db')}")
+
+    @event.listens_for(engine, "connect")
+    def _attach_schema(dbapi_conn, _):
+        dbapi_conn.execute(f"ATTACH DATABASE '{os.path.join(tmp_dir, 'llm_agent.db')}' AS llm_agent")
+
+    OrmBase.metadata.create_all(bind=engine)
+    session_ids = [uuid.uuid4() for _ in range(OTHER_SESSIONS + 1)]
+    with engine.begin() as conn:
+        conn.execute(insert(ChatSession), [
+            {"session_id": sid, "user_id": "bench", "agent_id": "ChatAgent", "model_id": "gpt-4o-mini"}
+            for sid in session_ids
+        ])
+        for sid in session_ids:
+            conn.execute(insert(SessionMessage), [
+                {
+                    "message_id": uuid.uuid4(), "session_id": sid, "sequence": seq,
+                    "role": "user" if seq % 2 else "assistant",
+                    "content": f"{seq}번째 메세지입니다. " + "lorem ipsum dolor sit amet " * 8,
+                }
+                for seq in range(1, (MESSAGES if sid == session_ids[0] else MESSAGES // 10) + 1)
+            ])
+    return engine, sessionmaker(bind=engine), session_ids[0]
+
+
+def _measure(name, session_factory, fn):
+    db = session_factory()
+    fn(db)  # warm up
+    started = time.perf_counter()
+    for _ in range(REPEAT):
+        messages = fn(db)
+    elapsed = (time.perf_counter() - started) / REPEAT
+    db.close()
+    tokens = sum(estimate_tokens(m["content"] if isinstance(m, dict) else m.content) for m in messages)
+    print(f"{name:8s}: {elapsed * 1000:8.2f}ms  messages={len(messages):6d}  prompt tokens≈{tokens:,}")
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine, session_factory, session_id = _setup(tmp_dir)
+        print(f"session messages={MESSAGES} (+ {OTHER_SESSIONS} other sessions)")
+        _measure("full", session_factory, lambda db: chat_crud.get_chat_history(db, session_id))
+        _measure("window", session_factory, lambda db: chat_crud.get_recent_messages(db, session_id, max_messages=40))
+        _measure("budget", session_factory, lambda db: chat_crud.get_recent_messages(db, session_id, max_tokens=4096))
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
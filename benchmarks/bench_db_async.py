@@ -0,0 +1,139 @@
+# benchmarks/bench_db_async.py
+"""
+DB 동시성 벤치마크 - async 라우트에서 sync Session(get_db) vs AsyncSession(get_async_db)
+
+요청 1건 = DB 왕복 지연(DB_LATENCY) 쿼리 1회 + 최근 대화 이력 조회(get_recent_messages, 40건)
+CONCURRENCY 개의 요청을 asyncio.gather 로 동시에 실행하고, 전체 시간과 이벤트 루프 지연(다른 요청이 기다린 최대 시간)을 측정합니다.
+
+- sync  : 이전 구현. 이벤트 루프 스레드에서 sync Session 으로 쿼리 -> 쿼리마다 루프 전체가 멈춤 (요청이 사실상 직렬 처리)
+- async : 현재 구현. AsyncSession(aiosqlite / asyncpg) -> 쿼리를 기다리는 동안 다른 요청 처리, 동시성은 풀 크기(DB_POOL_SIZE)까지
+
+기본값은 SQLite 파일(aiosqlite) stand-in 이며, DB 왕복 지연은 sleep_ms() SQL 함수로 흉내냅니다.
+PostgreSQL 로 측정하려면 --pg postgresql://user:pw@localhost:5432/db (DB 지연은 pg_sleep, 이력 조회는 생략)
+
+실행:
+    python -m benchmarks.bench_db_async
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+import uuid
+
+from sqlalchemy import create_engine, event, insert, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.database.crud import chat_crud
+from backend.database.db_manager import OrmBase, async_database_url
+from backend.database.models.chat_model import ChatSession, SessionMessage
+
+CONCURRENCY = 100
+POOL_SIZE = 5
+DB_LATENCY_MS = 10
+HISTORY_MESSAGES = 40
+
+
+def _sqlite_engines(tmp_dir: str):
+    main_db, schema_db = os.path.join(tmp_dir, "main.db"), os.path.join(tmp_dir, "llm_agent.db")
+
+    def on_connect(dbapi_conn, _):
+        cursor = dbapi_conn.cursor()
+        cursor.execute(f"ATTACH DATABASE '{schema_db}' AS llm_agent")
+        cursor.close()
+
+    def add_sleep(dbapi_conn):
+        dbapi_conn.create_function("sleep_ms", 1, lambda ms: time.sleep(ms / 1000) or 0)
+
+    sync_engine = create_engine(f"sqlite:///{main_db}", connect_args={"check_same_thread": False})
+    event.listen(sync_engine, "connect", lambda conn, rec: (on_connect(conn, rec), add_sleep(conn)))
+
+    async_engine = create_async_engine(
+        f"sqlite+aiosqlite:///{main_db}", pool_size=POOL_SIZE, max_overflow=0
+    )
+    event.listen(async_engine.sync_engine, "connect", lambda conn, rec: (on_connect(conn, rec), add_sleep(conn)))
+    return sync_engine, async_engine, text("SELECT sleep_ms(:ms)")
+
+
+def _seed(sync_engine) -> uuid.UUID:
+    OrmBase.metadata.create_all(bind=sync_engine)
+    session_id = uuid.uuid4()
+    with sessionmaker(bind=sync_engine)() as db:
+        db.add(ChatSession(session_id=session_id, user_id="bench", agent_id="ChatAgent", model_id="gpt-4o-mini"))
+        db.flush()
+        db.execute(insert(SessionMessage), [
+            {"message_id": uuid.uuid4(), "session_id": session_id, "role": "user" if i % 2 else "assistant",
+             "content": f"message {i}", "sequence": i}
+            for i in range(1, 201)
+        ])
+        db.commit()
+    return session_id
+
+
+async def _measure(handle) -> dict:
+    """CONCURRENCY 개 요청 동시 실행 + 이벤트 루프 지연 측정"""
+    lag = 0.0
+    stop = asyncio.Event()
+
+    async def monitor():
+        nonlocal lag
+        while not stop.is_set():
+            started = time.perf_counter()
+            await asyncio.sleep(0.001)
+            lag = max(lag, time.perf_counter() - started - 0.001)
+
+    monitor_task = asyncio.create_task(monitor())
+    started = time.perf_counter()
+    await asyncio.gather(*[handle() for _ in range(CONCURRENCY)])
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await monitor_task
+    return {"elapsed_s": elapsed, "loop_lag_ms": lag * 1000}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pg", default=None, help="PostgreSQL URL (기본: SQLite + aiosqlite stand-in)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        if args.pg:
+            sync_engine = create_engine(args.pg, pool_size=POOL_SIZE, max_overflow=0)
+            async_engine = create_async_engine(async_database_url(args.pg), pool_size=POOL_SIZE, max_overflow=0)
+            latency_query, session_id = text("SELECT pg_sleep(:ms / 1000.0)"), None
+            print(f"db=PostgreSQL concurrency={CONCURRENCY} pool_size={POOL_SIZE} db_latency={DB_LATENCY_MS}ms")
+        else:
+            sync_engine, async_engine, latency_query = _sqlite_engines(tmp_dir)
+            session_id = _seed(sync_engine)
+            print(f"db=SQLite(aiosqlite) concurrency={CONCURRENCY} pool_size={POOL_SIZE} db_latency={DB_LATENCY_MS}ms")
+
+        SyncSession = sessionmaker(bind=sync_engine)
+        AsyncSession = async_sessionmaker(bind=async_engine, expire_on_commit=False)
+
+        async def sync_handle():
+            # 이전 구현: async 핸들러 안에서 sync Session 사용 (루프 스레드에서 블로킹)
+            with SyncSession() as db:
+                db.execute(latency_query, {"ms": DB_LATENCY_MS})
+                if session_id:
+                    chat_crud.get_recent_messages(db, session_id, max_messages=HISTORY_MESSAGES)
+
+        async def async_handle():
+            async with AsyncSession() as db:
+                await db.execute(latency_query, {"ms": DB_LATENCY_MS})
+                if session_id:
+                    await chat_crud.aget_recent_messages(db, session_id, max_messages=HISTORY_MESSAGES)
+
+        async def run_async():
+            result = await _measure(async_handle)
+            await async_engine.dispose()
+            return result
+
+        for name, run in (("sync Session ", lambda: _measure(sync_handle)), ("AsyncSession ", run_async)):
+            result = asyncio.run(run())
+            print(f"{name}: elapsed={result['elapsed_s']:6.3f}s  max event loop lag={result['loop_lag_ms']:8.1f}ms")
+        sync_engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+# benchmarks/bench_embedding_batch.py
+"""
+임베딩 micro-batching 벤치마크 - batch window 별 처리량 / 요청 지연 시간
+
+동시 요청 CLIENTS 개(스레드)가 각각 TEXTS_PER_REQUEST 개 텍스트를 REQUESTS_PER_CLIENT 번 encode 합니다.
+- direct (legacy) : 이전 구현. 요청마다 호출한 스레드에서 바로 model.encode (같은 CPU 모델을 동시에/차례로 호출)
+- batch Nms       : 현재 구현 EmbeddingBatcher(window=N ms). 전용 스레드가 N ms 동안 모은 요청을 한 번에 encode
+
+모델: SentenceTransformer(EMBEDDING_MODEL_NAME) 를 로드할 수 있으면 실제 모델을 사용하고,
+      (오프라인 등으로) 로드할 수 없으면 비슷한 비용 구조의 가짜 모델을 사용합니다.
+      가짜 모델 = 호출당 고정 비용(토크나이저/커널 실행 흉내) + 텍스트 수에 비례하는 행렬곱 (numpy, GIL 해제)
+
+각 클라이언트는 응답을 받은 뒤 다음 요청을 보내므로(closed loop) 모든 클라이언트가 이미 대기 중일 때가 많아
+window 를 늘려도 batch 크기는 더 커지지 않고 대기 시간만 늘어납니다. 요청이 불규칙하게 도착하는 실제 서버에서는
+window 가 있어야 가까운 시점의 요청이 같은 batch 로 묶입니다. (기본 EMBEDDING_BATCH_WINDOW_MS=2)
+
+실행:
+    python -m benchmarks.bench_embedding_batch
+"""
+import statistics
+import threading
+import time
+
+import numpy as np
+
+from backend.core.config import settings
+from backend.core.embedding_service import EmbeddingBatcher, EmbeddingService
+
+CLIENTS = 16
+REQUESTS_PER_CLIENT = 20
+TEXTS_PER_REQUEST = 1
+WINDOWS_MS = (0, 1, 2, 5, 10, 20)
+
+
+class SyntheticModel:
+    """MiniLM 과 비슷한 비용 구조의 가짜 임베딩 모델 (dim 384, 6 layer)"""
+    DIM = 384
+    SEQ = 32
+    LAYERS = 6
+
+    def __init__(self):
+        rng = np.random.default_rng(0)
+        self.weights = [rng.standard_normal((self.DIM, self.DIM)).astype(np.float32) / 20 for _ in range(self.LAYERS)]
+
+    def encode(self, texts, normalize_embeddings=False, **kwargs):
+        # 호출당 고정 비용: 텍스트 수와 관계없는 작은 연산 여러 번 (토크나이저 / 레이어별 커널 실행)
+        for weight in self.weights:
+            for _ in range(20):
+                np.dot(weight[:8], weight[:, :8])
+        # 텍스트 수에 비례하는 비용
+        x = np.full((len(texts) * self.SEQ, self.DIM), 0.01, dtype=np.float32)
+        for weight in self.weights:
+            x = np.tanh(x @ weight)
+        vectors = x.reshape(len(texts), self.SEQ, self.DIM).mean(axis=1)
+        if normalize_embeddings:
+            vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors
+
+
+def _load_service() -> tuple[object, str]:
+    service = EmbeddingService(settings.EMBEDDING_MODEL_NAME)
+    try:
+        service.warm_up()
+        return service, "MiniLM"
+    except Exception as e:
+        print(f"실제 모델을 로드할 수 없어 가짜 모델을 사용합니다: {type(e).__name__}")
+        return SyntheticModel(), "synthetic"
+
+
+def _run(encode) -> tuple[float, list[float]]:
+    """(초당 처리 텍스트 수, 요청별 지연 시간)"""
+    latencies = []
+    barrier = threading.Barrier(CLIENTS + 1)
+
+    def client(index):
+        texts = [f"client {index} 기사 제목과 설명 {i}" for i in range(TEXTS_PER_REQUEST)]
+        barrier.wait()
+        for _ in range(REQUESTS_PER_CLIENT):
+            started = time.perf_counter()
+            encode(texts)
+            latencies.append(time.perf_counter() - started)
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(CLIENTS)]
+    for t in threads:
+        t.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - started
+    return CLIENTS * REQUESTS_PER_CLIENT * TEXTS_PER_REQUEST / elapsed, latencies
+
+
+def _report(name: str, throughput: float, latencies: list[float], extra: str = "") -> None:
+    latencies = sorted(latencies)
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(f"{name:16s}: {throughput:8.0f} texts/s   mean {statistics.mean(latencies) * 1000:7.2f}ms   p95 {p95 * 1000:7.2f}ms  {extra}")
+
+
+def main():
+    service, model_name = _load_service()
+    print(f"model={model_name}  clients={CLIENTS}  requests/client={REQUESTS_PER_CLIENT}  texts/request={TEXTS_PER_REQUEST}")
+    service.encode(["warm up"])
+
+    _report("direct (legacy)", *_run(lambda texts: service.encode(texts, normalize_embeddings=True)))
+    for window_ms in WINDOWS_MS:
+        batcher = EmbeddingBatcher(service, window=window_ms / 1000, enabled=True)
+        throughput, latencies = _run(lambda texts: batcher.encode(texts, normalize=True))
+        batcher.close()
+        stats = batcher.stats()
+        _report(f"batch {window_ms:>2d}ms", throughput, latencies, f"({stats['requests_per_batch']:.1f} requests/batch)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+# benchmarks/bench_embedding_pool.py
+"""
+프로세스 풀 임베딩 backend 벤치마크 - 자식 프로세스(코어) 수별 초당 임베딩 수
+
+- thread (legacy) : 이전 구현. 현재 프로세스에서 encode (EMBEDDING_BACKEND="thread")
+- process xN      : 현재 구현 EmbeddingProcessPool(workers=N). 텍스트를 CHUNK_SIZE 개씩 나눠 N 개 프로세스에서 계산하고
+                    결과는 공유 메모리로 받음 (EMBEDDING_BACKEND="process")
+
+모델: SentenceTransformer(EMBEDDING_MODEL_NAME) 를 로드할 수 있으면 실제 모델, 없으면 bench_embedding_batch 의 가짜 모델
+      (실제 모델은 torch 스레드를 프로세스당 1개로 제한하므로, 코어 수만큼 프로세스를 늘릴 때 처리량이 늘어납니다)
+
+실행:
+    python -m benchmarks.bench_embedding_pool
+"""
+import os
+import time
+
+from backend.core.config import settings
+from backend.core.embedding_pool import EmbeddingProcessPool, load_sentence_transformer
+from backend.core.embedding_service import EmbeddingService
+from benchmarks.bench_embedding_batch import SyntheticModel
+
+TEXTS = 2_048
+CHUNK_SIZE = 64
+REPEAT = 3
+
+
+def synthetic_model(model_name: str) -> SyntheticModel:
+    """자식 프로세스용 가짜 모델 (spawn 으로 넘기므로 모듈 최상위 함수)"""
+    return SyntheticModel()
+
+
+def _best_rate(encode, texts: list[str]) -> float:
+    """REPEAT 번 중 가장 빠른 초당 임베딩 수"""
+    best = float("inf")
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        vectors = encode(texts)
+        best = min(best, time.perf_counter() - started)
+        assert len(vectors) == len(texts)
+    return len(texts) / best
+
+
+def main():
+    texts = [f"뉴스 기사 {i} 제목과 설명 텍스트입니다." for i in range(TEXTS)]
+    try:
+        service = EmbeddingService(settings.EMBEDDING_MODEL_NAME)
+        service.warm_up()
+        model_name, factory = "MiniLM", load_sentence_transformer
+    except Exception as e:
+        print(f"실제 모델을 로드할 수 없어 가짜 모델을 사용합니다: {type(e).__name__}")
+        service, model_name, factory = SyntheticModel(), "synthetic", synthetic_model
+
+    cores = os.cpu_count() or 1
+    print(f"model={model_name}  texts={TEXTS}  chunk={CHUNK_SIZE}  cpu_count={cores}")
+    baseline = _best_rate(lambda batch: service.encode(batch, normalize_embeddings=True), texts)
+    print(f"thread (legacy) : {baseline:9.0f} embeddings/s")
+
+    workers = sorted({1, 2, 4, 8, cores} & set(range(1, cores + 1))) or [1]
+    for count in workers:
+        pool = EmbeddingProcessPool(settings.EMBEDDING_MODEL_NAME, workers=count, chunk_size=CHUNK_SIZE, model_factory=factory)
+        pool.warm_up()
+        rate = _best_rate(lambda batch: pool.encode(batch, normalize_embeddings=True), texts)
+        pool.close()
+        print(f"process x{count:<2d}     : {rate:9.0f} embeddings/s  (x{rate / baseline:.2f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# benchmarks/bench_import_time.py
+"""
+backend.main import(=워커 시작) 시간 벤치마크
+
+- lazy  : 현재 구현. import backend.main 만 수행 (임베딩 모델/torch 는 첫 뉴스 요청 시 로드)
+- eager : 이전 구현과 동일한 비용. import backend.main + SentenceTransformer 모델 로드
+          (news_db_manager 가 import 시점에 모델을 로드하던 동작 재현)
+- eager(import only) : 모델 가중치 없이 sentence_transformers(torch) import 비용만 추가한 하한값
+                       (HuggingFace 에 접근할 수 없는 환경에서도 측정 가능)
+
+각 측정은 새 파이썬 프로세스에서 REPEAT 회 실행 후 중앙값을 출력합니다.
+
+실행:
+    python -m benchmarks.bench_import_time
+"""
+import statistics
+import subprocess
+import sys
+
+REPEAT = 3
+
+LAZY = """
+import time
+started = time.perf_counter()
+import backend.main
+print(time.perf_counter() - started)
+"""
+
+EAGER = """
+import time
+started = time.perf_counter()
+import backend.main
+from backend.core.embedding_service import embedding_service
+embedding_service.model
+print(time.perf_counter() - started)
+"""
+
+EAGER_IMPORT_ONLY = """
+import time
+started = time.perf_counter()
+import backend.main
+import sentence_transformers
+print(time.perf_counter() - started)
+"""
+
+
+def _measure(code: str) -> float | None:
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    if result.returncode != 0:
+        print(result.stderr.strip().splitlines()[-1])
+        return None
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    runs = (
+        ("lazy  (import backend.main)", LAZY),
+        ("eager (+ embedding model load)", EAGER),
+        ("eager (import only)", EAGER_IMPORT_ONLY),
+    )
+    for name, code in runs:
+        samples = [_measure(code) for _ in range(REPEAT)]
+        samples = [s for s in samples if s is not None]
+        if samples:
+            print(f"{name:32s}: median {statistics.median(samples):6.2f}s  (runs: {', '.join(f'{s:.2f}' for s in samples)})")
+        else:
+            print(f"{name:32s}: failed")
+
+
+if __name__ == "__main__":
+    main()
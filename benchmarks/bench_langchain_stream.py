@@ -0,0 +1,155 @@
+# benchmarks/bench_langchain_stream.py
+"""
+LangchainChatStreamAgent 스트리밍 파이프라인 벤치마크
+
+- legacy : 요청마다 Thread 1개 + queue.Queue + 토큰마다 asyncio.to_thread(q.get) (이전 구현)
+- async  : 체인을 asyncio task로 실행 + AsyncCallbackHandler -> asyncio.Queue (현재 구현)
+
+가짜 스트리밍 LLM(FakeStreamingChatModel)이 TOKEN_INTERVAL 간격으로 토큰을 만들고,
+각 토큰에는 생성 시각(perf_counter)이 들어 있어 소비자(SSE generator)까지 도달하는 지연을 측정합니다.
+
+실행:
+    python -m benchmarks.bench_langchain_stream
+"""
+import asyncio
+import statistics
+import threading
+import time
+from queue import Queue
+from threading import Thread
+
+from langchain_classic.callbacks.base import BaseCallbackHandler
+from langchain_classic.chains import ConversationChain
+from langchain_classic.memory import ConversationBufferMemory
+from langchain_core.chat_history import InMemoryChatMessageHistory
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+
+from backend.agents.langchain_chatstream_agent import LangchainChatStreamAgent
+
+CONCURRENT_STREAMS = 200
+TOKENS_PER_STREAM = 50
+TOKEN_INTERVAL = 0.005
+
+
+class FakeStreamingChatModel(BaseChatModel):
+    """TOKEN_INTERVAL 간격으로 '생성시각' 토큰을 내보내는 가짜 스트리밍 LLM"""
+    streaming: bool = True
+    n_tokens: int = TOKENS_PER_STREAM
+    interval: float = TOKEN_INTERVAL
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-streaming"
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content="done"))])
+
+    def _stream(self, messages, stop=None, run_manager=None, **kwargs):
+        for _ in range(self.n_tokens):
+            time.sleep(self.interval)
+            yield ChatGenerationChunk(message=AIMessageChunk(content=f"{time.perf_counter()}"))
+
+    async def _astream(self, messages, stop=None, run_manager=None, **kwargs):
+        for _ in range(self.n_tokens):
+            await asyncio.sleep(self.interval)
+            yield ChatGenerationChunk(message=AIMessageChunk(content=f"{time.perf_counter()}"))
+
+
+def _fake_chain() -> ConversationChain:
+    memory = ConversationBufferMemory(chat_memory=InMemoryChatMessageHistory(), return_messages=True)
+    return ConversationChain(llm=FakeStreamingChatModel(streaming=True), memory=memory, verbose=False)
+
+
+class FakeAsyncAgent(LangchainChatStreamAgent):
+    """현재 구현 (Redis 대신 in-memory 이력 + 가짜 LLM)"""
+    def _build_chain(self) -> ConversationChain:
+        return _fake_chain()
+
+
+class _LegacyQueueCallbackHandler(BaseCallbackHandler):
+    def __init__(self, queue: Queue):
+        self.queue = queue
+
+    def on_llm_new_token(self, token: str, **kwargs) -> None:
+        self.queue.put(token)
+
+    def on_llm_end(self, *args, **kwargs) -> None:
+        self.queue.put(None)
+
+
+async def legacy_handle_stream(user_input: str):
+    """이전 구현: Thread + queue.Queue + 토큰마다 asyncio.to_thread(q.get)"""
+    q = Queue()
+    chain = _fake_chain()
+
+    def run_chain_in_thread():
+        chain.invoke({"input": user_input}, config={"callbacks": [_LegacyQueueCallbackHandler(q)]})
+
+    Thread(target=run_chain_in_thread).start()
+    while True:
+        token = await asyncio.to_thread(q.get)
+        if token is None:
+            break
+        yield f"data: {token}\n\n"
+    yield "data: [DONE]\n\n"
+
+
+async def _consume(stream, delays: list[float]):
+    async for event in stream:
+        payload = event[len("data: "):].strip()
+        if payload == "[DONE]":
+            break
+        if not payload:
+            continue
+        delays.append(time.perf_counter() - float(payload))
+
+
+async def _run(make_stream) -> dict:
+    delays: list[float] = []
+    peak_threads = threading.active_count()
+    stop = asyncio.Event()
+
+    async def monitor():
+        nonlocal peak_threads
+        while not stop.is_set():
+            peak_threads = max(peak_threads, threading.active_count())
+            await asyncio.sleep(0.005)
+
+    monitor_task = asyncio.create_task(monitor())
+    started = time.perf_counter()
+    await asyncio.gather(*[_consume(make_stream(i), delays) for i in range(CONCURRENT_STREAMS)])
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await monitor_task
+
+    delays.sort()
+    return {
+        "elapsed_s": elapsed,
+        "tokens": len(delays),
+        "peak_threads": peak_threads,
+        "token_delay_mean_ms": statistics.mean(delays) * 1000,
+        "token_delay_p99_ms": delays[int(len(delays) * 0.99) - 1] * 1000,
+    }
+
+
+def main():
+    ideal = TOKENS_PER_STREAM * TOKEN_INTERVAL
+    print(f"streams={CONCURRENT_STREAMS} tokens/stream={TOKENS_PER_STREAM} "
+          f"interval={TOKEN_INTERVAL*1000:.0f}ms (ideal per-stream time {ideal:.2f}s)")
+    runs = {
+        "legacy(thread+to_thread)": lambda i: legacy_handle_stream(f"q{i}"),
+        "async(asyncio.Queue)": lambda i: FakeAsyncAgent(user_id=f"u{i}").handle_stream(f"q{i}"),
+    }
+    for name, make_stream in runs.items():
+        result = asyncio.run(_run(make_stream))
+        print(
+            f"{name:26s} elapsed={result['elapsed_s']:.2f}s tokens={result['tokens']} "
+            f"peak_threads={result['peak_threads']} "
+            f"token_delay mean={result['token_delay_mean_ms']:.2f}ms p99={result['token_delay_p99_ms']:.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
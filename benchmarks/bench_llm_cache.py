@@ -0,0 +1,105 @@
+# benchmarks/bench_llm_cache.py
+"""
+LLM 응답 캐시 벤치마크 - 기록된 요청 로그(JSONL: agent, model, message)를 순서대로 재생
+
+- no cache : 모든 요청이 LLM 호출 (LLM_LATENCY 초 걸리는 가짜 LLM)
+- exact    : 해시 exact match 만 사용
+- semantic : exact -> MiniLM 임베딩 유사도(threshold 이상) 순서로 사용 (현재 구현)
+
+임베딩 모델(sentence-transformers/all-MiniLM-L6-v2)을 로드할 수 없는 환경에서는
+단어 해시 bag-of-words 임베딩으로 대체하여 측정합니다. (hit 비율은 실제 모델과 다를 수 있음)
+
+실행:
+    python -m benchmarks.bench_llm_cache
+    python -m benchmarks.bench_llm_cache --log path/to/request_log.jsonl --threshold 0.9
+"""
+import argparse
+import asyncio
+import json
+import os
+import time
+import zlib
+
+import numpy as np
+
+from backend.agents.chat_agent import ChatAgent
+from backend.agents.meeting_agent import MeetingAgent
+from backend.core.response_cache import LLMResponseCache, llm_cache_status
+
+DEFAULT_LOG = os.path.join(os.path.dirname(__file__), "data", "llm_request_log.jsonl")
+LLM_LATENCY = 0.8   # gpt-4o-mini 짧은 답변 1회 왕복 시간(초) 가정
+PROMPTS = {agent.name: agent.role_prompt for agent in (ChatAgent(), MeetingAgent())}
+
+
+def _bag_of_words_embed(texts):
+    vectors = np.zeros((len(texts), 256), dtype=np.float32)
+    for row, text in enumerate(texts):
+        for word in text.replace("?", " ").split():
+            vectors[row, zlib.crc32(word.lower().encode()) % 256] += 1
+    return vectors
+
+
+def _load_embed():
+    try:
+        from backend.core.embedding_service import embedding_service
+        embedding_service.warm_up()
+        return embedding_service.encode, "MiniLM"
+    except Exception as e:
+        print(f"(embedding model unavailable: {type(e).__name__}, using bag-of-words embedding)")
+        return _bag_of_words_embed, "bag-of-words"
+
+
+async def _replay(requests: list[dict], cache: LLMResponseCache | None) -> dict:
+    llm_calls = 0
+    overhead = 0.0
+    statuses = []
+
+    async def fake_llm():
+        nonlocal llm_calls
+        llm_calls += 1
+        return f"reply {llm_calls}"
+
+    for request in requests:
+        prompt = PROMPTS.get(request["agent"], "")
+        started = time.perf_counter()
+        if cache is None:
+            await fake_llm()
+            statuses.append("miss")
+        else:
+            await cache.get_or_call(request["model"], prompt, request["message"], 0.3, [], fake_llm)
+            statuses.append(llm_cache_status.get())
+        overhead += time.perf_counter() - started
+    return {
+        "llm_calls": llm_calls,
+        "hits": len(requests) - llm_calls,
+        "total_s": llm_calls * LLM_LATENCY + overhead,
+        "overhead_ms": overhead / len(requests) * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--log", default=DEFAULT_LOG)
+    parser.add_argument("--threshold", type=float, default=0.95)
+    args = parser.parse_args()
+
+    with open(args.log, encoding="utf-8") as f:
+        requests = [json.loads(line) for line in f if line.strip()]
+    embed, embed_name = _load_embed()
+    print(f"requests={len(requests)} llm_latency={LLM_LATENCY}s threshold={args.threshold} embedding={embed_name}")
+
+    runs = {
+        "no cache": None,
+        "exact": LLMResponseCache(ttl=3600, maxsize=1024, semantic=False),
+        "semantic": LLMResponseCache(ttl=3600, maxsize=1024, threshold=args.threshold, embed=embed),
+    }
+    for name, cache in runs.items():
+        result = asyncio.run(_replay(requests, cache))
+        print(
+            f"{name:9s}: llm_calls={result['llm_calls']:3d} hit_ratio={result['hits'] / len(requests):5.1%} "
+            f"total={result['total_s']:6.2f}s  cache overhead={result['overhead_ms']:.2f}ms/request"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+# benchmarks/bench_llm_clients.py
+"""
+/api/langchain/chat 요청당 준비(setup) 비용 벤치마크 - LLM 호출/Redis 통신 자체는 측정하지 않음
+
+- per-request : 이전 구현. 요청마다 ChatOpenAI(+ OpenAI 클라이언트) + RedisChatMessageHistory(url) + memory + chain 생성
+- registry    : 현재 구현. 공유 ChatOpenAI(llm_clients) + 공유 Redis 풀 클라이언트, 요청마다 memory + chain 만 생성
+
+실제 서비스에서는 per-request 방식이 새 OpenAI 클라이언트마다 TLS 연결을 다시 맺는 비용이 추가되므로
+(첫 호출 기준 수십~수백 ms) 실제 차이는 여기 측정값보다 큽니다.
+
+실행:
+    python -m benchmarks.bench_llm_clients
+"""
+import time
+
+from langchain_classic.chains import ConversationChain
+from langchain_classic.memory import ConversationBufferMemory
+from langchain_community.chat_message_histories import RedisChatMessageHistory
+from langchain_openai import ChatOpenAI
+
+from backend.core.chat_memory import get_conversation_chain
+from backend.core.env_loader import REDIS_DB, REDIS_HOST, REDIS_PORT
+
+REQUESTS = 500
+
+
+def legacy_conversation_chain(user_id: str) -> ConversationChain:
+    """이전 구현: 요청마다 LLM 클라이언트/Redis 클라이언트/체인 모두 새로 생성"""
+    history = RedisChatMessageHistory(session_id=f"user:{user_id}", url=f"redis://{REDIS_HOST}:{REDIS_PORT}/{REDIS_DB}", ttl=3600)
+    memory = ConversationBufferMemory(chat_memory=history, return_messages=True)
+    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.3)
+    return ConversationChain(llm=llm, memory=memory, verbose=False)
+
+
+def _measure(build) -> float:
+    build("warmup")
+    started = time.perf_counter()
+    for i in range(REQUESTS):
+        build(f"u{i}")
+    return (time.perf_counter() - started) / REQUESTS
+
+
+def main():
+    legacy = _measure(legacy_conversation_chain)
+    shared = _measure(get_conversation_chain)
+    print(f"requests={REQUESTS}")
+    print(f"per-request ChatOpenAI : {legacy*1000:8.3f}ms setup per request")
+    print(f"registry (shared LLM)  : {shared*1000:8.3f}ms setup per request  (x{legacy / shared:.1f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+# benchmarks/bench_logging.py
+"""
+acall_llm 요청 지연 시간 벤치마크 - 디버그 로그 방식별 비교 (LLM 응답은 즉시 반환하는 가짜 클라이언트)
+
+- print (legacy) : 이전 구현. 호출마다 프롬프트/메세지/대화 이력 전체를 print 로 동기 출력
+- logging off    : 현재 구현, LOG_LEVEL=INFO (debug 로그 인자를 문자열로 만들지 않음)
+- logging on     : 현재 구현, backend.core.llm_core=DEBUG (큰 값은 LOG_MAX_FIELD_CHARS 로 자르고, 출력은 QueueListener 스레드)
+
+대화 이력이 긴 세션(HISTORY_MESSAGES 건 x MESSAGE_CHARS 글자)을 가정하고, stdout 대신 임시 파일에 출력합니다.
+(실제 서버에서는 stdout 이 파이프/로그 수집기로 연결되어 있어 print 의 블로킹 비용이 더 큽니다)
+
+실행:
+    python -m benchmarks.bench_logging
+"""
+import asyncio
+import contextlib
+import logging
+import statistics
+import tempfile
+import time
+from unittest.mock import patch
+
+from backend.core import llm_core
+from backend.core.logging_config import setup_logging, shutdown_logging
+
+REQUESTS = 2_000
+HISTORY_MESSAGES = 40
+MESSAGE_CHARS = 1_000
+
+
+class _FakeResponse:
+    class _Choice:
+        class message:
+            content = "가짜 LLM 응답"
+    choices = [_Choice]
+
+
+async def _fake_create(**kwargs):
+    return _FakeResponse
+
+
+def _legacy_print(model, prompt, message, temperature, chat_history):
+    """이전 call_llm / acall_llm 의 print 디버그 출력"""
+    print(
+        f'[llm_core.py] >>>>>> acall_llm( model, prompt, message, temperature, chat_history)  \n'
+        f'  - model: {model} \n'
+        f'  - prompt: {prompt} \n'
+        f'  - message: {message} \n'
+        f'  - temperature: {temperature} \n'
+        f'  - chat_history: {chat_history} \n'
+    )
+
+
+async def _run(history: list[dict], legacy: bool) -> list[float]:
+    latencies = []
+    for i in range(REQUESTS):
+        started = time.perf_counter()
+        if legacy:
+            _legacy_print("gpt-4o-mini", "prompt", f"q{i}", 0.3, history)
+        await llm_core.acall_llm("gpt-4o-mini", "prompt", f"q{i}", chat_history=history)
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+def _report(name: str, latencies: list[float]) -> None:
+    latencies = sorted(latencies)
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    print(f"{name:16s}: mean {statistics.mean(latencies) * 1e6:8.1f}µs  p99 {p99 * 1e6:8.1f}µs")
+
+
+def main():
+    history = [{"role": "user" if i % 2 == 0 else "assistant", "content": "가" * MESSAGE_CHARS} for i in range(HISTORY_MESSAGES)]
+    print(f"requests={REQUESTS}  history={HISTORY_MESSAGES} messages x {MESSAGE_CHARS} chars")
+
+    with patch.object(llm_core.aclient.chat.completions, "create", _fake_create), \
+         tempfile.TemporaryFile("w", encoding="utf-8") as out:
+        # 1. legacy print (로깅은 끔)
+        setup_logging(level="WARNING", module_levels={}, handler=logging.StreamHandler(out))
+        with contextlib.redirect_stdout(out):
+            legacy = asyncio.run(_run(history, legacy=True))
+        _report("print (legacy)", legacy)
+
+        # 2. logging, debug off
+        setup_logging(level="INFO", module_levels={}, handler=logging.StreamHandler(out))
+        _report("logging off", asyncio.run(_run(history, legacy=False)))
+
+        # 3. logging, debug on (llm_core 만 DEBUG)
+        setup_logging(level="INFO", module_levels={"backend.core.llm_core": "DEBUG"}, handler=logging.StreamHandler(out))
+        _report("logging on", asyncio.run(_run(history, legacy=False)))
+        logging.getLogger("backend.core.llm_core").setLevel(logging.NOTSET)
+        shutdown_logging()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+# benchmarks/bench_metrics.py
+"""
+지연 시간 계측(backend/core/metrics.py) 오버헤드 벤치마크
+
+- span      : with span(...) 1회 비용 (요청 밖 / 요청 안: 구간 목록에도 기록)
+- timed     : @timed sync / async 함수 1회 호출 비용 (빈 함수 기준)
+- request   : MetricsMiddleware 를 붙인 빈 라우트 vs 붙이지 않은 라우트의 요청당 시간 (httpx ASGITransport)
+
+/api/chat 한 번에 계측되는 구간은 10개 안팎이므로 (DB 몇 번 + Redis 몇 번 + LLM 1번)
+구간당 수 µs 수준이면 DB/LLM 시간(ms~s)에 비해 무시할 수 있습니다.
+
+실행:
+    python -m benchmarks.bench_metrics
+"""
+import asyncio
+import time
+
+import httpx
+from fastapi import FastAPI
+
+from backend.core.metrics import MetricsMiddleware, request_spans, span, timed
+
+ITERATIONS = 200_000
+REQUESTS = 2_000
+
+
+def _per_call(func, iterations: int = ITERATIONS) -> float:
+    func()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - started) / iterations
+
+
+def _empty():
+    pass
+
+
+@timed("bench")
+def _timed_empty():
+    pass
+
+
+def _span_empty():
+    with span("bench", "empty"):
+        pass
+
+
+async def _async_empty():
+    pass
+
+
+@timed("bench")
+async def _timed_async_empty():
+    pass
+
+
+async def _per_await(func, iterations: int = ITERATIONS) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        await func()
+    return (time.perf_counter() - started) / iterations
+
+
+def _app(with_metrics: bool) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        with span("db", "ping"):
+            pass
+        return {"ok": True}
+
+    if with_metrics:
+        app.add_middleware(MetricsMiddleware)
+    return app
+
+
+async def _per_request(app: FastAPI) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        await client.get("/ping")
+        started = time.perf_counter()
+        for _ in range(REQUESTS):
+            await client.get("/ping")
+        return (time.perf_counter() - started) / REQUESTS
+
+
+def main():
+    baseline = _per_call(_empty)
+    print(f"iterations={ITERATIONS}")
+    print(f"empty function       : {baseline * 1e6:6.2f}µs")
+    print(f"span (no request)    : {(_per_call(_span_empty) - baseline) * 1e6:6.2f}µs overhead")
+    token = request_spans.set([])
+    print(f"span (in request)    : {(_per_call(_span_empty) - baseline) * 1e6:6.2f}µs overhead")
+    request_spans.reset(token)
+    print(f"@timed sync          : {(_per_call(_timed_empty) - baseline) * 1e6:6.2f}µs overhead")
+    async_baseline = asyncio.run(_per_await(_async_empty))
+    print(f"@timed async         : {(asyncio.run(_per_await(_timed_async_empty)) - async_baseline) * 1e6:6.2f}µs overhead")
+
+    # 요청 측정은 편차가 크므로 번갈아 3번씩 측정하여 최솟값 사용
+    plain_app, metered_app = _app(with_metrics=False), _app(with_metrics=True)
+    plain, metered = float("inf"), float("inf")
+    for _ in range(3):
+        plain = min(plain, asyncio.run(_per_request(plain_app)))
+        metered = min(metered, asyncio.run(_per_request(metered_app)))
+    print(f"requests={REQUESTS}")
+    print(f"route without middleware : {plain * 1000:7.3f}ms per request")
+    print(f"route with middleware    : {metered * 1000:7.3f}ms per request  (+{(metered - plain) * 1e6:.1f}µs)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+# benchmarks/bench_news_ingest.py
+"""
+뉴스 요청 경로 벤치마크 - /api/news 한 요청의 지연 시간 (인라인 처리 vs 백그라운드 수집)
+
+- inline (legacy) : 이전 NewsAgent. 요청마다 검색 -> 임베딩 -> 중복 검사 -> 저장 후 응답
+- ingest          : 현재 구현. NewsIngestPipeline 이 미리 수집/임베딩/중복 검사/저장하고,
+                    요청은 구독 확인 + 미전달 기사 조회만 수행 (fetch_pending_news)
+
+검색 API 는 UPSTREAM_DELAY 초가 걸리는 가짜 검색, 임베딩은 bench_embedding_batch 의 가짜 모델을 사용합니다.
+DB 는 임시 SQLite 파일입니다. 수집 pipeline 의 단계별 처리량도 함께 출력합니다.
+
+실행:
+    python -m benchmarks.bench_news_ingest
+"""
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+import zlib
+
+import numpy as np
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.core import news_db_manager
+from backend.core.config import settings
+from backend.core.news_db_manager import (
+    article_text, fetch_pending_news, find_similar_vectors, record_news_batch, subscribe_news,
+)
+from backend.core.news_ingest import NewsIngestPipeline, NewsIngestScheduler
+from benchmarks.bench_embedding_batch import SyntheticModel
+
+USERS = 20
+KEYWORDS_PER_USER = 2
+ARTICLES_PER_SEARCH = 20
+UPSTREAM_DELAY = 0.15     # 네이버 검색 API 응답 시간(초) 흉내
+REQUESTS = 40
+
+model = SyntheticModel()
+
+
+async def fake_search(keyword: str, display: int, sort: str = "sim", start: int = 100) -> list[dict]:
+    await asyncio.sleep(UPSTREAM_DELAY)
+    return [
+        {"keyword": keyword, "title": f"{keyword} 기사 {i}", "link": f"https://news/{keyword}/{i}",
+         "description": f"{keyword} 관련 {i}번째 기사 설명", "pubDate": ""}
+        for i in range(display)
+    ]
+
+
+async def fake_embed(texts: list[str]) -> np.ndarray:
+    vectors = await asyncio.to_thread(model.encode, texts, normalize_embeddings=True)
+    # 가짜 모델은 텍스트 내용과 관계없는 벡터를 내므로 텍스트별로 다른 방향이 되도록 섞음
+    seeds = [zlib.crc32(text.encode()) for text in texts]
+    noise = np.stack([np.random.default_rng(seed).standard_normal(vectors.shape[1]) for seed in seeds]).astype(np.float32)
+    vectors = vectors + noise
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def _use_temp_db(tmp_dir: str):
+    engine = create_engine(f"sqlite:///{os.path.join(tmp_dir, 'news.db')}", connect_args={"check_same_thread": False})
+    news_db_manager.Base.metadata.create_all(bind=engine)
+    news_db_manager.SessionLocal = sessionmaker(bind=engine)
+    news_db_manager._user_indexes.clear()
+    settings.VECTOR_INDEX_DIR = os.path.join(tmp_dir, "vector_index")
+
+
+async def _inline_request(user_name: str, keyword: str) -> None:
+    """이전 NewsAgent.handle + _record_new_articles"""
+    articles = await fake_search(keyword, ARTICLES_PER_SEARCH)
+    vectors = await fake_embed([article_text(a) for a in articles])
+
+    def record():
+        similar = find_similar_vectors(user_name, vectors)
+        new_indexes = [i for i, match in enumerate(similar) if match is None][:3]
+        record_news_batch([articles[i] for i in new_indexes], vectors[new_indexes], user_name, keyword)
+
+    await asyncio.to_thread(record)
+
+
+async def _ingest_request(user_name: str, keyword: str) -> None:
+    """현재 NewsAgent.handle (이미 구독 중인 키워드, 첫 요청의 수집 제외)"""
+    await asyncio.to_thread(subscribe_news, user_name, keyword)
+    await asyncio.to_thread(fetch_pending_news, user_name, keyword, settings.NEWS_DELIVER_LIMIT)
+
+
+async def _measure(handler, pairs) -> list[float]:
+    latencies = []
+    for user_name, keyword in pairs:
+        started = time.perf_counter()
+        await handler(user_name, keyword)
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+def _report(name: str, latencies: list[float]) -> None:
+    latencies = sorted(latencies)
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(f"{name:16s}: mean {statistics.mean(latencies) * 1000:8.2f}ms   p95 {p95 * 1000:8.2f}ms")
+
+
+async def main_async():
+    pairs = [(f"user{u}", f"키워드{u}-{k}") for u in range(USERS) for k in range(KEYWORDS_PER_USER)]
+    requests = [pairs[i % len(pairs)] for i in range(REQUESTS)]
+    print(f"users={USERS}  keywords/user={KEYWORDS_PER_USER}  articles/search={ARTICLES_PER_SEARCH}  "
+          f"upstream={UPSTREAM_DELAY * 1000:.0f}ms  requests={REQUESTS}")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        _use_temp_db(tmp_dir)
+        _report("inline (legacy)", await _measure(_inline_request, requests))
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        _use_temp_db(tmp_dir)
+        for user_name, keyword in pairs:
+            subscribe_news(user_name, keyword)
+        pipeline = NewsIngestPipeline(search=fake_search, embed=fake_embed, display=ARTICLES_PER_SEARCH)
+        started = time.perf_counter()
+        run = await NewsIngestScheduler(pipeline, enabled=False).run_once()
+        print(f"ingest run      : {time.perf_counter() - started:8.3f}s (background, {len(pairs)} keywords)")
+        for name, stats in run.items():
+            print(f"  {name:10s}: in {stats['items_in']:5d}  out {stats['items_out']:5d}  "
+                  f"busy {stats['seconds'] * 1000:8.1f}ms  {stats['items_per_second']:10.0f} items/s")
+        _report("ingest", await _measure(_ingest_request, requests))
+
+
+def main():
+    asyncio.run(main_async())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+# benchmarks/bench_session_cache.py
+"""
+Redis 세션 캐시 벤치마크 - 같은 세션에 연속으로 대화 턴을 보낼 때 (LLM 호출은 즉시 응답하는 가짜 함수)
+
+- db only : 세션 캐시 끔 (매 턴 최근 이력 SELECT + sequence 잠금/INSERT ... SELECT)
+- cache   : fakeredis 세션 캐시 (첫 턴만 DB에서 읽고, 이후 턴은 캐시 조회 + sequence 할당 후 INSERT 만 실행)
+
+SQLite 파일 DB(llm_agent 스키마는 ATTACH) + fakeredis(로컬 Redis 대체)로 측정하므로 절대값보다는
+턴당 DB 조회 수와 상대적인 차이를 보기 위한 벤치마크입니다.
+
+실행:
+    python -m benchmarks.bench_session_cache
+"""
+import asyncio
+import os
+import tempfile
+import time
+import uuid
+
+import fakeredis
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from backend.agents.chat_agent import ChatAgent
+from backend.core.session_cache import SessionHistoryCache
+from backend.database.db_manager import OrmBase
+from backend.database.models.chat_model import ChatSession, SessionMessage
+
+EXISTING_MESSAGES = 10_000
+TURNS = 200
+
+
+def _setup(tmp_dir: str):
+    engine = create_engine(f"sqlite:///{os.path.join(tmp_dir, 'main.db')}")
+
+    @event.listens_for(engine, "connect")
+    def _attach_schema(dbapi_conn, _):
+        dbapi_conn.execute(f"ATTACH DATABASE '{os.path.join(tmp_dir, 'llm_agent.db')}' AS llm_agent")
+
+    OrmBase.metadata.create_all(bind=engine)
+    session_id = uuid.uuid4()
+    with engine.begin() as conn:
+        conn.execute(insert(ChatSession), [{"session_id": session_id, "user_id": "bench", "agent_id": "ChatAgent", "model_id": "gpt-4o-mini"}])
+        conn.execute(insert(SessionMessage), [
+            {"message_id": uuid.uuid4(), "session_id": session_id, "sequence": seq,
+             "role": "user" if seq % 2 else "assistant", "content": f"{seq}번째 메세지 " + "lorem ipsum " * 10}
+            for seq in range(1, EXISTING_MESSAGES + 1)
+        ])
+    engine.dispose()
+    return str(session_id)
+
+
+def _async_engine(tmp_dir: str):
+    """ChatAgent 가 사용하는 AsyncSession 용 엔진 (aiosqlite, 이벤트 루프에 묶이므로 asyncio.run 안에서 생성)"""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{os.path.join(tmp_dir, 'main.db')}")
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _attach_schema(dbapi_conn, _):
+        cursor = dbapi_conn.cursor()
+        cursor.execute(f"ATTACH DATABASE '{os.path.join(tmp_dir, 'llm_agent.db')}' AS llm_agent")
+        cursor.close()
+
+    return engine
+
+
+async def _fake_llm_reply(model, message, chat_history, prompt=None):
+    return f"reply to {message}"
+
+
+def _run(name: str, agent: ChatAgent, tmp_dir: str, session_id: str):
+    selects = []
+
+    async def turns():
+        engine = _async_engine(tmp_dir)
+        event.listen(engine.sync_engine, "before_cursor_execute",
+                     lambda conn, cursor, sql, *args: selects.append(sql) if sql.startswith("SELECT") else None)
+        session_factory = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+        for i in range(TURNS):
+            await agent.handle(session_id, "bench", "gpt-4o-mini", f"q{i}", session_factory=session_factory)
+        await engine.dispose()
+
+    started = time.perf_counter()
+    asyncio.run(turns())
+    elapsed = time.perf_counter() - started
+    print(f"{name:8s}: {elapsed / TURNS * 1000:7.2f}ms per turn  DB SELECT per turn {len(selects) / TURNS:5.2f}  (first turn included)")
+
+
+def main():
+    ChatAgent._model_max_tokens["gpt-4o-mini"] = 16384
+    for name, cache in (
+        ("db only", SessionHistoryCache(enabled=False)),
+        ("cache", SessionHistoryCache(client=fakeredis.FakeRedis(decode_responses=True), enabled=True)),
+    ):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            session_id = _setup(tmp_dir)
+            agent = ChatAgent()
+            agent.session_cache = cache
+            agent._llm_reply = _fake_llm_reply
+            _run(name, agent, tmp_dir, session_id)
+            if cache.enabled:
+                print(f"          cache stats: {cache.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+# benchmarks/bench_vector_index.py
+"""
+뉴스 벡터 인덱스 벤치마크 - 정확 검색(numpy brute-force) 대비 ANN(HNSW) recall / 지연시간 (CPU 전용)
+
+- numpy   : NumpyVectorIndex (정확 검색, 기준값)
+- hnswlib : HnswVectorIndex  (설치되어 있을 때만)
+- faiss   : FaissVectorIndex (설치되어 있을 때만)
+
+임베딩과 비슷한 분포를 흉내내기 위해 군집(cluster) 중심 + 잡음으로 만든 벡터를 사용합니다.
+질의는 저장 벡터에 작은 잡음을 더한 것(중복 후보)과 무작위 벡터(신규 후보)를 섞습니다.
+
+실행:
+    python -m benchmarks.bench_vector_index
+"""
+import time
+
+import numpy as np
+
+from backend.core.vector_index import BACKENDS, create_vector_index, resolve_backend
+
+STORED_SIZES = (10_000, 100_000)
+QUERIES = 200
+DIM = 384                # all-MiniLM-L6-v2 임베딩 차원
+CLUSTERS = 256
+K = 10
+
+
+def _make_data(rng, n):
+    centers = rng.standard_normal((CLUSTERS, DIM)).astype(np.float32)
+    stored = centers[rng.integers(0, CLUSTERS, n)] + 0.6 * rng.standard_normal((n, DIM)).astype(np.float32)
+    near = stored[rng.integers(0, n, QUERIES // 2)] + 0.1 * rng.standard_normal((QUERIES // 2, DIM)).astype(np.float32)
+    fresh = centers[rng.integers(0, CLUSTERS, QUERIES // 2)] + 0.6 * rng.standard_normal((QUERIES // 2, DIM)).astype(np.float32)
+    return stored, np.vstack([near, fresh])
+
+
+def _recall(found: np.ndarray, exact: np.ndarray, k: int) -> float:
+    return float(np.mean([len(set(f[:k]) & set(e[:k])) / k for f, e in zip(found, exact)]))
+
+
+def main():
+    rng = np.random.default_rng(0)
+    for n in STORED_SIZES:
+        stored, queries = _make_data(rng, n)
+        ids = np.arange(1, n + 1)
+        print(f"stored={n} queries={QUERIES} dim={DIM}")
+        exact = None
+        for backend in BACKENDS:
+            if resolve_backend(backend) != backend:
+                continue
+            index = create_vector_index(backend, DIM)
+            started = time.perf_counter()
+            index.add(ids, stored)
+            build = time.perf_counter() - started
+
+            # NewsAgent 한 요청(후보 20건)과 같은 크기의 배치로 검색
+            started = time.perf_counter()
+            found = np.vstack([index.search(queries[i:i + 20], k=K)[1] for i in range(0, QUERIES, 20)])
+            per_request = (time.perf_counter() - started) / (QUERIES / 20)
+            if exact is None:
+                exact = found
+            print(
+                f"  {backend:8s} build {build:7.2f}s  per request(20) {per_request * 1000:7.2f}ms"
+                f"  recall@1 {_recall(found, exact, 1):.3f}  recall@{K} {_recall(found, exact, K):.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 # tests/agents/test_chat_agent.py
+import asyncio
 import pytest
-from unittest.mock import patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from backend.agents.chat_agent import ChatAgent
 
 @pytest.fixture
@@ -8,6 +9,12 @@ def chat_agent():
     """테스트를 위한 ChatAgent 인스턴스를 생성하는 Fixture"""
     return ChatAgent()
 
+def _session_factory():
+    """AsyncSessionLocal 대신 사용할 가짜 session_factory (async with 로 AsyncMock DB 세션을 반환)"""
+    session_factory = MagicMock()
+    session_factory.return_value.__aenter__.return_value = AsyncMock()
+    return session_factory
+
 def test_handle_new_session(chat_agent, mocker):
     """
     첫 대화일 때 (session_id=None), 새로운 session_id를 생성하고
@@ -20,17 +27,24 @@ def test_handle_new_session(chat_agent, mocker):
         return_value="LLM의 가짜 응답"
     )
 
-    # DB 연동 부분을 가정하기 위한 가짜 uuid 생성 mock
-    # uuid.uuid4()가 항상 예측 가능한 값을 반환하도록 설정
-    mocker.patch('backend.agents.chat_agent.uuid.uuid4', return_value='new-mock-uuid')
+    # DB 연동 부분(chat_crud) mock
+    # 새 세션 생성 시 항상 예측 가능한 session_id를 반환하도록 설정
+    mocker.patch(
+        'backend.agents.chat_agent.chat_crud.acreate_chat_session',
+        return_value=MagicMock(session_id='new-mock-uuid')
+    )
+    mocker.patch('backend.agents.chat_agent.chat_crud.asave_turn', return_value=[1, 2])
+    mocker.patch('backend.agents.chat_agent.chat_crud.acomplete_message', return_value=True)
 
     # 실행 (Act)
-    reply, session_id = chat_agent.handle(
+    # handle은 async 함수이므로 asyncio.run으로 실행합니다.
+    reply, session_id = asyncio.run(chat_agent.handle(
+        session_factory=_session_factory(),
         session_id=None,
         user_id="test_user",
         model="gpt-4o-mini",
         message="안녕하세요"
-    )
+    ))
 
     # 단언 (Assert)
     assert reply == "LLM의 가짜 응답"
@@ -38,7 +52,7 @@ def test_handle_new_session(chat_agent, mocker):
 
     # _llm_reply가 올바른 인자들로 호출되었는지 확인
     # 이 테스트에서는 chat_history가 비어있을 것으로 예상
-    mock_llm_reply.assert_called_once_with("gpt-4o-mini", "안녕하세요", [])
+    mock_llm_reply.assert_called_once_with("gpt-4o-mini", "안녕하세요", [], chat_agent.role_prompt)
 
 def test_handle_existing_session(chat_agent, mocker):
     """
@@ -55,13 +69,20 @@ def test_handle_existing_session(chat_agent, mocker):
         return_value="LLM의 두 번째 가짜 응답"
     )
 
+    mocker.patch('backend.agents.chat_agent.chat_crud.aget_recent_messages', return_value=[])
+    mocker.patch('backend.agents.chat_agent.chat_crud.aget_model_max_tokens', return_value=None)
+    mock_save_turn = mocker.patch('backend.agents.chat_agent.chat_crud.asave_turn', return_value=[7, 8])
+    mock_complete = mocker.patch('backend.agents.chat_agent.chat_crud.acomplete_message', return_value=True)
+    session_factory = _session_factory()
+
     # 실행 (Act)
-    reply, session_id = chat_agent.handle(
+    reply, session_id = asyncio.run(chat_agent.handle(
+        session_factory=session_factory,
         session_id="existing-session-123",
         user_id="test_user",
         model="gpt-4o-mini",
         message="제 이름이 뭔가요?"
-    )
+    ))
 
     # 단언 (Assert)
     assert reply == "LLM의 두 번째 가짜 응답"
@@ -70,4 +91,107 @@ def test_handle_existing_session(chat_agent, mocker):
     # 여기서 chat_history는 아직 DB 연동 전이라 빈 리스트[]로 넘어가는 것이 맞습니다.
     # 만약 DB 연동 후라면, fetch_history를 mocking하고 가짜 이력을 반환하게 한 뒤,
     # 그 가짜 이력이 _llm_reply에 잘 전달되는지 검증해야 합니다.
-    mock_llm_reply.assert_called_once_with("gpt-4o-mini", "제 이름이 뭔가요?", [])
\ No newline at end of file
+    mock_llm_reply.assert_called_once_with("gpt-4o-mini", "제 이름이 뭔가요?", [], chat_agent.role_prompt)
+
+    # LLM 호출 전: 사용자 메세지 + 빈 assistant 메세지(sequence 예약)를 한 번의 save_turn 으로 저장
+    mock_save_turn.assert_called_once()
+    assert mock_save_turn.call_args.args[1:] == (
+        "existing-session-123", [("user", "제 이름이 뭔가요?"), ("assistant", None)]
+    )
+    # LLM 호출 후: 예약한 assistant 메세지(sequence 8)에 답변 저장
+    mock_complete.assert_called_once()
+    assert mock_complete.call_args.args[1:] == ("existing-session-123", 8, "LLM의 두 번째 가짜 응답")
+    # DB 세션은 LLM 호출 앞/뒤로 각각 짧게 열고 닫음
+    db = session_factory.return_value.__aenter__.return_value
+    assert session_factory.call_count == 2
+    assert session_factory.return_value.__aexit__.call_count == 2
+    assert db.commit.await_count == 2
+
+def test_handle_discards_reserved_turn_when_llm_fails(chat_agent, mocker):
+    """LLM 호출이 실패하면 예약해 둔 user/assistant 메세지를 삭제하고 예외를 그대로 전달하는지 테스트합니다."""
+    mocker.patch('backend.agents.chat_agent.ChatAgent._llm_reply', side_effect=RuntimeError("LLM down"))
+    mocker.patch('backend.agents.chat_agent.chat_crud.aget_recent_messages', return_value=[])
+    mocker.patch('backend.agents.chat_agent.chat_crud.aget_model_max_tokens', return_value=None)
+    mocker.patch('backend.agents.chat_agent.chat_crud.asave_turn', return_value=[3, 4])
+    mock_complete = mocker.patch('backend.agents.chat_agent.chat_crud.acomplete_message')
+    mock_discard = mocker.patch('backend.agents.chat_agent.chat_crud.adiscard_messages')
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(chat_agent.handle(
+            session_factory=_session_factory(),
+            session_id="existing-session-123",
+            user_id="test_user",
+            model="gpt-4o-mini",
+            message="안녕하세요"
+        ))
+
+    mock_discard.assert_called_once()
+    assert mock_discard.call_args.args[1:] == ("existing-session-123", [3, 4])
+    mock_complete.assert_not_called()
+
+def test_handle_stream_saves_reply_once_at_end(chat_agent, mocker):
+    """
+    스트리밍 대화일 때 session 이벤트 -> 토큰 이벤트 -> [DONE] 순서로 전송하고,
+    assistant 답변은 스트림 종료 시 한 번에 저장하는지 테스트합니다.
+    DB 세션은 시작/종료 시점에 각각 짧게 열고 닫아야 합니다.
+    """
+    async def fake_stream(*args, **kwargs):
+        for token in ["안녕", "하세요", "\n반갑습니다"]:
+            yield token
+
+    mocker.patch.object(chat_agent, '_llm_reply_stream', side_effect=fake_stream)
+    mocker.patch(
+        'backend.agents.chat_agent.chat_crud.acreate_chat_session',
+        return_value=MagicMock(session_id='stream-session-id')
+    )
+    mock_save = mocker.patch('backend.agents.chat_agent.chat_crud.asave_turn')
+    session_factory = _session_factory()
+
+    async def collect():
+        return [event async for event in chat_agent.handle_stream(
+            session_id=None,
+            user_id="test_user",
+            model="gpt-4o-mini",
+            message="안녕하세요",
+            session_factory=session_factory,
+        )]
+
+    events = asyncio.run(collect())
+
+    assert events[0] == "event: session\ndata: stream-session-id\n\n"
+    assert events[1:3] == ["data: 안녕\n\n", "data: 하세요\n\n"]
+    # 줄바꿈이 포함된 토큰은 여러 줄의 data: 로 나눠서 전송
+    assert events[3] == "data: \ndata: 반갑습니다\n\n"
+    assert events[-1] == "data: [DONE]\n\n"
+
+    # 사용자 메세지(시작) + assistant 메세지(종료) 총 2번 저장
+    assert mock_save.call_count == 2
+    assert mock_save.call_args_list[0].args[1:] == ("stream-session-id", [("user", "안녕하세요")])
+    assert mock_save.call_args_list[1].args[1:] == ("stream-session-id", [("assistant", "안녕하세요\n반갑습니다")])
+    # DB 세션은 시작/종료 각각 열고 닫음
+    assert session_factory.call_count == 2
+    assert session_factory.return_value.__aexit__.call_count == 2
+
+def test_handle_does_not_cache_reply_missing_from_db(chat_agent, mocker):
+    """예약한 assistant 메세지가 DB 에 없어 답변이 저장되지 않으면 (0건) 캐시에 추가하지 않고 무효화하는지 테스트합니다."""
+    mocker.patch('backend.agents.chat_agent.ChatAgent._llm_reply', return_value="답변")
+    mocker.patch(
+        'backend.agents.chat_agent.chat_crud.acreate_chat_session',
+        return_value=MagicMock(session_id='new-mock-uuid')
+    )
+    mocker.patch('backend.agents.chat_agent.chat_crud.asave_turn', return_value=[1, 2])
+    mocker.patch('backend.agents.chat_agent.chat_crud.acomplete_message', return_value=False)
+    cache = chat_agent.session_cache = MagicMock(available=False)
+    cache.allocate.return_value = None
+
+    reply, _ = asyncio.run(chat_agent.handle(
+        session_factory=_session_factory(),
+        session_id=None,
+        user_id="test_user",
+        model="gpt-4o-mini",
+        message="안녕하세요"
+    ))
+
+    assert reply == "답변"
+    cache.invalidate.assert_called_once_with('new-mock-uuid')
+    cache.append.assert_not_called()
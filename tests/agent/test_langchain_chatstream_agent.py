@@ -0,0 +1,99 @@
+# tests/agent/test_langchain_chatstream_agent.py
+import asyncio
+
+from langchain_classic.chains import ConversationChain
+from langchain_classic.memory import ConversationBufferMemory
+from langchain_core.chat_history import InMemoryChatMessageHistory
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+
+from backend.agents.langchain_chatstream_agent import LangchainChatStreamAgent
+
+
+class FakeStreamingChatModel(BaseChatModel):
+    """토큰을 하나씩 흘려보내는 가짜 스트리밍 LLM (취소 여부를 기록)"""
+    streaming: bool = True
+    tokens: list[str] = []
+    state: dict = {}
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-streaming"
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content="".join(self.tokens)))])
+
+    async def _astream(self, messages, stop=None, run_manager=None, **kwargs):
+        completed = False
+        try:
+            for token in self.tokens:
+                self.state["produced"] = self.state.get("produced", 0) + 1
+                await asyncio.sleep(0.01)
+                yield ChatGenerationChunk(message=AIMessageChunk(content=token))
+            completed = True
+        finally:
+            # 끝까지 생성하기 전에 종료(취소/close) 되었는지 기록
+            self.state["cancelled"] = not completed
+
+
+class FakeAgent(LangchainChatStreamAgent):
+    def __init__(self, llm: BaseChatModel, **kwargs):
+        super().__init__(**kwargs)
+        self.llm = llm
+
+    def _build_chain(self) -> ConversationChain:
+        memory = ConversationBufferMemory(chat_memory=InMemoryChatMessageHistory(), return_messages=True)
+        return ConversationChain(llm=self.llm, memory=memory, verbose=False)
+
+
+def test_handle_stream_yields_tokens_then_done():
+    llm = FakeStreamingChatModel(streaming=True, tokens=["안녕", "하세요"])
+    agent = FakeAgent(llm)
+
+    async def collect():
+        return [event async for event in agent.handle_stream("hi")]
+
+    assert asyncio.run(collect()) == ["data: 안녕\n\n", "data: 하세요\n\n", "data: [DONE]\n\n"]
+
+
+def test_handle_stream_cancels_llm_when_client_disconnects():
+    """
+    클라이언트가 중간에 연결을 끊으면(generator aclose) upstream LLM 스트림도 취소되고,
+    작은 큐 크기(backpressure) 때문에 LLM이 소비자보다 크게 앞서 나가지 않는지 확인합니다.
+    """
+    llm = FakeStreamingChatModel(streaming=True, tokens=[f"t{i}" for i in range(100)], state={})
+    agent = FakeAgent(llm, queue_maxsize=2)
+
+    async def read_two_then_disconnect():
+        stream = agent.handle_stream("hi")
+        first = [await stream.__anext__(), await stream.__anext__()]
+        await stream.aclose()
+        # 취소가 task에 전달될 시간을 줌
+        await asyncio.sleep(0.05)
+        return first
+
+    assert asyncio.run(read_two_then_disconnect()) == ["data: t0\n\n", "data: t1\n\n"]
+    assert llm.state.get("cancelled") is True
+    assert llm.state["produced"] < 10
+
+
+def test_chain_task_finishes_when_client_disconnects_with_full_queue():
+    """큐가 가득 찬 상태에서 클라이언트가 연결을 끊어도 체인 task 가 종료 신호를 기다리며 남아 있지 않은지 확인합니다."""
+    llm = FakeStreamingChatModel(streaming=True, tokens=[f"t{i}" for i in range(100)], state={})
+    agent = FakeAgent(llm, queue_maxsize=4)
+
+    async def read_one_then_disconnect():
+        stream = agent.handle_stream("hi")
+        first = await stream.__anext__()
+        # LLM 이 큐를 가득 채울 때까지 기다린 뒤 연결 종료
+        await asyncio.sleep(0.1)
+        await stream.aclose()
+        await asyncio.sleep(0.05)
+        pending = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        return first, pending
+
+    first, pending = asyncio.run(read_one_then_disconnect())
+    assert first == "data: t0\n\n"
+    assert pending == []
+    assert llm.state.get("cancelled") is True
@@ -0,0 +1,91 @@
+# tests/agent/test_meeting_agent.py
+import asyncio
+import json
+from types import SimpleNamespace
+
+from backend.agents.meeting_agent import MeetingAgent
+from backend.core import onspace_api
+
+
+def _response(content: str = None, tool_calls: list = None):
+    """OpenAI chat.completions 응답 흉내 (choices[0].message.content / tool_calls)"""
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content, tool_calls=tool_calls))])
+
+
+def _tool_call(call_id: str, name: str, **arguments):
+    return SimpleNamespace(id=call_id, function=SimpleNamespace(name=name, arguments=json.dumps(arguments)))
+
+
+class ScriptedLLM:
+    """
+    정해진 순서로 도구를 호출하는 가짜 LLM
+    - 사용자 메세지 "reserve HH" -> reserve_room(room, HH:00~HH:30), "list" -> list_rooms(min_capacity=5)
+    - 도구 결과를 받으면 마지막 도구 결과의 message(없으면 결과 전체)를 답변으로 반환
+    - 요청마다 첫 호출의 system prompt / tools 를 기록
+    """
+    def __init__(self):
+        self.prompts = []
+        self.tools = []
+
+    async def create(self, model, messages, temperature, tools, tool_choice):
+        if messages[-1]["role"] == "user":
+            self.prompts.append(messages[0]["content"])
+            self.tools.append(json.dumps(tools, ensure_ascii=False))
+            command = messages[-1]["content"].split()
+            if command[0] == "reserve":
+                hour = int(command[2])
+                return _response(tool_calls=[_tool_call("c1", "reserve_room", room_name=command[1], time_range=f"{hour:02d}:00~{hour:02d}:30")])
+            if command[0] == "list":
+                return _response(tool_calls=[_tool_call("c1", "list_rooms", min_capacity=5)])
+            return _response("안녕하세요")
+        result = json.loads(messages[-1]["content"])
+        return _response(result["message"] if isinstance(result, dict) and "message" in result else json.dumps(result, ensure_ascii=False))
+
+
+def test_prompt_size_is_constant_across_requests(mocker):
+    """
+    회의실 예약이 쌓여도 LLM 에 보내는 system prompt / 도구 정의가 1000번의 요청 동안 같은지 테스트합니다.
+    (회의실 현황은 prompt 에 넣지 않고 list_rooms 도구로 필요한 만큼만 조회)
+    """
+    llm = ScriptedLLM()
+    mocker.patch('backend.core.llm_core.aclient.chat.completions.create', new=llm.create)
+    agent = MeetingAgent()
+    role_prompt = agent.role_prompt
+    rooms = [name for name, _ in onspace_api.MEETING_ROOMS]
+
+    async def run():
+        replies = []
+        for i in range(1000):
+            message = f"reserve {rooms[i % len(rooms)]} {i % 24}" if i % 2 == 0 else "list"
+            reply, _ = await agent.handle(None, f"user{i}", "gpt-4o-mini", message)
+            replies.append(reply)
+        return replies
+
+    replies = asyncio.run(run())
+
+    assert len(llm.prompts) == 1000
+    assert set(llm.prompts) == {role_prompt} and agent.role_prompt == role_prompt
+    assert len(set(llm.tools)) == 1
+    # 예약은 실제로 반영됨 (같은 회의실/시간대의 두 번째 예약부터는 실패)
+    assert "예약 완료" in replies[0] and "이미 예약됨" in replies[-2]
+    assert len(onspace_api.booking_engine) == len({(rooms[i % len(rooms)], i % 24) for i in range(0, 1000, 2)})
+
+
+def test_reserve_and_cancel_tools_use_requesting_user(mocker):
+    """reserve_room / cancel_room 도구가 요청한 사용자 이름으로 예약/취소하는지 테스트합니다."""
+    calls = iter([
+        _response(tool_calls=[_tool_call("c1", "reserve_room", room_name="A", time_range="15:00~17:00")]),
+        _response("A 회의실을 예약했습니다."),
+        _response(tool_calls=[_tool_call("c2", "cancel_room", room_name="A", time_range="15:00~17:00")]),
+        _response("다른 사용자의 예약은 취소할 수 없습니다."),
+    ])
+    mock_create = mocker.patch('backend.core.llm_core.aclient.chat.completions.create', new=mocker.AsyncMock(side_effect=lambda **kwargs: next(calls)))
+    agent = MeetingAgent()
+    start, end = onspace_api.parse_time_range("15:00~17:00")
+
+    asyncio.run(agent.handle(None, "leo", "gpt-4o-mini", "오후 3시부터 2시간 A 예약해줘"))
+    asyncio.run(agent.handle(None, "kim", "gpt-4o-mini", "A 예약 취소해줘"))
+
+    assert [b["user"] for b in onspace_api.booking_engine.bookings("A", start, end)] == ["leo"]
+    cancel_result = json.loads(mock_create.await_args_list[3].kwargs["messages"][-1]["content"])
+    assert cancel_result["status"] == "fail" and "leo님의 예약" in cancel_result["message"]
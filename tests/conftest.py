@@ -0,0 +1,142 @@
+# tests/conftest.py
+import json
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.agents.chat_agent import ChatAgent
+from backend.core.metrics import metrics
+from backend.core import onspace_api
+from backend.core.naver_news_api import news_search_cache
+from backend.core.response_cache import llm_response_cache
+from backend.core.session_cache import session_cache
+from backend.database.db_manager import OrmBase
+from backend.database.models.chat_model import ChatSession
+
+
+@pytest.fixture(autouse=True)
+def _isolate_process_caches(monkeypatch):
+    """
+    프로세스 단위 캐시가 테스트 사이에 공유되지 않도록 격리
+    - 회의실 예약 엔진은 테스트마다 기본 회의실 목록으로 새로 만듦 (DB 미연결)
+    - 테스트 환경에 Redis 가 없으므로 기본 세션 캐시 / 뉴스 검색 캐시의 Redis 단계는 끔 (캐시 테스트는 fakeredis 로 별도 인스턴스 사용)
+    """
+    monkeypatch.setattr(session_cache, "enabled", False)
+    monkeypatch.setattr(ChatAgent, "_model_max_tokens", {})
+    monkeypatch.setattr(news_search_cache, "use_redis", False)
+    monkeypatch.setattr(onspace_api, "booking_engine", onspace_api.new_booking_engine())
+    news_search_cache.clear()
+    llm_response_cache.clear()
+    metrics.clear()
+
+
+@pytest.fixture
+def chat_db(tmp_path):
+    """
+    실제 SQL을 실행해 보기 위한 SQLite 파일 DB (llm_agent 스키마는 ATTACH 로 흉내냄)
+    - 여러 스레드에서 동시에 접근할 수 있도록 파일 DB + busy timeout 을 사용합니다.
+    - Returns: sessionmaker (SessionLocal 과 같은 방식으로 사용)
+    """
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'main.db'}",
+        connect_args={"check_same_thread": False, "timeout": 30},
+    )
+
+    @event.listens_for(engine, "connect")
+    def _attach_schema(dbapi_conn, _):
+        dbapi_conn.execute(f"ATTACH DATABASE '{tmp_path / 'llm_agent.db'}' AS llm_agent")
+
+    OrmBase.metadata.create_all(bind=engine)
+    yield sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def chat_session_id(chat_db) -> str:
+    """chat_db 에 미리 만들어 둔 채팅 세션 id (SQLite 에는 gen_random_uuid()가 없으므로 직접 지정)"""
+    session_id = uuid.uuid4()
+    db = chat_db()
+    db.add(ChatSession(session_id=session_id, user_id="test_user", agent_id="ChatAgent", model_id="gpt-4o-mini"))
+    db.commit()
+    db.close()
+    return str(session_id)
+
+
+@pytest.fixture
+def async_chat_db(chat_db, tmp_path):
+    """
+    chat_db 와 같은 SQLite 파일을 aiosqlite 로 여는 async_sessionmaker (AsyncSessionLocal 과 같은 방식으로 사용)
+    - 엔진은 이벤트 루프에 묶이므로 asyncio.run 마다 새로 만들 수 있도록 (sessionmaker 생성 함수)를 반환합니다.
+    """
+    engines = []
+
+    def make_sessionmaker() -> async_sessionmaker:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'main.db'}", connect_args={"timeout": 30})
+
+        @event.listens_for(engine.sync_engine, "connect")
+        def _attach_schema(dbapi_conn, _):
+            cursor = dbapi_conn.cursor()
+            cursor.execute(f"ATTACH DATABASE '{tmp_path / 'llm_agent.db'}' AS llm_agent")
+            cursor.close()
+
+        engines.append(engine)
+        return async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+    yield make_sessionmaker
+    for engine in engines:
+        engine.sync_engine.dispose()
+
+
+class MockNaverHandler(BaseHTTPRequestHandler):
+    """네이버 뉴스 검색 API 흉내 (keep-alive 지원, 요청 지연/실패 응답 설정 가능)"""
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        query = parse_qs(urlparse(self.path).query)
+        keyword, display = query["query"][0], int(query["display"][0])
+        with server.lock:
+            server.requests.append((keyword, self.client_address[1], self.headers.get("X-Naver-Client-Id")))
+            fail = server.failures.get(keyword, 0)
+            if fail:
+                server.failures[keyword] = fail - 1
+        time.sleep(server.delay)
+        if fail:
+            body, status = b"{}", 503
+        elif keyword in server.bodies:
+            body, status = server.bodies[keyword], 200
+        else:
+            items = [
+                {"title": f"<b>{keyword}</b> 기사{i}", "link": f"https://news/{keyword}/{i}",
+                 "description": f"{keyword} 설명", "pubDate": "Mon, 01 Jan 2024 00:00:00 +0900"}
+                for i in range(display)
+            ]
+            body, status = json.dumps({"items": items}).encode(), 200
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def mock_naver():
+    """로컬 네이버 뉴스 검색 API 서버 (server.requests / failures / bodies / delay 로 요청 기록 및 응답 설정)"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), MockNaverHandler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.requests, server.failures, server.bodies, server.delay = [], {}, {}, 0.0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,205 @@
+# tests/core/test_booking_engine.py
+import datetime
+import threading
+
+import pytest
+
+from backend.core import onspace_api
+from backend.core.booking_engine import BookingEngine
+from backend.database.crud import meeting_crud
+from backend.database.models.meeting_model import MeetingBooking
+
+DAY = datetime.date(2026, 10, 19)
+
+
+def at(hhmm: str) -> datetime.datetime:
+    hour, minute = map(int, hhmm.split(":"))
+    return datetime.datetime.combine(DAY, datetime.time(hour, minute))
+
+
+@pytest.fixture
+def engine() -> BookingEngine:
+    engine = BookingEngine()
+    engine.add_rooms([("A", 6), ("B", 10), ("C", 4), ("E", 20)])
+    return engine
+
+
+def test_overlap_uses_half_open_intervals(engine):
+    """[start, end) 구간이므로 맞닿은 예약은 허용하고, 조금이라도 겹치면 거절하는지 테스트합니다."""
+    assert engine.reserve("A", at("15:00"), at("17:00"), "Leo")["status"] == "success"
+
+    assert engine.reserve("a", at("16:30"), at("18:00"), "Kim")["status"] == "fail"
+    assert engine.reserve("A", at("14:00"), at("15:01"), "Kim")["status"] == "fail"
+    assert engine.reserve("A", at("14:00"), at("18:00"), "Kim")["status"] == "fail"
+    assert engine.reserve("A", at("17:00"), at("18:00"), "Kim")["status"] == "success"
+    assert engine.reserve("A", at("14:00"), at("15:00"), "Lee")["status"] == "success"
+
+    assert [(b["start"], b["user"]) for b in engine.bookings("A", at("00:00"), at("23:59"))] == [
+        (at("14:00"), "Lee"), (at("15:00"), "Leo"), (at("17:00"), "Kim"),
+    ]
+    assert engine.reserve("Z", at("09:00"), at("10:00"))["status"] == "fail"
+    assert engine.reserve("A", at("10:00"), at("10:00"))["status"] == "fail"
+
+
+def test_find_free_room_returns_smallest_room_with_capacity(engine):
+    """N명 이상 수용 가능하고 해당 시간에 비어 있는 가장 작은 회의실을 찾는지 테스트합니다."""
+    assert engine.find_free_room(5, at("15:00"), at("16:00")) == "A"
+    engine.reserve("A", at("14:00"), at("16:00"), "Leo")
+    assert engine.find_free_room(5, at("15:00"), at("16:00")) == "B"
+    assert engine.find_free_room(5, at("16:00"), at("17:00")) == "A"
+    assert engine.find_free_room(30, at("15:00"), at("16:00")) is None
+
+    result = engine.reserve_smallest(5, at("15:00"), at("16:00"), "Kim")
+    assert result["status"] == "success" and "B 회의실" in result["message"]
+
+
+def test_cancel_only_own_booking(engine):
+    engine.reserve("C", at("09:00"), at("10:00"), "Leo")
+
+    assert engine.cancel("C", at("09:00"), at("10:00"), "Kim")["status"] == "fail"
+    assert engine.cancel("C", at("09:00"), at("09:30"), "Leo")["status"] == "fail"
+    assert engine.cancel("C", at("09:00"), at("10:00"), "Leo")["status"] == "success"
+    assert engine.is_free("C", at("09:00"), at("10:00"))
+
+
+def test_concurrent_reserve_only_one_wins(engine):
+    """여러 스레드가 같은 시간대를 동시에 예약하면 한 건만 성공하는지 테스트합니다."""
+    barrier = threading.Barrier(16)
+    results = []
+
+    def worker(i):
+        barrier.wait()
+        results.append(engine.reserve("E", at("13:00"), at("14:00") + datetime.timedelta(minutes=i), f"user{i}"))
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(16)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert sum(r["status"] == "success" for r in results) == 1
+    assert len(engine.bookings("E", at("00:00"), at("23:59"))) == 1
+
+
+def test_reserve_and_cancel_are_persisted(chat_db):
+    """예약/취소가 DB 에 저장되고, 새 엔진이 load() 로 끝나지 않은 예약만 다시 읽어 오는지 테스트합니다."""
+    seeded = BookingEngine()
+    seeded.add_rooms([("A", 6), ("B", 10)])
+    seeded.load(chat_db, now=at("00:00"))  # DB 에 회의실이 없으므로 메모리의 회의실을 DB 에 추가
+
+    seeded.reserve("A", at("08:00"), at("09:00"), "Kim")
+    seeded.reserve("A", at("15:00"), at("17:00"), "Leo")
+    seeded.reserve("B", at("10:00"), at("11:00"), "Lee")
+    seeded.cancel("B", at("10:00"), at("11:00"), "Lee")
+
+    reloaded = BookingEngine()
+    reloaded.load(chat_db, now=at("12:00"))
+
+    assert sorted(room.name for room in reloaded.rooms()) == ["A", "B"]
+    assert [(b["start"], b["end"], b["user"]) for b in reloaded.bookings("A", at("00:00"), at("23:59"))] == [
+        (at("15:00"), at("17:00"), "Leo"),
+    ]
+    assert reloaded.bookings("B", at("00:00"), at("23:59")) == []
+    assert reloaded.reserve("A", at("16:00"), at("18:00"), "Kim")["status"] == "fail"
+
+
+def test_reserve_fails_when_other_worker_booked_same_slot(chat_db, mocker):
+    """
+    다른 워커가 같은 구간을 먼저 저장했으면 예약 직전 DB 와 맞춘 메모리에서 겹침을 찾아 실패하고,
+    DB 에서 다시 읽기 전에 저장된 경우에도 (DB 제약 위반) 메모리에 반영하지 않고 실패하는지 테스트합니다.
+    """
+    engine = BookingEngine()
+    engine.add_rooms([("A", 6)])
+    engine.load(chat_db)
+    db = chat_db()
+    meeting_crud.insert_booking(db, "A", "Other", at("15:00"), at("16:00"))
+    db.commit()
+
+    result = engine.reserve("A", at("15:30"), at("16:30"), "Leo")
+    assert result["status"] == "fail" and "Other" in result["message"]
+    assert not engine.is_free("A", at("15:00"), at("16:00"))
+
+    # DB 를 다시 읽은 뒤 다른 워커가 저장한 경우
+    meeting_crud.insert_booking(db, "A", "Other", at("17:00"), at("18:00"))
+    db.commit()
+    db.close()
+    mocker.patch.object(engine, "_sync_room")
+    assert engine.reserve("A", at("17:00"), at("18:00"), "Leo")["status"] == "fail"
+    assert engine.is_free("A", at("17:00"), at("18:00"))
+
+
+def test_cancel_reflects_other_worker_changes(chat_db):
+    """다른 워커가 저장한 예약은 취소할 수 있고, 다른 워커가 이미 취소한 예약은 실패로 알려 주는지 테스트합니다."""
+    engine = BookingEngine()
+    engine.add_rooms([("A", 6)])
+    engine.load(chat_db)
+    other = BookingEngine(session_factory=chat_db)
+    other.add_rooms([("A", 6)])
+
+    other.reserve("A", at("09:00"), at("10:00"), "Kim")
+    assert engine.cancel("A", at("09:00"), at("10:00"), "Kim")["status"] == "success"
+
+    assert engine.reserve("A", at("11:00"), at("12:00"), "Lee")["status"] == "success"
+    assert other.cancel("A", at("11:00"), at("12:00"), "Lee")["status"] == "success"
+    assert engine.cancel("A", at("11:00"), at("12:00"), "Lee")["status"] == "fail"
+    assert engine.is_free("A", at("11:00"), at("12:00"))
+
+
+def test_cancel_fails_when_booking_was_not_deleted(chat_db, mocker):
+    """DB 에서 삭제된 예약이 0건이면 (다른 워커가 먼저 취소) 성공으로 알리지 않는지 테스트합니다."""
+    engine = BookingEngine()
+    engine.add_rooms([("A", 6)])
+    engine.load(chat_db)
+    engine.reserve("A", at("09:00"), at("10:00"), "Kim")
+    mocker.patch.object(meeting_crud, "delete_booking", return_value=0)
+
+    result = engine.cancel("A", at("09:00"), at("10:00"), "Kim")
+    assert result["status"] == "fail" and "이미 취소" in result["message"]
+
+
+def test_parse_time_range():
+    assert onspace_api.parse_time_range("A | 15:00~17:00", DAY) == (at("15:00"), at("17:00"))
+    assert onspace_api.parse_time_range("9:30 ~ 24:00", DAY)[1] == at("00:00") + datetime.timedelta(days=1)
+    for text in ("15시~17시", "17:00~15:00", "25:00~26:00"):
+        with pytest.raises(ValueError):
+            onspace_api.parse_time_range(text, DAY)
+
+
+def test_get_meeting_rooms_reports_current_and_today_bookings():
+    now = at("15:30")
+    onspace_api.reserve_meeting_room("B", "Leo", at("15:00"), at("16:00"))
+    onspace_api.reserve_meeting_room("B", "Kim", at("17:00"), at("18:00"))
+
+    rooms = {room["name"]: room for room in onspace_api.get_meeting_rooms(now)}
+
+    assert rooms["B"]["available"] is False and rooms["B"]["user"] == "Leo"
+    assert rooms["B"]["bookings"] == [
+        {"start": "15:00", "end": "16:00", "user": "Leo"},
+        {"start": "17:00", "end": "18:00", "user": "Kim"},
+    ]
+    assert rooms["A"] == {"name": "A", "capacity": 6, "available": True, "user": None, "bookings": []}
+
+
+def test_booking_times_are_naive_local_datetimes(chat_db):
+    """예약 시각은 timezone 없는 컬럼이고, DB 에서 다시 읽어도 엔진의 naive datetime 과 비교할 수 있는지 테스트합니다."""
+    assert MeetingBooking.__table__.c.start_time.type.timezone is False
+    assert MeetingBooking.__table__.c.end_time.type.timezone is False
+
+    engine = BookingEngine()
+    engine.add_rooms([("A", 6)])
+    engine.load(chat_db, now=at("00:00"))
+    engine.reserve("A", at("09:00"), at("10:00"), "Kim")
+
+    db = chat_db()
+    bookings = meeting_crud.get_bookings(db, at("00:00"), room_name="A")
+    db.close()
+    assert bookings == [("A", at("09:00"), at("10:00"), "Kim")]
+    assert bookings[0][1].tzinfo is None
+
+
+def test_rooms_by_capacity_reads_consistent_snapshot(engine):
+    """회의실 목록이 교체(load)되는 중에도 rooms_by_capacity 가 이전 색인과 새 목록을 섞어 읽지 않는지 테스트합니다."""
+    rooms = engine.rooms_by_capacity(5)
+    assert next(rooms).name == "A"
+    engine._rooms, engine._by_capacity = {}, []  # load() 로 회의실 목록이 바뀐 경우
+    assert [room.name for room in rooms] == ["B", "E"]
@@ -0,0 +1,49 @@
+# tests/core/test_embedding_pool.py
+import os
+
+import numpy as np
+
+from backend.core.embedding_pool import EmbeddingProcessPool
+
+
+class _FakeModel:
+    """텍스트 길이 / 처리한 프로세스 id 로 만든 3차원 벡터 (SentenceTransformer.encode 흉내)"""
+    def encode(self, texts, convert_to_numpy=True, normalize_embeddings=False):
+        vectors = np.array([[len(t), os.getpid(), 1.0] for t in texts], dtype=np.float32)
+        if normalize_embeddings:
+            vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors
+
+
+def fake_model(model_name: str) -> _FakeModel:
+    """자식 프로세스에서 호출되는 model_factory (spawn 으로 넘기므로 모듈 최상위 함수)"""
+    return _FakeModel()
+
+
+def _shared_memory_blocks() -> set[str]:
+    return {name for name in os.listdir("/dev/shm") if name.startswith("psm_")} if os.path.isdir("/dev/shm") else set()
+
+
+def test_process_pool_encodes_chunks_in_workers_through_shared_memory():
+    """텍스트를 chunk 단위로 자식 프로세스에서 계산하고, 공유 메모리로 받은 결과가 입력 순서와 같으며 공유 메모리를 남기지 않는지 테스트합니다."""
+    before = _shared_memory_blocks()
+    pool = EmbeddingProcessPool("fake-model", workers=2, chunk_size=3, model_factory=fake_model)
+    assert not pool.is_loaded
+    texts = ["a" * (i + 1) for i in range(10)]
+
+    try:
+        vectors = pool.encode(texts)
+        normalized = pool.encode(texts, normalize_embeddings=True)
+        single = pool.encode("abcd")
+        empty = pool.encode([])
+    finally:
+        pool.close()
+
+    assert vectors.dtype == np.float32 and vectors.shape == (10, 3)
+    assert vectors[:, 0].tolist() == [len(t) for t in texts]
+    assert os.getpid() not in set(vectors[:, 1].astype(int).tolist())  # 부모 프로세스에서 계산하지 않음
+    assert np.allclose(np.linalg.norm(normalized, axis=1), 1.0)
+    assert single.shape == (3,) and single[0] == 4
+    assert empty.shape == (0, 3)
+    assert pool.dim == 3
+    assert _shared_memory_blocks() <= before
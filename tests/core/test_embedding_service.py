@@ -0,0 +1,104 @@
+# tests/core/test_embedding_service.py
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pytest
+from backend.core.embedding_service import EmbeddingService
+
+
+def test_importing_news_db_manager_does_not_load_model():
+    """news_db_manager(및 backend.main) import 시점에는 임베딩 모델을 로드하지 않아야 합니다."""
+    import backend.core.news_db_manager  # noqa: F401
+    from backend.core.embedding_service import embedding_service
+    assert not embedding_service.is_loaded
+
+
+def test_model_is_loaded_once_on_first_encode(mocker):
+    """여러 스레드가 동시에 처음 encode 해도 모델은 한 번만 생성되어야 합니다."""
+    mock_cls = mocker.patch('sentence_transformers.SentenceTransformer')
+    mock_cls.return_value.encode.return_value = np.zeros((1, 4), dtype=np.float32)
+    service = EmbeddingService("fake-model")
+    assert not service.is_loaded
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda _: service.encode(["text"]), range(32)))
+
+    assert service.is_loaded
+    mock_cls.assert_called_once_with("fake-model")
+    assert mock_cls.return_value.encode.call_count == 32
+
+
+class _FakeService:
+    """텍스트 길이/첫 글자 코드로 만든 2차원 벡터를 돌려주는 가짜 모델 (encode 호출마다 batch 를 기록)"""
+    def __init__(self, delay: float = 0.0):
+        self.batches = []
+        self.delay = delay
+
+    def encode(self, texts, normalize_embeddings=False):
+        import time
+        time.sleep(self.delay)
+        self.batches.append(list(texts))
+        vectors = np.array([[len(t), ord(t[0])] for t in texts], dtype=np.float32)
+        if normalize_embeddings:
+            vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors
+
+
+def test_batcher_merges_concurrent_requests_into_one_encode():
+    """동시에 들어온 encode 요청을 한 번의 batch 로 계산하고, 요청마다 자기 텍스트의 행만 돌려받는지 테스트합니다."""
+    from backend.core.embedding_service import EmbeddingBatcher
+    service = _FakeService()
+    batcher = EmbeddingBatcher(service, window=0.2, max_batch=1000, enabled=True)
+    texts = [[f"{chr(97 + i)}" * (i + 1), "공통"] for i in range(16)]
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        results = list(pool.map(batcher.encode, texts))
+    batcher.close()
+
+    assert len(service.batches) < 16
+    # 중복 텍스트("공통")는 batch 안에서 한 번만 계산
+    assert sum(batch.count("공통") for batch in service.batches) == len(service.batches)
+    for request_texts, vectors in zip(texts, results):
+        assert vectors.tolist() == [[len(t), ord(t[0])] for t in request_texts]
+
+
+def test_batcher_aencode_does_not_block_event_loop():
+    """aencode 는 결과를 기다리는 동안 이벤트 루프를 막지 않고, normalize 옵션별로 따로 계산하는지 테스트합니다."""
+    import asyncio
+    from backend.core.embedding_service import EmbeddingBatcher
+    service = _FakeService(delay=0.05)
+    batcher = EmbeddingBatcher(service, window=0.05, enabled=True)
+
+    async def run():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        task = asyncio.create_task(ticker())
+        results = await asyncio.gather(*[batcher.aencode(["ab"], normalize=i % 2 == 1) for i in range(8)])
+        task.cancel()
+        return results, ticks
+
+    results, ticks = asyncio.run(run())
+    batcher.close()
+
+    assert ticks >= 10
+    assert sorted(map(len, service.batches)) == [1, 1]  # normalize False / True 두 batch, 중복 제거
+    assert results[0].tolist() == [[2.0, 97.0]]
+    assert np.allclose(np.linalg.norm(results[1], axis=1), 1.0)
+    assert batcher.stats()["requests"] == 8
+
+
+def test_batcher_propagates_encode_errors():
+    from backend.core.embedding_service import EmbeddingBatcher
+    class BrokenService:
+        def encode(self, texts, normalize_embeddings=False):
+            raise RuntimeError("model failed")
+
+    batcher = EmbeddingBatcher(BrokenService(), window=0.01, enabled=True)
+    with pytest.raises(RuntimeError, match="model failed"):
+        batcher.encode(["a"])
+    batcher.close()
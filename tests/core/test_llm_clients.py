@@ -0,0 +1,52 @@
+# tests/core/test_llm_clients.py
+import threading
+
+from langchain_openai import ChatOpenAI
+
+from backend.core.chat_memory import get_conversation_chain
+from backend.core.llm_clients import LLMClientRegistry, llm_clients
+
+
+def test_registry_reuses_client_per_key():
+    registry = LLMClientRegistry()
+    llm = registry.get("gpt-4o-mini", temperature=0.3)
+    assert isinstance(llm, ChatOpenAI)
+    assert registry.get("gpt-4o-mini", temperature=0.3) is llm
+    assert registry.get("gpt-4o-mini", temperature=0.3, streaming=True) is not llm
+    assert registry.get("gpt-4o-mini", temperature=0.7) is not llm
+    assert len(registry) == 3
+
+
+def test_registry_creates_client_once_under_concurrency():
+    """여러 스레드가 동시에 처음 요청해도 클라이언트는 한 번만 생성되는지 테스트합니다."""
+    created = []
+    barrier = threading.Barrier(16)
+
+    def factory(model, temperature, streaming):
+        created.append((model, temperature, streaming))
+        return object()
+
+    registry = LLMClientRegistry(factory=factory)
+    results = []
+
+    def worker():
+        barrier.wait()
+        results.append(registry.get("m", 0.3))
+
+    threads = [threading.Thread(target=worker) for _ in range(16)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert created == [("m", 0.3, False)]
+    assert all(r is results[0] for r in results)
+
+
+def test_conversation_chains_share_llm_but_not_memory():
+    """요청(사용자)마다 memory 는 따로 결합되고, LLM 클라이언트는 공유되는지 테스트합니다."""
+    kim = get_conversation_chain("kim")
+    lee = get_conversation_chain("lee")
+    assert kim.llm is lee.llm is llm_clients.get("gpt-4o-mini", temperature=0.3)
+    assert kim.memory is not lee.memory
+    assert kim.memory.chat_memory.key == "message_store:user:kim"
+    assert get_conversation_chain("kim", streaming=True).llm.streaming is True
@@ -1,7 +1,8 @@
 # tests/core/test_llm_core.py
+import asyncio
 import pytest
-from unittest.mock import MagicMock # Mock 객체 생성을 위해 import
-from backend.core.llm_core import call_llm # 테스트할 함수를 import
+from unittest.mock import AsyncMock, MagicMock # Mock 객체 생성을 위해 import
+from backend.core.llm_core import LLMTool, acall_llm, acall_llm_stream, acall_llm_tools, call_llm # 테스트할 함수를 import
 
 # 1. OpenAI 모델 호출 테스트
 def test_call_llm_with_openai_model(mocker):
@@ -72,4 +73,183 @@ def test_call_llm_with_gemini_model(mocker):
 # 3. 비활성화 예시
 @pytest.mark.skip(reason="이 테스트는 아직 준비되지 않았습니다.")
 def test_future_feature():
-    assert False
\ No newline at end of file
+    assert False
+
+# 4. async 버전(acall_llm) OpenAI 모델 호출 테스트
+def test_acall_llm_with_openai_model(mocker):
+    """
+    acall_llm은 AsyncOpenAI 클라이언트(aclient)를 await 하는지 테스트합니다.
+    """
+    mock_response = MagicMock()
+    mock_response.choices[0].message.content = "이것은 async OpenAI 가짜 응답입니다."
+
+    # async 함수를 가로채므로 AsyncMock을 사용합니다.
+    mock_create = mocker.patch(
+        'backend.core.llm_core.aclient.chat.completions.create',
+        new_callable=AsyncMock,
+        return_value=mock_response
+    )
+
+    result = asyncio.run(acall_llm(
+        model="gpt-4o-mini",
+        prompt="테스트 프롬프트",
+        message="테스트 메시지",
+        chat_history=[{"role": "user", "content": "이전 메시지"}]
+    ))
+
+    assert result == "이것은 async OpenAI 가짜 응답입니다."
+    mock_create.assert_awaited_once()
+    # system 프롬프트 + 이력 + 신규 메세지 순으로 전달되었는지 확인
+    messages = mock_create.call_args.kwargs["messages"]
+    assert [m["role"] for m in messages] == ["system", "user", "user"]
+    assert messages[-1]["content"] == "테스트 메시지"
+
+
+# 5. async 버전(acall_llm) Gemini 모델 호출 테스트
+def test_acall_llm_with_gemini_model(mocker):
+    mock_response = MagicMock()
+    mock_response.text = "이것은 async Gemini 가짜 응답입니다."
+
+    mock_generate = mocker.patch(
+        'backend.core.llm_core.clientGemini.aio.models.generate_content',
+        new_callable=AsyncMock,
+        return_value=mock_response
+    )
+
+    result = asyncio.run(acall_llm(
+        model="gemini-1.5-flash",
+        prompt="테스트 프롬프트",
+        message="테스트 메시지",
+        chat_history=[]
+    ))
+
+    assert result == "이것은 async Gemini 가짜 응답입니다."
+    mock_generate.assert_awaited_once()
+
+
+# 6. 스트리밍 버전(acall_llm_stream) OpenAI 모델 호출 테스트
+def test_acall_llm_stream_with_openai_model(mocker):
+    """
+    acall_llm_stream은 stream=True로 호출하고, delta.content 조각만 순서대로 yield 하는지 테스트합니다.
+    """
+    def make_chunk(content):
+        chunk = MagicMock()
+        chunk.choices[0].delta.content = content
+        return chunk
+
+    async def fake_stream():
+        for content in ["안녕", None, "하세요"]:
+            yield make_chunk(content)
+
+    mock_create = mocker.patch(
+        'backend.core.llm_core.aclient.chat.completions.create',
+        new_callable=AsyncMock,
+        return_value=fake_stream()
+    )
+
+    async def collect():
+        return [c async for c in acall_llm_stream(model="gpt-4o-mini", prompt="p", message="m")]
+
+    assert asyncio.run(collect()) == ["안녕", "하세요"]
+    assert mock_create.call_args.kwargs["stream"] is True
+
+
+# 7. function calling (acall_llm_tools) OpenAI 모델 호출 테스트
+def _echo_tool(calls: list) -> LLMTool:
+    def echo(text: str) -> dict:
+        calls.append(text)
+        return {"echo": text}
+    return LLMTool("echo", "텍스트를 그대로 돌려줍니다.", {"type": "object", "properties": {"text": {"type": "string"}}}, echo)
+
+
+def test_acall_llm_tools_with_openai_model(mocker):
+    """
+    모델이 도구 호출을 요청하면 도구를 실행하고 결과(role=tool)를 붙여 다시 호출하며,
+    max_rounds 에 도달하면 tool_choice="none" 으로 답변을 강제하는지 테스트합니다.
+    """
+    with_tool = MagicMock()
+    with_tool.choices[0].message.content = None
+    tool_call = with_tool.choices[0].message.tool_calls[0]
+    tool_call.id = "call_1"
+    tool_call.function.name = "echo"
+    tool_call.function.arguments = '{"text": "안녕"}'
+    with_tool.choices[0].message.tool_calls = [tool_call]
+    final = MagicMock()
+    final.choices[0].message.content = "끝"
+
+    mock_create = mocker.patch(
+        'backend.core.llm_core.aclient.chat.completions.create',
+        new_callable=AsyncMock,
+        side_effect=[with_tool, with_tool, final],
+    )
+    calls = []
+
+    result = asyncio.run(acall_llm_tools("gpt-4o-mini", "p", "m", [_echo_tool(calls)], max_rounds=2))
+
+    assert result == "끝"
+    assert calls == ["안녕", "안녕"]
+    kwargs = [c.kwargs for c in mock_create.await_args_list]
+    assert [k["tool_choice"] for k in kwargs] == ["auto", "auto", "none"]
+    assert kwargs[0]["tools"][0]["function"]["name"] == "echo"
+    assert kwargs[2]["messages"][-1] == {"role": "tool", "tool_call_id": "call_1", "content": '{"echo": "안녕"}'}
+
+
+# 8. function calling (acall_llm_tools) Gemini 모델 호출 테스트
+def test_acall_llm_tools_with_gemini_model(mocker):
+    function_call = MagicMock()
+    function_call.name = "echo"
+    function_call.args = {"text": "hi"}
+    with_tool = MagicMock()
+    with_tool.function_calls = [function_call]
+    final = MagicMock()
+    final.function_calls = None
+    final.text = "done"
+
+    mock_generate = mocker.patch(
+        'backend.core.llm_core.clientGemini.aio.models.generate_content',
+        new_callable=AsyncMock,
+        side_effect=[with_tool, final],
+    )
+    calls = []
+
+    result = asyncio.run(acall_llm_tools("gemini-2.0-flash-lite", "p", "m", [_echo_tool(calls)]))
+
+    assert result == "done"
+    assert calls == ["hi"]
+    contents = mock_generate.await_args_list[1].kwargs["contents"]
+    assert contents[-1].parts[0].function_response.response == {"result": {"echo": "hi"}}
+
+
+def test_acall_llm_tools_reports_bad_arguments_to_model(mocker):
+    """잘못된 인자(JSON 오류/알 수 없는 인자)는 예외 대신 {"error": ...} 결과로 모델에 돌려주는지 테스트합니다."""
+    with_tool = MagicMock()
+    tool_call = MagicMock()
+    tool_call.id = "call_1"
+    tool_call.function.name = "echo"
+    tool_call.function.arguments = '{"wrong": 1}'
+    with_tool.choices[0].message.tool_calls = [tool_call]
+    final = MagicMock()
+    final.choices[0].message.tool_calls = None
+    final.choices[0].message.content = "다시 시도"
+    mock_create = mocker.patch(
+        'backend.core.llm_core.aclient.chat.completions.create',
+        new_callable=AsyncMock,
+        side_effect=[with_tool, final],
+    )
+
+    assert asyncio.run(acall_llm_tools("gpt-4o-mini", "p", "m", [_echo_tool([])])) == "다시 시도"
+    assert "error" in mock_create.await_args_list[1].kwargs["messages"][-1]["content"]
+
+
+def test_tool_handler_error_is_reported_to_model(caplog):
+    """도구 handler 내부 오류도 예외 대신 {"error": ...} 결과로 돌려주고 traceback 을 로그로 남기는지 테스트합니다."""
+    def broken(room: str):
+        raise RuntimeError("db down")
+
+    tool = LLMTool("broken", "항상 실패", {"type": "object", "properties": {"room": {"type": "string"}}}, broken)
+
+    with caplog.at_level("ERROR", logger="backend.core.llm_core"):
+        result = asyncio.run(tool.run({"room": "A"}))
+
+    assert result == {"error": "RuntimeError: db down"}
+    assert caplog.records[-1].exc_info is not None
@@ -0,0 +1,94 @@
+# tests/core/test_logging_config.py
+import asyncio
+import json
+import logging
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from backend.core import llm_core
+from backend.core.logging_config import setup_logging, shutdown_logging, truncate
+
+
+class CollectingHandler(logging.Handler):
+    """출력 대신 (포맷된 문자열, 출력한 스레드 이름)을 모아두는 handler"""
+    def __init__(self):
+        super().__init__()
+        self.lines = []
+        self.threads = set()
+
+    def emit(self, record):
+        self.lines.append(self.format(record))
+        self.threads.add(threading.current_thread().name)
+
+
+@pytest.fixture
+def collected():
+    handler = CollectingHandler()
+    yield handler
+    shutdown_logging()
+
+
+def test_truncate_limits_large_values_and_is_lazy():
+    """큰 값은 limit 글자로 자르고, 로그 레벨이 꺼져 있으면 문자열 변환을 하지 않는지 테스트합니다."""
+    assert str(truncate("short", limit=10)) == "short"
+    assert str(truncate("x" * 25, limit=10)) == "xxxxxxxxxx...(+15 chars)"
+    assert str(truncate([{"role": "user", "content": "hi"}], limit=100)) == "[{'role': 'user', 'content': 'hi'}]"
+
+    class Payload:
+        converted = 0
+
+        def __repr__(self):
+            Payload.converted += 1
+            return "payload"
+
+    logger = logging.getLogger("backend.test_lazy")
+    logger.setLevel(logging.INFO)
+    logger.debug("payload=%s", truncate(Payload()))
+    assert Payload.converted == 0
+
+
+def test_records_are_written_by_listener_thread_with_module_levels(collected):
+    """로그 출력은 요청 스레드가 아닌 QueueListener 스레드에서 수행되고, 모듈별 레벨이 적용되는지 테스트합니다."""
+    setup_logging(level="INFO", module_levels={"backend.core.llm_core": "DEBUG"}, fmt="text", handler=collected)
+
+    logging.getLogger("backend.core.llm_core").debug("llm debug %s", 1)
+    logging.getLogger("backend.agents.chat_agent").debug("hidden")
+    logging.getLogger("backend.agents.chat_agent").warning("chat warning %s", 2)
+    shutdown_logging()  # 큐에 남은 로그를 모두 출력
+
+    assert len(collected.lines) == 2
+    assert collected.lines[0].endswith("backend.core.llm_core | llm debug 1")
+    assert "WARNING" in collected.lines[1] and collected.lines[1].endswith("chat warning 2")
+    assert threading.current_thread().name not in collected.threads
+
+
+def test_json_format(collected):
+    setup_logging(level="INFO", module_levels={}, fmt="json", handler=collected)
+    logging.getLogger("backend.core.naver_news_api").info("검색 %d건", 3, extra={"keyword": "AI"})
+    shutdown_logging()
+
+    entry = json.loads(collected.lines[0])
+    assert entry["level"] == "INFO"
+    assert entry["logger"] == "backend.core.naver_news_api"
+    assert entry["message"] == "검색 3건"
+    assert entry["keyword"] == "AI"
+
+
+def test_acall_llm_debug_log_truncates_chat_history(collected, mocker):
+    """DEBUG 로그에서 대화 이력 전체가 아닌 LOG_MAX_FIELD_CHARS 까지만 출력하는지 테스트합니다."""
+    mocker.patch('backend.core.logging_config.settings.LOG_MAX_FIELD_CHARS', 200)
+    response = MagicMock()
+    response.choices[0].message.content = "답변"
+    mocker.patch('backend.core.llm_core.aclient.chat.completions.create', mocker.AsyncMock(return_value=response))
+    setup_logging(level="INFO", module_levels={"backend.core.llm_core": "DEBUG"}, fmt="text", handler=collected)
+
+    history = [{"role": "user", "content": "긴 대화 " * 200}] * 20
+    assert asyncio.run(llm_core.acall_llm("gpt-4o-mini", "prompt", "질문", chat_history=history)) == "답변"
+    shutdown_logging()
+
+    assert len(collected.lines) == 1
+    assert "chat_history(20)=" in collected.lines[0]
+    assert collected.lines[0].endswith("...(truncated)")
+    assert len(collected.lines[0]) < 1000
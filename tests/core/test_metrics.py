@@ -0,0 +1,133 @@
+# tests/core/test_metrics.py
+import asyncio
+import time
+
+import anyio
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from backend.core.metrics import MetricsMiddleware, MetricsRegistry, metrics, request_spans, server_timing, span, timed
+from backend.core.redis_cache import RedisPools
+from backend.database.crud import chat_crud
+from backend.routes.metrics_routes import router as metrics_router
+
+
+def test_histogram_renders_cumulative_prometheus_buckets():
+    """bucket 값이 누적 개수로, +Inf / _sum / _count 와 함께 Prometheus text format 으로 출력되는지 테스트합니다."""
+    registry = MetricsRegistry(buckets=(0.01, 0.1), enabled=True)
+    for seconds in (0.005, 0.05, 1.0):
+        registry.observe_span("db", "save_turn", seconds)
+
+    text = registry.render()
+    assert "# TYPE app_span_duration_seconds histogram" in text
+    assert 'app_span_duration_seconds_bucket{component="db",operation="save_turn",le="0.01"} 1' in text
+    assert 'app_span_duration_seconds_bucket{component="db",operation="save_turn",le="0.1"} 2' in text
+    assert 'app_span_duration_seconds_bucket{component="db",operation="save_turn",le="+Inf"} 3' in text
+    assert 'app_span_duration_seconds_count{component="db",operation="save_turn"} 3' in text
+    assert 'app_span_duration_seconds_sum{component="db",operation="save_turn"} 1.055' in text
+
+
+def test_span_and_timed_record_into_current_request():
+    """span / @timed(sync, async) 가 히스토그램과 현재 요청의 구간 목록에 모두 기록되는지 테스트합니다."""
+    @timed("embedding")
+    def encode():
+        return "v"
+
+    @timed("llm", "fake_llm")
+    async def call():
+        await asyncio.sleep(0)
+        return "reply"
+
+    spans = []
+    token = request_spans.set(spans)
+    try:
+        with span("db", "query"):
+            pass
+        assert encode() == "v"
+        assert asyncio.run(call()) == "reply"
+        with pytest.raises(ValueError):  # 예외가 나도 기록
+            with span("http", "upstream"):
+                raise ValueError
+    finally:
+        request_spans.reset(token)
+
+    assert [component for component, _ in spans] == ["db", "embedding", "llm", "http"]
+    text = metrics.render()
+    assert 'operation="encode"' in text and 'operation="fake_llm"' in text
+
+
+def test_server_timing_sums_by_component():
+    header = server_timing([("db", 0.002), ("llm", 0.5), ("db", 0.001)], total=0.51)
+    assert header == 'db;dur=3.0;desc="2 calls", llm;dur=500.0;desc="1 call", total;dur=510.0'
+
+
+def test_middleware_adds_server_timing_and_exposes_metrics(chat_db, chat_session_id):
+    """
+    요청 안에서 실행된 chat_crud(스레드) / LLM(async) 구간이 Server-Timing 헤더에 포함되고,
+    /api/metrics 에 구간 및 요청 히스토그램이 노출되는지 테스트합니다.
+    """
+    app = FastAPI()
+    app.include_router(metrics_router, prefix="/api")
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/api/slow/{session_id}")
+    async def slow(session_id: str):
+        def load():
+            db = chat_db()
+            try:
+                return chat_crud.get_recent_messages(db, session_id, max_messages=10)
+            finally:
+                db.close()
+        await anyio.to_thread.run_sync(load)
+        with span("llm", "fake_llm"):
+            await asyncio.sleep(0.02)
+        return {"ok": True}
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            first = await client.get(f"/api/slow/{chat_session_id}")
+            second = await client.get(f"/api/slow/{chat_session_id}")
+            return first, second, await client.get("/api/metrics")
+
+    first, second, scraped = asyncio.run(run())
+
+    assert first.status_code == 200
+    timing = {entry.split(";")[0]: entry for entry in first.headers["server-timing"].split(", ")}
+    assert set(timing) == {"db", "llm", "total"}
+    assert float(timing["llm"].split("dur=")[1].split(";")[0]) >= 20.0
+
+    assert scraped.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'app_span_duration_seconds_count{component="db",operation="get_recent_messages"} 2' in scraped.text
+    assert 'http_request_duration_seconds_count{method="GET",route="/api/slow/{session_id}",status="200"} 2' in scraped.text
+
+
+def test_pooled_redis_clients_record_command_spans():
+    """공유 풀의 Redis 클라이언트가 단일 명령 / pipeline 실행 시간을 redis 구간으로 기록하는지 테스트합니다."""
+    fakeredis = pytest.importorskip("fakeredis")
+    from fakeredis.aioredis import FakeConnection as FakeAsyncConnection
+
+    pools = RedisPools(connection_class=fakeredis.FakeConnection, async_connection_class=FakeAsyncConnection,
+                       server=fakeredis.FakeServer())
+    spans = []
+    token = request_spans.set(spans)
+    try:
+        client = pools.client()
+        client.set("k", "v")
+        pipe = client.pipeline()
+        pipe.get("k").get("k")
+        assert pipe.execute() == ["v", "v"]
+
+        async def async_calls():
+            async_client = pools.async_client()
+            assert await async_client.get("k") == "v"
+            await async_client.connection_pool.disconnect()
+        asyncio.run(async_calls())
+    finally:
+        request_spans.reset(token)
+
+    assert [component for component, _ in spans] == ["redis"] * 3
+    text = metrics.render()
+    for operation in ("set", "pipeline", "get"):
+        assert f'component="redis",operation="{operation}"' in text
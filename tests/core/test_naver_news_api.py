@@ -0,0 +1,87 @@
+# tests/core/test_naver_news_api.py
+import asyncio
+import time
+
+from backend.core.naver_news_api import NaverNewsClient
+from backend.core.result_cache import ResultCache
+
+
+def _client(server, **kwargs) -> NaverNewsClient:
+    return NaverNewsClient(
+        url=f"http://127.0.0.1:{server.server_address[1]}/v1/search/news.json",
+        client_id="id", client_secret="secret", **{"timeout": 2.0, "retries": 2, "backoff": 0.01, **kwargs},
+    )
+
+
+def test_search_parses_articles_and_reuses_connection(mock_naver):
+    client = _client(mock_naver)
+
+    async def run():
+        first = await client.search("경제", display=2)
+        for _ in range(4):
+            await client.search("경제", display=2)
+        await client.aclose()
+        return first
+
+    articles = asyncio.run(run())
+    assert [a["title"] for a in articles] == ["경제 기사0", "경제 기사1"]
+    assert articles[0]["keyword"] == "경제"
+    # keep-alive: 순차 요청 5번이 하나의 TCP 연결(같은 client port)로 처리됨
+    assert len({port for _, port, _ in mock_naver.requests}) == 1
+    assert mock_naver.requests[0][2] == "id"
+
+
+def test_search_many_runs_keywords_concurrently_with_cap(mock_naver):
+    """키워드 검색이 동시에 실행되고(전체 시간 ~= 요청 1번), 합친 결과 수 상한이 적용되는지 테스트합니다."""
+    mock_naver.delay = 0.3
+    client = _client(mock_naver)
+
+    async def run():
+        started = time.perf_counter()
+        results = await client.search_many(["AI", "반도체", "환율"], display=3, max_results=7)
+        return results, time.perf_counter() - started
+
+    results, elapsed = asyncio.run(run())
+    assert elapsed < 0.3 * 2
+    assert [len(r) for r in results] == [3, 3, 1]
+    assert [r[0]["keyword"] for r in results] == ["AI", "반도체", "환율"]
+
+
+def test_search_retries_server_errors_then_succeeds(mock_naver):
+    mock_naver.failures["AI"] = 2
+    articles = asyncio.run(_client(mock_naver).search("AI", display=1))
+    assert len(articles) == 1
+    assert len(mock_naver.requests) == 3
+
+
+def test_search_gives_up_after_retries_and_timeouts(mock_naver):
+    mock_naver.failures["AI"] = 10
+    assert asyncio.run(_client(mock_naver, retries=1).search("AI")) == []
+    assert len(mock_naver.requests) == 2
+
+    # 응답이 timeout 보다 늦으면 재시도 후 빈 결과
+    mock_naver.delay = 0.3
+    assert asyncio.run(_client(mock_naver, timeout=0.05, retries=1).search("경제")) == []
+
+
+def test_search_many_returns_empty_for_malformed_response(mock_naver):
+    """200 응답이어도 본문이 JSON 이 아니거나 items 가 없는 키워드는 빈 결과이고, 다른 키워드 결과는 그대로인지 테스트합니다."""
+    mock_naver.bodies.update({"깨짐": b"<html>error</html>", "빈값": b'{"total": 0}'})
+    results = asyncio.run(_client(mock_naver).search_many(["AI", "깨짐", "빈값"], display=2))
+    assert [len(articles) for articles in results] == [2, 0, 0]
+
+
+def test_cached_client_calls_upstream_once_for_same_search(mock_naver):
+    """캐시를 사용하면 같은 검색이 동시에/연속으로 들어와도 네이버 API 는 한 번만 호출되는지 테스트합니다."""
+    mock_naver.delay = 0.05
+    client = _client(mock_naver, cache=ResultCache("naver_news", ttl=60, use_redis=False))
+
+    async def run():
+        results = await asyncio.gather(*[client.search("AI", display=2) for _ in range(5)])
+        results.append(await client.search("AI", display=2))
+        results.append(await client.search("AI", display=3))
+        return results
+
+    results = asyncio.run(run())
+    assert all(r == results[0] for r in results[:6]) and len(results[6]) == 3
+    assert [keyword for keyword, _, _ in mock_naver.requests] == ["AI", "AI"]
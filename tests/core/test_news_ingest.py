@@ -0,0 +1,242 @@
+# tests/core/test_news_ingest.py
+import asyncio
+import datetime
+import zlib
+
+import numpy as np
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.agents.news_agent import NewsAgent
+from backend.core import naver_news_api, news_db_manager
+from backend.core.config import settings
+from backend.core.naver_news_api import NaverNewsClient
+from backend.core.news_db_manager import NewsVector, parse_pub_date, subscribe_news
+from backend.core.news_ingest import NewsIngestPipeline, NewsIngestScheduler
+from backend.core.result_cache import ResultCache
+
+
+async def fake_embed(texts: list[str]) -> np.ndarray:
+    """텍스트마다 고정된 임의의 정규화 벡터 (같은 텍스트 -> 같은 벡터, 다른 텍스트끼리는 거의 직교)"""
+    vectors = np.stack([
+        np.random.default_rng(zlib.crc32(text.encode())).standard_normal(64).astype(np.float32) for text in texts
+    ])
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+@pytest.fixture
+def news_db(tmp_path, monkeypatch):
+    """news / news_subscription 테이블을 임시 SQLite 파일에 만들고 사용자 벡터 인덱스도 테스트마다 새로 시작"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'news.db'}", connect_args={"check_same_thread": False})
+    news_db_manager.Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(bind=engine)
+    monkeypatch.setattr(news_db_manager, "SessionLocal", session_factory)
+    monkeypatch.setattr(news_db_manager, "_user_indexes", {})
+    monkeypatch.setattr(settings, "VECTOR_INDEX_DIR", str(tmp_path / "vector_index"))
+    yield session_factory
+    engine.dispose()
+
+
+def _client(server, **kwargs) -> NaverNewsClient:
+    return NaverNewsClient(
+        url=f"http://127.0.0.1:{server.server_address[1]}/v1/search/news.json",
+        client_id="id", client_secret="secret", timeout=2.0, retries=0, **kwargs,
+    )
+
+
+def _pipeline(server, **kwargs) -> NewsIngestPipeline:
+    client = _client(server)
+    return NewsIngestPipeline(search=client.search, **{"embed": fake_embed, "display": 5, "batch_size": 3, "queue_size": 1, **kwargs})
+
+
+def _stored(session_factory, user_name: str) -> list[tuple[str, str]]:
+    session = session_factory()
+    rows = session.query(NewsVector.keyword, NewsVector.title).filter(NewsVector.user_name == user_name)\
+                  .order_by(NewsVector.news_id).all()
+    session.close()
+    return [tuple(row) for row in rows]
+
+
+def test_pipeline_stores_new_articles_per_subscriber(mock_naver, news_db):
+    """
+    구독 키워드를 로컬 검색 서버에서 수집하여 구독 사용자별로 저장하고,
+    다시 수집하면 이미 저장된 기사는 중복으로 걸러지는지 테스트합니다.
+    """
+    subscribe_news("kim", "경제")
+    subscribe_news("lee", "경제")
+    subscribe_news("lee", "증시")
+    scheduler = NewsIngestScheduler(_pipeline(mock_naver), enabled=False)
+
+    first = asyncio.run(scheduler.run_once())
+    second = asyncio.run(scheduler.run_once())
+
+    kim, lee = _stored(news_db, "kim"), _stored(news_db, "lee")
+    assert kim == [("경제", f"경제 기사{i}") for i in range(5)]  # HTML 태그 제거
+    assert sorted(lee) == sorted(kim + [("증시", f"증시 기사{i}") for i in range(5)])
+    # 키워드는 한 번씩만 검색하고, 같은 기사는 한 번만 임베딩
+    assert sorted(keyword for keyword, _, _ in mock_naver.requests) == ["경제", "경제", "증시", "증시"]
+    assert first["fetch"]["items_in"] == 2 and first["embed"]["items_out"] == 10
+    assert first["store"]["items_out"] == 15
+    assert second["dedup"]["items_in"] == 10 and second["store"]["items_out"] == 0
+    stats = scheduler.pipeline.stats()
+    assert stats["runs"] == 2 and stats["stages"]["fetch"]["items_out"] == 20
+    # 기사 발행 시각(pubDate, RFC 2822)을 서버 로컬 시각으로 저장
+    session = news_db()
+    pub_dates = {row.pubDate for row in session.query(NewsVector.pubDate)}
+    session.close()
+    published = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone(datetime.timedelta(hours=9)))
+    assert pub_dates == {published.astimezone().replace(tzinfo=None)}
+
+
+def test_parse_pub_date():
+    """pubDate 는 RFC 2822 형식만 읽고, 비어 있거나 형식이 맞지 않으면 None 인지 테스트합니다."""
+    parsed = parse_pub_date("Tue, 20 Oct 2026 09:30:00 +0900")
+    assert parsed.tzinfo is None
+    assert parsed == datetime.datetime(2026, 10, 20, 0, 30, tzinfo=datetime.timezone.utc).astimezone().replace(tzinfo=None)
+    assert parse_pub_date("") is None and parse_pub_date(None) is None
+    assert parse_pub_date("2026-10-20 09:30") is None
+
+
+def test_pipeline_dedups_same_story_across_keywords_and_batches(news_db):
+    """
+    다른 키워드/다른 임베딩 batch 로 들어온 같은 기사는 사용자에게 한 번만 저장되는지,
+    검색은 최신순 첫 페이지(start=1)부터 하는지 테스트합니다.
+    """
+    searched = []
+
+    async def search(keyword, display, sort="sim", start=100):
+        searched.append((keyword, sort, start))
+        await asyncio.sleep(0.01 if keyword == "AI" else 0.05)
+        return [{"title": "AI 반도체 수출 급증", "link": f"https://news/{keyword}", "description": "&quot;역대 최대&quot;",
+                 "pubDate": ""}] + [{"title": f"{keyword} 단독 {i}", "link": f"https://news/{keyword}/{i}",
+                                     "description": "", "pubDate": ""} for i in range(2)]
+
+    subscribe_news("kim", "AI")
+    subscribe_news("kim", "반도체")
+    pipeline = NewsIngestPipeline(search=search, embed=fake_embed, batch_size=2, queue_size=1)
+    asyncio.run(NewsIngestScheduler(pipeline, enabled=False).run_once())
+
+    titles = [title for _, title in _stored(news_db, "kim")]
+    assert len(titles) == 5 and titles.count("AI 반도체 수출 급증") == 1
+    assert sorted(searched) == [("AI", "date", 1), ("반도체", "date", 1)]
+
+
+def test_default_search_skips_search_result_cache(mock_naver, news_db, monkeypatch):
+    """기본 검색은 공유 클라이언트의 검색 결과 캐시를 거치지 않아 수집할 때마다 네이버 API 를 호출하는지 테스트합니다."""
+    monkeypatch.setattr(naver_news_api, "naver_client", _client(mock_naver, cache=ResultCache("naver_news", ttl=300, use_redis=False)))
+    subscribe_news("kim", "경제")
+    scheduler = NewsIngestScheduler(NewsIngestPipeline(embed=fake_embed, display=2), enabled=False)
+
+    asyncio.run(scheduler.run_once())
+    asyncio.run(scheduler.run_once())
+
+    assert [keyword for keyword, _, _ in mock_naver.requests] == ["경제", "경제"]
+
+
+def test_failing_stage_stops_pipeline(mock_naver, news_db):
+    """한 단계가 실패하면 나머지 단계가 대기열에서 멈추지 않고 수집이 예외로 끝나는지 테스트합니다."""
+    async def broken_embed(texts):
+        raise RuntimeError("embedding failed")
+
+    subscribe_news("kim", "경제")
+    scheduler = NewsIngestScheduler(_pipeline(mock_naver, embed=broken_embed), enabled=False)
+
+    async def run():
+        await asyncio.wait_for(scheduler.run_once(), timeout=5)
+
+    with pytest.raises(RuntimeError, match="embedding failed"):
+        asyncio.run(run())
+    assert _stored(news_db, "kim") == []
+
+
+def test_news_agent_only_reads_ingested_articles(mock_naver, news_db, monkeypatch):
+    """
+    NewsAgent 는 처음 요청한 키워드만 바로 한 번 수집하고, 이후에는 검색/임베딩 없이
+    수집된 기사 중 전달하지 않은 기사만 NEWS_DELIVER_LIMIT 건씩 돌려주는지 테스트합니다.
+    """
+    from backend.agents import news_agent
+    scheduler = NewsIngestScheduler(_pipeline(mock_naver), interval=60, enabled=True)
+    monkeypatch.setattr(news_agent, "news_ingest_scheduler", scheduler)
+    agent = NewsAgent()
+    data = {"user_name": "kim", "keywords": "경제"}
+
+    async def run():
+        scheduler.start()
+        replies = [await agent.handle(data) for _ in range(3)]
+        await scheduler.stop()
+        return replies
+
+    replies = asyncio.run(run())
+
+    assert replies[0].startswith("총 3개의 새 기사가 있습니다.") and "경제 기사0" in replies[0]
+    assert replies[1].startswith("총 2개의 새 기사가 있습니다.") and "경제 기사4" in replies[1]
+    assert replies[2] == "신규 기사가 없습니다."
+    # 시작 시 전체 수집과 첫 요청의 수집이 겹쳐도 (순서대로 실행) 기사는 한 번씩만 저장
+    assert {keyword for keyword, _, _ in mock_naver.requests} == {"경제"}
+    assert len(_stored(news_db, "kim")) == 5
+    assert not scheduler.running
+
+
+def test_news_agent_reports_collection_started_when_first_ingest_fails(news_db, monkeypatch):
+    """새 구독의 첫 수집이 실패하면 기사가 없다고 하지 않고 수집을 시작했다고 안내하고, 스케줄러에 다시 요청하는지 테스트합니다."""
+    from backend.agents import news_agent
+
+    async def broken_search(keyword, display, sort="sim", start=100):
+        raise RuntimeError("search failed")
+
+    scheduler = NewsIngestScheduler(NewsIngestPipeline(search=broken_search, embed=fake_embed), enabled=False)
+    requested = []
+    monkeypatch.setattr(scheduler, "request", requested.append)
+    monkeypatch.setattr(news_agent, "news_ingest_scheduler", scheduler)
+
+    reply = asyncio.run(NewsAgent().handle({"user_name": "kim", "keywords": "경제"}))
+
+    assert "수집을 시작했습니다" in reply
+    assert requested == ["경제"]
+
+
+def test_news_agent_does_not_wait_behind_running_full_refresh(news_db, monkeypatch):
+    """주기 수집이 진행 중이라 새 구독 수집이 NEWS_FIRST_INGEST_TIMEOUT 안에 끝나지 않으면 기다리지 않고 수집 중이라고 안내하는지 테스트합니다."""
+    from backend.agents import news_agent
+    scheduler = NewsIngestScheduler(NewsIngestPipeline(search=None, embed=fake_embed), enabled=False)
+    requested = []
+    monkeypatch.setattr(scheduler, "request", requested.append)
+    monkeypatch.setattr(news_agent, "news_ingest_scheduler", scheduler)
+    monkeypatch.setattr(settings, "NEWS_FIRST_INGEST_TIMEOUT", 0.1)
+
+    async def run():
+        async with scheduler._run_lock:  # 주기 수집이 실행 중인 상태
+            started = asyncio.get_running_loop().time()
+            reply = await NewsAgent().handle({"user_name": "kim", "keywords": "경제"})
+            return reply, asyncio.get_running_loop().time() - started
+
+    reply, elapsed = asyncio.run(run())
+
+    assert "수집을 시작했습니다" in reply and elapsed < 1.0
+    assert requested == ["경제"]
+
+
+def test_scheduler_full_refresh_is_not_starved_by_requests(monkeypatch):
+    """interval 보다 자주 request() 가 들어와도 전체 수집이 interval 마다 실행되는지 테스트합니다."""
+    scheduler = NewsIngestScheduler(NewsIngestPipeline(search=None, embed=fake_embed), interval=0.2, enabled=True)
+    runs = []
+
+    async def run_once(keywords=None):
+        runs.append(keywords)
+        return {}
+
+    monkeypatch.setattr(scheduler, "run_once", run_once)
+
+    async def run():
+        scheduler.start()
+        for i in range(20):
+            scheduler.request(f"키워드{i}")
+            await asyncio.sleep(0.05)
+        await scheduler.stop()
+
+    asyncio.run(run())
+
+    full_runs = runs.count(None)
+    assert 4 <= full_runs <= 7  # 시작 시 1회 + 약 1초 동안 0.2초마다
+    assert len(runs) > full_runs  # 요청된 키워드도 기다리지 않고 수집
@@ -0,0 +1,74 @@
+# tests/core/test_redis_cache.py
+import asyncio
+
+import pytest
+import redis
+from langchain_core.messages import AIMessage, HumanMessage
+
+from backend.core.chat_memory import PooledRedisChatMessageHistory
+from backend.core.redis_cache import RedisPools
+
+fakeredis = pytest.importorskip("fakeredis")
+from fakeredis.aioredis import FakeConnection as FakeAsyncConnection  # noqa: E402
+
+
+@pytest.fixture
+def pools():
+    return RedisPools(
+        max_connections=3,
+        connection_class=fakeredis.FakeConnection,
+        async_connection_class=FakeAsyncConnection,
+        server=fakeredis.FakeServer(),
+    )
+
+
+def test_sync_client_reuses_pooled_connection(pools):
+    """호출마다 새 커넥션을 만들지 않고 풀의 커넥션 하나를 재사용하는지 테스트합니다."""
+    for _ in range(100):
+        assert pools.client().ping()
+    stats = pools.stats()["sync"]
+    assert stats["created"] == 1
+    assert stats["checkouts"] == 100 and stats["in_use"] == 0
+
+
+def test_pool_is_bounded_by_max_connections(pools, mocker):
+    """max_connections 개가 모두 사용 중이면 새 커넥션을 만들지 않고 기다리다가 timeout 되는지 테스트합니다."""
+    mocker.patch('backend.core.redis_cache.settings.REDIS_POOL_TIMEOUT', 0.05)
+    pool = pools.client().connection_pool
+    held = [pool.get_connection() for _ in range(3)]
+    with pytest.raises(redis.ConnectionError):
+        pool.get_connection()
+    for connection in held:
+        pool.release(connection)
+    assert pools.stats()["sync"]["peak_in_use"] == 3
+    assert pools.stats()["sync"]["in_use"] == 0
+
+
+def test_async_client_shares_bounded_pool(pools):
+    async def run():
+        client = pools.async_client()
+        await asyncio.gather(*[client.incr("hits") for _ in range(50)])
+        value = await client.get("hits")
+        await pools.close()
+        return value
+
+    stats_holder = {}
+    original_close = pools.close
+
+    async def close_and_keep_stats():
+        stats_holder.update(pools.stats())
+        await original_close()
+
+    pools.close = close_and_keep_stats
+    assert asyncio.run(run()) == "50"
+    assert stats_holder["async"]["created"] <= 3
+    assert stats_holder["async"]["checkouts"] == 51
+
+
+def test_pooled_chat_message_history_roundtrip(pools):
+    """공유 풀(decode_responses=True) 클라이언트로도 LangChain 메세지를 저장/조회할 수 있는지 테스트합니다."""
+    history = PooledRedisChatMessageHistory(session_id="user:kim", client=pools.client(), ttl=60)
+    history.add_message(HumanMessage(content="안녕"))
+    history.add_message(AIMessage(content="반가워요"))
+    assert [m.content for m in history.messages] == ["안녕", "반가워요"]
+    assert 0 < pools.client().ttl("message_store:user:kim") <= 60
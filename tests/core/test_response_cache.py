@@ -0,0 +1,90 @@
+# tests/core/test_response_cache.py
+import asyncio
+import zlib
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+
+from backend.core.llm_core import acall_llm
+from backend.core.response_cache import LLMResponseCache, llm_cache_headers, llm_cache_status
+
+DIM = 64
+
+
+def fake_embed(texts):
+    """단어 해시 bag-of-words 임베딩 (단어 구성이 비슷하면 유사도가 높음)"""
+    vectors = np.zeros((len(texts), DIM), dtype=np.float32)
+    for row, text in enumerate(texts):
+        for word in text.replace("?", " ").split():
+            vectors[row, zlib.crc32(word.encode()) % DIM] += 1
+    return vectors
+
+
+def _run(cache, message, prompt="prompt", history=None, reply="답변"):
+    calls = []
+
+    async def call():
+        calls.append(message)
+        return reply
+
+    async def run():
+        result = await cache.get_or_call("gpt-4o-mini", prompt, message, 0.3, history or [], call)
+        return result, llm_cache_status.get(), llm_cache_headers()
+
+    result, status, headers = asyncio.run(run())
+    return result, status, headers, calls
+
+
+def test_exact_then_semantic_hit():
+    cache = LLMResponseCache(ttl=60, maxsize=10, threshold=0.8, embed=fake_embed)
+    assert _run(cache, "오늘 서울 날씨 어때?")[1] == "miss"
+
+    reply, status, headers, calls = _run(cache, "오늘 서울 날씨 어때?", reply="다른 답변")
+    assert (reply, status, calls) == ("답변", "hit-exact", [])
+    assert headers == {"X-LLM-Cache": "hit-exact"}
+
+    # 단어 하나만 다른 질문 -> 유사도 threshold 이상이면 semantic hit
+    reply, status, _, calls = _run(cache, "오늘 서울 날씨 어때 알려줘?", reply="다른 답변")
+    assert (reply, status, calls) == ("답변", "hit-semantic", [])
+    assert cache.stats()["exact_hits"] == 1 and cache.stats()["semantic_hits"] == 1
+
+
+def test_semantic_match_requires_same_prompt_and_similarity():
+    cache = LLMResponseCache(ttl=60, maxsize=10, threshold=0.8, embed=fake_embed)
+    _run(cache, "오늘 서울 날씨 어때?")
+    # system prompt 가 다르면(예: 회의실 현황 변경) 비슷한 질문이라도 재사용하지 않음
+    assert _run(cache, "오늘 서울 날씨 어때?", prompt="changed")[1] == "miss"
+    # 전혀 다른 질문
+    assert _run(cache, "회의실 예약해줘")[1] == "miss"
+    # 대화 이력이 다르면 exact key 가 달라짐
+    assert _run(cache, "오늘 서울 날씨 어때?", history=[{"role": "user", "content": "부산 여행 계획 세워줘"}])[1] == "miss"
+
+
+def test_entries_expire_and_lru_evicts(mocker):
+    clock = mocker.patch('backend.core.result_cache.time.monotonic', return_value=0.0)
+    mocker.patch('backend.core.response_cache.time.monotonic', new=clock)
+    cache = LLMResponseCache(ttl=10, maxsize=2, threshold=0.99, embed=fake_embed)
+    for message in ("질문 하나", "질문 둘", "질문 셋"):
+        _run(cache, message)
+    assert _run(cache, "질문 하나")[1] == "miss"   # maxsize 초과로 제거됨
+    assert _run(cache, "질문 셋")[1] == "hit-exact"
+
+    clock.return_value = 11.0
+    assert _run(cache, "질문 셋")[1] == "miss"
+
+
+def test_acall_llm_uses_cache_only_when_requested(mocker):
+    mocker.patch('backend.core.llm_core.llm_response_cache', LLMResponseCache(ttl=60, maxsize=10, semantic=False))
+    mock_response = MagicMock()
+    mock_response.choices[0].message.content = "캐시된 답변"
+    mock_create = mocker.patch('backend.core.llm_core.aclient.chat.completions.create', new=AsyncMock(return_value=mock_response))
+
+    async def run():
+        for _ in range(3):
+            assert await acall_llm("gpt-4o-mini", "prompt", "안녕", cache=True) == "캐시된 답변"
+        await acall_llm("gpt-4o-mini", "prompt", "안녕")
+        return llm_cache_status.get()
+
+    assert asyncio.run(run()) == "hit-exact"
+    # 캐시 사용 3회 중 첫 번째만 + 캐시를 사용하지 않은 1회
+    assert mock_create.await_count == 2
@@ -0,0 +1,106 @@
+# tests/core/test_result_cache.py
+import asyncio
+
+import pytest
+import redis.asyncio as aioredis
+
+from backend.core.result_cache import ResultCache, TTLCache
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+def test_ttl_cache_expires_and_evicts_lru(mocker):
+    clock = mocker.patch('backend.core.result_cache.time.monotonic', return_value=100.0)
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1          # a 를 최근 사용으로 갱신
+    cache.set("c", 3)                   # 가장 오래 사용하지 않은 b 제거
+    assert cache.get("b") is None and cache.get("c") == 3
+
+    clock.return_value = 111.0
+    assert cache.get("a") is None and len(cache) == 1
+
+
+def test_concurrent_misses_are_coalesced_into_one_load():
+    """같은 key 로 동시에 miss 가 나면 loader 는 한 번만 실행되는지 테스트합니다. (single-flight)"""
+    cache = ResultCache("test", ttl=60, use_redis=False)
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return ["article"]
+
+    async def run():
+        results = await asyncio.gather(*[cache.get_or_load(("AI", 3), loader) for _ in range(10)])
+        results.append(await cache.get_or_load(("AI", 3), loader))
+        return results
+
+    results = asyncio.run(run())
+    assert calls == [1]
+    assert all(r == ["article"] for r in results)
+    stats = cache.stats()
+    assert (stats["misses"], stats["coalesced"], stats["local_hits"]) == (1, 9, 1)
+    assert stats["hit_ratio"] == pytest.approx(10 / 11)
+
+
+def test_empty_results_and_errors_are_not_cached():
+    cache = ResultCache("test", ttl=60, use_redis=False)
+    calls = []
+
+    async def empty():
+        calls.append("empty")
+        return []
+
+    async def broken():
+        raise RuntimeError("upstream down")
+
+    async def run():
+        await cache.get_or_load("k", empty)
+        await cache.get_or_load("k", empty)
+        with pytest.raises(RuntimeError):
+            await cache.get_or_load("k2", broken)
+        return await cache.get_or_load("k2", empty)
+
+    assert asyncio.run(run()) == []
+    assert calls == ["empty"] * 3
+
+
+def test_redis_tier_is_shared_between_workers():
+    """한 워커가 저장한 결과를 다른 워커(별도 로컬 캐시)가 Redis 에서 읽는지 테스트합니다."""
+    server = fakeredis.FakeServer()
+    worker_a = ResultCache("news", ttl=60, client=fakeredis.aioredis.FakeRedis(server=server, decode_responses=True))
+    worker_b = ResultCache("news", ttl=60, client=fakeredis.aioredis.FakeRedis(server=server, decode_responses=True))
+
+    async def load():
+        return [{"title": "뉴스"}]
+
+    async def run():
+        await worker_a.get_or_load(("AI", 3, "sim"), load)
+        ttl = await worker_a.client.ttl("cache:news:AI:3:sim")
+        return await worker_b.get_or_load(("AI", 3, "sim"), None), ttl
+
+    value, ttl = asyncio.run(run())
+    assert value == [{"title": "뉴스"}]
+    assert 0 < ttl <= 60
+    assert worker_b.stats()["redis_hits"] == 1
+
+
+def test_redis_errors_fall_back_to_loader(mocker):
+    client = mocker.Mock()
+    client.get = mocker.AsyncMock(side_effect=aioredis.ConnectionError("down"))
+    cache = ResultCache("news", ttl=60, client=client, retry_after=30)
+
+    async def load():
+        return ["fresh"]
+
+    async def run():
+        first = await cache.get_or_load("k", load)
+        cache.clear()
+        return first, await cache.get_or_load("k", load)
+
+    assert asyncio.run(run()) == (["fresh"], ["fresh"])
+    # 첫 실패 이후에는 retry_after 동안 Redis 를 호출하지 않음
+    assert client.get.await_count == 1
+    assert cache.stats()["errors"] == 1
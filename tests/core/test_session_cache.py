@@ -0,0 +1,94 @@
+# tests/core/test_session_cache.py
+import asyncio
+import threading
+
+import pytest
+import redis
+from sqlalchemy import event
+
+from backend.agents.chat_agent import ChatAgent
+from backend.core.session_cache import SessionHistoryCache
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+@pytest.fixture
+def cache():
+    return SessionHistoryCache(client=fakeredis.FakeRedis(decode_responses=True), ttl=60, max_messages=6, enabled=True)
+
+
+def _messages(first, last):
+    return [{"sequence": i, "role": "user" if i % 2 else "assistant", "content": f"m{i}"} for i in range(first, last + 1)]
+
+
+def test_miss_fill_then_hit(cache):
+    """처음에는 miss, DB에서 읽은 메세지로 채운 뒤에는 hit 이고 write-through 로 추가한 메세지도 반영되는지 테스트합니다."""
+    assert cache.get("s1", 6) is None
+    cache.fill("s1", _messages(1, 4), 4, summary="요약", summary_until=0)
+    messages, summary, summary_until = cache.get("s1", 6)
+    assert [m["sequence"] for m in messages] == [1, 2, 3, 4] and summary == "요약"
+
+    first = cache.allocate("s1", 4)
+    assert first == 5
+    assert cache.get("s1", 6) is None  # 할당 후 아직 추가(commit) 전이면 miss
+    cache.append("s1", _messages(5, 8))
+    messages, _, _ = cache.get("s1", 6)
+    assert [m["sequence"] for m in messages] == [3, 4, 5, 6, 7, 8]  # max_messages 만큼만 유지
+    assert cache.get("s1", 10) is None  # 필요한 개수보다 적게 들고 있으면 miss
+    assert cache.stats()["hits"] == 2 and cache.stats()["misses"] == 2
+
+
+def test_allocate_is_atomic_across_threads(cache):
+    cache.fill("s1", [], 0)
+    allocated = []
+    threads = [threading.Thread(target=lambda: allocated.append(cache.allocate("s1", 2))) for _ in range(20)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert sorted(allocated) == list(range(1, 41, 2))
+    assert cache.allocate("unknown", 2) is None  # 카운터가 없으면 DB에서 계산하도록 None
+
+
+def test_redis_down_falls_back_and_backs_off(mocker):
+    client = mocker.MagicMock()
+    client.pipeline.side_effect = redis.ConnectionError("down")
+    cache = SessionHistoryCache(client=client, max_messages=6, retry_after=60, enabled=True)
+
+    assert cache.get("s1", 6) is None
+    assert cache.allocate("s1", 2) is None
+    assert cache.errors == 1  # 실패 후 retry_after 동안은 Redis를 호출하지 않음
+    assert client.pipeline.call_count == 1
+
+
+def test_steady_state_turn_reads_nothing_from_db(async_chat_db, chat_session_id, cache, mocker):
+    """캐시가 채워진 뒤의 대화 턴은 DB에서 SELECT 없이 INSERT(sequence 예약) + UPDATE(답변 저장) 만 실행하는지 테스트합니다."""
+    agent = ChatAgent()
+    agent.session_cache = cache
+    mocker.patch.object(agent, '_llm_reply', return_value="답변")
+    mocker.patch.dict(ChatAgent._model_max_tokens, {"gpt-4o-mini": 4096})
+    mocker.patch('backend.agents.chat_agent.settings.CHAT_HISTORY_MAX_TURNS', 3)  # cache.max_messages(6) 와 같은 window
+    statements = []
+
+    def session_factory():
+        # async 엔진은 이벤트 루프에 묶이므로 asyncio.run 마다 새로 만들고, 실행된 SQL 은 sync_engine 에서 수집
+        factory = async_chat_db()
+        event.listen(factory.kw["bind"].sync_engine, "before_cursor_execute",
+                     lambda conn, cursor, sql, *args: statements.append(sql))
+        return factory
+
+    def turn(message):
+        statements.clear()
+        asyncio.run(agent.handle(chat_session_id, "test_user", "gpt-4o-mini", message, session_factory=session_factory()))
+        return list(statements)
+
+    assert any(s.startswith("SELECT") for s in turn("q1"))  # miss: DB에서 읽고 캐시를 채움
+    for i in range(2, 6):
+        assert [s.split()[0] for s in turn(f"q{i}") if "SAVEPOINT" not in s] == ["INSERT", "UPDATE"]
+
+    async def load_history():
+        async with async_chat_db()() as db:
+            return await agent._load_history(db, chat_session_id, "gpt-4o-mini", "q6")
+
+    history = asyncio.run(load_history())[0]
+    assert [m["content"] for m in history] == ["q3", "답변", "q4", "답변", "q5", "답변"]
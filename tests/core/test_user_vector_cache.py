@@ -0,0 +1,39 @@
+# tests/core/test_user_vector_cache.py
+import numpy as np
+from backend.core.user_vector_cache import UserVectorCache
+
+
+def test_best_matches_returns_most_similar_row_per_query():
+    """후보 여러 건을 한 번에 비교하여 후보별로 가장 유사한 저장 뉴스를 찾는지 테스트합니다."""
+    cache = UserVectorCache()
+    cache.append([1, 2, 3], ["a", "b", "c"], np.eye(3, 4) * 5)  # 정규화 전 벡터도 허용
+
+    rows, scores = cache.best_matches(np.array([[0, 1, 0, 0], [0.1, 0, 1, 0]]))
+
+    assert [cache.news_id(r) for r in rows] == [2, 3]
+    assert [cache.title(r) for r in rows] == ["b", "c"]
+    assert np.isclose(scores[0], 1.0)
+    assert 1.0 > scores[1] > 0.9
+
+
+def test_best_matches_on_empty_cache():
+    rows, scores = UserVectorCache().best_matches(np.ones((2, 4)))
+    assert list(rows) == [-1, -1]
+    assert list(scores) == [0, 0]
+
+
+def test_append_grows_buffer_and_skips_already_loaded_ids():
+    """버퍼 용량을 넘겨도 기존 행이 유지되고, 이미 반영된 news_id는 다시 추가하지 않는지 테스트합니다."""
+    cache = UserVectorCache()
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((100, 8))
+    for i in range(100):
+        cache.append([i + 1], [f"t{i}"], vectors[i])
+
+    # DB 동기화와 record_news 반영이 겹친 경우 (id 100은 이미 반영됨)
+    cache.append([100, 101], ["dup", "new"], vectors[:2])
+
+    assert len(cache) == 101
+    assert cache.last_news_id == 101
+    rows, _ = cache.best_matches(vectors[50])
+    assert cache.news_id(rows[0]) == 51
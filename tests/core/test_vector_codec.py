@@ -0,0 +1,46 @@
+# tests/core/test_vector_codec.py
+import pickle
+import numpy as np
+import pytest
+from backend.core.vector_codec import HEADER, decode_vector, decode_vectors, encode_vector, is_encoded
+
+
+def test_float32_round_trip_is_exact_and_zero_copy():
+    vec = np.random.default_rng(0).standard_normal(384).astype(np.float32)
+    blob = encode_vector(vec)
+
+    assert len(blob) == HEADER.size + 384 * 4
+    decoded = decode_vector(blob)
+    assert decoded.dtype == np.float32
+    assert np.array_equal(decoded, vec)
+    # np.frombuffer view 이므로 bytes 버퍼를 그대로 참조 (쓰기 불가)
+    assert not decoded.flags.writeable
+
+
+@pytest.mark.parametrize("dtype, size, atol", [("float16", 2, 1e-3), ("int8", 1, 2e-2)])
+def test_quantized_round_trip_is_close(dtype, size, atol):
+    vec = np.random.default_rng(1).uniform(-1, 1, 384).astype(np.float32)
+    blob = encode_vector(vec, dtype)
+
+    assert len(blob) == HEADER.size + 384 * size
+    assert np.allclose(decode_vector(blob), vec, atol=atol)
+
+
+def test_decode_vectors_concatenates_rows():
+    """같은 포맷의 여러 행은 한 번에 (n, dim) 행렬로, 섞여 있으면 행 단위로 디코딩합니다."""
+    vecs = np.random.default_rng(2).standard_normal((5, 8)).astype(np.float32)
+    blobs = [encode_vector(v) for v in vecs]
+
+    assert np.array_equal(decode_vectors(blobs), vecs)
+    # int8 은 행마다 scale 이 다름
+    assert np.allclose(decode_vectors([encode_vector(v, "int8") for v in vecs]), vecs, atol=3e-2)
+
+    mixed = blobs[:4] + [encode_vector(vecs[4], "float16")]
+    assert np.allclose(decode_vectors(mixed), vecs, atol=1e-2)
+
+
+def test_legacy_pickle_value_is_rejected():
+    legacy = pickle.dumps(np.ones(8, dtype=np.float32))
+    assert not is_encoded(legacy)
+    with pytest.raises(ValueError):
+        decode_vector(legacy)
@@ -0,0 +1,71 @@
+# tests/core/test_vector_index.py
+import numpy as np
+import pytest
+from backend.core.vector_index import (
+    BACKENDS, create_vector_index, index_path, load_vector_index, save_vector_index,
+)
+
+DIM = 16
+
+
+def _available(backend):
+    try:
+        __import__(backend) if backend != "numpy" else None
+        return True
+    except ImportError:
+        return False
+
+
+backends = pytest.mark.parametrize(
+    "backend", [pytest.param(b, marks=pytest.mark.skipif(not _available(b), reason=f"{b} not installed")) for b in BACKENDS]
+)
+
+
+@backends
+def test_search_finds_nearest_id_and_skips_already_added(backend):
+    """추가한 벡터 중 가장 가까운 id를 찾고, 이미 추가된 id(max_id 이하)는 다시 추가하지 않는지 테스트합니다."""
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((2000, DIM)).astype(np.float32)
+    index = create_vector_index(backend, DIM)
+    assert index.add(np.arange(1, 1001), vectors[:1000]) == 1000
+    assert index.add(np.arange(1, 2001), vectors) == 1000  # 1..1000 은 건너뜀 (버퍼 resize 포함)
+    assert len(index) == 2000
+
+    scores, ids = index.search(vectors[[5, 1500]] * 3, k=3)  # 정규화 전 질의도 허용
+    assert list(ids[:, 0]) == [6, 1501]
+    assert np.allclose(scores[:, 0], 1.0, atol=1e-4)
+    assert (scores[:, 0] >= scores[:, 1]).all()
+
+
+@backends
+def test_search_pads_missing_results(backend):
+    index = create_vector_index(backend, DIM)
+    scores, ids = index.search(np.ones((2, DIM)), k=2)
+    assert ids.tolist() == [[-1, -1], [-1, -1]]
+
+    index.add([7], np.ones((1, DIM)))
+    scores, ids = index.search(np.ones((1, DIM)), k=2)
+    assert ids.tolist() == [[7, -1]]
+
+
+@backends
+def test_save_and_load_roundtrip(backend, tmp_path):
+    """디스크에 저장한 인덱스를 다시 로드해 같은 결과를 내고, 이어서 증분 추가할 수 있는지 테스트합니다."""
+    rng = np.random.default_rng(1)
+    vectors = rng.standard_normal((50, DIM)).astype(np.float32)
+    index = create_vector_index(backend, DIM)
+    index.add(np.arange(10, 60), vectors)
+    path = index_path(str(tmp_path), backend, "user/kim")
+    save_vector_index(index, path)
+    assert index.unsaved == 0
+
+    loaded = load_vector_index(backend, path, DIM)
+    assert len(loaded) == 50 and loaded.max_id == 59
+    assert loaded.search(vectors[:3], k=1)[1][:, 0].tolist() == [10, 11, 12]
+    assert loaded.add([59, 60], vectors[:2]) == 1
+    assert load_vector_index(backend, path + ".missing", DIM) is None
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError):
+        create_vector_index("annoy", DIM)
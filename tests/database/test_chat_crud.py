@@ -0,0 +1,149 @@
+# tests/database/test_chat_crud.py
+import asyncio
+import threading
+import uuid
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from backend.agents.chat_agent import ChatAgent
+from backend.core.token_counter import estimate_tokens
+from backend.database.crud import chat_crud
+from backend.database.models.chat_model import SessionMessage
+
+CONCURRENT_TURNS = 20
+
+
+def test_save_turn_appends_messages_with_next_sequences(chat_db, chat_session_id):
+    """save_turn 이 기존 마지막 sequence 다음 번호로 여러 메세지를 한 번에 저장하는지 테스트합니다."""
+    db = chat_db()
+    assert chat_crud.save_turn(db, chat_session_id, [("user", "q1"), ("assistant", "a1")]) == [1, 2]
+    assert chat_crud.save_turn(db, chat_session_id, [("user", "q2")]) == [3]
+    db.commit()
+
+    history = chat_crud.get_chat_history(db, uuid.UUID(chat_session_id))
+    assert [(m.sequence, m.role, m.content) for m in history] == [
+        (1, "user", "q1"), (2, "assistant", "a1"), (3, "user", "q2"),
+    ]
+    db.close()
+
+
+def test_duplicate_sequence_is_rejected(chat_db, chat_session_id):
+    """(session_id, sequence) unique 제약으로 같은 sequence가 두 번 저장되지 않는지 테스트합니다."""
+    db = chat_db()
+    session_id = uuid.UUID(chat_session_id)
+    db.add(SessionMessage(message_id=uuid.uuid4(), session_id=session_id, role="user", content="a", sequence=1))
+    db.add(SessionMessage(message_id=uuid.uuid4(), session_id=session_id, role="user", content="b", sequence=1))
+    with pytest.raises(IntegrityError):
+        db.commit()
+    db.close()
+
+
+def test_concurrent_turns_on_one_session(chat_db, async_chat_db, chat_session_id, mocker):
+    """
+    같은 세션에 CONCURRENT_TURNS 개의 대화를 동시에 보냈을 때 (요청마다 별도의 스레드/DB 세션)
+    모든 메세지가 겹치지 않는 sequence로 저장되고, 각 턴의 user/assistant 메세지가 연속된 번호를 갖는지 테스트합니다.
+    """
+    agent = ChatAgent()
+
+    async def fake_llm_reply(model, message, chat_history, prompt=None):
+        await asyncio.sleep(0.01)
+        return f"reply to {message}"
+
+    mocker.patch.object(agent, '_llm_reply', side_effect=fake_llm_reply)
+    start = threading.Barrier(CONCURRENT_TURNS)
+    errors = []
+
+    def run_turn(i):
+        try:
+            start.wait()
+            asyncio.run(agent.handle(chat_session_id, "test_user", "gpt-4o-mini", f"q{i}", session_factory=async_chat_db()))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=run_turn, args=(i,)) for i in range(CONCURRENT_TURNS)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == []
+
+    db = chat_db()
+    history = chat_crud.get_chat_history(db, uuid.UUID(chat_session_id))
+    db.close()
+    assert [m.sequence for m in history] == list(range(1, 2 * CONCURRENT_TURNS + 1))
+    for user_msg, assistant_msg in zip(history[::2], history[1::2]):
+        assert user_msg.role == "user" and assistant_msg.role == "assistant"
+        assert assistant_msg.content == f"reply to {user_msg.content}"
+
+
+def _fill_session(chat_db, session_id, turns):
+    db = chat_db()
+    for i in range(1, turns + 1):
+        chat_crud.save_turn(db, session_id, [("user", f"q{i}"), ("assistant", f"a{i}")])
+    db.commit()
+    db.close()
+
+
+def test_get_recent_messages_window(chat_db, chat_session_id):
+    """최근 N개 메세지만 시간 순서대로 읽고, 잘린 턴의 assistant 메세지로 시작하지 않는지 테스트합니다."""
+    _fill_session(chat_db, chat_session_id, 30)
+    db = chat_db()
+
+    recent = chat_crud.get_recent_messages(db, chat_session_id, max_messages=4)
+    assert [(m["sequence"], m["content"]) for m in recent] == [(57, "q29"), (58, "a29"), (59, "q30"), (60, "a30")]
+
+    recent = chat_crud.get_recent_messages(db, chat_session_id, max_messages=5)
+    assert recent[0]["content"] == "q29"  # 5번째(a28)는 user 메세지가 잘린 턴이므로 제외
+
+    assert len(chat_crud.get_recent_messages(db, chat_session_id)) == 60
+    db.close()
+
+
+def test_get_recent_messages_token_budget_reads_pages(chat_db, chat_session_id):
+    """토큰 예산 안에서만 읽으며, 여러 page(keyset)에 걸쳐도 순서와 내용이 이어지는지 테스트합니다."""
+    _fill_session(chat_db, chat_session_id, 30)
+    db = chat_db()
+    per_message = estimate_tokens("q10")  # 모든 메세지 토큰 수 동일
+
+    recent = chat_crud.get_recent_messages(db, chat_session_id, max_tokens=per_message * 25, page_size=7)
+    assert [m["sequence"] for m in recent] == list(range(37, 61))  # 25번째(36, a18)부터는 턴 단위로 맞춤
+
+    recent = chat_crud.get_recent_messages(db, chat_session_id, max_messages=10, max_tokens=per_message * 100, page_size=3)
+    assert [m["sequence"] for m in recent] == list(range(51, 61))
+    db.close()
+
+
+def _load_history(agent, async_chat_db, session_id, message):
+    async def run():
+        async with async_chat_db()() as db:
+            return await agent._load_history(db, session_id, "gpt-4o-mini", message)
+    return asyncio.run(run())
+
+
+def test_refresh_summary_saves_summary_of_older_turns(chat_db, async_chat_db, chat_session_id, mocker):
+    """window 밖의 오래된 대화를 요약하여 저장하고, 다음 이력 조회 시 프롬프트에 포함하는지 테스트합니다."""
+    _fill_session(chat_db, chat_session_id, 30)
+    agent = ChatAgent()
+    mock_llm_reply = mocker.patch.object(agent, '_llm_reply', return_value="요약된 이전 대화")
+    mocker.patch.multiple(
+        'backend.agents.chat_agent.settings',
+        CHAT_HISTORY_SUMMARY=True, CHAT_HISTORY_MAX_TURNS=5, CHAT_HISTORY_SUMMARY_MIN_MESSAGES=20,
+    )
+
+    chat_history, prompt, summarize_before = _load_history(agent, async_chat_db, chat_session_id, "q31")
+    assert len(chat_history) == 10 and prompt == agent.role_prompt
+    assert summarize_before == 51
+
+    summary = asyncio.run(agent.refresh_summary(chat_session_id, "gpt-4o-mini", summarize_before,
+                                                 session_factory=async_chat_db()))
+    assert summary == "요약된 이전 대화"
+    transcript = mock_llm_reply.call_args.args[1]
+    assert "user: q1\nassistant: a1" in transcript and "a25" in transcript and "q26" not in transcript
+
+    db = chat_db()
+    assert chat_crud.get_session_summary(db, chat_session_id) == ("요약된 이전 대화", 50)
+    db.close()
+    _, prompt, summarize_before = _load_history(agent, async_chat_db, chat_session_id, "q31")
+    assert prompt.endswith("[이전 대화 요약]\n요약된 이전 대화")
+    assert summarize_before is None  # 요약되지 않은 오래된 메세지가 아직 적음
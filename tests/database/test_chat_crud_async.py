@@ -0,0 +1,75 @@
+# tests/database/test_chat_crud_async.py
+import asyncio
+import subprocess
+import sys
+
+from backend.database import db_manager
+from backend.database.crud import chat_crud
+
+
+def test_async_crud_matches_sync_crud(chat_db, async_chat_db, chat_session_id):
+    """a 로 시작하는 async crud 함수가 sync 함수와 같은 결과를 반환하는지 테스트합니다."""
+    async def run():
+        session_factory = async_chat_db()
+        async with session_factory() as db:
+            assert await chat_crud.asave_turn(db, chat_session_id, [("user", "q1"), ("assistant", "a1")]) == [1, 2]
+            # 미리 할당받은 sequence 로 저장 / 이미 사용 중이면 DB에서 다시 계산
+            assert await chat_crud.asave_turn(db, chat_session_id, [("user", "q2"), ("assistant", "a2")], first_sequence=3) == [3, 4]
+            assert await chat_crud.asave_turn(db, chat_session_id, [("user", "q3")], first_sequence=1) == [5]
+            await chat_crud.aupdate_session_summary(db, chat_session_id, "요약", 2)
+            await db.commit()
+
+        async with session_factory() as db:
+            return (
+                [(m.sequence, m.content) for m in await chat_crud.aget_chat_history(db, chat_session_id)],
+                await chat_crud.aget_recent_messages(db, chat_session_id, max_messages=3),
+                await chat_crud.aget_recent_messages(db, chat_session_id, max_tokens=3, page_size=1),
+                await chat_crud.aget_messages_between(db, chat_session_id, 1, 5),
+                await chat_crud.aget_session_summary(db, chat_session_id),
+                await chat_crud.aget_last_sequence(db, chat_session_id),
+                (await chat_crud.aget_chat_session(db, chat_session_id)).user_id,
+            )
+
+    history, recent, budget, between, summary, last, user_id = asyncio.run(run())
+    assert history == [(1, "q1"), (2, "a1"), (3, "q2"), (4, "a2"), (5, "q3")]
+    assert (summary, last, user_id) == (("요약", 2), 5, "test_user")
+
+    db = chat_db()
+    assert recent == chat_crud.get_recent_messages(db, chat_session_id, max_messages=3)
+    assert budget == chat_crud.get_recent_messages(db, chat_session_id, max_tokens=3, page_size=1)
+    assert between == chat_crud.get_messages_between(db, chat_session_id, 1, 5)
+    db.close()
+
+
+def test_engine_options_and_async_url(mocker):
+    mocker.patch.object(db_manager.settings, "DB_POOL_SIZE", 7)
+    mocker.patch.object(db_manager.settings, "DB_POOL_RECYCLE", 600)
+    options = db_manager.engine_options("postgresql://u:p@db:5432/app")
+    assert options["pool_size"] == 7 and options["pool_recycle"] == 600 and options["pool_pre_ping"] is True
+    # SQLite 는 풀 크기 설정 없이 pre_ping 만 적용
+    assert db_manager.engine_options("sqlite:///./mydb.db") == {"pool_pre_ping": True}
+
+    assert db_manager.async_database_url("postgresql://u:p@db:5432/app") == "postgresql+asyncpg://u:p@db:5432/app"
+    assert db_manager.async_database_url("postgresql+psycopg2://u:p@db/app") == "postgresql+asyncpg://u:p@db/app"
+    assert db_manager.async_database_url("sqlite:///./mydb.db") == "sqlite+aiosqlite:///./mydb.db"
+
+
+def test_sync_imports_do_not_need_async_driver():
+    """
+    async 엔진은 처음 사용할 때 만들어지므로, async 드라이버(aiosqlite / asyncpg)가 없어도
+    모델 / db_manager 를 import 하는 sync 코드는 동작하는지 테스트합니다. (드라이버 import 를 막은 별도 프로세스)
+    """
+    code = (
+        "import sys\n"
+        "sys.modules['aiosqlite'] = sys.modules['asyncpg'] = None\n"
+        "from backend.database import db_manager\n"
+        "from backend.database.models import chat_model, meeting_model\n"
+        "db_manager.SessionLocal().close()\n"
+        "try:\n"
+        "    db_manager.get_async_engine()\n"
+        "except ImportError:\n"
+        "    print('async driver required')\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "async driver required"
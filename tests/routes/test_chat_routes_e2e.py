@@ -1,4 +1,5 @@
 # tests/routes/test_chat_routes_e2e.py
+from unittest.mock import MagicMock
 from fastapi.testclient import TestClient
 from backend.main import app
 
@@ -10,9 +11,12 @@ def test_chat_e2e_scenario_without_agent_mock(mocker):
     Routes -> Agent 계층까지의 실제 통합을 테스트합니다.
     """
     # 준비 (Arrange)
-    # 1. DB 계층 Mocking (아직 db_manager가 없으므로 Agent 내부의 uuid 호출을 Mocking)
-    mocker.patch('backend.agents.chat_agent.uuid.uuid4', return_value='real-e2e-session-id')
-    # (나중에 여기에 fetch_history, save_history 등을 mocking하는 코드가 들어갑니다)
+    # 1. DB 계층 Mocking (Agent 내부의 chat_crud 호출을 Mocking)
+    mocker.patch(
+        'backend.agents.chat_agent.chat_crud.acreate_chat_session',
+        return_value=MagicMock(session_id='real-e2e-session-id')
+    )
+    mocker.patch('backend.agents.chat_agent.chat_crud.asave_turn')
 
     # 2. Core 계층 (LLM 호출) Mocking
     # Agent가 내부적으로 호출하는 _llm_reply를 Mocking합니다.
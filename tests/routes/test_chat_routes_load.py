@@ -0,0 +1,184 @@
+# tests/routes/test_chat_routes_load.py
+import asyncio
+import time
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from backend.database.crud import chat_crud
+from backend.database.models.chat_model import ChatSession
+from backend.routes.chat_routes import router as chat_router
+from backend.routes.meeting_routes import router as meeting_router
+
+
+# 동시에 보낼 요청 수 / 가짜 LLM 한 번의 응답 지연 시간(초)
+CONCURRENT_REQUESTS = 200
+FAKE_LLM_LATENCY = 0.2
+# DB 커넥션 풀 크기 / 작은 풀로 동시에 처리할 대화 수
+DB_POOL_SIZE = 5
+POOLED_CHATS = 100
+
+
+class FakeLLM:
+    """
+    로컬 가짜 LLM (AsyncOpenAI chat.completions.create 대체)
+    - expected 개의 호출이 모두 in-flight 상태가 될 때까지 기다린 뒤(barrier) FAKE_LLM_LATENCY 만큼 더 await 합니다.
+    - LLM 호출이 이벤트 루프를 막는다면(직렬 처리) barrier에 도달하지 못하고 timeout 으로 실패합니다.
+    """
+    def __init__(self, expected: int, timeout: float = 10.0):
+        self.expected = expected
+        self.timeout = timeout
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls = 0
+        self.all_in_flight = asyncio.Event()
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        if self.in_flight >= self.expected:
+            self.all_in_flight.set()
+        try:
+            await asyncio.wait_for(self.all_in_flight.wait(), timeout=self.timeout)
+            await asyncio.sleep(FAKE_LLM_LATENCY)
+        finally:
+            self.in_flight -= 1
+        response = MagicMock()
+        response.choices[0].message.content = "가짜 LLM 응답"
+        return response
+
+
+def _build_app() -> FastAPI:
+    """테스트 대상 라우터만 포함한 앱"""
+    app = FastAPI()
+    app.include_router(chat_router, prefix="/api")
+    app.include_router(meeting_router, prefix="/api")
+    return app
+
+
+async def _fire(app: FastAPI, path: str, payloads: list[dict]) -> list[httpx.Response]:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await asyncio.gather(*[client.post(path, json=p) for p in payloads])
+
+
+def _patch_chat_crud(mocker):
+    """DB 세션은 MagicMock으로 대체 (async with 로 AsyncMock 세션 반환)"""
+    session_factory = MagicMock()
+    session_factory.return_value.__aenter__.return_value = AsyncMock()
+    mocker.patch('backend.routes.chat_routes.agent.session_factory', session_factory)
+    mocker.patch(
+        'backend.agents.chat_agent.chat_crud.acreate_chat_session',
+        return_value=MagicMock(session_id='load-session-id')
+    )
+    mocker.patch('backend.agents.chat_agent.chat_crud.asave_turn')
+
+
+def test_chat_requests_in_flight_scale(mocker):
+    """
+    /api/chat 에 CONCURRENT_REQUESTS 개의 요청을 동시에 보냈을 때
+    한 이벤트 루프(=uvicorn worker 1개) 안에서 모든 LLM 호출이 동시에 진행(in-flight)되는지 확인합니다.
+    동기 호출이었다면 max_in_flight == 1, 총 소요 시간 ≈ CONCURRENT_REQUESTS * FAKE_LLM_LATENCY 가 됩니다.
+    """
+    fake_llm = FakeLLM(expected=CONCURRENT_REQUESTS)
+    mocker.patch('backend.core.llm_core.aclient.chat.completions.create', side_effect=fake_llm.create)
+    _patch_chat_crud(mocker)
+
+    payloads = [{"user_id": f"user{i}", "message": f"메시지 {i}"} for i in range(CONCURRENT_REQUESTS)]
+
+    started = time.perf_counter()
+    responses = asyncio.run(_fire(_build_app(), "/api/chat", payloads))
+    elapsed = time.perf_counter() - started
+
+    assert all(r.status_code == 200 for r in responses)
+    assert fake_llm.calls == CONCURRENT_REQUESTS
+    assert fake_llm.max_in_flight == CONCURRENT_REQUESTS
+    # 직렬 처리 시간(40초)의 1/4 보다 빨라야 합니다.
+    assert elapsed < CONCURRENT_REQUESTS * FAKE_LLM_LATENCY / 4
+
+
+def test_meeting_requests_in_flight_scale(mocker):
+    """/api/meeting 도 동일하게 LLM 호출이 동시에 진행되는지 확인합니다."""
+    fake_llm = FakeLLM(expected=50)
+    mocker.patch('backend.core.llm_core.aclient.chat.completions.create', side_effect=fake_llm.create)
+
+    payloads = [{"message": "회의실 목록 알려줘"} for _ in range(50)]
+    responses = asyncio.run(_fire(_build_app(), "/api/meeting", payloads))
+
+    assert all(r.status_code == 200 for r in responses)
+    assert fake_llm.max_in_flight == 50
+
+
+def test_small_db_pool_serves_many_slow_chats(chat_db, tmp_path, mocker):
+    """
+    커넥션 DB_POOL_SIZE 개(max_overflow=0)짜리 풀로 POOLED_CHATS 개의 느린 LLM 대화를 동시에 처리할 수 있는지 확인합니다.
+    - DB 커넥션은 LLM 호출 앞뒤의 짧은 트랜잭션에서만 사용하므로 모든 LLM 호출이 동시에 진행(in-flight)되어야 하고,
+      동시에 사용 중인 커넥션은 풀 크기를 넘지 않아야 합니다.
+    - 요청 전체 동안 커넥션을 잡고 있었다면 LLM 을 기다리는 대화는 최대 DB_POOL_SIZE 개뿐이라 barrier 에 도달하지 못합니다.
+    """
+    checked_out = {"now": 0, "max": 0}
+
+    # 대화마다 별도의 세션 (SQLite 에는 gen_random_uuid()가 없으므로 미리 생성)
+    session_ids = [uuid.uuid4() for _ in range(POOLED_CHATS)]
+    db = chat_db()
+    db.add_all([ChatSession(session_id=sid, user_id=f"user{i}", agent_id="ChatAgent", model_id="gpt-4o-mini")
+                for i, sid in enumerate(session_ids)])
+    db.commit()
+    db.close()
+
+    fake_llm = FakeLLM(expected=POOLED_CHATS, timeout=30.0)
+    mocker.patch('backend.core.llm_core.aclient.chat.completions.create', side_effect=fake_llm.create)
+
+    async def run():
+        # chat_db fixture 가 테이블을 만든 SQLite 파일에 풀 크기를 제한한 async 엔진을 따로 연결 (엔진은 이벤트 루프에 묶임)
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{tmp_path / 'main.db'}", connect_args={"timeout": 30},
+            poolclass=AsyncAdaptedQueuePool, pool_size=DB_POOL_SIZE, max_overflow=0, pool_timeout=10,
+        )
+
+        @event.listens_for(engine.sync_engine, "connect")
+        def _attach_schema(dbapi_conn, _):
+            cursor = dbapi_conn.cursor()
+            cursor.execute(f"ATTACH DATABASE '{tmp_path / 'llm_agent.db'}' AS llm_agent")
+            cursor.close()
+
+        @event.listens_for(engine.sync_engine, "checkout")
+        def _checkout(*args):
+            checked_out["now"] += 1
+            checked_out["max"] = max(checked_out["max"], checked_out["now"])
+
+        @event.listens_for(engine.sync_engine, "checkin")
+        def _checkin(*args):
+            checked_out["now"] -= 1
+
+        mocker.patch('backend.routes.chat_routes.agent.session_factory',
+                     async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False))
+        try:
+            return await _fire(_build_app(), "/api/chat", payloads)
+        finally:
+            await engine.dispose()
+
+    payloads = [{"session_id": str(sid), "user_id": f"user{i}", "message": f"메시지 {i}"}
+                for i, sid in enumerate(session_ids)]
+    responses = asyncio.run(run())
+
+    assert all(r.status_code == 200 for r in responses)
+    assert fake_llm.max_in_flight == POOLED_CHATS
+    assert checked_out["max"] <= DB_POOL_SIZE
+
+    # 모든 턴이 (user, assistant) 순서의 연속된 sequence 로 저장됨
+    db = chat_db()
+    try:
+        for i, sid in enumerate(session_ids):
+            history = chat_crud.get_chat_history(db, sid)
+            assert [(m.sequence, m.role, m.content) for m in history] == [
+                (1, "user", f"메시지 {i}"), (2, "assistant", "가짜 LLM 응답")
+            ]
+    finally:
+        db.close()
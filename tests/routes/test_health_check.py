@@ -0,0 +1,23 @@
+# tests/routes/test_health_check.py
+from unittest.mock import AsyncMock
+
+import redis.asyncio as aioredis
+from fastapi.testclient import TestClient
+
+from backend.core.redis_cache import get_async_redis
+from backend.main import app
+
+
+def test_health_check_uses_shared_async_redis():
+    """/api/health 가 주입된 공유 asyncio Redis 클라이언트로 PING 하는지 테스트합니다."""
+    fake_redis = AsyncMock()
+    app.dependency_overrides[get_async_redis] = lambda: fake_redis
+    try:
+        response = TestClient(app).get("/api/health")
+        assert response.json()["redis"] == "connected"
+        fake_redis.ping.assert_awaited_once()
+
+        fake_redis.ping.side_effect = aioredis.ConnectionError("down")
+        assert TestClient(app).get("/api/health").json()["redis"] == "not connected"
+    finally:
+        app.dependency_overrides.pop(get_async_redis)
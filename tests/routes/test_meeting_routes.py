@@ -0,0 +1,66 @@
+# tests/routes/test_meeting_routes.py
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+from fastapi.testclient import TestClient
+
+from backend.core.response_cache import LLMResponseCache
+from backend.main import app
+
+client = TestClient(app)
+
+
+def test_meeting_reply_cache_header(mocker):
+    """MeetingAgent 에 응답 캐시를 켜면 같은 질문의 두 번째 요청은 LLM 을 호출하지 않고 X-LLM-Cache: hit-exact 로 응답하는지 테스트합니다."""
+    mocker.patch('backend.core.config.settings.LLM_CACHE_AGENTS', ["MeetingAgent"])
+    mocker.patch('backend.core.llm_core.llm_response_cache', LLMResponseCache(ttl=60, maxsize=10, semantic=False))
+    mock_response = MagicMock()
+    mock_response.choices[0].message.content = "A, C, D 회의실이 예약 가능합니다."
+    mock_response.choices[0].message.tool_calls = None
+    mock_create = mocker.patch('backend.core.llm_core.aclient.chat.completions.create', new=AsyncMock(return_value=mock_response))
+
+    payload = {"user_id": "test_user", "message": "지금 비어있는 회의실 알려줘"}
+    first = client.post("/api/meeting", json=payload)
+    second = client.post("/api/meeting", json=payload)
+
+    assert first.headers["X-LLM-Cache"] == "miss"
+    assert second.headers["X-LLM-Cache"] == "hit-exact"
+    assert second.json()["reply"] == first.json()["reply"]
+    assert mock_create.await_count == 1
+
+
+def test_meeting_without_cache_has_no_header(mocker):
+    mock_response = MagicMock()
+    mock_response.choices[0].message.content = "안녕하세요"
+    mock_response.choices[0].message.tool_calls = None
+    mocker.patch('backend.core.llm_core.aclient.chat.completions.create', new=AsyncMock(return_value=mock_response))
+    response = client.post("/api/meeting", json={"message": "안녕"})
+    assert "X-LLM-Cache" not in response.headers
+
+
+
+def test_meeting_reply_with_tool_call_is_not_cached(mocker):
+    """도구를 호출한 답변(회의실 현황/예약 결과)은 상태에 따라 달라지므로 응답 캐시에 저장하지 않는지 테스트합니다."""
+    mocker.patch('backend.core.config.settings.LLM_CACHE_AGENTS', ["MeetingAgent"])
+    mocker.patch('backend.core.llm_core.llm_response_cache', LLMResponseCache(ttl=60, maxsize=10, semantic=False))
+    tool_call = MagicMock()
+    tool_call.id = "c1"
+    tool_call.function.name = "list_rooms"
+    tool_call.function.arguments = '{"min_capacity": 10}'
+    with_tool, final = MagicMock(), MagicMock()
+    with_tool.choices[0].message.content = None
+    with_tool.choices[0].message.tool_calls = [tool_call]
+    final.choices[0].message.content = "B, E 회의실이 있습니다."
+    final.choices[0].message.tool_calls = None
+    mock_create = mocker.patch('backend.core.llm_core.aclient.chat.completions.create', new=AsyncMock(side_effect=[with_tool, final] * 2))
+
+    payload = {"user_id": "test_user", "message": "10명 회의실 알려줘"}
+    first = client.post("/api/meeting", json=payload)
+    second = client.post("/api/meeting", json=payload)
+
+    assert first.headers["X-LLM-Cache"] == second.headers["X-LLM-Cache"] == "miss"
+    assert second.json()["reply"] == "B, E 회의실이 있습니다."
+    assert mock_create.await_count == 4
+    # 도구 결과: 10명 이상 회의실만 작은 순으로
+    rooms = json.loads(mock_create.await_args_list[1].kwargs["messages"][-1]["content"])
+    assert [room["name"] for room in rooms] == ["B", "E"]